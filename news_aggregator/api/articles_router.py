@@ -14,6 +14,7 @@ import sqlalchemy
 from ..database import get_db
 from ..models import Article, ArticleCategory
 from ..orchestrator import NewsOrchestrator
+from ..core.adaptive_limiter import AIPriority, with_ai_priority
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,7 @@ class ReprocessRequest(BaseModel):
 # ============================================================================
 
 @router.post("/{article_id}/reprocess")
+@with_ai_priority(AIPriority.INTERACTIVE)
 async def reprocess_article(
     article_id: int,
     request: ReprocessRequest,
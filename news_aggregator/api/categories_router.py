@@ -12,6 +12,9 @@ from sqlalchemy.orm import selectinload
 
 from ..database import get_db
 from ..models import Article, Category, ArticleCategory, CategoryMapping
+from ..services.prompts import invalidate_prompt_templates
+from ..services.category_cache import get_category_cache
+from ..core.adaptive_limiter import AIPriority, with_ai_priority
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +173,8 @@ async def create_category(
     
     db.add(category)
     await db.commit()
+    invalidate_prompt_templates()
+    await get_category_cache().invalidate()
     await db.refresh(category)
     
     return category
@@ -209,6 +214,8 @@ async def update_category(
         category.is_local = payload.is_local
     
     await db.commit()
+    invalidate_prompt_templates()
+    await get_category_cache().invalidate()
     await db.refresh(category)
     
     return category
@@ -272,6 +279,7 @@ async def create_category_mapping(
         existing.is_active = True
         existing.updated_at = datetime.utcnow()
         await db.commit()
+        invalidate_prompt_templates()
         await db.refresh(existing)
         mapping = existing
     else:
@@ -287,6 +295,7 @@ async def create_category_mapping(
         )
         db.add(mapping)
         await db.commit()
+        invalidate_prompt_templates()
         await db.refresh(mapping)
     
     return CategoryMappingResponse(
@@ -330,6 +339,7 @@ async def update_category_mapping(
     mapping.updated_at = datetime.utcnow()
     
     await db.commit()
+    invalidate_prompt_templates()
     await db.refresh(mapping)
     
     return CategoryMappingUpdateResponse(
@@ -363,6 +373,7 @@ async def delete_category_mapping(
     # Delete mapping
     await db.execute(delete(CategoryMapping).where(CategoryMapping.id == mapping_id))
     await db.commit()
+    invalidate_prompt_templates()
     
     return {"message": "Mapping deleted successfully"}
 
@@ -389,6 +400,7 @@ async def toggle_category_mapping(
     mapping.updated_at = datetime.utcnow()
     
     await db.commit()
+    invalidate_prompt_templates()
     
     return {
         "message": f"Mapping {'activated' if mapping.is_active else 'deactivated'}",
@@ -544,6 +556,7 @@ class AICategoryMappingApprovalRequest(BaseModel):
 
 
 @router.post("/ai-category-analysis", response_model=AICategoryAnalysisBatchResponse)
+@with_ai_priority(AIPriority.INTERACTIVE)
 async def analyze_categories_with_ai(
     request: AICategoryAnalysisRequest,
     db: AsyncSession = Depends(get_db)
@@ -784,6 +797,7 @@ async def approve_ai_category_mapping(
                 existing.is_active = True
                 existing.updated_at = func.now()
                 await db.commit()
+                invalidate_prompt_templates()
                 return {
                     "success": True,
                     "message": f"Reactivated mapping: '{request.ai_category}' → '{request.approved_fixed_category}'"
@@ -801,6 +815,7 @@ async def approve_ai_category_mapping(
         
         db.add(new_mapping)
         await db.commit()
+        invalidate_prompt_templates()
         
         # Get count of articles that will be affected
         count_result = await db.execute(
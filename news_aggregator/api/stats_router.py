@@ -8,15 +8,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, text
 
 from ..database import get_db
-from ..models import Article, ProcessingStat
+from ..models import Article, PipelineCycleStat, ProcessingStat
 from ..orchestrator import NewsOrchestrator
 from ..services.extraction_memory import get_extraction_memory
+from ..services.ai_cache import get_ai_cache
+from ..services.gemini_context_cache import get_gemini_context_cache
+from ..services.model_router import get_model_router
+from ..services.extractive_summarizer import get_extractive_summarizer
+from ..services.job_queue import get_job_queue
+from ..config import settings
+from ..core.metrics import pipeline_metrics
+from ..core.circuit_breaker import ai_service_breaker
+from ..core.dead_letter_queue import get_dead_letter_queue
 from ..processing.processing_stats_service import get_processing_stats_service
 
 
 router = APIRouter()
 
 
+def _context_cache_savings(cached_tokens: int) -> float:
+    """Cost saved by serving prompt tokens from Gemini context cache instead of full input price."""
+    input_rate = settings.ai_input_cost_per_1m or 0.0
+    cached_rate = settings.ai_cached_input_cost_per_1m or 0.0
+    return round(cached_tokens * max(0.0, input_rate - cached_rate) / 1_000_000, 4)
+
+
 @router.get("/dashboard")
 async def get_dashboard_stats(
     days: int = Query(7, ge=1, le=30),
@@ -178,6 +194,81 @@ async def get_queue_stats():
         return {"error": str(e)}
 
 
+@router.get("/ai-limiter")
+async def get_ai_limiter_stats():
+    """Get adaptive AI concurrency limiter and circuit breaker state."""
+    try:
+        from ..core.adaptive_limiter import ai_concurrency_limiter
+        from ..core.circuit_breaker import ai_service_breaker
+        from ..core.hedging import ai_request_hedger
+        return {
+            "limiter": ai_concurrency_limiter.get_stats(),
+            "hedging": ai_request_hedger.get_stats(),
+            "circuit_breaker": ai_service_breaker.get_stats(),
+            "router": get_model_router().get_stats(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.get("/ai-jobs")
+async def get_ai_job_stats(db: AsyncSession = Depends(get_db)):
+    """Get durable AI job queue progress and per-worker throughput."""
+    try:
+        return {
+            "enabled": settings.ai_job_queue_enabled,
+            **(await get_job_queue().get_stats(db)),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.get("/dead-letters")
+async def get_dead_letter_stats(db: AsyncSession = Depends(get_db)):
+    """Get dead-letter queue depth by failure reason and the AI breaker state gating retries."""
+    try:
+        return {
+            "enabled": settings.dlq_enabled,
+            **(await get_dead_letter_queue().get_stats(db)),
+            "ai_service_breaker": ai_service_breaker.get_stats(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.get("/pipeline")
+async def get_pipeline_stats(
+    cycles: int = Query(10, ge=0, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get per-stage pipeline metrics (this process) and the metrics of recent cycles."""
+    try:
+        result = await db.execute(
+            select(PipelineCycleStat).order_by(PipelineCycleStat.started_at.desc()).limit(cycles)
+        )
+        return {
+            **pipeline_metrics.snapshot(),
+            "recent_cycles": [
+                {
+                    "started_at": c.started_at.isoformat() if c.started_at else None,
+                    "finished_at": c.finished_at.isoformat() if c.finished_at else None,
+                    "duration_seconds": c.duration_seconds,
+                    "articles_fetched": c.articles_fetched,
+                    "articles_processed": c.articles_processed,
+                    "errors_count": c.errors_count,
+                    "stages": c.stages or {},
+                }
+                for c in result.scalars().all()
+            ],
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @router.get("/ai-usage")
 async def get_ai_usage_stats(
     days: int = Query(30, ge=1, le=90),
@@ -195,7 +286,8 @@ async def get_ai_usage_stats(
                     COALESCE(SUM(tokens_used), 0) as total_tokens,
                     COALESCE(SUM(credits_cost), 0) as total_cost,
                     COALESCE(SUM(patterns_discovered), 0) as patterns_discovered,
-                    COALESCE(SUM(patterns_successful), 0) as patterns_successful
+                    COALESCE(SUM(patterns_successful), 0) as patterns_successful,
+                    COALESCE(SUM((analysis_result->>'cached_tokens')::int), 0) as cached_tokens
                 FROM ai_usage_tracking
                 WHERE created_at >= :since_date OR created_at IS NULL
             """),
@@ -210,7 +302,8 @@ async def get_ai_usage_stats(
                 SELECT
                     COUNT(*) as requests,
                     COALESCE(SUM(tokens_used), 0) as tokens,
-                    COALESCE(SUM(credits_cost), 0) as cost
+                    COALESCE(SUM(credits_cost), 0) as cost,
+                    COALESCE(SUM((analysis_result->>'cached_tokens')::int), 0) as cached_tokens
                 FROM ai_usage_tracking
                 WHERE created_at >= :today
             """),
@@ -243,6 +336,35 @@ async def get_ai_usage_stats(
             for row in by_type_result.fetchall()
         ]
 
+        # Usage by model and routing decision
+        by_model_result = await db.execute(
+            text("""
+                SELECT
+                    COALESCE(analysis_result->>'model', 'unknown') as model,
+                    COALESCE(analysis_result->>'route', '-') as route,
+                    COUNT(*) as requests,
+                    COALESCE(SUM(tokens_used), 0) as tokens,
+                    COALESCE(SUM(credits_cost), 0) as cost,
+                    AVG((analysis_result->>'latency_ms')::int) as avg_latency_ms
+                FROM ai_usage_tracking
+                WHERE created_at >= :since_date OR created_at IS NULL
+                GROUP BY 1, 2
+                ORDER BY requests DESC
+            """),
+            {"since_date": since_date}
+        )
+        by_model = [
+            {
+                "model": row.model,
+                "route": row.route,
+                "requests": row.requests,
+                "tokens": int(row.tokens),
+                "cost": float(row.cost),
+                "avg_latency_ms": round(float(row.avg_latency_ms)) if row.avg_latency_ms is not None else None
+            }
+            for row in by_model_result.fetchall()
+        ]
+
         # Daily usage for chart
         daily_result = await db.execute(
             text("""
@@ -294,6 +416,8 @@ async def get_ai_usage_stats(
             for row in top_domains_result.fetchall()
         ]
 
+        total_cached_tokens = int(total_stats.cached_tokens) if total_stats else 0
+
         return {
             "period_days": days,
             "total": {
@@ -301,16 +425,23 @@ async def get_ai_usage_stats(
                 "tokens": int(total_stats.total_tokens) if total_stats else 0,
                 "cost": float(total_stats.total_cost) if total_stats else 0,
                 "patterns_discovered": int(total_stats.patterns_discovered) if total_stats else 0,
-                "patterns_successful": int(total_stats.patterns_successful) if total_stats else 0
+                "patterns_successful": int(total_stats.patterns_successful) if total_stats else 0,
+                "cached_tokens": total_cached_tokens,
+                "cache_savings": _context_cache_savings(total_cached_tokens)
             },
             "today": {
                 "requests": today_stats.requests if today_stats else 0,
                 "tokens": int(today_stats.tokens) if today_stats else 0,
-                "cost": float(today_stats.cost) if today_stats else 0
+                "cost": float(today_stats.cost) if today_stats else 0,
+                "cached_tokens": int(today_stats.cached_tokens) if today_stats else 0
             },
             "by_type": by_type,
+            "by_model": by_model,
             "daily": daily,
             "top_domains": top_domains,
+            "cache": get_ai_cache().get_metrics(),
+            "local_summaries": get_extractive_summarizer().get_stats(),
+            "context_cache": get_gemini_context_cache().get_stats(),
             "timestamp": datetime.utcnow().isoformat()
         }
 
@@ -321,6 +452,7 @@ async def get_ai_usage_stats(
             "total": {"requests": 0, "tokens": 0, "cost": 0},
             "today": {"requests": 0, "tokens": 0, "cost": 0},
             "by_type": [],
+            "by_model": [],
             "daily": [],
             "top_domains": [],
             "timestamp": datetime.utcnow().isoformat()
@@ -0,0 +1,185 @@
+"""Text rules API router - spam, boilerplate and bot-protection rules (services.text_rules)."""
+
+import logging
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.rule_engine import CompiledRules, Rule
+from ..database import get_db
+from ..models import TextRule
+from ..services.text_rules import RULE_SETS, get_text_rules
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter()
+
+
+class TextRuleRequest(BaseModel):
+    rule_key: str
+    rule_set: str
+    pattern: str
+    is_regex: bool = False
+    enabled: bool = True
+    description: Optional[str] = None
+
+
+class TextRuleResponse(BaseModel):
+    id: int
+    rule_key: str
+    rule_set: str
+    pattern: str
+    is_regex: bool
+    enabled: bool
+    description: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+class TextRuleTestRequest(BaseModel):
+    text: str
+    rule_sets: Optional[List[str]] = None
+
+
+def _to_response(rule: TextRule) -> TextRuleResponse:
+    return TextRuleResponse(
+        id=rule.id,
+        rule_key=rule.rule_key,
+        rule_set=rule.rule_set,
+        pattern=rule.pattern,
+        is_regex=bool(rule.is_regex),
+        enabled=bool(rule.enabled),
+        description=rule.description,
+        updated_at=rule.updated_at
+    )
+
+
+def _validate(payload: TextRuleRequest) -> None:
+    if payload.rule_set not in RULE_SETS:
+        raise HTTPException(status_code=400, detail=f"Unknown rule set '{payload.rule_set}'")
+    if not payload.pattern:
+        raise HTTPException(status_code=400, detail="Pattern must not be empty")
+    if payload.is_regex:
+        try:
+            re.compile(payload.pattern)
+        except re.error as e:
+            raise HTTPException(status_code=400, detail=f"Invalid regex: {e}")
+
+
+async def _validate_with_active_rules(db: AsyncSession, payload: TextRuleRequest,
+                                      replaced_key: Optional[str] = None) -> None:
+    """Reject a rule that only breaks once compiled together with the other active rules."""
+    await _reload_rules(db)
+    rules = [
+        r for r in get_text_rules().engine.rules
+        if r.rule_id not in (payload.rule_key, replaced_key)
+    ]
+    if payload.enabled:
+        rules.append(Rule(payload.rule_key, payload.rule_set, payload.pattern, payload.is_regex))
+    errors = CompiledRules(rules).errors
+    if errors:
+        raise HTTPException(status_code=400, detail='; '.join(errors))
+
+
+async def _reload_rules(db: AsyncSession) -> None:
+    """Apply edits in this process right away (other processes reload periodically)."""
+    await get_text_rules().load(db)
+
+
+@router.get("/", response_model=List[TextRuleResponse])
+async def get_text_rules_list(
+    rule_set: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """List text rules, optionally of one rule set."""
+    query = select(TextRule).order_by(TextRule.rule_set, TextRule.rule_key)
+    if rule_set:
+        query = query.where(TextRule.rule_set == rule_set)
+    result = await db.execute(query)
+    return [_to_response(rule) for rule in result.scalars().all()]
+
+
+@router.get("/sets")
+async def get_rule_sets() -> Dict[str, Dict]:
+    """Rule sets with their purpose and active rule counts."""
+    counts = get_text_rules().engine.rule_sets()
+    return {
+        name: {'description': description, 'active_rules': counts.get(name, 0)}
+        for name, description in RULE_SETS.items()
+    }
+
+
+@router.post("/", response_model=TextRuleResponse)
+async def create_text_rule(
+    payload: TextRuleRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a text rule."""
+    _validate(payload)
+    existing = await db.execute(select(TextRule.id).where(TextRule.rule_key == payload.rule_key))
+    if existing.scalar_one_or_none():
+        raise HTTPException(status_code=409, detail=f"Rule '{payload.rule_key}' already exists")
+    await _validate_with_active_rules(db, payload)
+
+    rule = TextRule(**payload.model_dump())
+    db.add(rule)
+    await db.commit()
+    await db.refresh(rule)
+    await _reload_rules(db)
+    return _to_response(rule)
+
+
+@router.put("/{rule_id}", response_model=TextRuleResponse)
+async def update_text_rule(
+    rule_id: int,
+    payload: TextRuleRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Update a text rule."""
+    _validate(payload)
+    result = await db.execute(select(TextRule).where(TextRule.id == rule_id))
+    rule = result.scalar_one_or_none()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+    if payload.rule_key != rule.rule_key:
+        existing = await db.execute(select(TextRule.id).where(TextRule.rule_key == payload.rule_key))
+        if existing.scalar_one_or_none():
+            raise HTTPException(status_code=409, detail=f"Rule '{payload.rule_key}' already exists")
+    await _validate_with_active_rules(db, payload, replaced_key=rule.rule_key)
+
+    for field, value in payload.model_dump().items():
+        setattr(rule, field, value)
+    rule.updated_at = datetime.utcnow()
+    await db.commit()
+    await db.refresh(rule)
+    await _reload_rules(db)
+    return _to_response(rule)
+
+
+@router.delete("/{rule_id}")
+async def delete_text_rule(
+    rule_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a text rule."""
+    result = await db.execute(select(TextRule).where(TextRule.id == rule_id))
+    rule = result.scalar_one_or_none()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+
+    await db.delete(rule)
+    await db.commit()
+    await _reload_rules(db)
+    return {"message": "Rule deleted successfully"}
+
+
+@router.post("/test")
+async def test_text_rules(payload: TextRuleTestRequest):
+    """Classify a text with the active rules; returns matched rule ids by rule set."""
+    rule_sets = payload.rule_sets or list(RULE_SETS)
+    return {'matches': get_text_rules().classify(payload.text, *rule_sets)}
@@ -408,6 +408,74 @@ async def update_mapping(ai_category: str, new_fixed_category: str, description:
         sys.exit(1)
 
 
+@cli.command(name='worker')
+@click.option('--worker-id', default=None, help='Worker name in the job table (default: host-pid)')
+@click.option('--batch-size', default=None, type=int, help='Jobs leased at a time')
+@click.option('--drain', is_flag=True, help='Exit when no job can be leased instead of polling')
+@async_command
+async def worker(worker_id: Optional[str], batch_size: Optional[int], drain: bool):
+    """Process AI jobs from the durable job queue (AI_JOB_QUEUE_ENABLED)."""
+    import signal
+    from .services.ai_worker import AIWorker
+
+    orchestrator = NewsOrchestrator()
+    await orchestrator.start()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass
+
+    ai_worker = AIWorker(orchestrator, worker_id=worker_id, batch_size=batch_size)
+    console.print(f"[cyan]👷 Worker {ai_worker.worker_id} processing AI jobs (Ctrl+C to stop after the current batch)[/cyan]")
+    try:
+        totals = await ai_worker.run(drain=drain, stop_event=stop_event)
+    finally:
+        await orchestrator.stop()
+
+    console.print(f"[green]✅ Worker stopped: {totals['jobs']} jobs, "
+                  f"{totals['articles_processed']} articles processed, "
+                  f"{totals['api_calls_made']} API calls[/green]")
+
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', help='Bind address')
+@click.option('--port', default=8089, type=int, help='Bind port')
+@click.option('--latency', default='lognormal:800:0.5',
+              help="Latency distribution in ms: fixed:300, uniform:200:1500 or lognormal:800:0.5")
+@click.option('--rate-429', default=0.0, type=float, help='Share of requests answered with 429')
+@click.option('--rate-5xx', default=0.0, type=float, help='Share of requests answered with 500/503')
+@click.option('--replay', multiple=True, help='Directory with recordings made via AI_RECORD_DIR')
+@click.option('--replay-latency', is_flag=True, help='Use recorded latencies for replayed responses')
+@click.option('--feeds', default=0, type=int, help='Also serve N synthetic RSS feeds under /feeds/')
+@click.option('--seed', default=None, type=int, help='Random seed')
+def mock_gemini(host: str, port: int, latency: str, rate_429: float, rate_5xx: float,
+                replay: tuple, replay_latency: bool, feeds: int, seed: Optional[int]):
+    """Run a local Gemini stand-in server for offline load testing."""
+    from .devtools.gemini_mock import LatencyModel, MockConfig, run_mock_server
+
+    try:
+        latency_model = LatencyModel.parse(latency)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        sys.exit(1)
+
+    config = MockConfig(
+        latency=latency_model,
+        error_429_rate=rate_429,
+        error_5xx_rate=rate_5xx,
+        replay_dirs=list(replay),
+        replay_latency=replay_latency,
+        seed=seed,
+    )
+    console.print(f"[cyan]🧪 Gemini mock: GEMINI_API_ENDPOINT=http://{host}:{port}/v1/models[/cyan]")
+    if feeds:
+        console.print(f"[cyan]📰 Synthetic feeds: http://{host}:{port}/feeds/0..{feeds - 1}.xml[/cyan]")
+    run_mock_server(host=host, port=port, config=config, synthetic_feeds=feeds)
+
+
 
 
 
@@ -25,11 +25,20 @@ class Settings(BaseSettings):
     summarization_model: str = Field(default="gemini-1.5-flash-latest", alias="SUMMARIZATION_MODEL")
     categorization_model: str = Field(default="gemini-1.5-flash-latest", alias="CATEGORIZATION_MODEL") 
     digest_model: str = Field(default="gemini-1.5-pro-latest", alias="DIGEST_MODEL")
+    light_model: Optional[str] = Field(default=None, alias="LIGHT_MODEL")  # Cheaper model for short posts (routing off if unset)
+
+    # Model routing between SUMMARIZATION_MODEL and LIGHT_MODEL for article analysis
+    ai_router_enabled: bool = Field(default=True, alias="AI_ROUTER_ENABLED")
+    ai_router_short_chars: int = Field(default=500, alias="AI_ROUTER_SHORT_CHARS")  # Always light below this
+    ai_router_light_max_chars: int = Field(default=1500, alias="AI_ROUTER_LIGHT_MAX_CHARS")  # Light-source posts up to this
+    ai_router_light_source_types: str = Field(default="telegram", alias="AI_ROUTER_LIGHT_SOURCE_TYPES")
 
     # AI usage pricing (per 1M tokens) - optional, configure per provider/model
     ai_input_cost_per_1m: Optional[float] = Field(default=None, alias="AI_INPUT_COST_PER_1M")
     ai_output_cost_per_1m: Optional[float] = Field(default=None, alias="AI_OUTPUT_COST_PER_1M")
     ai_cached_input_cost_per_1m: Optional[float] = Field(default=None, alias="AI_CACHED_INPUT_COST_PER_1M")
+    light_input_cost_per_1m: Optional[float] = Field(default=None, alias="LIGHT_INPUT_COST_PER_1M")
+    light_output_cost_per_1m: Optional[float] = Field(default=None, alias="LIGHT_OUTPUT_COST_PER_1M")
     
     # Browser (Chrome CDP endpoint, e.g. ws://chrome:9222)
     browser_ws_endpoint: Optional[str] = Field(default=None, alias="BROWSER_WS_ENDPOINT")
@@ -65,7 +74,48 @@ class Settings(BaseSettings):
     
     # API Rate Limiting
     api_rate_limit: int = Field(default=3, alias="RPS")  # Requests per second
-    
+
+    # Adaptive AI concurrency (AIMD): grows while Gemini is healthy, halves on 429/5xx
+    ai_concurrency_initial: int = Field(default=5, alias="AI_CONCURRENCY_INITIAL")
+    ai_concurrency_min: int = Field(default=1, alias="AI_CONCURRENCY_MIN")
+    ai_concurrency_max: int = Field(default=16, alias="AI_CONCURRENCY_MAX")
+    ai_latency_target: float = Field(default=20.0, alias="AI_LATENCY_TARGET")  # Seconds per request
+    ai_backlog_age_hours: int = Field(default=24, alias="AI_BACKLOG_AGE_HOURS")  # Older articles get backlog priority
+    ai_streaming_enabled: bool = Field(default=True, alias="AI_STREAMING_ENABLED")  # streamGenerateContent for long outputs
+    ai_record_dir: Optional[str] = Field(default=None, alias="AI_RECORD_DIR")  # Record Gemini traffic for replay by the mock server
+    ai_hedging_enabled: bool = Field(default=True, alias="AI_HEDGING_ENABLED")  # Duplicate requests slower than recent p95
+    ai_hedge_budget: float = Field(default=0.05, alias="AI_HEDGE_BUDGET")  # Max extra requests as a fraction of all requests
+    ai_hedge_min_delay: float = Field(default=2.0, alias="AI_HEDGE_MIN_DELAY")  # Seconds before a hedge may be sent
+
+    # AI batch analysis (several short posts in one structured request)
+    ai_batch_enabled: bool = Field(default=True, alias="AI_BATCH_ENABLED")
+    ai_batch_max_size: int = Field(default=8, alias="AI_BATCH_MAX_SIZE")  # Upper bound for K
+    ai_batch_max_article_chars: int = Field(default=1500, alias="AI_BATCH_MAX_ARTICLE_CHARS")  # Longer posts go single
+    ai_batch_input_token_budget: int = Field(default=6000, alias="AI_BATCH_INPUT_TOKEN_BUDGET")  # Article tokens per batch
+    ai_batch_output_tokens_per_article: int = Field(default=600, alias="AI_BATCH_OUTPUT_TOKENS_PER_ARTICLE")
+    ai_batch_max_output_tokens: int = Field(default=8192, alias="AI_BATCH_MAX_OUTPUT_TOKENS")
+
+    # Persistent AI result cache (keyed by content hash, model, prompt and category versions)
+    ai_cache_enabled: bool = Field(default=True, alias="AI_CACHE_ENABLED")
+    ai_cache_ttl: int = Field(default=30 * 86400, alias="AI_CACHE_TTL")  # 30 days
+    ai_cache_max_entries: int = Field(default=5000, alias="AI_CACHE_MAX_ENTRIES")
+    ai_cache_max_size_mb: float = Field(default=100.0, alias="AI_CACHE_MAX_SIZE_MB")
+
+    # Local extractive summaries instead of Gemini for very short / low-value posts
+    local_summary_enabled: bool = Field(default=False, alias="LOCAL_SUMMARY_ENABLED")
+    local_summary_max_chars: int = Field(default=300, alias="LOCAL_SUMMARY_MAX_CHARS")  # "Very short" posts
+    local_summary_quality_threshold: float = Field(default=0.55, alias="LOCAL_SUMMARY_QUALITY_THRESHOLD")
+    local_summary_share: float = Field(default=0.5, alias="LOCAL_SUMMARY_SHARE")  # Fraction of eligible posts
+    local_summary_audit_rate: float = Field(default=0.05, alias="LOCAL_SUMMARY_AUDIT_RATE")  # Also sent to AI for comparison
+
+    # Smart filter exact-duplicate cache (content hashes seen within 24h)
+    smart_filter_duplicate_cache_size: int = Field(default=50000, alias="SMART_FILTER_DUPLICATE_CACHE_SIZE")  # Oldest evicted first
+
+    # Gemini context caching of the static analysis prompt prefix (cachedContents API)
+    ai_context_cache_enabled: bool = Field(default=True, alias="AI_CONTEXT_CACHE_ENABLED")
+    ai_context_cache_ttl: int = Field(default=3600, alias="AI_CONTEXT_CACHE_TTL")  # Seconds
+    ai_context_cache_refresh_margin: int = Field(default=300, alias="AI_CONTEXT_CACHE_REFRESH_MARGIN")  # Recreate before expiry
+
     
     # Database Connection Pool
     db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")  # Base pool size
@@ -77,6 +127,40 @@ class Settings(BaseSettings):
     db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
     db_pool_recycle: int = Field(default=300, alias="DB_POOL_RECYCLE")  # 5min aggressive recycle
 
+    # Incremental persistence of AI results during a cycle
+    persist_batch_size: int = Field(default=25, alias="PERSIST_BATCH_SIZE")  # Articles per write transaction
+    persist_flush_interval: float = Field(default=5.0, alias="PERSIST_FLUSH_INTERVAL")  # Seconds before a partial batch is written
+    backlog_page_size: int = Field(default=200, alias="BACKLOG_PAGE_SIZE")  # Unprocessed articles per keyset page
+    backlog_queue_size: int = Field(default=400, alias="BACKLOG_QUEUE_SIZE")  # Articles read ahead of the AI workers
+    backlog_ranking_enabled: bool = Field(default=True, alias="BACKLOG_RANKING_ENABLED")  # Process the backlog by value instead of recency
+    backlog_freshness_hours: float = Field(default=12.0, alias="BACKLOG_FRESHNESS_HOURS")  # Age at which freshness has decayed to 1/e
+    backlog_source_fairness: float = Field(default=0.5, alias="BACKLOG_SOURCE_FAIRNESS")  # Score divided by rank-within-source ** this
+    near_duplicates_enabled: bool = Field(default=True, alias="NEAR_DUPLICATES_ENABLED")  # Reuse analysis of near-identical articles
+    near_duplicate_max_distance: int = Field(default=3, alias="NEAR_DUPLICATE_MAX_DISTANCE")  # SimHash Hamming distance (0-3)
+    near_duplicate_window_hours: int = Field(default=72, alias="NEAR_DUPLICATE_WINDOW_HOURS")  # How far back canonicals are matched
+    pipeline_staged_enabled: bool = Field(default=True, alias="PIPELINE_STAGED_ENABLED")  # Overlap fetch, save and AI in one cycle
+    pipeline_fetch_concurrency: int = Field(default=5, alias="PIPELINE_FETCH_CONCURRENCY")  # Sources fetched at once
+    pipeline_save_queue_size: int = Field(default=10, alias="PIPELINE_SAVE_QUEUE_SIZE")  # Fetched sources waiting to be saved
+    cycle_resume_window_minutes: int = Field(default=90, alias="CYCLE_RESUME_WINDOW_MINUTES")  # Interrupted cycles younger than this are resumed
+    cycle_stale_minutes: int = Field(default=10, alias="CYCLE_STALE_MINUTES")  # Running cycles of other processes without a heartbeat this long are taken over
+
+    # Durable AI job queue (ai_jobs table) consumed by `python -m news_aggregator worker` processes
+    ai_job_queue_enabled: bool = Field(default=False, alias="AI_JOB_QUEUE_ENABLED")  # Cycle enqueues jobs instead of processing inline
+    ai_job_visibility_timeout: int = Field(default=600, alias="AI_JOB_VISIBILITY_TIMEOUT")  # Lease seconds (extended by heartbeat)
+    ai_job_max_attempts: int = Field(default=3, alias="AI_JOB_MAX_ATTEMPTS")
+    ai_job_retry_delay: int = Field(default=60, alias="AI_JOB_RETRY_DELAY")  # Seconds × attempt before a failed job is retried
+    ai_worker_batch_size: int = Field(default=50, alias="AI_WORKER_BATCH_SIZE")  # Jobs leased at a time
+    ai_worker_poll_interval: float = Field(default=10.0, alias="AI_WORKER_POLL_INTERVAL")  # Seconds between polls when idle
+
+    # Dead-letter queue (dead_letter_entries table) of articles whose processing failed
+    dlq_enabled: bool = Field(default=True, alias="DLQ_ENABLED")  # Record failures and retry them after each cycle
+    dlq_max_retries: int = Field(default=3, alias="DLQ_MAX_RETRIES")  # Then the entry is kept as permanently failed
+    dlq_retry_base_delay: int = Field(default=300, alias="DLQ_RETRY_BASE_DELAY")  # Seconds before the first retry, doubled per retry
+    dlq_retry_max_delay: int = Field(default=6 * 3600, alias="DLQ_RETRY_MAX_DELAY")  # Backoff cap in seconds
+    dlq_retry_batch_size: int = Field(default=50, alias="DLQ_RETRY_BATCH_SIZE")  # Entries claimed at a time
+    dlq_retry_max_batches: int = Field(default=4, alias="DLQ_RETRY_MAX_BATCHES")  # Per processing cycle
+    dlq_retention_days: int = Field(default=7, alias="DLQ_RETENTION_DAYS")  # Done entries (and orphaned failed ones) are deleted after this
+
     # HTTP / proxy / CORS
     allowed_origins: Optional[str] = Field(
         default="http://localhost:8000,http://127.0.0.1:8000,https://news.dzarlax.dev",
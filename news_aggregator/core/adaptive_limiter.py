@@ -0,0 +1,259 @@
+"""Adaptive (AIMD) concurrency limiter with priority classes for external service calls."""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+import logging
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AIPriority(IntEnum):
+    """Dispatch classes for AI requests (lower value is served first)."""
+    INTERACTIVE = 0  # Admin UI actions, on-demand reprocessing
+    DIGEST = 1  # Daily category summaries and digests
+    FRESH = 2  # Newly fetched articles
+    BACKLOG = 3  # Old unprocessed articles, reprocess_failed
+
+
+# Fraction of the current limit each class may occupy; lower classes can never
+# take every slot, so higher-priority work always finds room quickly.
+DEFAULT_CLASS_SHARES: Dict[AIPriority, float] = {
+    AIPriority.INTERACTIVE: 1.0,
+    AIPriority.DIGEST: 1.0,
+    AIPriority.FRESH: 0.8,
+    AIPriority.BACKLOG: 0.5,
+}
+
+# Priority of AI requests made from the current task (None → FRESH)
+ai_priority_var: contextvars.ContextVar[Optional[AIPriority]] = contextvars.ContextVar(
+    'ai_priority', default=None
+)
+
+
+@contextmanager
+def ai_priority(priority: AIPriority):
+    """Run AI requests in this block with the given priority (never lowers an already higher one)."""
+    current = ai_priority_var.get()
+    token = ai_priority_var.set(priority if current is None else min(current, priority))
+    try:
+        yield
+    finally:
+        ai_priority_var.reset(token)
+
+
+def with_ai_priority(priority: AIPriority):
+    """Decorator form of ai_priority() for async functions."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with ai_priority(priority):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter with additive-increase / multiplicative-decrease control.
+
+    Waiting callers form a priority queue: when a slot frees up, the most
+    important queued request gets it, jumping ahead of lower-priority requests
+    queued earlier. Each class is capped at a share of the current limit.
+
+    - Every healthy call (fast enough, no overload error) adds 1/limit, so the
+      limit grows by one per "window" of successful calls.
+    - Overload signals (429, 5xx, timeouts) cut the limit by decrease_factor,
+      at most once per cooldown so a burst of errors counts as one event.
+    - Slow calls (latency above target) or a high recent error rate stop growth.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_target: float = 20.0,  # Seconds; slower calls stop growth
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 5.0,  # Seconds between multiplicative cuts
+        max_error_rate: float = 0.2,  # EWMA error rate above which growth stops
+        is_overload: Optional[Callable[[BaseException], bool]] = None,
+        class_shares: Optional[Dict[AIPriority, float]] = None,
+        name: str = "default"
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.max_error_rate = max_error_rate
+        self.is_overload = is_overload or (lambda e: isinstance(e, asyncio.TimeoutError))
+        self.class_shares = dict(class_shares or DEFAULT_CLASS_SHARES)
+        self.name = name
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._class_in_flight: Dict[AIPriority, int] = {p: 0 for p in AIPriority}
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._error_rate = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._last_decrease = 0.0
+        self._total_calls = 0
+        self._total_overloads = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers waiting for a slot."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def class_cap(self, priority: AIPriority) -> int:
+        """Maximum concurrent requests of one class at the current limit."""
+        return max(1, int(self.limit * self.class_shares.get(priority, 1.0)))
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued requests in priority order."""
+        skipped = []
+        while self._waiters and self._in_flight < self.limit:
+            priority, seq, fut = heapq.heappop(self._waiters)
+            if fut.done():  # Cancelled while queued
+                continue
+            priority = AIPriority(priority)
+            if self._class_in_flight[priority] >= self.class_cap(priority):
+                skipped.append((priority, seq, fut))
+                continue
+            self._in_flight += 1
+            self._class_in_flight[priority] += 1
+            fut.set_result(None)
+        for item in skipped:
+            heapq.heappush(self._waiters, item)
+
+    async def acquire(self, priority: Optional[AIPriority] = None) -> AIPriority:
+        """Wait for a slot; returns the priority class the slot was granted to."""
+        if priority is None:
+            current = ai_priority_var.get()
+            # INTERACTIVE is 0, so a plain `or` would demote it to FRESH
+            priority = current if current is not None else AIPriority.FRESH
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), fut))
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was granted just before cancellation - give it back
+                self.release(priority)
+            raise
+        return priority
+
+    def release(self, priority: AIPriority) -> None:
+        self._in_flight -= 1
+        self._class_in_flight[priority] -= 1
+        self._dispatch()
+
+    def on_success(self, latency: float) -> None:
+        """Feed a successful call into the controller."""
+        self._total_calls += 1
+        self._error_rate *= 0.9
+        self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+
+        if latency > self.latency_target or self._error_rate > self.max_error_rate:
+            return
+        if self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._dispatch()
+
+    def on_overload(self) -> None:
+        """Feed an overload signal (429/5xx/timeout) into the controller."""
+        self._total_calls += 1
+        self._total_overloads += 1
+        self._error_rate = 0.9 * self._error_rate + 0.1
+
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        logger.warning(f"Adaptive limiter '{self.name}' overload: limit {previous} → {self.limit}")
+
+    async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Execute function within a concurrency slot and adapt the limit to its outcome.
+
+        The request's priority class comes from ai_priority_var (see ai_priority()).
+        Errors that are not overload signals (bad request, parse errors) leave the
+        limit unchanged.
+        """
+        priority = await self.acquire()
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            if isinstance(e, Exception) and self.is_overload(e):
+                self.on_overload()
+            raise
+        else:
+            self.on_success(time.monotonic() - started)
+            return result
+        finally:
+            self.release(priority)
+
+    def get_stats(self) -> dict:
+        """Get limiter statistics."""
+        return {
+            'name': self.name,
+            'limit': self.limit,
+            'in_flight': self._in_flight,
+            'queue_depth': self.queue_depth,
+            'classes': {
+                p.name.lower(): {
+                    'in_flight': self._class_in_flight[p],
+                    'queued': sum(1 for prio, _, fut in self._waiters if prio == p and not fut.done()),
+                    'cap': self.class_cap(p),
+                }
+                for p in AIPriority
+            },
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'error_rate': round(self._error_rate, 3),
+            'latency_ewma_s': round(self._latency_ewma, 2) if self._latency_ewma is not None else None,
+            'latency_target_s': self.latency_target,
+            'total_calls': self._total_calls,
+            'total_overloads': self._total_overloads,
+        }
+
+
+def _is_ai_overload(exc: BaseException) -> bool:
+    """429, 5xx, timeouts and connection failures mean the AI service is saturated."""
+    import aiohttp
+    status_code = getattr(exc, 'status_code', None)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    return isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+# Shared limiter for all Gemini requests (summaries, categorization, digests, page analysis)
+ai_concurrency_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.ai_concurrency_initial,
+    min_limit=settings.ai_concurrency_min,
+    max_limit=settings.ai_concurrency_max,
+    latency_target=settings.ai_latency_target,
+    is_overload=_is_ai_overload,
+    name="ai_service"
+)
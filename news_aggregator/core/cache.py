@@ -5,6 +5,7 @@ import json
 import hashlib
 import time
 import asyncio
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Union
 import aiofiles
@@ -15,15 +16,51 @@ logger = logging.getLogger(__name__)
 
 
 class FileCache:
-    """File-based cache with TTL support and size limits."""
-
-    def __init__(self, cache_dir: Union[str, Path] = None, default_ttl: int = None):
+    """
+    File-based cache with TTL support and size limits.
+
+    Limits are enforced from an in-memory index of the files (size, oldest
+    write first), built with one stat-only directory scan on the first write
+    and kept up to date by this instance; writes never read other cache
+    files. Files other processes add to the directory are only counted
+    after the next scan (after clear()).
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = None, default_ttl: int = None,
+                 max_size_mb: Optional[float] = None, max_entries: Optional[int] = None):
         self.cache_dir = Path(cache_dir or settings.cache_dir)
         self.default_ttl = default_ttl or settings.cache_ttl
-        self.max_size_mb = settings.cache_max_size_mb
-        self.max_entries = settings.cache_max_entries
+        self.max_size_mb = max_size_mb or settings.cache_max_size_mb
+        self.max_entries = max_entries or settings.cache_max_entries
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = asyncio.Lock()
+        self._index: Optional["OrderedDict[Path, int]"] = None  # path -> size, oldest write first
+        self._index_bytes = 0
+
+    def _load_index(self) -> None:
+        """Build the file index from one directory scan (stat only)."""
+        entries = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, cache_file, stat.st_size))
+        entries.sort(key=lambda x: x[0])
+        self._index = OrderedDict((cache_file, size) for _, cache_file, size in entries)
+        self._index_bytes = sum(size for _, _, size in entries)
+
+    def _index_remove(self, cache_path: Path) -> None:
+        if self._index is not None:
+            self._index_bytes -= self._index.pop(cache_path, 0)
+
+    def _unlink(self, cache_path: Path) -> bool:
+        self._index_remove(cache_path)
+        try:
+            cache_path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
     
     def _get_cache_path(self, key: str) -> Path:
         """Get cache file path for key."""
@@ -45,83 +82,33 @@ class FileCache:
             # Check TTL
             if time.time() > data.get('expires_at', 0):
                 # Cache expired, remove file
-                try:
-                    cache_path.unlink()
-                except FileNotFoundError:
-                    pass
+                self._unlink(cache_path)
                 return None
             
             return data.get('value')
         
         except (json.JSONDecodeError, KeyError, FileNotFoundError):
             # Corrupted or missing cache file
-            try:
-                cache_path.unlink()
-            except FileNotFoundError:
-                pass
+            self._unlink(cache_path)
             return None
 
-    async def _check_and_enforce_limits(self) -> None:
-        """Check cache limits and remove old entries if needed."""
+    async def _check_and_enforce_limits(self, incoming_bytes: int = 0) -> None:
+        """Remove the oldest entries until one more entry of incoming_bytes fits the limits."""
         try:
-            stats = await self.get_stats()
-
-            # Check if we exceed the number of entries limit
-            if stats['total_files'] > self.max_entries:
-                # Remove oldest entries first
-                entries = []
-                for cache_file in self.cache_dir.glob("*.json"):
-                    try:
-                        stat = cache_file.stat()
-                        entries.append((cache_file, stat.st_mtime))
-                    except FileNotFoundError:
-                        continue
-
-                # Sort by modification time (oldest first)
-                entries.sort(key=lambda x: x[1])
-
-                # Remove oldest entries to get under limit
-                entries_to_remove = len(entries) - self.max_entries
-                for cache_file, _ in entries[:entries_to_remove]:
-                    try:
-                        cache_file.unlink()
-                    except FileNotFoundError:
-                        continue
-
-                logger.info(f"Cache limit enforced: removed {entries_to_remove} old entries")
-            # Check if we exceed the size limit
-            if stats['total_size_mb'] > self.max_size_mb:
-                # Clean expired entries first
-                await self.cleanup_expired()
-
-                # If still over limit, remove oldest entries
-                stats = await self.get_stats()
-                if stats['total_size_mb'] > self.max_size_mb:
-                    entries = []
-                    for cache_file in self.cache_dir.glob("*.json"):
-                        try:
-                            stat = cache_file.stat()
-                            entries.append((cache_file, stat.st_mtime, stat.st_size))
-                        except FileNotFoundError:
-                            continue
-
-                    # Sort by modification time (oldest first)
-                    entries.sort(key=lambda x: x[1])
-
-                    # Remove oldest entries until under size limit
-                    current_size = stats['total_size_bytes']
-                    for cache_file, _, file_size in entries:
-                        if current_size <= self.max_size_mb * 1024 * 1024:
-                            break
-                        try:
-                            cache_file.unlink()
-                            current_size -= file_size
-                        except FileNotFoundError:
-                            continue
-
-                    logger.info(f"Cache size limit enforced: removed entries to get under {self.max_size_mb}MB")
+            if self._index is None:
+                self._load_index()
+            max_bytes = self.max_size_mb * 1024 * 1024
+            removed = 0
+            while self._index and (len(self._index) >= self.max_entries
+                                   or self._index_bytes + incoming_bytes > max_bytes):
+                oldest = next(iter(self._index))
+                self._unlink(oldest)
+                removed += 1
+            if removed:
+                logger.info(f"Cache limit enforced: removed {removed} old entries")
         except Exception as e:
             logger.info(f"Warning: Failed to enforce cache limits: {e}")
+
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache with size and entry limits."""
         cache_path = self._get_cache_path(key)
@@ -134,17 +121,24 @@ class FileCache:
             'key': key  # For debugging
         }
 
+        payload = json.dumps(data, ensure_ascii=False, indent=2)
+        size = len(payload.encode('utf-8'))
+
         async with self._lock:
-            # Check and enforce limits before adding new entry
-            await self._check_and_enforce_limits()
+            # Check and enforce limits before adding new entry (an overwritten entry makes room)
+            self._index_remove(cache_path)
+            await self._check_and_enforce_limits(size)
 
             try:
                 # Write to temporary file first, then rename (atomic operation)
                 temp_path = cache_path.with_suffix('.tmp')
                 async with aiofiles.open(temp_path, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+                    await f.write(payload)
 
                 temp_path.rename(cache_path)
+                if self._index is not None:
+                    self._index[cache_path] = size
+                    self._index_bytes += size
             except Exception as e:
                 # Clean up temporary file if it exists
                 try:
@@ -155,12 +149,7 @@ class FileCache:
     
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
-        cache_path = self._get_cache_path(key)
-        try:
-            cache_path.unlink()
-            return True
-        except FileNotFoundError:
-            return False
+        return self._unlink(self._get_cache_path(key))
     
     async def clear(self) -> int:
         """Clear all cache files."""
@@ -171,6 +160,7 @@ class FileCache:
                 count += 1
             except FileNotFoundError:
                 pass
+        self._index = None  # Rebuilt on the next write
         return count
     
     async def cleanup_expired(self) -> int:
@@ -185,15 +175,12 @@ class FileCache:
                     data = json.loads(content)
                 
                 if current_time > data.get('expires_at', 0):
-                    cache_file.unlink()
-                    count += 1
+                    if self._unlink(cache_file):
+                        count += 1
             except (json.JSONDecodeError, KeyError, FileNotFoundError):
                 # Corrupted file, remove it
-                try:
-                    cache_file.unlink()
+                if self._unlink(cache_file):
                     count += 1
-                except FileNotFoundError:
-                    pass
         
         return count
     
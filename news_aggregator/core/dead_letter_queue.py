@@ -1,14 +1,14 @@
 import logging
 """Dead Letter Queue for failed article processing."""
 
-import json
-import time
 import asyncio
-from pathlib import Path
-from typing import Any, Optional, List, Dict
-from datetime import datetime
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Optional, List, Dict, Iterable, Tuple
 from enum import Enum
-import aiofiles
+
+from sqlalchemy import text
 
 from ..config import settings
 
@@ -25,39 +25,74 @@ class FailureReason(Enum):
     TIMEOUT = "timeout"
     UNKNOWN_ERROR = "unknown_error"
 
+    @classmethod
+    def from_exception(cls, error: BaseException) -> "FailureReason":
+        """Best-effort classification of a processing exception."""
+        from .circuit_breaker import CircuitBreakerError
+
+        if isinstance(error, CircuitBreakerError):
+            return cls.AI_SERVICE_UNAVAILABLE
+        if isinstance(error, asyncio.TimeoutError):
+            return cls.TIMEOUT
+        message = str(error).lower()
+        if '429' in message or 'rate limit' in message or 'quota' in message:
+            return cls.RATE_LIMITED
+        if 'timeout' in message or 'timed out' in message:
+            return cls.TIMEOUT
+        return cls.UNKNOWN_ERROR
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """An entry claimed for a retry."""
+    id: int
+    article_id: Optional[int]
+    reason: str
+    retry_count: int
+    max_retries: int
+    article_data: Dict[str, Any]
+
 
 class DeadLetterQueue:
     """
-    Dead Letter Queue for storing failed article processing attempts.
+    Dead Letter Queue for storing failed article processing attempts (table dead_letter_entries).
 
     Features:
-    - Persistent storage on disk
-    - Automatic retry with exponential backoff
-    - Max retry attempts to prevent infinite loops
-    - Categorization by failure reason
-    - Automatic cleanup of old entries
+    - One open entry per article; repeated failures update it
+    - Exponential backoff: next_retry_at is pushed out by backoff_seconds,
+      which doubles with every failed retry up to DLQ_RETRY_MAX_DELAY
+    - Due entries are claimed in batches with FOR UPDATE SKIP LOCKED over
+      the partial next_retry_at index; claims of a crashed worker expire
+    - Max retry attempts, after which the entry stays as 'failed'
+    - Cleanup of finished entries
+
+    Methods take an open session and are meant to run inside
+    DatabaseQueueManager operations.
     """
 
-    def __init__(self, queue_dir: Optional[str] = None, max_retries: int = 3):
+    def __init__(self, max_retries: Optional[int] = None, claim_timeout: int = 600):
         """
         Initialize Dead Letter Queue.
 
         Args:
-            queue_dir: Directory for queue storage (default: cache_dir/dlq)
             max_retries: Maximum retry attempts before permanent failure
+            claim_timeout: Seconds a claimed entry stays with its worker
         """
-        base_dir = Path(queue_dir or settings.cache_dir)
-        self.queue_dir = base_dir / "dlq"
-        self.queue_dir.mkdir(parents=True, exist_ok=True)
-        self.max_retries = max_retries
-        self._lock = asyncio.Lock()
+        self.max_retries = max_retries if max_retries is not None else settings.dlq_max_retries
+        self.base_delay = settings.dlq_retry_base_delay
+        self.max_delay = settings.dlq_retry_max_delay
+        self.claim_timeout = claim_timeout
 
-    def _get_queue_file(self, reason: FailureReason) -> Path:
-        """Get queue file path for failure reason."""
-        return self.queue_dir / f"{reason.value}.jsonl"
+    @staticmethod
+    def _get_entry_id(article_data: Dict[str, Any]) -> str:
+        """Generate unique ID for entry based on article data."""
+        # Use URL or ID as identifier
+        identifier = article_data.get('url') or article_data.get('id') or str(article_data)
+        return hashlib.md5(str(identifier).encode()).hexdigest()
 
     async def add(
         self,
+        db,
         article_data: Dict[str, Any],
         reason: FailureReason,
         error_message: str = "",
@@ -72,146 +107,130 @@ class DeadLetterQueue:
             error_message: Error message/description
             metadata: Additional metadata about the failure
         """
-        entry = {
-            "article_data": article_data,
-            "reason": reason.value,
-            "error_message": error_message,
-            "metadata": metadata or {},
-            "first_failed_at": time.time(),
-            "last_retry_at": None,
-            "retry_count": 0,
-            "created_at": datetime.utcnow().isoformat()
-        }
+        await self.add_many(db, [(article_data, reason, error_message, metadata)])
 
-        queue_file = self._get_queue_file(reason)
-
-        async with self._lock:
-            try:
-                async with aiofiles.open(queue_file, 'a', encoding='utf-8') as f:
-                    await f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-            except Exception as e:
-                logger.warning(f"  ⚠️ Failed to add to DLQ: {e}")
-    async def get_retryable_entries(
+    async def add_many(
         self,
-        reason: Optional[FailureReason] = None,
-        min_delay: float = 300.0  # 5 minutes default
-    ) -> List[Dict[str, Any]]:
-        """
-        Get entries ready for retry.
-
-        Args:
-            reason: Filter by failure reason (None = all reasons)
-            min_delay: Minimum seconds since last retry
-
-        Returns:
-            List of retryable entries with article data
-        """
-        now = time.time()
-        retryable = []
-
-        queue_files = (
-            [self._get_queue_file(reason)] if reason
-            else list(self.queue_dir.glob("*.jsonl"))
+        db,
+        failures: Iterable[Tuple[Dict[str, Any], FailureReason, str, Optional[Dict[str, Any]]]]
+    ) -> int:
+        """Add several failures in one statement; returns how many were given."""
+        params = [
+            {
+                'entry_key': self._get_entry_id(article_data),
+                'article_id': article_data.get('id'),
+                'reason': reason.value,
+                'error': (error_message or '')[:2000],
+                'article_data': json.dumps(article_data, ensure_ascii=False, default=str),
+                'details': json.dumps(metadata or {}, ensure_ascii=False, default=str),
+                'max_retries': self.max_retries,
+                'delay': self.base_delay,
+            }
+            for article_data, reason, error_message, metadata in failures
+        ]
+        if not params:
+            return 0
+        # An open entry keeps its retry schedule; only the latest error is recorded
+        await db.execute(
+            text("""
+                INSERT INTO dead_letter_entries (entry_key, article_id, reason, status, error_message,
+                                                 article_data, details, retry_count, max_retries,
+                                                 backoff_seconds, next_retry_at, first_failed_at,
+                                                 created_at, updated_at)
+                VALUES (:entry_key, :article_id, :reason, 'pending', :error,
+                        CAST(:article_data AS JSON), CAST(:details AS JSON), 0, :max_retries,
+                        :delay, now() + make_interval(secs => :delay), now(), now(), now())
+                ON CONFLICT (entry_key) WHERE status IN ('pending', 'claimed') DO UPDATE
+                SET reason = EXCLUDED.reason, error_message = EXCLUDED.error_message,
+                    details = EXCLUDED.details, updated_at = now()
+            """),
+            params
         )
+        return len(params)
+
+    async def claim_due(self, db, owner: str, limit: int,
+                        reason: Optional[FailureReason] = None) -> List[DeadLetter]:
+        """Claim up to limit entries whose next_retry_at has passed (earliest first)."""
+        # Claims of a crashed worker go back to the queue
+        await db.execute(text("""
+            UPDATE dead_letter_entries
+            SET status = 'pending', claimed_by = NULL, claim_expires_at = NULL, updated_at = now()
+            WHERE status = 'claimed' AND claim_expires_at < now()
+        """))
+        result = await db.execute(
+            text("""
+                WITH due AS (
+                    SELECT id FROM dead_letter_entries
+                    WHERE status = 'pending' AND next_retry_at <= now()
+                      AND (CAST(:reason AS VARCHAR) IS NULL OR reason = :reason)
+                    ORDER BY next_retry_at
+                    LIMIT :limit
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE dead_letter_entries AS e
+                SET status = 'claimed', claimed_by = :owner,
+                    claim_expires_at = now() + make_interval(secs => :timeout), updated_at = now()
+                FROM due
+                WHERE e.id = due.id
+                RETURNING e.id, e.article_id, e.reason, e.retry_count, e.max_retries, e.article_data
+            """),
+            {'owner': owner, 'limit': limit, 'timeout': float(self.claim_timeout),
+             'reason': reason.value if reason else None}
+        )
+        entries = []
+        for row in result:
+            article_data = row.article_data
+            if isinstance(article_data, str):
+                article_data = json.loads(article_data)
+            entries.append(DeadLetter(row.id, row.article_id, row.reason, row.retry_count,
+                                      row.max_retries, article_data or {}))
+        return entries
+
+    async def complete(self, db, owner: str, entry_ids: List[int]) -> int:
+        """Mark claimed entries as done (the article was processed)."""
+        if not entry_ids:
+            return 0
+        result = await db.execute(
+            text("""
+                UPDATE dead_letter_entries
+                SET status = 'done', claim_expires_at = NULL, last_retry_at = now(),
+                    finished_at = now(), updated_at = now()
+                WHERE id = ANY(CAST(:ids AS INTEGER[])) AND status = 'claimed' AND claimed_by = :owner
+            """),
+            {'ids': entry_ids, 'owner': owner}
+        )
+        return result.rowcount or 0
 
-        for queue_file in queue_files:
-            try:
-                async with aiofiles.open(queue_file, 'r', encoding='utf-8') as f:
-                    async for line in f:
-                        try:
-                            entry = json.loads(line.strip())
-
-                            # Check if max retries exceeded
-                            if entry.get('retry_count', 0) >= self.max_retries:
-                                continue
-
-                            # Check if enough time has passed since last retry
-                            last_retry = entry.get('last_retry_at') or entry.get('first_failed_at', 0)
-                            if now - last_retry < min_delay:
-                                continue
-
-                            retryable.append(entry)
-
-                        except (json.JSONDecodeError, KeyError):
-                            continue
-
-            except FileNotFoundError:
-                continue
-
-        return retryable
-
-    async def mark_retry(self, entry: Dict[str, Any]) -> None:
+    async def mark_retry(self, db, owner: str, entry: DeadLetter, error_message: str = "") -> bool:
         """
-        Mark entry as retried.
+        Record a failed retry: back off (doubled delay) or give up after max_retries.
 
         Args:
-            entry: Queue entry to mark
+            entry: Claimed entry whose retry failed
         """
-        entry['retry_count'] = entry.get('retry_count', 0) + 1
-        entry['last_retry_at'] = time.time()
-
-        # Remove from queue and re-add with updated count
-        reason = FailureReason(entry.get('reason', FailureReason.UNKNOWN_ERROR.value))
-        await self._remove_entry(entry, reason)
-
-        if entry['retry_count'] < self.max_retries:
-            # Re-add for future retry
-            await self.add(
-                entry['article_data'],
-                reason,
-                entry.get('error_message', ''),
-                entry.get('metadata', {})
-            )
-        else:
-            # Max retries reached - archive permanently failed
-            await self._archive_permanent_failure(entry)
-
-    async def _remove_entry(self, entry: Dict[str, Any], reason: FailureReason) -> bool:
-        """Remove entry from queue file."""
-        queue_file = self._get_queue_file(reason)
-        entry_id = self._get_entry_id(entry)
-
-        try:
-            # Read all entries
-            entries = []
-            async with aiofiles.open(queue_file, 'r', encoding='utf-8') as f:
-                async for line in f:
-                    try:
-                        entry_data = json.loads(line.strip())
-                        if self._get_entry_id(entry_data) != entry_id:
-                            entries.append(line.strip())
-                    except json.JSONDecodeError:
-                        entries.append(line.strip())
-
-            # Write back without the removed entry
-            async with aiofiles.open(queue_file, 'w', encoding='utf-8') as f:
-                for line in entries:
-                    await f.write(line + '\n')
-
-            return True
-
-        except FileNotFoundError:
-            return False
-
-    async def _archive_permanent_failure(self, entry: Dict[str, Any]) -> None:
-        """Archive permanently failed entries."""
-        archive_file = self.queue_dir / "permanent_failures.jsonl"
-
-        try:
-            async with aiofiles.open(archive_file, 'a', encoding='utf-8') as f:
-                await f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-        except Exception as e:
-            logger.warning(f"  ⚠️ Failed to archive permanent failure: {e}")
-    def _get_entry_id(self, entry: Dict[str, Any]) -> str:
-        """Generate unique ID for entry based on article data."""
-        article = entry.get('article_data', {})
-        # Use URL or ID as identifier
-        identifier = article.get('url') or article.get('id') or str(article)
-        import hashlib
-        return hashlib.md5(str(identifier).encode()).hexdigest()
+        final = entry.retry_count + 1 >= entry.max_retries
+        result = await db.execute(
+            text("""
+                UPDATE dead_letter_entries
+                SET status = :status, retry_count = retry_count + 1, last_retry_at = now(),
+                    error_message = COALESCE(NULLIF(:error, ''), error_message),
+                    backoff_seconds = LEAST(backoff_seconds * 2, :max_delay),
+                    next_retry_at = CASE WHEN :final THEN NULL
+                                         ELSE now() + make_interval(secs => LEAST(backoff_seconds * 2, :max_delay)) END,
+                    claim_expires_at = NULL, finished_at = CASE WHEN :final THEN now() END,
+                    updated_at = now()
+                WHERE id = :id AND status = 'claimed' AND claimed_by = :owner
+            """),
+            {'id': entry.id, 'owner': owner, 'status': 'failed' if final else 'pending',
+             'final': final, 'error': (error_message or '')[:2000], 'max_delay': self.max_delay}
+        )
+        if final and result.rowcount:
+            logger.warning(f"  ⚠️ DLQ entry {entry.id} (article {entry.article_id}) failed permanently "
+                           f"after {entry.retry_count + 1} retries")
+        return bool(result.rowcount)
 
-    async def get_stats(self) -> Dict[str, Any]:
-        """Get queue statistics."""
+    async def get_stats(self, db) -> Dict[str, Any]:
+        """Get queue statistics: depth by reason and status, due entries, oldest failure."""
         stats = {
             'total_entries': 0,
             'by_reason': {},
@@ -219,43 +238,39 @@ class DeadLetterQueue:
             'permanent_failures': 0
         }
 
-        for queue_file in self.queue_dir.glob("*.jsonl"):
-            if queue_file.name == "permanent_failures.jsonl":
-                continue
-
-            reason = queue_file.stem
-            count = 0
-
-            try:
-                async with aiofiles.open(queue_file, 'r', encoding='utf-8') as f:
-                    async for line in f:
-                        count += 1
-
-                stats['by_reason'][reason] = count
-                stats['total_entries'] += count
-
-            except FileNotFoundError:
-                pass
-
-        # Count permanent failures
-        permanent_file = self.queue_dir / "permanent_failures.jsonl"
-        if permanent_file.exists():
-            try:
-                async with aiofiles.open(permanent_file, 'r', encoding='utf-8') as f:
-                    async for line in f:
-                        stats['permanent_failures'] += 1
-            except FileNotFoundError:
-                pass
-
-        # Count retryable entries
-        retryable = await self.get_retryable_entries()
-        stats['ready_for_retry'] = len(retryable)
+        rows = await db.execute(text("""
+            SELECT reason, status, COUNT(*) AS n,
+                   COUNT(*) FILTER (WHERE status = 'pending' AND next_retry_at <= now()) AS due,
+                   MIN(first_failed_at) FILTER (WHERE status IN ('pending', 'claimed')) AS oldest,
+                   MIN(next_retry_at) FILTER (WHERE status = 'pending') AS next_retry
+            FROM dead_letter_entries
+            GROUP BY reason, status
+        """))
+        for row in rows:
+            reason = stats['by_reason'].setdefault(
+                row.reason, {'open': 0, 'due': 0, 'oldest_failure': None, 'next_retry_at': None}
+            )
+            reason[row.status] = row.n
+            reason['due'] += row.due or 0
+            if row.status in ('pending', 'claimed'):
+                reason['open'] += row.n
+                stats['total_entries'] += row.n
+            if row.status == 'failed':
+                stats['permanent_failures'] += row.n
+            if row.oldest and (reason['oldest_failure'] is None or row.oldest.isoformat() < reason['oldest_failure']):
+                reason['oldest_failure'] = row.oldest.isoformat()
+            if row.next_retry:
+                reason['next_retry_at'] = row.next_retry.isoformat()
+            stats['ready_for_retry'] += row.due or 0
 
         return stats
 
-    async def clear_old_entries(self, max_age_days: int = 7) -> int:
+    async def clear_old_entries(self, db, max_age_days: int = 7) -> int:
         """
-        Clear entries older than specified days.
+        Clear finished entries older than specified days.
+
+        Done entries go, and failed ones only once their article is gone: a
+        failed entry is what keeps its article out of the backlog readers.
 
         Args:
             max_age_days: Maximum age in days
@@ -263,38 +278,15 @@ class DeadLetterQueue:
         Returns:
             Number of entries removed
         """
-        now = time.time()
-        max_age_seconds = max_age_days * 24 * 3600
-        removed = 0
-
-        for queue_file in self.queue_dir.glob("*.jsonl"):
-            if queue_file.name == "permanent_failures.jsonl":
-                continue
-
-            try:
-                entries = []
-                async with aiofiles.open(queue_file, 'r', encoding='utf-8') as f:
-                    async for line in f:
-                        try:
-                            entry = json.loads(line.strip())
-                            first_failed = entry.get('first_failed_at', 0)
-
-                            if now - first_failed > max_age_seconds:
-                                removed += 1
-                            else:
-                                entries.append(line.strip())
-
-                        except json.JSONDecodeError:
-                            entries.append(line.strip())
-
-                # Write back filtered entries
-                async with aiofiles.open(queue_file, 'w', encoding='utf-8') as f:
-                    for line in entries:
-                        await f.write(line + '\n')
-
-            except FileNotFoundError:
-                continue
-
+        result = await db.execute(
+            text("""
+                DELETE FROM dead_letter_entries
+                WHERE (status = 'done' OR (status = 'failed' AND article_id IS NULL))
+                  AND finished_at < now() - make_interval(days => :days)
+            """),
+            {'days': max_age_days}
+        )
+        removed = result.rowcount or 0
         if removed > 0:
             logger.info(f"  🗑️ Cleared {removed} old entries from DLQ (older than {max_age_days} days)")
         return removed
@@ -0,0 +1,70 @@
+"""Deadline object for bounding the total time of multi-step operations."""
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    Absolute deadline shared by every step of a multi-step operation.
+
+    A single instance is created per unit of work (e.g. one article extraction)
+    and passed down through fetches, strategies, browser rendering and retries.
+    Each step caps its own timeout by the remaining budget and skips expensive
+    work the budget can no longer afford.
+    """
+
+    def __init__(self, budget_seconds: float):
+        """
+        Initialize deadline.
+
+        Args:
+            budget_seconds: Total time budget starting from now
+        """
+        self.budget = max(0.0, float(budget_seconds))
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + self.budget
+
+    @classmethod
+    def from_ms(cls, budget_ms: int) -> "Deadline":
+        """Create a deadline from a budget in milliseconds."""
+        return cls(budget_ms / 1000)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def remaining_ms(self) -> int:
+        """Milliseconds left before the deadline (never negative)."""
+        return int(self.remaining() * 1000)
+
+    def elapsed(self) -> float:
+        """Seconds spent since the deadline was created."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is exhausted."""
+        return self.remaining() <= 0
+
+    def can_afford(self, cost_ms: int) -> bool:
+        """Whether at least ``cost_ms`` milliseconds of budget remain."""
+        return self.remaining_ms() >= cost_ms
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """
+        Cap a step timeout (seconds) by the remaining budget.
+
+        Args:
+            timeout: Step's own timeout in seconds, or None for "no own limit"
+
+        Returns:
+            The smaller of the step timeout and the remaining budget
+        """
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget:.1f}s, remaining={self.remaining():.1f}s)"
@@ -35,6 +35,14 @@ class APIError(NewsAggregatorError):
         self.response_text = response_text
 
 
+class GenerationAbortedError(ProcessingError):
+    """Streaming AI generation stopped early because the partial output failed validation."""
+    
+    def __init__(self, message: str, partial_text: str = ""):
+        super().__init__(message)
+        self.partial_text = partial_text
+
+
 class CacheError(NewsAggregatorError):
     """Cache related errors."""
     pass
@@ -0,0 +1,156 @@
+"""Hedged requests: a budgeted duplicate for calls slower than the recent p95."""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from ..config import settings
+from .adaptive_limiter import AdaptiveConcurrencyLimiter, ai_concurrency_limiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RequestHedger:
+    """
+    Sends a second copy of a request that has not answered by the hedge delay.
+
+    The delay is a percentile (p95 by default) of recent successful latencies,
+    measured from the moment the request got a limiter slot. Whichever copy
+    succeeds first wins and the other is cancelled; a copy that fails does
+    not win while the other is still running.
+
+    Hedges are paid for from a token budget: every primary request earns
+    budget_ratio tokens and a hedge costs one, so hedges stay at or below
+    budget_ratio extra requests. A hedge is only sent while the adaptive
+    limiter has a free slot and nobody is queued, so it never takes capacity
+    from queued work or exceeds the limit the controller has settled on.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        enabled: bool = True,
+        budget_ratio: float = 0.05,
+        percentile: float = 0.95,
+        min_delay: float = 2.0,  # Seconds; never hedge sooner than this
+        min_samples: int = 20,
+        window: int = 200,
+        max_tokens: float = 10.0,
+        name: str = "default"
+    ):
+        self.limiter = limiter
+        self.enabled = enabled
+        self.budget_ratio = budget_ratio
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_tokens = max_tokens
+        self.name = name
+
+        self._latencies: deque = deque(maxlen=window)
+        self._tokens = 0.0
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'skipped_budget': 0, 'skipped_capacity': 0}
+
+    def observe(self, latency: float) -> None:
+        """Record the latency of a successful request (excluding queue wait)."""
+        self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little history."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay, ordered[index])
+
+    def _can_hedge(self) -> bool:
+        if self._tokens < 1.0:
+            self._stats['skipped_budget'] += 1
+            return False
+        limiter_stats = self.limiter.get_stats()
+        if limiter_stats['in_flight'] >= limiter_stats['limit'] or limiter_stats['queue_depth'] > 0:
+            self._stats['skipped_capacity'] += 1
+            return False
+        self._tokens -= 1.0
+        return True
+
+    async def run(self, attempt: Callable[[asyncio.Event], Awaitable[T]]) -> T:
+        """
+        Run attempt, hedging it once if it is slow.
+
+        Args:
+            attempt: Coroutine factory for one full request (including its limiter
+                slot); it must set the given event once the request is under way
+        """
+        self._stats['requests'] += 1
+        self._tokens = min(self.max_tokens, self._tokens + self.budget_ratio)
+        delay = self.hedge_delay()
+        if not self.enabled or delay is None:
+            return await attempt(asyncio.Event())
+
+        primary_started = asyncio.Event()
+        primary = asyncio.ensure_future(attempt(primary_started))
+        try:
+            # The hedge clock starts when the primary leaves the limiter queue
+            waiter = asyncio.ensure_future(primary_started.wait())
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            if primary.done():
+                return primary.result()
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._can_hedge():
+                return await primary
+
+            self._stats['hedged'] += 1
+            logger.info(f"  🪞 Hedging slow request after {delay:.1f}s ({self.name})")
+            hedge = asyncio.ensure_future(attempt(asyncio.Event()))
+            return await self._first_success(primary, hedge)
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    async def _first_success(self, primary: asyncio.Future, hedge: asyncio.Future):
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._stats['hedge_wins'] += 1
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> dict:
+        """Get hedging statistics."""
+        delay = self.hedge_delay()
+        requests = self._stats['requests']
+        return {
+            'name': self.name,
+            'enabled': self.enabled,
+            **self._stats,
+            'hedge_rate': round(self._stats['hedged'] / requests, 4) if requests else 0.0,
+            'budget_ratio': self.budget_ratio,
+            'budget_tokens': round(self._tokens, 2),
+            'hedge_delay_s': round(delay, 2) if delay is not None else None,
+            'samples': len(self._latencies),
+        }
+
+
+# Hedger for single-article combined analysis requests (AIClient._call_ai_service)
+ai_request_hedger = RequestHedger(
+    ai_concurrency_limiter,
+    enabled=settings.ai_hedging_enabled,
+    budget_ratio=settings.ai_hedge_budget,
+    min_delay=settings.ai_hedge_min_delay,
+    name="ai_service"
+)
@@ -25,34 +25,43 @@ class RateLimiter:
 
     async def acquire(self):
         """Acquire permission to make a call."""
-        async with self.lock:
-            now = time.time()
-            # Remove old calls outside the time window
-            while self.calls and now - self.calls[0] >= self.time_window:
-                self.calls.popleft()
-
-            if len(self.calls) >= self.max_calls:
-                # Wait until we can make another call
-                sleep_time = self.time_window - (now - self.calls[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    return await self.acquire()
+        while True:
+            async with self.lock:
+                now = time.time()
+                # Remove old calls outside the time window
+                while self.calls and now - self.calls[0] >= self.time_window:
+                    self.calls.popleft()
 
-            self.calls.append(now)
+                if len(self.calls) < self.max_calls:
+                    self.calls.append(now)
+                    return
+                # Wait until we can make another call (outside the lock - it is not reentrant)
+                sleep_time = self.time_window - (now - self.calls[0])
+            await asyncio.sleep(max(sleep_time, 0.001))
 
 
 class AsyncHTTPClient:
     """Async HTTP client with rate limiting and connection pooling."""
     
-    def __init__(self):
+    def __init__(self, limit: int = 20, limit_per_host: int = 5, rate_limit: Optional[int] = None,
+                 rate_limited: bool = True):
+        """
+        Args:
+            limit: Total connection pool size
+            limit_per_host: Connections per host
+            rate_limit: POST requests per second (default: API_RATE_LIMIT)
+            rate_limited: False to leave rate limiting of POSTs to the caller
+        """
         self.session: Optional[aiohttp.ClientSession] = None
-        self.rate_limiter = RateLimiter(max_calls=settings.api_rate_limit, time_window=1.0)
+        self.rate_limiter = RateLimiter(
+            max_calls=rate_limit or settings.api_rate_limit, time_window=1.0
+        ) if rate_limited else None
         
         # Connection configuration  
         self.timeout = ClientTimeout(total=60, connect=15, sock_read=30)
         self.connector = aiohttp.TCPConnector(
-            limit=20,  # Total connection pool size
-            limit_per_host=5,  # Connections per host
+            limit=limit,  # Total connection pool size
+            limit_per_host=limit_per_host,  # Connections per host
             ttl_dns_cache=300,  # DNS cache TTL
             use_dns_cache=True,
             # SSL verification enabled by default; disable per-request only when necessary
@@ -110,7 +119,8 @@ class AsyncHTTPClient:
             await self.start()
         
         # Apply rate limiting for POST requests (usually API calls)
-        await self.rate_limiter.acquire()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
         
         return await self.session.post(url, data=data, json=json, headers=headers, **kwargs)
     
@@ -146,3 +156,27 @@ async def get_http_client():
     finally:
         # Don't close here - let it be reused
         pass
+
+
+# Gemini requests: a pool sized to the adaptive limiter's maximum, so the
+# limiter alone decides concurrency. Callers apply ai_rate_limiter themselves,
+# before timing the request, so waiting for a rate slot doesn't count as latency.
+ai_http_client = None
+ai_rate_limiter = RateLimiter(max_calls=settings.api_rate_limit, time_window=1.0)
+
+
+@asynccontextmanager
+async def get_ai_http_client():
+    """Get the AI service HTTP client context manager."""
+    global ai_http_client
+
+    if ai_http_client is None:
+        ai_http_client = AsyncHTTPClient(
+            limit=settings.ai_concurrency_max,
+            limit_per_host=settings.ai_concurrency_max,
+            rate_limited=False
+        )
+
+    if not ai_http_client.session or ai_http_client.session.closed:
+        await ai_http_client.start()
+    yield ai_http_client
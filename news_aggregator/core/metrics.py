@@ -0,0 +1,194 @@
+"""Per-stage pipeline instrumentation: counts, latency histograms, in-flight and queue depth."""
+
+import bisect
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Histogram bucket upper bounds in seconds (last bucket is +Inf)
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class StageStats:
+    """Counters and latency distribution of one pipeline stage."""
+
+    def __init__(self, window: int = 2000):
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_time = 0.0
+        self.max_latency = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.queue_depth: Optional[int] = None
+        self.max_queue_depth = 0
+        # Recent latencies for percentiles (bounded)
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def enter(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def observe(self, duration: float, ok: bool = True) -> None:
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total_time += duration
+        self.max_latency = max(self.max_latency, duration)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self._recent.append(duration)
+
+    def set_queue_depth(self, depth: int) -> None:
+        self.queue_depth = depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self._recent)
+
+        def pick(q: float) -> Optional[float]:
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4) if ordered else None
+
+        histogram = {f"le_{bound:g}": n for bound, n in zip(LATENCY_BUCKETS, self.buckets)}
+        histogram['le_inf'] = self.buckets[-1]
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'total_seconds': round(self.total_time, 3),
+            'avg': round(self.total_time / self.count, 4) if self.count else None,
+            'p50': pick(0.50),
+            'p95': pick(0.95),
+            'p99': pick(0.99),
+            'max': round(self.max_latency, 4),
+            'histogram': histogram,
+        }
+
+
+class PipelineMetrics:
+    """
+    Registry of stage statistics, kept for two scopes.
+
+    'lifetime' covers everything since process start (percentiles over the
+    most recent `window` samples per stage); 'cycle' is reset by
+    begin_cycle() and returned by end_cycle() so each processing cycle can be
+    persisted on its own. Stage names are dotted, e.g. 'fetch.rss',
+    'extract.readability', 'ai.summary'.
+    """
+
+    def __init__(self, window: int = 2000):
+        self.window = window
+        self.stages: Dict[str, StageStats] = {}
+        self.cycle_stages: Dict[str, StageStats] = {}
+        self.cycle_started_at: Optional[float] = None
+        self.last_cycle: Optional[Dict[str, Any]] = None
+
+    def _stats(self, stage: str) -> List[StageStats]:
+        lifetime = self.stages.get(stage)
+        if lifetime is None:
+            lifetime = self.stages[stage] = StageStats(self.window)
+        cycle = self.cycle_stages.get(stage)
+        if cycle is None:
+            cycle = self.cycle_stages[stage] = StageStats(self.window)
+        return [lifetime, cycle]
+
+    def observe(self, stage: str, duration: float, ok: bool = True) -> None:
+        """Record one completed operation of a stage."""
+        for stats in self._stats(stage):
+            stats.observe(duration, ok)
+
+    def set_queue_depth(self, stage: str, depth: int) -> None:
+        """Record the current depth of the queue feeding a stage."""
+        for stats in self._stats(stage):
+            stats.set_queue_depth(depth)
+
+    @asynccontextmanager
+    async def track(self, stage: str):
+        """Time the enclosed block as one operation; exceptions count as errors."""
+        stats = self._stats(stage)
+        for s in stats:
+            s.enter()
+        started = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            duration = time.monotonic() - started
+            for s in stats:
+                s.leave()
+                s.observe(duration, ok)
+
+    def timed(self, stage: str, falsy_is_error: bool = False) -> Callable:
+        """
+        Decorator form of track() for async functions.
+
+        With falsy_is_error, a False/None return (for services that report
+        failure by return value) is counted as an error too.
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                stats = self._stats(stage)
+                for s in stats:
+                    s.enter()
+                started = time.monotonic()
+                ok = False
+                try:
+                    result = await func(*args, **kwargs)
+                    ok = bool(result) or not falsy_is_error
+                    return result
+                finally:
+                    duration = time.monotonic() - started
+                    for s in stats:
+                        s.leave()
+                        s.observe(duration, ok)
+            return wrapper
+        return decorator
+
+    def begin_cycle(self) -> None:
+        """Start a new cycle scope (operations already in flight finish in the previous one)."""
+        self.cycle_stages = {}
+        self.cycle_started_at = time.time()
+
+    def end_cycle(self) -> Dict[str, Any]:
+        """Close the cycle scope and return its snapshot."""
+        self.last_cycle = {
+            'started_at': self.cycle_started_at,
+            'finished_at': time.time(),
+            'stages': self._snapshot(self.cycle_stages),
+        }
+        return self.last_cycle
+
+    @staticmethod
+    def _snapshot(stages: Dict[str, StageStats]) -> Dict[str, Any]:
+        return {name: stats.snapshot() for name, stats in sorted(stages.items())}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Live view: lifetime stages, current cycle stages and the last finished cycle."""
+        return {
+            'buckets': list(LATENCY_BUCKETS),
+            'lifetime': self._snapshot(self.stages),
+            'current_cycle': {
+                'started_at': self.cycle_started_at,
+                'stages': self._snapshot(self.cycle_stages),
+            },
+            'last_cycle': self.last_cycle,
+        }
+
+    def reset(self) -> None:
+        self.stages = {}
+        self.cycle_stages = {}
+        self.cycle_started_at = None
+        self.last_cycle = None
+
+
+# Global instance
+pipeline_metrics = PipelineMetrics()
@@ -0,0 +1,142 @@
+"""Compiled text rules: classify a text against many literal and regex rules in one pass."""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Constructs that change meaning or fail once a pattern is one alternative of a
+# bigger one: backreferences (group numbers shift), named groups (names clash)
+# and global inline flags (only allowed at the very start of a pattern)
+_STANDALONE_RE = re.compile(r'\\[1-9]|\\g<|\(\?P=|\(\?P?<(?![=!])|\(\?[aiLmsux]+\)')
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One text rule. Literals match case-insensitively as substrings; regexes with re.IGNORECASE."""
+    rule_id: str
+    rule_set: str
+    pattern: str
+    is_regex: bool = False
+
+
+class CompiledRules:
+    """
+    A group of rules compiled into two scanners.
+
+    Literals become one alternation, longest first, inside a zero-width
+    lookahead: a single finditer() over the lowercased text reports the
+    longest literal starting at every position, and each literal carries
+    the ids of all literals that are its prefixes (the only other literals
+    that can match at the same position), so every matching literal rule is
+    found. Regexes become one pattern of alternatives; a text none of them
+    matches is rejected by a single search(), and only texts that do match
+    are checked rule by rule for the complete list. Regexes that cannot be
+    embedded in that pattern (backreferences, named groups, global inline
+    flags) are always checked on their own, as are all regexes if the
+    combined pattern fails to compile. Problems are listed in errors.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: Dict[str, Rule] = {}
+        self.errors: List[str] = []
+        literal_ids: Dict[str, Set[str]] = {}
+        regex_rules: List[Tuple[Rule, Pattern]] = []
+        for rule in rules:
+            if rule.is_regex:
+                try:
+                    regex_rules.append((rule, re.compile(rule.pattern, re.IGNORECASE)))
+                except re.error as e:
+                    self.errors.append(f"Invalid regex in rule {rule.rule_id}: {e}")
+                    logger.warning(f"⚠️ Skipping invalid regex rule {rule.rule_id}: {e}")
+                    continue
+            else:
+                literal = rule.pattern.lower()
+                if not literal:
+                    continue
+                literal_ids.setdefault(literal, set()).add(rule.rule_id)
+            self.rules[rule.rule_id] = rule
+
+        self._literal_scan: Optional[Pattern] = None
+        self._literal_hits: Dict[str, Set[str]] = {}
+        if literal_ids:
+            literals = sorted(literal_ids, key=len, reverse=True)
+            self._literal_scan = re.compile('(?=(' + '|'.join(re.escape(lit) for lit in literals) + '))')
+            for literal in literals:
+                hits: Set[str] = set()
+                for other, ids in literal_ids.items():
+                    if literal.startswith(other):
+                        hits |= ids
+                self._literal_hits[literal] = hits
+
+        self._regex_rules = [(r, c) for r, c in regex_rules if not _STANDALONE_RE.search(r.pattern)]
+        self._standalone_rules = [(r, c) for r, c in regex_rules if _STANDALONE_RE.search(r.pattern)]
+        self._regex_scan: Optional[Pattern] = None
+        if self._regex_rules:
+            try:
+                self._regex_scan = re.compile(
+                    '|'.join(f'(?:{rule.pattern})' for rule, _ in self._regex_rules), re.IGNORECASE
+                )
+            except re.error as e:
+                self.errors.append(f"Regex rules cannot be combined: {e}")
+                logger.warning(f"⚠️ Regex rules cannot be combined, checking them one by one: {e}")
+                self._standalone_rules += self._regex_rules
+                self._regex_rules = []
+
+    def match(self, text: str) -> Set[str]:
+        """Ids of all rules matching the text."""
+        if not text:
+            return set()
+        matched: Set[str] = set()
+        if self._literal_scan is not None:
+            for m in self._literal_scan.finditer(text.lower()):
+                matched |= self._literal_hits[m.group(1)]
+        if self._regex_scan is not None and self._regex_scan.search(text):
+            matched.update(rule.rule_id for rule, compiled in self._regex_rules if compiled.search(text))
+        matched.update(rule.rule_id for rule, compiled in self._standalone_rules if compiled.search(text))
+        return matched
+
+
+class RuleEngine:
+    """
+    Rules grouped into named rule sets, compiled lazily per requested combination.
+
+    classify(text, 'spam', 'navigation') scans the text once for both sets.
+    replace_rules() swaps the whole rule list (e.g. after reloading from the
+    database); compiled scanners are rebuilt on next use.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = ()):
+        self.rules: List[Rule] = list(rules)
+        self._compiled: Dict[Tuple[str, ...], CompiledRules] = {}
+
+    def replace_rules(self, rules: Iterable[Rule]) -> None:
+        self.rules = list(rules)
+        self._compiled = {}
+
+    def rule_sets(self) -> Dict[str, int]:
+        """Rule count per rule set."""
+        counts: Dict[str, int] = {}
+        for rule in self.rules:
+            counts[rule.rule_set] = counts.get(rule.rule_set, 0) + 1
+        return counts
+
+    def _compile(self, rule_sets: Tuple[str, ...]) -> CompiledRules:
+        key = tuple(sorted(set(rule_sets)))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = CompiledRules(r for r in self.rules if r.rule_set in key)
+        return compiled
+
+    def classify(self, text: str, *rule_sets: str) -> Dict[str, List[str]]:
+        """Matched rule ids by rule set (sets without a match are left out)."""
+        compiled = self._compile(rule_sets)
+        result: Dict[str, List[str]] = {}
+        for rule_id in sorted(compiled.match(text)):
+            result.setdefault(compiled.rules[rule_id].rule_set, []).append(rule_id)
+        return result
+
+    def matches(self, text: str, rule_set: str) -> bool:
+        return bool(self._compile((rule_set,)).match(text))
@@ -0,0 +1 @@
+"""Development and benchmarking tools (Gemini mock server, synthetic sources)."""
@@ -0,0 +1,294 @@
+"""Local stand-in for the Gemini generateContent API (load tests, CI benchmarks).
+
+Point GEMINI_API_ENDPOINT at http://<host>:<port>/v1/models and the AIClient
+talks to this server instead of Google. Responses come from recordings made
+with AI_RECORD_DIR when the request fingerprint matches, otherwise they are
+synthesized from the request's response schema.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from ..services.gemini_recorder import request_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_ARTICLE_ID_RE = re.compile(r'\[ARTICLE ID (\d+)\]')
+
+
+@dataclass
+class LatencyModel:
+    """
+    Response latency distribution in milliseconds.
+
+    kind is 'fixed' (a), 'uniform' (a..b) or 'lognormal' (median a, sigma b).
+    """
+    kind: str = 'lognormal'
+    a: float = 800.0
+    b: float = 0.5
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyModel':
+        """Parse 'fixed:300', 'uniform:200:1500' or 'lognormal:800:0.5'."""
+        parts = spec.split(':')
+        kind = parts[0]
+        if kind not in ('fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        values = [float(p) for p in parts[1:]]
+        defaults = {'fixed': [300.0, 0.0], 'uniform': [200.0, 1500.0], 'lognormal': [800.0, 0.5]}[kind]
+        values += defaults[len(values):]
+        return cls(kind, values[0], values[1])
+
+    def sample(self, rng: random.Random) -> float:
+        """Latency in seconds."""
+        if self.kind == 'fixed':
+            ms = self.a
+        elif self.kind == 'uniform':
+            ms = rng.uniform(self.a, self.b)
+        else:
+            ms = rng.lognormvariate(0.0, self.b) * self.a
+        return max(0.0, ms) / 1000
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock server."""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_429_rate: float = 0.0
+    error_5xx_rate: float = 0.0
+    replay_dirs: List[str] = field(default_factory=list)
+    replay_latency: bool = False  # Use recorded latencies for replayed responses
+    stream_chunk_chars: int = 80
+    seed: Optional[int] = None
+
+
+class GeminiMockServer:
+    """aiohttp application emulating the Gemini endpoints the AIClient uses."""
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.rng = random.Random(self.config.seed)
+        self.recordings: Dict[str, Dict[str, Any]] = {}
+        self.stats = {'requests': 0, 'replayed': 0, 'synthesized': 0, 'errors_429': 0, 'errors_5xx': 0}
+        self._cached_texts: Dict[str, str] = {}  # cachedContents name -> system instruction
+        for directory in self.config.replay_dirs:
+            self.load_recordings(directory)
+
+    def load_recordings(self, directory: str) -> int:
+        """Load *.jsonl recordings; later entries win for duplicate fingerprints."""
+        loaded = 0
+        for path in sorted(Path(directory).glob('*.jsonl')):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if entry.get('key') and entry.get('status', 200) == 200 and entry.get('response'):
+                        self.recordings[entry['key']] = entry
+                        loaded += 1
+        logger.info(f"  📼 Loaded {loaded} recorded Gemini responses from {directory}")
+        return loaded
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=32 * 1024 ** 2)
+        app.router.add_post('/{version}/models/{model_action}', self.handle_model_action)
+        app.router.add_post('/{version}/cachedContents', self.handle_cached_contents)
+        app.router.add_get('/mock/stats', self.handle_stats)
+        return app
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, 'recordings': len(self.recordings)})
+
+    async def handle_cached_contents(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        name = f"cachedContents/mock-{len(self._cached_texts) + 1}"
+        self._cached_texts[name] = ''.join(
+            part.get('text') or '' for part in (body.get('systemInstruction') or {}).get('parts') or []
+        )
+        return web.json_response({
+            'name': name,
+            'model': body.get('model'),
+            'ttl': body.get('ttl'),
+        })
+
+    async def handle_model_action(self, request: web.Request) -> web.StreamResponse:
+        model, _, action = request.match_info['model_action'].partition(':')
+        if action not in ('generateContent', 'streamGenerateContent'):
+            raise web.HTTPNotFound()
+        payload = await request.json()
+        self.stats['requests'] += 1
+
+        cached_prefix = self._cached_texts.get(payload.get('cachedContent') or '')
+        recorded = self.recordings.get(request_fingerprint(model, payload, cached_prefix))
+        if recorded and self.config.replay_latency:
+            delay = recorded.get('latency_ms', 0) / 1000
+        else:
+            delay = self.config.latency.sample(self.rng)
+
+        roll = self.rng.random()
+        if roll < self.config.error_429_rate:
+            self.stats['errors_429'] += 1
+            await asyncio.sleep(delay / 4)
+            return web.json_response(
+                {'error': {'code': 429, 'message': 'Resource has been exhausted (mock)', 'status': 'RESOURCE_EXHAUSTED'}},
+                status=429
+            )
+        if roll < self.config.error_429_rate + self.config.error_5xx_rate:
+            self.stats['errors_5xx'] += 1
+            await asyncio.sleep(delay)
+            status = self.rng.choice([500, 503])
+            return web.json_response(
+                {'error': {'code': status, 'message': 'Backend error (mock)', 'status': 'UNAVAILABLE'}},
+                status=status
+            )
+
+        if recorded:
+            self.stats['replayed'] += 1
+            response = recorded['response']
+        else:
+            self.stats['synthesized'] += 1
+            response = self.synthesize(model, payload)
+
+        if action == 'streamGenerateContent':
+            return await self._stream(request, response, delay)
+        await asyncio.sleep(delay)
+        return web.json_response(response)
+
+    async def _stream(self, request: web.Request, response: Dict[str, Any], delay: float) -> web.StreamResponse:
+        """Send the response as SSE chunks; the latency is spread over the chunks."""
+        text = _response_text(response)
+        size = max(1, self.config.stream_chunk_chars)
+        chunks = [text[i:i + size] for i in range(0, len(text), size)] or ['']
+        stream = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+        await stream.prepare(request)
+        for i, chunk in enumerate(chunks):
+            await asyncio.sleep(delay / len(chunks))
+            event = {'candidates': [{'content': {'role': 'model', 'parts': [{'text': chunk}]}}]}
+            if i == len(chunks) - 1:
+                event['candidates'][0]['finishReason'] = 'STOP'
+                event['usageMetadata'] = response.get('usageMetadata') or {}
+            await stream.write(f"data: {json.dumps(event, ensure_ascii=False)}\r\n\r\n".encode('utf-8'))
+        await stream.write_eof()
+        return stream
+
+    def synthesize(self, model: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a plausible response: schema-conforming JSON or Russian free text."""
+        prompt = ''.join(
+            part.get('text') or ''
+            for message in payload.get('contents') or []
+            for part in message.get('parts') or []
+        )
+        seed = int(hashlib.md5(prompt.encode('utf-8')).hexdigest()[:8], 16)
+        generation_config = payload.get('generationConfig') or {}
+        schema = generation_config.get('responseJsonSchema')
+        if schema:
+            text = json.dumps(_from_schema(schema, prompt, seed), ensure_ascii=False)
+        else:
+            max_chars = int(generation_config.get('maxOutputTokens', 1000)) * 3
+            text = _synthetic_text(seed, max_chars=min(max_chars, 900))
+
+        prompt_tokens = len(prompt) // 3 + 1
+        cached_tokens = 2000 if payload.get('cachedContent') else 0
+        return {
+            'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}, 'finishReason': 'STOP'}],
+            'usageMetadata': {
+                'promptTokenCount': prompt_tokens + cached_tokens,
+                'candidatesTokenCount': len(text) // 3 + 1,
+                'cachedContentTokenCount': cached_tokens,
+                'totalTokenCount': prompt_tokens + cached_tokens + len(text) // 3 + 1,
+            },
+            'modelVersion': f"{model}-mock",
+        }
+
+
+_SENTENCES = [
+    "Власти объявили о новых мерах поддержки малого бизнеса.",
+    "Эксперты ожидают, что решение повлияет на рынок уже в следующем квартале.",
+    "Компания представила обновлённую версию своего сервиса.",
+    "Исследователи опубликовали результаты масштабного эксперимента.",
+    "В Белграде прошла конференция, посвящённая развитию технологий.",
+    "Аналитики отмечают рост интереса инвесторов к отрасли.",
+    "Представители ведомства пообещали раскрыть подробности позже.",
+    "Новые правила вступят в силу с начала следующего месяца.",
+]
+
+
+def _synthetic_text(seed: int, max_chars: int = 600) -> str:
+    rng = random.Random(seed)
+    parts: List[str] = []
+    while len(' '.join(parts)) < max_chars * 0.6:
+        parts.append(rng.choice(_SENTENCES))
+    return ' '.join(parts)[:max_chars]
+
+
+def _from_schema(schema: Dict[str, Any], prompt: str, seed: int, name: str = '') -> Any:
+    """Generate a value matching the JSON schema (the subset the AIClient uses)."""
+    schema_type = schema.get('type')
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != 'null'), 'null')
+
+    if schema_type == 'object':
+        return {
+            key: _from_schema(sub_schema, prompt, seed, key)
+            for key, sub_schema in (schema.get('properties') or {}).items()
+        }
+    if schema_type == 'array':
+        items = schema.get('items') or {}
+        if 'id' in (items.get('properties') or {}):
+            # Batch requests: one result per article block in the prompt
+            ids = [int(i) for i in _ARTICLE_ID_RE.findall(prompt)] or [1]
+            results = []
+            for article_id in ids:
+                item = _from_schema(items, prompt, seed + article_id)
+                item['id'] = article_id
+                results.append(item)
+            return results
+        return [_from_schema(items, prompt, seed, name)]
+    if schema_type == 'string':
+        if name in ('summary', 'ad_reasoning'):
+            return _synthetic_text(seed, max_chars=300)
+        if name == 'optimized_title':
+            return _synthetic_text(seed, max_chars=80).rstrip('.')
+        if name in ('categories', 'original_categories', 'category'):
+            return 'Other'
+        if name == 'ad_type':
+            return 'news_article'
+        if name == 'publication_date':
+            return None
+        return ''
+    if schema_type == 'number':
+        return 0.1 if name == 'ad_confidence' else 0.85
+    if schema_type == 'integer':
+        return 1
+    if schema_type == 'boolean':
+        return False
+    return None
+
+
+def _response_text(response: Dict[str, Any]) -> str:
+    candidates = response.get('candidates') or []
+    parts = ((candidates[0].get('content') or {}).get('parts') or []) if candidates else []
+    return ''.join(part.get('text') or '' for part in parts)
+
+
+def run_mock_server(host: str = '127.0.0.1', port: int = 8089, config: Optional[MockConfig] = None,
+                    synthetic_feeds: int = 0, items_per_feed: int = 20) -> None:
+    """Run the mock server (blocking), optionally serving synthetic RSS sources too."""
+    server = GeminiMockServer(config)
+    app = server.create_app()
+    if synthetic_feeds:
+        from .synthetic_sources import add_synthetic_source_routes
+        add_synthetic_source_routes(app, feeds=synthetic_feeds, items_per_feed=items_per_feed,
+                                    seed=server.config.seed or 0)
+    logger.info(f"🧪 Gemini mock listening on http://{host}:{port}/v1/models")
+    web.run_app(app, host=host, port=port, print=None)
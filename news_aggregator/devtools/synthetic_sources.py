@@ -0,0 +1,79 @@
+"""Synthetic RSS feeds and article pages for offline pipeline benchmarks."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+from .gemini_mock import _SENTENCES
+
+
+def _article_text(feed: int, item: int, seed: int) -> List[str]:
+    """Paragraphs of one synthetic article; every third item is a short post."""
+    rng = random.Random(seed * 100003 + feed * 1009 + item)
+    paragraphs = 1 if item % 3 == 0 else rng.randint(4, 9)
+    return [
+        ' '.join(rng.choice(_SENTENCES) for _ in range(rng.randint(2, 5)))
+        for _ in range(paragraphs)
+    ]
+
+
+def synthetic_feed_urls(base_url: str, feeds: int) -> List[str]:
+    """Feed URLs served by add_synthetic_source_routes()."""
+    return [f"{base_url.rstrip('/')}/feeds/{n}.xml" for n in range(feeds)]
+
+
+def add_synthetic_source_routes(app: web.Application, feeds: int = 5, items_per_feed: int = 20,
+                                seed: int = 0) -> None:
+    """Serve /feeds/{n}.xml and /articles/{n}/{i} with deterministic content."""
+
+    async def feed(request: web.Request) -> web.Response:
+        n = int(request.match_info['n'])
+        if n >= feeds:
+            raise web.HTTPNotFound()
+        base = f"{request.scheme}://{request.host}"
+        now = datetime.now(timezone.utc)
+        items = []
+        for i in range(items_per_feed):
+            paragraphs = _article_text(n, i, seed)
+            title = paragraphs[0].split('.')[0]
+            items.append(
+                "<item>"
+                f"<title>{escape(title)} #{n}-{i}</title>"
+                f"<link>{base}/articles/{n}/{i}</link>"
+                f"<guid>{base}/articles/{n}/{i}</guid>"
+                f"<pubDate>{format_datetime(now - timedelta(minutes=10 * i))}</pubDate>"
+                f"<description>{escape(paragraphs[0])}</description>"
+                "</item>"
+            )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            f"<title>Synthetic feed {n}</title><link>{base}/</link>"
+            "<description>Benchmark source</description>"
+            f"{''.join(items)}"
+            "</channel></rss>"
+        )
+        return web.Response(text=body, content_type='application/rss+xml')
+
+    async def article(request: web.Request) -> web.Response:
+        n, i = int(request.match_info['n']), int(request.match_info['i'])
+        if n >= feeds or i >= items_per_feed:
+            raise web.HTTPNotFound()
+        paragraphs = _article_text(n, i, seed)
+        title = escape(paragraphs[0].split('.')[0])
+        body = ''.join(f"<p>{escape(p)}</p>" for p in paragraphs)
+        html = (
+            f"<!DOCTYPE html><html lang=\"ru\"><head><meta charset=\"utf-8\"><title>{title}</title>"
+            f"<meta property=\"og:title\" content=\"{title}\"></head>"
+            f"<body><header><nav>Главная</nav></header>"
+            f"<article><h1>{title}</h1>{body}</article>"
+            f"<footer>© Synthetic</footer></body></html>"
+        )
+        return web.Response(text=html, content_type='text/html')
+
+    app.router.add_get('/feeds/{n}.xml', feed)
+    app.router.add_get('/articles/{n}/{i}', article)
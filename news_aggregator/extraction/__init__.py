@@ -63,13 +63,13 @@ class ContentExtractor:
         """Close browser if open."""
         return await self.core_extractor.close_browser()
     
-    async def extract_article_content_with_metadata(self, url: str, retry_count: int = 3):
+    async def extract_article_content_with_metadata(self, url: str, retry_count: int = 3, deadline=None):
         """Extract article content with metadata (main public method)."""
-        return await self.core_extractor.extract_article_content_with_metadata(url, retry_count)
+        return await self.core_extractor.extract_article_content_with_metadata(url, retry_count, deadline=deadline)
     
-    async def extract_article_content(self, url: str, retry_count: int = 2):
+    async def extract_article_content(self, url: str, retry_count: int = 2, deadline=None):
         """Extract article content (main public method)."""
-        return await self.core_extractor.extract_article_content(url, retry_count)
+        return await self.core_extractor.extract_article_content(url, retry_count, deadline=deadline)
 
 
 # Factory function for backward compatibility
@@ -7,6 +7,9 @@ from typing import Optional, Dict, Any
 
 from ..services.extraction_memory import get_extraction_memory, ExtractionAttempt
 from ..services.domain_stability_tracker import get_stability_tracker
+from ..services.extraction_constants import EXTRACTION_TOTAL_BUDGET_MS, MIN_ATTEMPT_BUDGET_MS
+from ..core.deadline import Deadline
+from ..core.metrics import pipeline_metrics
 
 from .extraction_utils import ExtractionUtils
 from .html_processor import HTMLProcessor
@@ -92,13 +95,17 @@ class CoreExtractor:
         except Exception:
             return False
 
-    async def extract_article_content_with_metadata(self, url: str, retry_count: int = 3) -> Dict[str, Optional[str]]:
+    async def extract_article_content_with_metadata(
+        self, url: str, retry_count: int = 3, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Optional[str]]:
         """
         Extract article content along with metadata (title, publication date, author).
 
         Args:
             url: URL to extract from
             retry_count: Number of retry attempts
+            deadline: Shared time budget for all attempts, fetches and browser
+                rendering (default: EXTRACTION_TOTAL_BUDGET_MS from now)
 
         Returns:
             Dict with content, title, publication_date, author, description, method_used
@@ -128,10 +135,23 @@ class CoreExtractor:
             'url': clean_url[:100]
         })
 
+        if deadline is None:
+            deadline = Deadline.from_ms(EXTRACTION_TOTAL_BUDGET_MS)
+
         extraction_start = time.time()
         last_exception = None
+        attempts_made = 0
 
         for attempt_num in range(1, retry_count + 1):
+            if not deadline.can_afford(MIN_ATTEMPT_BUDGET_MS):
+                logger.info(f"Extraction budget exhausted before attempt {attempt_num}", extra={
+                    'event': 'extraction_deadline',
+                    'attempt': attempt_num,
+                    'domain': domain,
+                    'elapsed_s': round(deadline.elapsed(), 2)
+                })
+                break
+            attempts_made = attempt_num
             try:
                 logger.debug(f"Extraction attempt {attempt_num}/{retry_count}", extra={
                     'event': 'extraction_attempt',
@@ -140,7 +160,15 @@ class CoreExtractor:
                 })
 
                 # Use comprehensive extraction with metadata
-                result = await self.strategies.attempt_extraction_with_metadata(clean_url, domain, attempt_num)
+                attempt_start = time.monotonic()
+                result = await self.strategies.attempt_extraction_with_metadata(
+                    clean_url, domain, attempt_num, deadline=deadline
+                )
+                # Attributed to the strategy that produced content ('none' if all failed)
+                pipeline_metrics.observe(
+                    f"extract.{result.get('method_used') or 'none'}",
+                    time.monotonic() - attempt_start, ok=bool(result.get('content'))
+                )
 
                 if result.get('content') and self.utils.is_good_content(result['content']):
                     extraction_time = time.time() - extraction_start
@@ -201,7 +229,7 @@ class CoreExtractor:
                         'attempt': attempt_num,
                         'domain': domain
                     })
-                    if attempt_num < retry_count:
+                    if attempt_num < retry_count and deadline.can_afford(MIN_ATTEMPT_BUDGET_MS):
                         await asyncio.sleep(1)
 
             except Exception as e:
@@ -236,7 +264,7 @@ class CoreExtractor:
                 except Exception as record_error:
                     logger.warning(f"Failed to record failure: {record_error}")
 
-                if attempt_num < retry_count:
+                if attempt_num < retry_count and deadline.can_afford(MIN_ATTEMPT_BUDGET_MS):
                     await asyncio.sleep(1)
         
         # All attempts failed
@@ -246,21 +274,27 @@ class CoreExtractor:
             'event': 'extraction_failed',
             'domain': domain,
             'duration_s': round(extraction_time, 2),
-            'attempts': retry_count
+            'attempts': attempts_made
         })
 
-        # Try alternative URLs if available
+        # Try alternative URLs if available (only while budget remains)
         try:
-            html = await self.strategies.fetch_html_content(clean_url)
+            html = None
+            if deadline.can_afford(MIN_ATTEMPT_BUDGET_MS):
+                html = await self.strategies.fetch_html_content(clean_url, deadline=deadline)
             if html:
                 from bs4 import BeautifulSoup
                 soup = BeautifulSoup(html, 'html.parser')
                 alt_urls = self.strategies.metadata_extractor.find_alt_article_links(soup, clean_url)
 
                 for alt_url in alt_urls[:2]:
+                    if not deadline.can_afford(MIN_ATTEMPT_BUDGET_MS):
+                        break
                     logger.debug(f"Trying alternative URL: {alt_url[:60]}")
                     try:
-                        alt_result = await self.strategies.attempt_extraction_with_metadata(alt_url, domain, 1)
+                        alt_result = await self.strategies.attempt_extraction_with_metadata(
+                            alt_url, domain, 1, deadline=deadline
+                        )
                         if alt_result.get('content') and self.utils.is_good_content(alt_result['content']):
                             logger.info(f"Alternative URL successful", extra={
                                 'event': 'alt_url_success',
@@ -278,9 +312,11 @@ class CoreExtractor:
         return {'content': None, 'title': None, 'publication_date': None,
                'author': None, 'description': None, 'method_used': 'failed'}
     
-    async def extract_article_content(self, url: str, retry_count: int = 2) -> Optional[str]:
+    async def extract_article_content(
+        self, url: str, retry_count: int = 2, deadline: Optional[Deadline] = None
+    ) -> Optional[str]:
         """Extract article content (delegates to extract_article_content_with_metadata)."""
-        result = await self.extract_article_content_with_metadata(url, retry_count)
+        result = await self.extract_article_content_with_metadata(url, retry_count, deadline=deadline)
         content = result.get('content')
         return content if content else None
     
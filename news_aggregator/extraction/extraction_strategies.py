@@ -16,6 +16,7 @@ from nodriver import cdp
 
 from ..core.http_client import get_http_client
 from ..core.exceptions import ContentExtractionError
+from ..core.deadline import Deadline
 from ..services.extraction_memory import get_extraction_memory, ExtractionAttempt
 from ..services.domain_stability_tracker import get_stability_tracker
 from ..services.ai_extraction_optimizer import get_ai_extraction_optimizer
@@ -24,6 +25,9 @@ from ..services.extraction_constants import (
     BROWSER_TIMEOUT_FIRST_MS,
     BROWSER_TIMEOUT_RETRY_MS,
     BROWSER_TOTAL_BUDGET_MS,
+    BROWSER_MIN_BUDGET_MS,
+    EXTRACTION_TOTAL_BUDGET_MS,
+    HTML_FETCH_TIMEOUT_MS,
 )
 
 from .extraction_utils import ExtractionUtils
@@ -211,10 +215,16 @@ class ExtractionStrategies:
         }
 
     async def attempt_extraction_with_metadata(
-        self, url: str, domain: str, attempt_num: int
+        self, url: str, domain: str, attempt_num: int, deadline: Optional[Deadline] = None
     ) -> Dict[str, Optional[str]]:
-        """Attempt content extraction with comprehensive metadata extraction."""
-        logger.info(f"    🔄 Extraction attempt #{attempt_num} for domain: {domain}")
+        """Attempt content extraction with comprehensive metadata extraction.
+
+        All network steps are capped by ``deadline``; browser rendering is only
+        attempted while the remaining budget can afford it.
+        """
+        if deadline is None:
+            deadline = Deadline.from_ms(EXTRACTION_TOTAL_BUDGET_MS)
+        logger.info(f"    🔄 Extraction attempt #{attempt_num} for domain: {domain} ({deadline.remaining():.0f}s budget left)")
         result = {
             "content": None,
             "title": None,
@@ -235,7 +245,7 @@ class ExtractionStrategies:
                 if link_url:
                     logger.info(f"    🔗 Reddit link post — extracting linked URL: {link_url}")
                     try:
-                        linked_html = await self.fetch_html_content(link_url)
+                        linked_html = await self.fetch_html_content(link_url, deadline=deadline)
                         if linked_html:
                             linked_soup = BeautifulSoup(linked_html, "html.parser")
                             linked_content, _ = self.html_processor.extract_by_enhanced_selectors(linked_soup)
@@ -251,7 +261,7 @@ class ExtractionStrategies:
         shared_html: Optional[str] = None
         shared_soup = None
         try:
-            shared_html = await self.fetch_html_content(url)
+            shared_html = await self.fetch_html_content(url, deadline=deadline)
             if shared_html:
                 shared_soup = BeautifulSoup(shared_html, "html.parser")
         except Exception as e:
@@ -276,34 +286,35 @@ class ExtractionStrategies:
 
         # If learned pattern requires browser, skip HTTP strategies and go straight to browser
         if learned_pattern and learned_pattern.get("method") == "browser_rendering":
-            logger.info(f"    📚 Learned pattern for {domain} requires browser — jumping to Strategy 4")
-            selector = learned_pattern.get("selector")
-            try:
-                content, sel, browser_html = await self._extract_with_browser_and_html(url)
-                if content and self.utils.is_good_content(content, is_full_article=True):
-                    # Try learned selector on browser-rendered HTML
-                    if selector and browser_html:
-                        b_soup = BeautifulSoup(browser_html, "html.parser")
-                        elements = b_soup.select(selector)
-                        if elements:
-                            sel_content = self.html_processor.clean_text(
-                                elements[0].get_text(separator=" ", strip=True)
+            if self._can_afford_browser(deadline):
+                logger.info(f"    📚 Learned pattern for {domain} requires browser — jumping to Strategy 4")
+                selector = learned_pattern.get("selector")
+                try:
+                    content, sel, browser_html = await self._extract_with_browser_within_deadline(url, deadline)
+                    if content and self.utils.is_good_content(content, is_full_article=True):
+                        # Try learned selector on browser-rendered HTML
+                        if selector and browser_html:
+                            b_soup = BeautifulSoup(browser_html, "html.parser")
+                            elements = b_soup.select(selector)
+                            if elements:
+                                sel_content = self.html_processor.clean_text(
+                                    elements[0].get_text(separator=" ", strip=True)
+                                )
+                                if sel_content and len(sel_content) > len(content or ''):
+                                    content = sel_content
+                                    sel = selector
+                        if await self._is_high_quality_content(content, url=url):
+                            result["content"] = content
+                            result["selector_used"] = sel
+                            result["method_used"] = "learned_pattern_browser_rendering"
+                            if browser_html:
+                                _fill_metadata(result, BeautifulSoup(browser_html, "html.parser"))
+                            await self.record_extraction_success(
+                                domain, "browser_rendering", sel, len(content)
                             )
-                            if sel_content and len(sel_content) > len(content or ''):
-                                content = sel_content
-                                sel = selector
-                    if await self._is_high_quality_content(content, url=url):
-                        result["content"] = content
-                        result["selector_used"] = sel
-                        result["method_used"] = "learned_pattern_browser_rendering"
-                        if browser_html:
-                            _fill_metadata(result, BeautifulSoup(browser_html, "html.parser"))
-                        await self.record_extraction_success(
-                            domain, "browser_rendering", sel, len(content)
-                        )
-                        return result
-            except Exception as e:
-                logger.error(f"    ❌ Learned browser pattern failed: {e}")
+                            return result
+                except Exception as e:
+                    logger.error(f"    ❌ Learned browser pattern failed: {e}")
 
         elif learned_pattern and shared_soup:
             logger.info(f"    📚 Trying learned pattern for {domain}")
@@ -391,41 +402,44 @@ class ExtractionStrategies:
             except Exception as e:
                 logger.error(f"    ❌ Readability extraction failed: {e}")
         # Strategy 4: Browser rendering (more expensive) — extracts metadata in same session
-        try:
-            logger.info(f"    🎭 Trying browser rendering")
-            content, selector, browser_html = await self._extract_with_browser_and_html(url)
-            if (
-                content
-                and self.utils.is_good_content(content, is_full_article=True)
-                and await self._is_high_quality_content(content, url=url)
-            ):
-                result["content"] = content
-                result["selector_used"] = selector
-                result["method_used"] = "browser_rendering"
-                await self.record_extraction_success(
-                    domain, "browser_rendering", selector, len(content)
-                )
+        if self._can_afford_browser(deadline):
+            try:
+                logger.info(f"    🎭 Trying browser rendering")
+                content, selector, browser_html = await self._extract_with_browser_within_deadline(url, deadline)
+                if (
+                    content
+                    and self.utils.is_good_content(content, is_full_article=True)
+                    and await self._is_high_quality_content(content, url=url)
+                ):
+                    result["content"] = content
+                    result["selector_used"] = selector
+                    result["method_used"] = "browser_rendering"
+                    await self.record_extraction_success(
+                        domain, "browser_rendering", selector, len(content)
+                    )
 
-                # Use HTML from the same browser session — no second request
-                if browser_html:
-                    try:
-                        b_soup = BeautifulSoup(browser_html, "html.parser")
-                        _fill_metadata(result, b_soup)
-                    except Exception as e:
-                        logger.warning(f"    ⚠️ Browser metadata extraction failed: {e}")
-                        # Fallback: metadata from initial shared_soup if available
-                        if shared_soup:
-                            _fill_metadata(result, shared_soup)
+                    # Use HTML from the same browser session — no second request
+                    if browser_html:
+                        try:
+                            b_soup = BeautifulSoup(browser_html, "html.parser")
+                            _fill_metadata(result, b_soup)
+                        except Exception as e:
+                            logger.warning(f"    ⚠️ Browser metadata extraction failed: {e}")
+                            # Fallback: metadata from initial shared_soup if available
+                            if shared_soup:
+                                _fill_metadata(result, shared_soup)
 
-                return result
-        except Exception as e:
-            logger.error(f"    ❌ Browser rendering failed: {e}")
+                    return result
+            except Exception as e:
+                logger.error(f"    ❌ Browser rendering failed: {e}")
 
         # Strategy 5: Fallback to basic text extraction
         try:
             logger.info(f"    🔄 Trying fallback extraction")
             # Reuse already-fetched HTML when possible; only use sync fallback if needed
-            fallback_html = shared_html or await self.fetch_html_content_fallback(url)
+            fallback_html = shared_html
+            if not fallback_html and not deadline.expired:
+                fallback_html = await self.fetch_html_content_fallback(url, deadline=deadline)
             if fallback_html:
                 soup = BeautifulSoup(fallback_html, "html.parser")
 
@@ -458,8 +472,30 @@ class ExtractionStrategies:
         await self.record_extraction_failure(domain, "all_strategies", "No strategy produced content")
         return result
 
+    @staticmethod
+    def _can_afford_browser(deadline: Deadline) -> bool:
+        """Whether the remaining budget is enough to start browser rendering."""
+        if deadline.can_afford(BROWSER_MIN_BUDGET_MS):
+            return True
+        logger.info(f"    ⏱️ Skipping browser rendering: {deadline.remaining_ms()}ms budget left")
+        return False
+
+    async def _extract_with_browser_within_deadline(
+        self, url: str, deadline: Deadline
+    ) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """Run browser extraction bounded by the deadline, including waiting for a tab."""
+        try:
+            return await asyncio.wait_for(
+                self._extract_with_browser_and_html(url, deadline=deadline),
+                timeout=deadline.remaining(),
+            )
+        except asyncio.TimeoutError:
+            raise ContentExtractionError(
+                f"Browser extraction exceeded deadline after {deadline.elapsed():.1f}s"
+            )
+
     async def _extract_with_browser_and_html(
-        self, url: str
+        self, url: str, deadline: Optional[Deadline] = None
     ) -> tuple[Optional[str], Optional[str], Optional[str]]:
         """Extract content via browser and also return the rendered HTML for metadata.
 
@@ -491,16 +527,18 @@ class ExtractionStrategies:
                     domain, "browser_rendering", BROWSER_TIMEOUT_FIRST_MS
                 )
                 adaptive_total_budget = min(adaptive_timeout * 3, BROWSER_TOTAL_BUDGET_MS)
+                if deadline is not None:
+                    adaptive_total_budget = min(adaptive_total_budget, deadline.remaining_ms())
 
                 def remaining_s() -> float:
                     return max(0.0, adaptive_total_budget / 1000 - (time.time() - budget_start))
 
-                await tab.get(url, new_tab=False)
+                await asyncio.wait_for(tab.get(url, new_tab=False), timeout=remaining_s())
 
                 # Wait for content to appear (poll JS condition)
                 try:
-                    deadline = time.time() + min(10, remaining_s())
-                    while time.time() < deadline:
+                    poll_until = time.time() + min(10, remaining_s())
+                    while time.time() < poll_until:
                         result = await tab.evaluate(
                             "document.body ? document.body.innerText.length : 0"
                         )
@@ -540,9 +578,13 @@ class ExtractionStrategies:
         enc = detected.get('encoding') or 'utf-8'
         return data.decode(enc, errors='replace')
 
-    async def fetch_html_content(self, url: str) -> Optional[str]:
-        """Fetch HTML content using shared HTTP client."""
-        try:
+    async def fetch_html_content(self, url: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Fetch HTML content using shared HTTP client.
+
+        With a deadline, the whole fetch (including the client's own retries)
+        is bounded by the smaller of HTML_FETCH_TIMEOUT_MS and the remaining budget.
+        """
+        async def _fetch() -> Optional[str]:
             async with get_http_client() as client:
                 async with await client.get(
                     url, headers=self.utils.get_headers()
@@ -554,12 +596,26 @@ class ExtractionStrategies:
                         logger.warning(f"    ⚠️ HTTP {response.status} for {url}")
                         return None
 
+        try:
+            if deadline is None:
+                return await _fetch()
+            if deadline.expired:
+                logger.info(f"    ⏱️ Skipping HTML fetch, extraction budget exhausted: {url}")
+                return None
+            return await asyncio.wait_for(
+                _fetch(), timeout=deadline.cap(HTML_FETCH_TIMEOUT_MS / 1000)
+            )
+
+        except asyncio.TimeoutError:
+            logger.warning(f"    ⏱️ HTML fetch timed out (deadline) for {url}")
+            return None
         except Exception as e:
             logger.error(f"    ❌ HTML fetch failed: {e}")
             return None
 
-    async def fetch_html_content_fallback(self, url: str) -> Optional[str]:
+    async def fetch_html_content_fallback(self, url: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """Fallback HTML fetching with a different User-Agent (async, non-blocking)."""
+        timeout_s = deadline.cap(15) if deadline is not None else 15
         try:
             import aiohttp
             fallback_headers = dict(self.utils.get_headers())
@@ -568,7 +624,7 @@ class ExtractionStrategies:
                 "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15"
             )
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=fallback_headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                async with session.get(url, headers=fallback_headers, timeout=aiohttp.ClientTimeout(total=timeout_s)) as response:
                     if response.status == 200:
                         data = await response.read()
                         return self._decode_response_bytes(data, response.charset)
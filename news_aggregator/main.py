@@ -35,6 +35,42 @@ migration_manager = create_migration_manager(AsyncSessionLocal, "Evening News v2
 from .migrations.feed_performance_optimization import FeedPerformanceOptimization
 migration_manager.register_migration(FeedPerformanceOptimization())
 
+# Partial index for keyset reading of the unprocessed backlog
+from .migrations.unprocessed_backlog_index import UnprocessedBacklogIndex
+migration_manager.register_migration(UnprocessedBacklogIndex())
+
+# Durable AI job queue (worker processes)
+from .migrations.ai_jobs_table import AIJobsTable
+migration_manager.register_migration(AIJobsTable())
+
+# Per-cycle pipeline stage metrics
+from .migrations.pipeline_cycle_stats_table import PipelineCycleStatsTable
+migration_manager.register_migration(PipelineCycleStatsTable())
+
+# Processing cycle journal (resume after restart)
+from .migrations.cycle_runs_table import CycleRunsTable
+migration_manager.register_migration(CycleRunsTable())
+
+# Near-duplicate signatures (SimHash + LSH band table)
+from .migrations.near_duplicate_signatures import NearDuplicateSignatures
+migration_manager.register_migration(NearDuplicateSignatures())
+
+# Editable filter / bot-marker text rules
+from .migrations.text_rules_table import TextRulesTable
+migration_manager.register_migration(TextRulesTable())
+
+# Postgres-backed dead-letter queue
+from .migrations.dead_letter_entries_table import DeadLetterEntriesTable
+migration_manager.register_migration(DeadLetterEntriesTable())
+
+# Incremental near-duplicate index loads by created_at
+from .migrations.near_duplicate_bands_created_index import NearDuplicateBandsCreatedIndex
+migration_manager.register_migration(NearDuplicateBandsCreatedIndex())
+
+# Dead-lettered articles excluded from the backlog readers
+from .migrations.dead_letter_open_article_index import DeadLetterOpenArticleIndex
+migration_manager.register_migration(DeadLetterOpenArticleIndex())
+
 
 
 
@@ -0,0 +1,91 @@
+"""AI job queue migration.
+
+Creates the ai_jobs table used by services.job_queue: durable article-analysis
+jobs leased by worker processes (FOR UPDATE SKIP LOCKED).
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class AIJobsTable(BaseMigration):
+    """Migration creating the durable AI job queue table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="008_ai_jobs_table",
+            description="Add ai_jobs table for the durable AI work queue",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE indexname = 'uq_ai_jobs_open'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the ai_jobs table and its indexes."""
+        try:
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS ai_jobs (
+                    id SERIAL PRIMARY KEY,
+                    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+                    job_type VARCHAR(50) NOT NULL DEFAULT 'article_analysis',
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    priority INTEGER NOT NULL DEFAULT 2,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    available_at TIMESTAMP DEFAULT now(),
+                    leased_by VARCHAR(100),
+                    lease_expires_at TIMESTAMP,
+                    last_error TEXT,
+                    result JSON,
+                    created_at TIMESTAMP DEFAULT now(),
+                    updated_at TIMESTAMP DEFAULT now(),
+                    finished_at TIMESTAMP
+                )
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_ai_jobs_article_id ON ai_jobs(article_id)"
+            ))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_ai_jobs_status ON ai_jobs(status)"
+            ))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_ai_jobs_finished_at ON ai_jobs(finished_at)"
+            ))
+            # At most one open job per article and type - enqueueing is idempotent
+            await db.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_ai_jobs_open
+                ON ai_jobs(article_id, job_type) WHERE status IN ('pending', 'leased')
+            """))
+            await db.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_ai_jobs_leasable
+                ON ai_jobs(priority, available_at) WHERE status IN ('pending', 'leased')
+            """))
+            await db.commit()
+
+            return {'tables_created': 1, 'indexes_created': 5, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the ai_jobs table."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS ai_jobs"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
@@ -0,0 +1,74 @@
+"""Cycle journal migration.
+
+Creates the cycle_runs table used by services.cycle_journal to checkpoint
+processing cycles and resume them after a restart.
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class CycleRunsTable(BaseMigration):
+    """Migration creating the processing cycle journal table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="010_cycle_runs_table",
+            description="Add cycle_runs table for cycle checkpoints and resume",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_name = 'cycle_runs'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the cycle_runs table."""
+        try:
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS cycle_runs (
+                    id SERIAL PRIMARY KEY,
+                    status VARCHAR(20) NOT NULL DEFAULT 'running',
+                    owner VARCHAR(100),
+                    started_at TIMESTAMP DEFAULT now(),
+                    origin_started_at TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT now(),
+                    finished_at TIMESTAMP,
+                    resumed_from_id INTEGER REFERENCES cycle_runs(id) ON DELETE SET NULL,
+                    sources_done JSON,
+                    articles_fetched INTEGER DEFAULT 0,
+                    articles_analyzed INTEGER DEFAULT 0,
+                    stats JSON,
+                    error TEXT
+                )
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_cycle_runs_status ON cycle_runs(status)"
+            ))
+            await db.commit()
+
+            return {'tables_created': 1, 'indexes_created': 1, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the cycle_runs table."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS cycle_runs"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
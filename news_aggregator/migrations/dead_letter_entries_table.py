@@ -0,0 +1,91 @@
+"""Dead-letter queue migration.
+
+Creates the dead_letter_entries table used by core.dead_letter_queue to
+keep failed article processing attempts and schedule their retries.
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class DeadLetterEntriesTable(BaseMigration):
+    """Migration creating the dead-letter queue table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="013_dead_letter_entries_table",
+            description="Add dead_letter_entries table for failed processing retries",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_name = 'dead_letter_entries'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the dead_letter_entries table and its indexes."""
+        try:
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS dead_letter_entries (
+                    id SERIAL PRIMARY KEY,
+                    entry_key VARCHAR(64) NOT NULL,
+                    article_id INTEGER REFERENCES articles(id) ON DELETE SET NULL,
+                    reason VARCHAR(50) NOT NULL,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    error_message TEXT,
+                    article_data JSON,
+                    details JSON,
+                    retry_count INTEGER NOT NULL DEFAULT 0,
+                    max_retries INTEGER NOT NULL DEFAULT 3,
+                    backoff_seconds INTEGER NOT NULL DEFAULT 300,
+                    next_retry_at TIMESTAMP,
+                    claimed_by VARCHAR(100),
+                    claim_expires_at TIMESTAMP,
+                    first_failed_at TIMESTAMP DEFAULT now(),
+                    last_retry_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT now(),
+                    updated_at TIMESTAMP DEFAULT now(),
+                    finished_at TIMESTAMP
+                )
+            """))
+            for column in ('article_id', 'reason', 'status', 'finished_at'):
+                await db.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_dead_letter_entries_{column} ON dead_letter_entries({column})"
+                ))
+            # One open entry per article - repeated failures update it
+            await db.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_dead_letter_entries_open
+                ON dead_letter_entries(entry_key) WHERE status IN ('pending', 'claimed')
+            """))
+            # Retry scheduling: due entries are claimed in next_retry_at order
+            await db.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_dead_letter_entries_due
+                ON dead_letter_entries(next_retry_at) WHERE status = 'pending'
+            """))
+            await db.commit()
+
+            return {'tables_created': 1, 'indexes_created': 6, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the dead_letter_entries table."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS dead_letter_entries"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
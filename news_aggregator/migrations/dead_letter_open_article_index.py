@@ -0,0 +1,60 @@
+"""Dead-letter article index migration.
+
+Partial index on dead_letter_entries.article_id for the NOT EXISTS check that
+keeps dead-lettered articles out of the backlog readers
+(services.backlog_reader.not_dead_lettered_predicate).
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class DeadLetterOpenArticleIndex(BaseMigration):
+    """Migration adding a partial article_id index on dead_letter_entries."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="015_dead_letter_open_article_index",
+            description="Add article_id index for excluding dead-lettered articles from the backlog",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE indexname = 'idx_dead_letter_entries_open_article'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the index."""
+        try:
+            await db.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_dead_letter_entries_open_article
+                ON dead_letter_entries(article_id)
+                WHERE status IN ('pending', 'claimed', 'failed')
+            """))
+            await db.commit()
+
+            return {'indexes_created': 1, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Remove the index."""
+        try:
+            await db.execute(text("DROP INDEX IF EXISTS idx_dead_letter_entries_open_article"))
+            await db.commit()
+            return {"rollback": "completed", "indexes_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
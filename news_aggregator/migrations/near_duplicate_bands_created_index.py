@@ -0,0 +1,58 @@
+"""Near-duplicate band index migration.
+
+Index on article_simhash_bands.created_at for the incremental loads of
+services.near_duplicates.NearDuplicateIndex.refresh().
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class NearDuplicateBandsCreatedIndex(BaseMigration):
+    """Migration adding a created_at index on article_simhash_bands."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="014_near_duplicate_bands_created_index",
+            description="Add created_at index for incremental near-duplicate index loads",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE indexname = 'idx_article_simhash_bands_created_at'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the index."""
+        try:
+            await db.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_article_simhash_bands_created_at
+                ON article_simhash_bands(created_at)
+            """))
+            await db.commit()
+
+            return {'indexes_created': 1, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Remove the index."""
+        try:
+            await db.execute(text("DROP INDEX IF EXISTS idx_article_simhash_bands_created_at"))
+            await db.commit()
+            return {"rollback": "completed", "indexes_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
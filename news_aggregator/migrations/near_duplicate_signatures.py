@@ -0,0 +1,82 @@
+"""Near-duplicate detection migration.
+
+Adds the SimHash fingerprint and canonical article link to articles and
+creates the article_simhash_bands table (the persisted LSH band index used
+by services.near_duplicates).
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class NearDuplicateSignatures(BaseMigration):
+    """Migration adding near-duplicate signatures and the LSH band table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="011_near_duplicate_signatures",
+            description="Add articles.simhash, articles.canonical_article_id and article_simhash_bands",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT
+                    EXISTS (
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_name = 'articles' AND column_name = 'canonical_article_id'
+                    )
+                    AND EXISTS (
+                        SELECT 1 FROM information_schema.tables
+                        WHERE table_name = 'article_simhash_bands'
+                    )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Add the columns and create the band table."""
+        try:
+            await db.execute(text("ALTER TABLE articles ADD COLUMN IF NOT EXISTS simhash BIGINT"))
+            await db.execute(text("""
+                ALTER TABLE articles ADD COLUMN IF NOT EXISTS canonical_article_id INTEGER
+                    REFERENCES articles(id) ON DELETE SET NULL
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_articles_canonical_article_id ON articles(canonical_article_id)"
+            ))
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS article_simhash_bands (
+                    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+                    band INTEGER NOT NULL,
+                    value INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT now(),
+                    PRIMARY KEY (article_id, band)
+                )
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_article_simhash_bands_lookup ON article_simhash_bands(band, value)"
+            ))
+            await db.commit()
+
+            return {'columns_added': 2, 'tables_created': 1, 'indexes_created': 2, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the band table and the columns."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS article_simhash_bands"))
+            await db.execute(text("ALTER TABLE articles DROP COLUMN IF EXISTS canonical_article_id"))
+            await db.execute(text("ALTER TABLE articles DROP COLUMN IF EXISTS simhash"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1, "columns_dropped": 2}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
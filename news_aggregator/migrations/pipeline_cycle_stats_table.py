@@ -0,0 +1,69 @@
+"""Pipeline cycle metrics migration.
+
+Creates the pipeline_cycle_stats table holding the per-stage metrics
+(counts, latency percentiles and histograms) of every processing cycle.
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class PipelineCycleStatsTable(BaseMigration):
+    """Migration creating the per-cycle pipeline metrics table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="009_pipeline_cycle_stats_table",
+            description="Add pipeline_cycle_stats table for per-stage cycle metrics",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_name = 'pipeline_cycle_stats'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the pipeline_cycle_stats table."""
+        try:
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS pipeline_cycle_stats (
+                    id SERIAL PRIMARY KEY,
+                    started_at TIMESTAMP NOT NULL,
+                    finished_at TIMESTAMP,
+                    duration_seconds DOUBLE PRECISION,
+                    articles_fetched INTEGER DEFAULT 0,
+                    articles_processed INTEGER DEFAULT 0,
+                    errors_count INTEGER DEFAULT 0,
+                    stages JSON
+                )
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_pipeline_cycle_stats_started_at ON pipeline_cycle_stats(started_at)"
+            ))
+            await db.commit()
+
+            return {'tables_created': 1, 'indexes_created': 1, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the pipeline_cycle_stats table."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS pipeline_cycle_stats"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
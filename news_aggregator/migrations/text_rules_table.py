@@ -0,0 +1,85 @@
+"""Text rules migration.
+
+Creates the text_rules table used by services.text_rules and seeds it with
+the built-in spam, boilerplate and bot-protection rules so they can be
+edited from the database.
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class TextRulesTable(BaseMigration):
+    """Migration creating and seeding the text rules table."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="012_text_rules_table",
+            description="Add text_rules table seeded with built-in filter and bot-marker rules",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM information_schema.tables
+                    WHERE table_name = 'text_rules'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the text_rules table and seed the default rules."""
+        from ..services.text_rules import DEFAULT_RULES
+
+        try:
+            await db.execute(text("""
+                CREATE TABLE IF NOT EXISTS text_rules (
+                    id SERIAL PRIMARY KEY,
+                    rule_key VARCHAR(100) NOT NULL UNIQUE,
+                    rule_set VARCHAR(50) NOT NULL,
+                    pattern TEXT NOT NULL,
+                    is_regex BOOLEAN DEFAULT FALSE,
+                    enabled BOOLEAN DEFAULT TRUE,
+                    description TEXT,
+                    created_at TIMESTAMP DEFAULT now(),
+                    updated_at TIMESTAMP DEFAULT now()
+                )
+            """))
+            await db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_text_rules_rule_set ON text_rules(rule_set)"
+            ))
+            await db.execute(
+                text("""
+                    INSERT INTO text_rules (rule_key, rule_set, pattern, is_regex, enabled, description)
+                    VALUES (:rule_key, :rule_set, :pattern, :is_regex, TRUE, 'built-in')
+                    ON CONFLICT (rule_key) DO NOTHING
+                """),
+                [
+                    {'rule_key': rule.rule_id, 'rule_set': rule.rule_set,
+                     'pattern': rule.pattern, 'is_regex': rule.is_regex}
+                    for rule in DEFAULT_RULES
+                ]
+            )
+            await db.commit()
+
+            return {'tables_created': 1, 'indexes_created': 1, 'rules_seeded': len(DEFAULT_RULES), 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Drop the text_rules table."""
+        try:
+            await db.execute(text("DROP TABLE IF EXISTS text_rules"))
+            await db.commit()
+            return {"rollback": "completed", "tables_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
@@ -0,0 +1,70 @@
+"""Unprocessed backlog index migration.
+
+Partial index for keyset pagination of unprocessed articles
+(services.backlog_reader). The older idx_articles_unprocessed only covers
+NOT summary_processed, which cannot serve the full unprocessed predicate.
+"""
+
+from sqlalchemy import text
+from .base_migration import BaseMigration
+
+
+class UnprocessedBacklogIndex(BaseMigration):
+    """Migration adding a (fetched_at, id) partial index on unprocessed articles."""
+
+    def __init__(self):
+        super().__init__(
+            migration_id="007_unprocessed_backlog_index",
+            description="Add partial keyset index for the unprocessed article backlog",
+            version="1.0.0"
+        )
+
+    async def check_needed(self, db) -> bool:
+        """Check if migration is needed."""
+        try:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE indexname = 'idx_articles_unprocessed_keyset'
+                )
+            """))
+            return not result.scalar()
+        except Exception:
+            return True
+
+    async def execute(self, db):
+        """Create the partial index."""
+        try:
+            # Predicate must match services.backlog_reader.unprocessed_predicate()
+            await db.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_articles_unprocessed_keyset
+                ON articles(fetched_at DESC, id DESC)
+                WHERE processed = false
+                   OR summary_processed = false
+                   OR category_processed = false
+                   OR ad_processed = false
+                   OR (summary IS NULL AND content IS NOT NULL)
+            """))
+            await db.commit()
+
+            try:
+                await db.execute(text("ANALYZE articles"))
+            except Exception:
+                pass
+
+            return {'indexes_created': 1, 'errors': []}
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def rollback(self, db):
+        """Remove the partial index."""
+        try:
+            await db.execute(text("DROP INDEX IF EXISTS idx_articles_unprocessed_keyset"))
+            await db.commit()
+            return {"rollback": "completed", "indexes_dropped": 1}
+
+        except Exception as e:
+            await db.rollback()
+            return {"rollback": "failed", "error": str(e)}
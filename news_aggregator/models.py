@@ -4,11 +4,11 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Date, Float, ForeignKey, Integer,
+    BigInteger, Boolean, Column, DateTime, Date, Float, ForeignKey, Index, Integer,
     String, Text, JSON, DECIMAL, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from .database import Base
 
@@ -63,6 +63,10 @@ class Article(Base):
     ad_markers = Column(JSON, default=list)  # List of advertising markers found
     ad_processed = Column(Boolean, default=False)  # True if advertising detection was attempted
 
+    # Near-duplicate detection (services.near_duplicates)
+    simhash = Column(BigInteger)  # 64-bit SimHash of title + content shingles (signed)
+    canonical_article_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), index=True)  # Set on near-duplicates
+
     # Relationships
     source = relationship("Source", back_populates="articles")
     article_categories = relationship("ArticleCategory", back_populates="article", cascade="all, delete-orphan")
@@ -144,6 +148,19 @@ class Category(Base):
     article_categories = relationship("ArticleCategory", back_populates="category")
 
 
+class ArticleSimhashBand(Base):
+    """LSH band of a canonical article's SimHash (persisted near-duplicate index)."""
+    __tablename__ = "article_simhash_bands"
+    __table_args__ = (
+        Index('idx_article_simhash_bands_lookup', 'band', 'value'),
+    )
+
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    band = Column(Integer, primary_key=True)  # Band number (0-3)
+    value = Column(Integer, nullable=False)  # 16 bits of the SimHash
+    created_at = Column(DateTime, default=func.now())
+
+
 class ArticleCategory(Base):
     """Junction table for article-category many-to-many relationship."""
     __tablename__ = "article_categories"
@@ -203,6 +220,38 @@ class ProcessingStat(Base):
     processing_time_seconds = Column(Integer, default=0)
 
 
+class PipelineCycleStat(Base):
+    """Per-stage pipeline metrics of one processing cycle."""
+    __tablename__ = "pipeline_cycle_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    started_at = Column(DateTime, nullable=False, index=True)
+    finished_at = Column(DateTime)
+    duration_seconds = Column(Float)
+    articles_fetched = Column(Integer, default=0)
+    articles_processed = Column(Integer, default=0)
+    errors_count = Column(Integer, default=0)
+    stages = Column(JSON)  # {stage: {count, errors, p50, p95, p99, max, histogram, ...}}
+
+
+class CycleRun(Base):
+    """Journal of one processing cycle, checkpointed while it runs so a restart can resume it."""
+    __tablename__ = "cycle_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, default="running", index=True)  # running, completed, failed, interrupted
+    owner = Column(String(100))  # Process that runs the cycle (host-pid)
+    started_at = Column(DateTime, default=func.now())
+    origin_started_at = Column(DateTime)  # Start of the first cycle in a resume chain
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())  # Last checkpoint
+    finished_at = Column(DateTime)
+    resumed_from_id = Column(Integer, ForeignKey("cycle_runs.id", ondelete="SET NULL"))
+    sources_done = Column(JSON)  # Ids of sources whose articles are saved
+    articles_fetched = Column(Integer, default=0)
+    articles_analyzed = Column(Integer, default=0)  # Articles whose AI results are persisted
+    stats = Column(JSON)  # Final cycle stats
+    error = Column(Text)
+
 
 class ScheduleSettings(Base):
     """Schedule settings for automated tasks."""
@@ -336,3 +385,89 @@ class CategoryMapping(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
 
+class TextRule(Base):
+    """Text classification rule (services.text_rules): literal or regex, grouped into rule sets."""
+    __tablename__ = "text_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    rule_key = Column(String(100), nullable=False, unique=True)  # Rule id reported on match, e.g. 'spam.buy_now'
+    rule_set = Column(String(50), nullable=False, index=True)  # spam, navigation, bot_summary, ...
+    pattern = Column(Text, nullable=False)
+    is_regex = Column(Boolean, default=False)  # Literal substrings match case-insensitively
+    enabled = Column(Boolean, default=True)
+    description = Column(Text)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class DeadLetterEntry(Base):
+    """Failed article processing, retried with exponential backoff (core.dead_letter_queue)."""
+    __tablename__ = "dead_letter_entries"
+    __table_args__ = (
+        # One open entry per article - repeated failures update it
+        Index(
+            'uq_dead_letter_entries_open', 'entry_key', unique=True,
+            postgresql_where=text("status IN ('pending', 'claimed')")
+        ),
+        Index(
+            'idx_dead_letter_entries_due', 'next_retry_at',
+            postgresql_where=text("status = 'pending'")
+        ),
+        # Backlog readers skip articles that have one of these entries
+        Index(
+            'idx_dead_letter_entries_open_article', 'article_id',
+            postgresql_where=text("status IN ('pending', 'claimed', 'failed')")
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    entry_key = Column(String(64), nullable=False)  # md5 of article URL (or id)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), index=True)
+    reason = Column(String(50), nullable=False, index=True)  # FailureReason value
+    status = Column(String(20), nullable=False, default="pending", index=True)  # pending, claimed, done, failed
+    error_message = Column(Text)
+    article_data = Column(JSON)
+    details = Column(JSON)  # Additional failure metadata
+    retry_count = Column(Integer, nullable=False, default=0)
+    max_retries = Column(Integer, nullable=False, default=3)
+    backoff_seconds = Column(Integer, nullable=False, default=300)  # Delay before next_retry_at, doubled per retry
+    next_retry_at = Column(DateTime)
+    claimed_by = Column(String(100))
+    claim_expires_at = Column(DateTime)  # Expired claims (crashed retry worker) become pending again
+    first_failed_at = Column(DateTime, default=func.now())
+    last_retry_at = Column(DateTime)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, index=True)
+
+
+class AIJob(Base):
+    """Durable AI work item (article analysis), leased by workers with FOR UPDATE SKIP LOCKED."""
+    __tablename__ = "ai_jobs"
+    __table_args__ = (
+        # At most one open job per article and type - enqueueing is idempotent
+        Index(
+            'uq_ai_jobs_open', 'article_id', 'job_type', unique=True,
+            postgresql_where=text("status IN ('pending', 'leased')")
+        ),
+        Index(
+            'idx_ai_jobs_leasable', 'priority', 'available_at',
+            postgresql_where=text("status IN ('pending', 'leased')")
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
+    job_type = Column(String(50), nullable=False, default="article_analysis")
+    status = Column(String(20), nullable=False, default="pending", index=True)  # pending, leased, done, failed
+    priority = Column(Integer, nullable=False, default=2)  # AIPriority value, lower is served first
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime, default=func.now())  # Not leasable before this (retry backoff)
+    leased_by = Column(String(100))  # Worker id holding the lease
+    lease_expires_at = Column(DateTime)  # Visibility timeout; expired leases are leasable again
+    last_error = Column(Text)
+    result = Column(JSON)  # Outcome summary (flags, categories, summary length)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, index=True)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -10,18 +11,29 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, text
 
-from .models import Source, Article, ProcessingStat, DailySummary
+from .models import Source, Article, ProcessingStat, DailySummary, PipelineCycleStat
 from .services.source_manager import SourceManager
 from .processing.ai_processor import AIProcessor
 from .processing.summarization_processor import SummarizationProcessor
 from .processing.categorization_processor import CategorizationProcessor
-from .processing.digest_builder import DigestBuilder
+from .processing.digest_builder import DigestBuilder, StreamingDigest
 from .processing.stats_collector import StatsCollector
 from .services.ai_client import get_ai_client
 from .services.telegram_service import get_telegram_service, TelegramService
 from .services.database_queue import get_database_queue, DatabaseQueueManager
 from .services.article_limiter import get_article_limiter, ArticleLimiter
+from .services.extractive_summarizer import get_extractive_summarizer
+from .services.result_writer import ArticleResultWriter
+from .services.cycle_journal import CycleCheckpoint, get_cycle_journal
+from .services.near_duplicates import get_near_duplicate_index, load_canonical_analysis, simhash
+from .services.text_rules import get_text_rules
+from .services.backlog_reader import (
+    StreamingArticleReader, create_backlog_reader, not_dead_lettered_predicate, unprocessed_predicate
+)
 from .core.exceptions import NewsAggregatorError
+from .core.adaptive_limiter import AIPriority, ai_priority_var, with_ai_priority
+from .core.metrics import pipeline_metrics
+from .core.dead_letter_queue import FailureReason, get_dead_letter_queue
 from .config import settings
 
 logger = logging.getLogger(__name__)
@@ -101,6 +113,9 @@ class NewsOrchestrator:
     async def run_full_cycle(self) -> Dict[str, Any]:
         """Run complete news processing cycle."""
         start_time = datetime.utcnow()
+        pipeline_metrics.begin_cycle()
+        checkpoint: Optional[CycleCheckpoint] = None
+        journal_heartbeat: Optional[asyncio.Task] = None
         stats = {
             'start_time': start_time.isoformat(),
             'sources_synced': 0,
@@ -124,54 +139,31 @@ class NewsOrchestrator:
             logger.info("  📋 Getting enabled sources...")
             sources = await self.source_manager.get_sources_from_db()
             logger.info(f"  ✅ Found {len(sources)} enabled sources")
-            # Step 1b: HTTP fetching (NO DB transaction - semaphore free!)
-            logger.info("  🌐 Fetching articles via HTTP (no DB lock)...")
-            fetch_start = time.time()
-
-            # HTTP fetching happens here WITHOUT database lock
-            raw_articles = await self.source_manager.fetch_from_all_sources_no_db(sources)
-
-            fetch_duration = time.time() - fetch_start
-            logger.info(f"  ✅ HTTP fetching completed in {fetch_duration:.1f}s")
-            # Step 1c: Save articles to database (quick DB write)
-            logger.info("  💾 Saving articles to database...")
-            save_start = time.time()
-
-            async def save_operation(db):
-                # Refresh sources with DB session
-                from sqlalchemy import select
-                source_query = select(Source).where(Source.enabled == True)
-                result = await db.execute(source_query)
-                sources_db = result.scalars().all()
-
-                # Create source name -> source mapping
-                source_map = {s.name: s for s in sources_db}
-
-                return await self.source_manager.save_fetched_articles_with_sources(raw_articles, source_map, db)
-
-            sync_result = await self.db_queue_manager.execute_write(save_operation, timeout=30.0)
-            total_articles = sum(len(articles) for articles in sync_result.values())
-
-            save_duration = time.time() - save_start
-            logger.info(f"  ✅ Saved {total_articles} articles in {save_duration:.1f}s")
-            stats.update({
-                'sources_synced': len(sync_result),
-                'articles_fetched': total_articles
-            })
-
-            sync_duration = time.time() - sync_start
-            stats['performance']['sync_duration'] = sync_duration
-            logger.info(f"  ✅ Total sync: {stats['sources_synced']} sources, {stats['articles_fetched']} articles in {sync_duration:.1f}s")
-            # Step 2: Process articles with AI
-            logger.info("🤖 Step 2: Processing articles with AI...")
-            process_start = time.time()
-            
-            processing_result = await self._process_unprocessed_articles(stats)
-            stats.update(processing_result)
-            
-            process_duration = time.time() - process_start
-            stats['performance']['processing_duration'] = process_duration
-            logger.info(f"  ✅ Processed {stats['articles_processed']} articles in {process_duration:.1f}s")
+            checkpoint = await self._start_cycle_journal()
+            if checkpoint is not None:
+                journal_heartbeat = asyncio.create_task(self._cycle_journal_heartbeat(checkpoint))
+            if checkpoint and checkpoint.resumed_from_id:
+                stats['resumed_from'] = checkpoint.resumed_from_id
+                done_before = len(sources)
+                sources = [s for s in sources if s.id not in checkpoint.sources_done]
+                logger.info(f"  ⏯️ Resuming interrupted cycle #{checkpoint.resumed_from_id}: "
+                            f"{done_before - len(sources)} sources already saved, {len(sources)} to fetch")
+            if settings.pipeline_staged_enabled and not settings.ai_job_queue_enabled:
+                # Steps 1b-2 as concurrent stages: AI starts on the first saved source
+                # while the remaining sources are still being fetched
+                logger.info("  🌊 Fetching, saving and processing as a staged pipeline...")
+                process_start = time.time()
+                processing_result = await self._run_staged_cycle(stats, sources, checkpoint)
+                stats.update(processing_result)
+                process_duration = time.time() - process_start
+                stats['performance']['processing_duration'] = process_duration
+                logger.info(f"  ✅ Synced {stats['sources_synced']} sources ({stats['articles_fetched']} articles) "
+                            f"and processed {stats['articles_processed']} articles in {process_duration:.1f}s")
+            else:
+                await self._run_sequential_cycle(stats, sources, sync_start, checkpoint)
+            if settings.dlq_enabled:
+                # Step 3: Retry failed articles whose backoff has elapsed (not while the AI breaker is open)
+                stats['dead_letter_retry'] = await self._retry_dead_letters()
             # Calculate total duration
             end_time = datetime.utcnow()
             total_duration = (end_time - start_time).total_seconds()
@@ -193,16 +185,248 @@ class NewsOrchestrator:
                 )
             except Exception as e:
                 logger.info(f"  Failed to update processing stats: {e}")
+            await self._record_cycle_metrics(stats)
+            await self._finish_cycle_journal(checkpoint, stats)
             return stats
-            
+
+        except asyncio.CancelledError:
+            # Interrupted (e.g. stuck-task reset): leave the journal entry for the next cycle to resume
+            if checkpoint is not None:
+                get_cycle_journal().release(checkpoint)
+            raise
         except Exception as e:
             import traceback
             error_msg = f"Error in full processing cycle: {str(e)}"
             logger.error(f"❌ {error_msg}")
             logger.info(f"📍 Traceback:\n{traceback.format_exc()}")
             stats['errors'].append(error_msg)
+            await self._record_cycle_metrics(stats)
+            await self._finish_cycle_journal(checkpoint, stats, error=error_msg)
             return stats
-    
+        finally:
+            if journal_heartbeat is not None:
+                journal_heartbeat.cancel()
+
+    async def _run_sequential_cycle(self, stats: Dict[str, Any], sources: List[Source], sync_start: float,
+                                    checkpoint: Optional[CycleCheckpoint] = None) -> None:
+        """Steps 1b-2 one after another: fetch every source, save everything, then process."""
+        # Step 1b: HTTP fetching (NO DB transaction - semaphore free!)
+        logger.info("  🌐 Fetching articles via HTTP (no DB lock)...")
+        fetch_start = time.time()
+
+        # HTTP fetching happens here WITHOUT database lock
+        raw_articles = await self.source_manager.fetch_from_all_sources_no_db(sources)
+
+        fetch_duration = time.time() - fetch_start
+        logger.info(f"  ✅ HTTP fetching completed in {fetch_duration:.1f}s")
+        # Step 1c: Save articles to database (quick DB write)
+        logger.info("  💾 Saving articles to database...")
+        save_start = time.time()
+
+        sync_result = await self._save_fetched_articles(raw_articles, checkpoint)
+        total_articles = sum(len(articles) for articles in sync_result.values())
+
+        save_duration = time.time() - save_start
+        logger.info(f"  ✅ Saved {total_articles} articles in {save_duration:.1f}s")
+        stats.update({
+            'sources_synced': len(sync_result),
+            'articles_fetched': total_articles
+        })
+
+        sync_duration = time.time() - sync_start
+        stats['performance']['sync_duration'] = sync_duration
+        logger.info(f"  ✅ Total sync: {stats['sources_synced']} sources, {stats['articles_fetched']} articles in {sync_duration:.1f}s")
+        # Step 2: Process articles with AI
+        logger.info("🤖 Step 2: Processing articles with AI...")
+        process_start = time.time()
+        
+        if settings.ai_job_queue_enabled:
+            # Durable queue: other worker processes share the work; this cycle
+            # enqueues and then works on the queue itself until nothing is leasable
+            processing_result = await self._process_via_job_queue(stats)
+        else:
+            processing_result = await self._process_unprocessed_articles(
+                stats, after_save=self._journal_after_save(checkpoint)
+            )
+        stats.update(processing_result)
+        
+        process_duration = time.time() - process_start
+        stats['performance']['processing_duration'] = process_duration
+        logger.info(f"  ✅ Processed {stats['articles_processed']} articles in {process_duration:.1f}s")
+
+    async def _run_staged_cycle(self, stats: Dict[str, Any], sources: List[Source],
+                                checkpoint: Optional[CycleCheckpoint] = None) -> Dict[str, Any]:
+        """
+        Fetch, save and process as concurrent stages connected by bounded queues.
+
+        fetch (PIPELINE_FETCH_CONCURRENCY sources at once) -> save (one write per
+        group of finished sources) -> analyze (ai_concurrency_max workers; smart
+        filter and content extraction run per article inside this stage) ->
+        persist (micro-batch writer). A full queue makes the stage before it
+        wait, so fetching can't run arbitrarily far ahead of the AI. After the
+        freshly saved articles the rest of the unprocessed backlog is processed.
+        """
+        save_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.pipeline_save_queue_size)
+        id_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.pipeline_save_queue_size)
+        reader = StreamingArticleReader(self.db_queue_manager, self.article_limiter, id_queue)
+        sync_start = time.time()
+
+        async def _fetch() -> None:
+            try:
+                async for fetched in self.source_manager.iter_fetch_sources_no_db(
+                    sources, max_concurrent=settings.pipeline_fetch_concurrency
+                ):
+                    await save_queue.put(fetched)
+                    pipeline_metrics.set_queue_depth("save", save_queue.qsize())
+            finally:
+                await save_queue.put(None)
+
+        async def _save() -> None:
+            try:
+                done = False
+                while not done:
+                    item = await save_queue.get()
+                    # Sources that finished while the previous write ran share one transaction
+                    raw_articles = {}
+                    while item is not None:
+                        raw_articles[item[0]] = item[1]
+                        if save_queue.empty():
+                            break
+                        item = save_queue.get_nowait()
+                    done = item is None
+                    if not raw_articles:
+                        continue
+                    try:
+                        sync_result = await self._save_fetched_articles(raw_articles, checkpoint)
+                    except Exception as e:
+                        error_msg = f"Error saving articles of {len(raw_articles)} sources: {e}"
+                        logger.error(f"  ❌ {error_msg}")
+                        stats['errors'].append(error_msg)
+                        continue
+                    saved_ids = [a.id for articles in sync_result.values() for a in articles if a.id]
+                    stats['sources_synced'] += len(sync_result)
+                    stats['articles_fetched'] += len(saved_ids)
+                    logger.info(f"  💾 Saved {len(saved_ids)} articles from {len(sync_result)} sources")
+                    if saved_ids:
+                        await id_queue.put(saved_ids)
+            finally:
+                stats['performance']['sync_duration'] = time.time() - sync_start
+                await id_queue.put(None)
+
+        fetch_task = asyncio.create_task(_fetch())
+        save_task = asyncio.create_task(_save())
+        try:
+            return await self._process_unprocessed_articles(
+                stats, reader=reader, after_save=self._journal_after_save(checkpoint)
+            )
+        finally:
+            # Processing may stop reading early (error); saving still has to finish
+            async def _drain() -> None:
+                while await id_queue.get() is not None:
+                    pass
+
+            drain_task = asyncio.create_task(_drain())
+            await asyncio.gather(fetch_task, save_task, return_exceptions=True)
+            drain_task.cancel()
+
+    async def _save_fetched_articles(self, raw_articles: Dict[str, Optional[List[Article]]],
+                                     checkpoint: Optional[CycleCheckpoint] = None) -> Dict[str, List[Article]]:
+        """Save fetched articles (one write transaction); returns saved articles by source name.
+
+        With a checkpoint the sources are recorded as done in the cycle journal
+        in the same transaction. Sources whose fetch failed (None) are not
+        saved or recorded, so a resumed cycle fetches them again.
+        """
+        async def save_operation(db):
+            # Refresh sources with DB session
+            source_query = select(Source).where(Source.enabled == True)
+            result = await db.execute(source_query)
+            sources_db = result.scalars().all()
+
+            # Create source name -> source mapping
+            source_map = {s.name: s for s in sources_db}
+
+            saved = await self.source_manager.save_fetched_articles_with_sources(raw_articles, source_map, db)
+            # Assign ids now so callers can hand the new articles on
+            await db.flush()
+            if checkpoint is not None:
+                await get_cycle_journal().record_sources(
+                    db, checkpoint,
+                    [source_map[name].id for name in saved if name in source_map],
+                    sum(len(articles) for articles in saved.values())
+                )
+            return saved
+
+        async with pipeline_metrics.track("save"):
+            return await self.db_queue_manager.execute_write(save_operation, timeout=30.0)
+
+    async def _start_cycle_journal(self) -> Optional[CycleCheckpoint]:
+        """Open this cycle's journal entry (taking over an interrupted one); None if unavailable."""
+        try:
+            return await self.db_queue_manager.execute_write(get_cycle_journal().start, timeout=10.0)
+        except Exception as e:
+            logger.warning(f"  ⚠️ Cycle journal unavailable, running without checkpoints: {e}")
+            return None
+
+    async def _cycle_journal_heartbeat(self, checkpoint: CycleCheckpoint) -> None:
+        """Keep the journal entry fresh so other processes don't take the running cycle over."""
+        interval = max(5.0, settings.cycle_stale_minutes * 60 / 3)
+        while True:
+            await asyncio.sleep(interval)
+
+            async def heartbeat_operation(db):
+                await get_cycle_journal().heartbeat(db, checkpoint)
+
+            try:
+                await self.db_queue_manager.execute_write(heartbeat_operation, timeout=10.0)
+            except Exception as e:
+                logger.warning(f"  ⚠️ Cycle journal heartbeat failed: {e}")
+
+    def _journal_after_save(self, checkpoint: Optional[CycleCheckpoint]):
+        """Result writer hook counting persisted articles in the cycle journal."""
+        if checkpoint is None:
+            return None
+
+        async def record_analyzed(db, batch: List[Dict[str, Any]]) -> None:
+            await get_cycle_journal().record_analyzed(db, checkpoint, len(batch))
+
+        return record_analyzed
+
+    async def _finish_cycle_journal(self, checkpoint: Optional[CycleCheckpoint], stats: Dict[str, Any],
+                                    error: Optional[str] = None) -> None:
+        if checkpoint is None:
+            return
+
+        async def finish_journal_operation(db):
+            await get_cycle_journal().finish(db, checkpoint, stats, error=error)
+
+        try:
+            await self.db_queue_manager.execute_write(finish_journal_operation, timeout=10.0)
+        except Exception as e:
+            logger.info(f"  Failed to close cycle journal entry: {e}")
+
+    async def _record_cycle_metrics(self, stats: Dict[str, Any]) -> None:
+        """Close the cycle's pipeline metrics scope and persist it to pipeline_cycle_stats."""
+        cycle = pipeline_metrics.end_cycle()
+        started_at = datetime.utcfromtimestamp(cycle['started_at'] or cycle['finished_at'])
+        finished_at = datetime.utcfromtimestamp(cycle['finished_at'])
+
+        async def save_cycle_metrics_operation(db):
+            db.add(PipelineCycleStat(
+                started_at=started_at,
+                finished_at=finished_at,
+                duration_seconds=(finished_at - started_at).total_seconds(),
+                articles_fetched=stats.get('articles_fetched', 0),
+                articles_processed=stats.get('articles_processed', 0),
+                errors_count=len(stats.get('errors', [])),
+                stages=cycle['stages'],
+            ))
+
+        try:
+            await self.db_queue_manager.execute_write(save_cycle_metrics_operation, timeout=10.0)
+        except Exception as e:
+            logger.info(f"  Failed to save pipeline cycle metrics: {e}")
+
     async def _get_telegram_service_with_db_overrides(self) -> TelegramService:
         """Load telegram channel IDs from DB and return a properly configured service."""
         from .models import Setting
@@ -221,6 +445,7 @@ class NewsOrchestrator:
             service_chat_id=service_chat_id or None,
         )
 
+    @with_ai_priority(AIPriority.DIGEST)
     async def send_telegram_digest(self) -> Dict[str, Any]:
         """Generate and send Telegram digest."""
         try:
@@ -242,31 +467,7 @@ class NewsOrchestrator:
 
             summaries_count = await self.db_queue_manager.execute_read(check_summaries_operation, timeout=30.0)
 
-            # Step 2: Generate missing daily summaries (potentially slow write + AI)
-            if summaries_count == 0:
-                logger.info("📊 No daily summaries found for today - generating them first...")
-                summary_result = await self._generate_daily_summaries(timeout=300.0)
-                logger.info(f"  ✅ Generated {summary_result.get('summaries_generated', 0)} daily summaries")
-            else:
-                logger.info(f"📊 Using existing {summaries_count} daily summaries for today")
-            # Step 3: Build digest (read-only operation)
-            async def build_digest_operation(db):
-                digest_content = await self.digest_builder.create_combined_digest(db, today)
-
-                if digest_content == "SPLIT_NEEDED":
-                    # Use new method that handles splitting internally
-                    digest_parts = await self.digest_builder.create_digest_parts(db, today)
-
-                    if not digest_parts or digest_parts[0] == "Сводки новостей пока не готовы.":
-                        return {'error': 'No valid summaries found'}
-
-                    return {'digest_parts': digest_parts, 'split': True}
-
-                return {'digest_content': digest_content, 'split': False}
-
-            digest_result = await self.db_queue_manager.execute_read(build_digest_operation, timeout=30.0)
-
-            # Step 4: Build Telegraph page (read-only operation)
+            # Telegraph page only needs today's articles - build it while summaries are generated
             async def build_telegraph_payload(db):
                 grouped = await self._group_articles_by_category(db, today)
                 articles_by_category = {}
@@ -282,25 +483,88 @@ class NewsOrchestrator:
                     ]
                 return articles_by_category
 
-            telegraph_url = None
+            async def build_telegraph_page() -> Optional[str]:
+                try:
+                    from .services.telegraph_service import TelegraphService
+                    telegraph_service = TelegraphService()
+                    telegraph_payload = await self.db_queue_manager.execute_read(build_telegraph_payload, timeout=30.0)
+                    return await telegraph_service.create_news_page(telegraph_payload)
+                except Exception as e:
+                    logger.warning(f"⚠️ Telegraph generation failed: {e}")
+                    return None
+
+            telegraph_task = asyncio.create_task(build_telegraph_page())
+            digest_stream = None
+            streamed_parts: asyncio.Queue = asyncio.Queue()
+            stream_sender: Optional[asyncio.Task] = None
+            digest_result = None
+
             try:
-                from .services.telegraph_service import TelegraphService
-                telegraph_service = TelegraphService()
-                telegraph_payload = await self.db_queue_manager.execute_read(build_telegraph_payload, timeout=30.0)
-                telegraph_url = await telegraph_service.create_news_page(telegraph_payload)
-            except Exception as e:
-                logger.warning(f"⚠️ Telegraph generation failed: {e}")
+                # Step 2: Generate missing daily summaries (potentially slow write + AI)
+                if summaries_count == 0:
+                    logger.info("📊 No daily summaries found for today - generating them first...")
+                    if settings.ai_streaming_enabled:
+                        # Digest parts go out as soon as their summaries are final,
+                        # while later categories are still streaming
+                        digest_stream = self.digest_builder.create_streaming_digest(today, streamed_parts.put_nowait)
+                        stream_sender = asyncio.create_task(self._send_digest_parts(streamed_parts))
+                    summary_result = await self._generate_daily_summaries(timeout=300.0, digest_stream=digest_stream)
+                    logger.info(f"  ✅ Generated {summary_result.get('summaries_generated', 0)} daily summaries")
+                    if digest_stream is not None:
+                        remaining_parts = digest_stream.finish()
+                        if remaining_parts or digest_stream.parts_closed:
+                            digest_result = {'digest_parts': remaining_parts, 'split': True}
+                else:
+                    logger.info(f"📊 Using existing {summaries_count} daily summaries for today")
+
+                # Step 3: Build digest (read-only operation)
+                async def build_digest_operation(db):
+                    digest_content = await self.digest_builder.create_combined_digest(db, today)
+
+                    if digest_content == "SPLIT_NEEDED":
+                        # Use new method that handles splitting internally
+                        digest_parts = await self.digest_builder.create_digest_parts(db, today)
+
+                        if not digest_parts or digest_parts[0] == "Сводки новостей пока не готовы.":
+                            return {'error': 'No valid summaries found'}
+
+                        return {'digest_parts': digest_parts, 'split': True}
+
+                    return {'digest_content': digest_content, 'split': False}
+
+                if digest_result is None:
+                    digest_result = await self.db_queue_manager.execute_read(build_digest_operation, timeout=30.0)
+            except BaseException:
+                telegraph_task.cancel()
+                if stream_sender is not None:
+                    stream_sender.cancel()
+                raise
+
+            # Step 4: Telegraph page (started before summary generation)
+            telegraph_url = await telegraph_task
+            streamed_ok = 0
+            if stream_sender is not None:
+                streamed_parts.put_nowait(None)
+                streamed_ok = await stream_sender
+            parts_streamed = digest_stream.parts_closed if digest_stream is not None else 0
+
+            if digest_result.get('error'):
+                logger.warning(f"⚠️ Digest not sent: {digest_result['error']}")
+                return {'success': False, 'error': digest_result['error']}
             if digest_result.get('split'):
                 # Send multiple parts
-                if telegraph_url:
+                digest_parts = digest_result['digest_parts']
+                if telegraph_url and digest_parts:
                     link_line = f"\n<b>Полная версия:</b> <a href=\"{telegraph_url}\">Telegraph</a>"
-                    digest_result['digest_parts'][0] = digest_result['digest_parts'][0] + link_line
+                    # Parts already streamed out can't take the link, so it goes last then
+                    link_index = -1 if parts_streamed else 0
+                    digest_parts[link_index] = digest_parts[link_index] + link_line
 
-                sent_ok = 0
-                for part in digest_result['digest_parts']:
+                sent_ok = streamed_ok
+                for part in digest_parts:
                     if await self.telegram_service.send_message(part):
                         sent_ok += 1
-                return {'success': sent_ok == len(digest_result['digest_parts']), 'parts_sent': sent_ok}
+                return {'success': sent_ok == parts_streamed + len(digest_parts), 'parts_sent': sent_ok}
             else:
                 # Send single message
                 digest_content = digest_result['digest_content']
@@ -313,117 +577,238 @@ class NewsOrchestrator:
             error_msg = f"Error sending Telegram digest ({type(e).__name__}): {e}"
             logger.error(f"❌ {error_msg}")
             return {'success': False, 'error': error_msg}
+
+    async def _send_digest_parts(self, parts: asyncio.Queue) -> int:
+        """Send digest parts from the queue in order until None; returns how many were sent."""
+        sent = 0
+        while True:
+            part = await parts.get()
+            if part is None:
+                return sent
+            if await self.telegram_service.send_message(part):
+                sent += 1
     
-    async def _process_unprocessed_articles(self, stats: Dict[str, Any]) -> Dict[str, Any]:
-        """Process unprocessed articles using specialized processors."""
+    async def _process_unprocessed_articles(self, stats: Dict[str, Any], reader=None,
+                                            after_save=None,
+                                            record_dead_letters: bool = True) -> Dict[str, Any]:
+        """Process unprocessed articles using specialized processors.
+
+        Args:
+            reader: Page source with pages()/rows_read/pages_read; defaults to the
+                whole unprocessed backlog (AI workers pass their leased jobs)
+            after_save: Hook run in each result batch's write transaction
+            record_dead_letters: Add failed articles to the dead-letter queue; False
+                for callers that retry failures themselves (AI job leases, DLQ retries)
+        """
         try:
-            # Step 1: Get articles from database (quick transaction)
-            logger.info("  📋 Fetching unprocessed articles from database...")
-            from sqlalchemy.orm import selectinload
-
-            async def fetch_articles_operation(db):
-                # Build base query
-                from sqlalchemy import and_ as sa_and
-                unprocessed_query = select(Article).options(
-                    selectinload(Article.source)  # Eager load source
-                ).where(
-                    (Article.processed == False) |
-                    (Article.summary_processed == False) |
-                    (Article.category_processed == False) |
-                    (Article.ad_processed == False) |
-                    # Re-process articles that were marked done but have no summary
-                    sa_and(Article.summary.is_(None), Article.content.isnot(None))
-                )
-
-                # Apply limits
-                unprocessed_query = self.article_limiter.apply_limits_to_query(unprocessed_query)
-                unprocessed_query = self.article_limiter.apply_date_filters_to_query(unprocessed_query)
-
-                result = await db.execute(unprocessed_query)
-                articles = result.scalars().all()
-
-                # Convert to list of dicts for processing outside transaction
-                return [
-                    {
-                        'id': a.id,
-                        'title': a.title,
-                        'url': a.url,
-                        'content': a.content,
-                        'summary': a.summary,
-                        'source_id': a.source_id,
-                        'source_type': a.source.source_type if a.source else 'rss',
-                        'published_at': a.published_at,
-                        'summary_processed': a.summary_processed,
-                        'category_processed': a.category_processed,
-                        'ad_processed': a.ad_processed,
-                    }
-                    for a in articles
-                ]
-
-            articles_data = await self.db_queue_manager.execute_read(fetch_articles_operation, timeout=10.0)
-
-            if not articles_data:
-                return {'articles_processed': 0, 'articles_summarized': 0, 'articles_categorized': 0}
-
-            logger.info(f"  🔄 Processing {len(articles_data)} unprocessed articles (transaction closed)...")
+            # Step 1: The backlog is read page by page (most valuable first, short reads) and fed
+            # into a bounded work queue, so a large backlog neither times out nor fills memory
+            reader = reader or create_backlog_reader(self.db_queue_manager, self.article_limiter)
+            # Articles whose processing raised, for the dead-letter queue
+            failures: List[tuple] = []
+            # Per-cycle memo of combined analyses keyed by article id: one AI analysis
+            # feeds summary, title, categories and ad flags for the same article
+            analysis_memo: Dict[int, Dict[str, Any]] = {}
+            # Trivial posts get a local extractive summary instead of an AI request
+            local_summaries: Dict[int, Dict[str, Any]] = {}
             # Step 2: Process with AI in parallel (NO database transaction - semaphore is free!)
             processed_count = 0
             summarized_count = 0
             categorized_count = 0
             _lock = asyncio.Lock()
 
-            # Max 5 articles processed concurrently to avoid hammering the AI API
-            _ai_semaphore = asyncio.Semaphore(5)
+            # Bounds articles in flight; Gemini concurrency itself is governed by the
+            # shared adaptive limiter (core.adaptive_limiter.ai_concurrency_limiter)
+            _ai_semaphore = asyncio.Semaphore(settings.ai_concurrency_max)
+
+            backlog_cutoff = datetime.utcnow() - timedelta(hours=settings.ai_backlog_age_hours)
+
+            # Error-page markers for summaries and titles ('bad_summary'/'bad_title' rule sets)
+            text_rules = get_text_rules()
+            await text_rules.refresh_if_stale(self.db_queue_manager)
+
+            # Near-duplicates reuse their canonical article's analysis instead of a new AI request.
+            # Canonicals analyzed in this call resolve a future with their results (None on failure)
+            near_duplicates = get_near_duplicate_index() if settings.near_duplicates_enabled else None
+            canonical_results: Dict[int, asyncio.Future] = {}
+            if near_duplicates is not None:
+                try:
+                    loaded = await self.db_queue_manager.execute_read(near_duplicates.refresh, timeout=10.0)
+                    if loaded:
+                        logger.info(f"  🧬 Loaded {loaded} article signatures into the near-duplicate index")
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Near-duplicate index refresh failed: {e}")
+
+            async def _finish_locally(article_data: dict, local_plan: dict) -> bool:
+                """Complete a trivial post without AI: extractive summary, keyword category, no ad."""
+                nonlocal processed_count, summarized_count, categorized_count
+                article_data['summary'] = local_plan['summary']
+                if not article_data['category_processed']:
+                    category = self.categorization_processor.get_fallback_category(
+                        article_data.get('title') or '', article_data.get('content') or ''
+                    )
+                    article_data['categories'] = [{'name': category, 'confidence': 0.5, 'ai_category': category}]
+                if not article_data['ad_processed']:
+                    # Posts with 'ad_signal' rule hits never get here (should_summarize_locally)
+                    article_data['advertising'] = {
+                        'is_advertisement': False,
+                        'ad_confidence': 0.0,
+                        'ad_type': None,
+                        'ad_reasoning': local_plan['reason'],
+                    }
+                article_data['summary_processed'] = True
+                article_data['category_processed'] = True
+                article_data['ad_processed'] = True
+                async with _lock:
+                    processed_count += 1
+                    summarized_count += 1
+                    categorized_count += 1
+                return True
+
+            async def _attach_to_canonical(article_data: dict) -> bool:
+                """Copy a near-duplicate's results from its canonical article; registers canonicals."""
+                nonlocal processed_count
+                fingerprint = simhash(article_data.get('title'), article_data.get('content'))
+                article_data['simhash'] = fingerprint
+                if fingerprint is None or article_data['summary_processed']:
+                    return False
+                match = near_duplicates.find(fingerprint, exclude=article_data['id'])
+                if match is None:
+                    near_duplicates.add(article_data['id'], fingerprint)
+                    canonical_results[article_data['id']] = asyncio.get_running_loop().create_future()
+                    return False
+
+                canonical_id, distance = match
+                pending = canonical_results.get(canonical_id)
+                if pending is not None:
+                    canonical = await pending
+                else:
+                    canonical = await self.db_queue_manager.execute_read(
+                        lambda db: load_canonical_analysis(db, canonical_id), timeout=10.0
+                    )
+                if not canonical:
+                    return False
+
+                article_data['summary'] = canonical['summary']
+                if canonical.get('categories'):
+                    article_data['categories'] = [dict(c) for c in canonical['categories']]
+                if canonical.get('advertising'):
+                    article_data['advertising'] = dict(canonical['advertising'])
+                article_data['canonical_article_id'] = canonical_id
+                article_data['summary_processed'] = True
+                article_data['category_processed'] = True
+                article_data['ad_processed'] = True
+                async with _lock:
+                    processed_count += 1
+                    stats['near_duplicates'] = stats.get('near_duplicates', 0) + 1
+                logger.info(f"  🧬 Article {article_data['id']} is a near-duplicate of {canonical_id} (distance {distance})")
+                return True
+
+            async def _process_or_attach(article_data: dict) -> bool:
+                if near_duplicates is None:
+                    return await _process_one(article_data)
+                try:
+                    if await _attach_to_canonical(article_data):
+                        return True
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Near-duplicate lookup failed for {article_data.get('url')}: {e}")
+                ok = False
+                try:
+                    ok = await _process_one(article_data)
+                    return ok
+                finally:
+                    pending = canonical_results.get(article_data['id'])
+                    if pending is not None and not pending.done():
+                        if ok and article_data.get('summary'):
+                            pending.set_result({
+                                'summary': article_data['summary'],
+                                'categories': article_data.get('categories'),
+                                'advertising': article_data.get('advertising'),
+                            })
+                        else:
+                            # Not a usable canonical: its duplicates get analyzed themselves
+                            pending.set_result(None)
+                            near_duplicates.remove(article_data['id'])
+
+            def _ai_priority(article_data: dict) -> AIPriority:
+                published_at = article_data.get('published_at')
+                is_backlog = published_at is not None and published_at.replace(tzinfo=None) < backlog_cutoff
+                return AIPriority.BACKLOG if is_backlog else AIPriority.FRESH
 
             async def _process_one(article_data: dict) -> bool:
                 nonlocal processed_count, summarized_count, categorized_count
+                # Each gather() task has its own context, so this only affects this article's AI requests
+                if ai_priority_var.get() is None:
+                    ai_priority_var.set(_ai_priority(article_data))
                 async with _ai_semaphore:
                     try:
                         source_type = article_data['source_type']
                         article_url = article_data['url']
 
+                        article_id = article_data['id']
+
+                        local_plan = local_summaries.get(article_id)
+                        if local_plan and not local_plan['audit']:
+                            return await _finish_locally(article_data, local_plan)
+
                         if not article_data['summary_processed'] or (not article_data.get('summary') and article_data.get('content')):
-                            async with _lock:
-                                stats['api_calls_made'] += 1
-                            summary_result = await self.ai_processor.get_summary_by_source_type(
-                                ArticleDTO.for_summarization(article_data), source_type, stats
-                            )
+                            memo_analysis = analysis_memo.get(article_id)
+                            if memo_analysis:
+                                summary_result = {
+                                    'summary': memo_analysis.get('summary'),
+                                    'optimized_title': memo_analysis.get('optimized_title'),
+                                    'analysis': memo_analysis,
+                                }
+                            else:
+                                async with _lock:
+                                    stats['api_calls_made'] += 1
+                                summary_result = await self.ai_processor.get_summary_by_source_type(
+                                    ArticleDTO.for_summarization(article_data), source_type, stats
+                                )
                             summary = summary_result.get('summary') if isinstance(summary_result, dict) else summary_result
                             optimized_title = summary_result.get('optimized_title') if isinstance(summary_result, dict) else None
                             if summary:
                                 # Don't save summary if it describes a blocked/error page
-                                _bad_summary_markers = [
-                                    'недоступен', 'защиты от ботов', 'just a moment',
-                                    'access denied', 'cloudflare', 'enable javascript',
-                                    'checking your browser', 'temporarily unavailable',
-                                ]
-                                if not any(m in summary.lower() for m in _bad_summary_markers):
+                                if not text_rules.matches(summary, 'bad_summary'):
                                     article_data['summary'] = summary
+                                    if summary_result.get('analysis'):
+                                        analysis_memo[article_id] = summary_result['analysis']
+                                    if local_plan:
+                                        get_extractive_summarizer().record_audit(local_plan['summary'], summary)
                                     async with _lock:
                                         summarized_count += 1
                                 else:
+                                    analysis_memo.pop(article_id, None)
                                     logger.warning(f"  ⚠️ Skipped error-page summary for {article_url}")
                             if optimized_title and optimized_title != article_data.get('title'):
                                 # Don't overwrite good RSS title with error page titles
-                                _bad_title_markers = [
-                                    'ошибка', 'just a moment', 'access denied', 'forbidden',
-                                    'cloudflare', 'captcha', 'robot', 'bot detection',
-                                    'please wait', 'checking your browser', 'temporarily unavailable',
-                                ]
-                                if not any(m in optimized_title.lower() for m in _bad_title_markers):
+                                if not text_rules.matches(optimized_title, 'bad_title'):
                                     article_data['title'] = optimized_title
 
+                        analysis = analysis_memo.get(article_id)
+
                         if not article_data['category_processed']:
-                            async with _lock:
-                                stats['api_calls_made'] += 1
-                            categories = await self.categorization_processor.categorize_by_source_type_new(
-                                ArticleDTO.for_categorization(article_data), source_type, stats
-                            )
+                            if analysis:
+                                categories = self.categorization_processor.categories_from_analysis(analysis)
+                            else:
+                                async with _lock:
+                                    stats['api_calls_made'] += 1
+                                categories = await self.categorization_processor.categorize_by_source_type_new(
+                                    ArticleDTO.for_categorization(article_data), source_type, stats
+                                )
                             if categories:
                                 article_data['categories'] = categories
                                 async with _lock:
                                     categorized_count += 1
 
+                        if analysis and not article_data['ad_processed']:
+                            article_data['advertising'] = {
+                                'is_advertisement': bool(analysis.get('is_advertisement', False)),
+                                'ad_confidence': float(analysis.get('ad_confidence') or 0.0),
+                                'ad_type': (analysis.get('ad_type') or '')[:50] or None,
+                                'ad_reasoning': analysis.get('ad_reasoning'),
+                            }
+
                         article_data['summary_processed'] = True
                         article_data['category_processed'] = True
                         article_data['ad_processed'] = True
@@ -433,65 +818,81 @@ class NewsOrchestrator:
 
                     except Exception as e:
                         logger.warning(f"  ⚠️ Error processing article {article_data.get('url')}: {e}")
+                        failures.append((article_data, e))
                         return False
 
-            await asyncio.gather(*[_process_one(a) for a in articles_data])
-            logger.info(f"  ✅ AI processing completed: {processed_count} articles, {summarized_count} summaries, {categorized_count} categories")
-            # Step 3: Save results to database (new transaction, only writes)
-            logger.info("  💾 Saving processed results to database...")
-            async def save_results_operation(db):
-                updated_count = 0
-
-                # Batch-load all articles in one query instead of N×db.get()
-                article_ids = [a['id'] for a in articles_data]
-                result = await db.execute(select(Article).where(Article.id.in_(article_ids)))
-                articles_by_id = {a.id: a for a in result.scalars().all()}
-
-                # Pre-load categories once for all articles
-                from .models import Category
-                cat_result = await db.execute(select(Category))
-                categories_by_name: Dict[str, int] = {
-                    c.name.lower(): c.id for c in cat_result.scalars().all()
-                }
-
-                for article_data in articles_data:
+            # Step 3: Results are persisted in micro-batches while the AI work is still running,
+            # so a crash or timeout only loses the articles not yet flushed
+            result_writer = ArticleResultWriter(
+                self.db_queue_manager, self._save_ai_categories_bulk, after_save=after_save
+            )
+            result_writer.start()
+            work_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.backlog_queue_size)
+
+            async def _prefetch_then_queue(candidates: List[Dict[str, Any]], priority: AIPriority) -> None:
+                # Own task: the page's other articles are already being worked on meanwhile
+                if ai_priority_var.get() is None:
+                    ai_priority_var.set(priority)
+                try:
+                    await self._prefetch_batch_analysis(candidates, stats, analysis_memo)
+                finally:
+                    # Queued only now, so the per-article pass finds their analyses in the memo
+                    for article_data in candidates:
+                        await work_queue.put(article_data)
+
+            async def _produce() -> None:
+                prefetches: List[asyncio.Task] = []
+                try:
+                    async for page in reader.pages():
+                        logger.info(f"  🔄 Read {len(page)} unprocessed articles (page {reader.pages_read}, {reader.rows_read} total)")
+                        page_local = self._plan_local_summaries(page, stats)
+                        local_summaries.update(page_local)
+                        # Short Telegram posts are analyzed several-per-request, fresh and backlog apart
+                        candidates = self._batch_analysis_candidates(
+                            [a for a in page if a['id'] not in page_local or page_local[a['id']]['audit']]
+                        )
+                        by_priority: Dict[AIPriority, List[Dict[str, Any]]] = {}
+                        for article_data in candidates:
+                            by_priority.setdefault(_ai_priority(article_data), []).append(article_data)
+                        for priority, group in by_priority.items():
+                            prefetches.append(asyncio.create_task(_prefetch_then_queue(group, priority)))
+                        candidate_ids = {a['id'] for a in candidates}
+                        for article_data in page:
+                            if article_data['id'] not in candidate_ids:
+                                await work_queue.put(article_data)
+                finally:
+                    await asyncio.gather(*prefetches, return_exceptions=True)
+
+            async def _work() -> None:
+                while True:
+                    article_data = await work_queue.get()
+                    if article_data is None:
+                        return
+                    pipeline_metrics.set_queue_depth("process", work_queue.qsize())
                     try:
-                        article = articles_by_id.get(article_data['id'])
-                        if not article:
-                            continue
-
-                        if article_data.get('summary') and article_data['summary'] != article.summary:
-                            article.summary = article_data['summary']
-
-                        if article_data.get('title') and article_data['title'] != article.title:
-                            article.title = article_data['title']
-
-                        article.summary_processed = article_data['summary_processed']
-                        article.category_processed = article_data['category_processed']
-                        article.ad_processed = article_data['ad_processed']
-                        article.processed = all([
-                            article_data['summary_processed'],
-                            article_data['category_processed'],
-                            article_data['ad_processed']
-                        ])
-
-                        # Save categories in the same transaction
-                        categories = article_data.get('categories')
-                        if categories:
-                            await self._save_ai_categories_to_database(
-                                db, article_data['id'], categories,
-                                preloaded_categories=categories_by_name
-                            )
-
-                        updated_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"  ⚠️ Error saving article {article_data['id']}: {e}")
-                        continue
-
-                return updated_count
-
-            saved_count = await self.db_queue_manager.execute_write(save_results_operation, timeout=30.0)
+                        # Own task per article so the AI priority it sets doesn't leak into the next one
+                        async with pipeline_metrics.track("process"):
+                            await asyncio.create_task(_process_or_attach(article_data))
+                    finally:
+                        result_writer.submit(article_data)
+                        # The memo entry is only needed while this article is processed
+                        analysis_memo.pop(article_data['id'], None)
+                        local_summaries.pop(article_data['id'], None)
+
+            workers = [asyncio.create_task(_work()) for _ in range(settings.ai_concurrency_max)]
+            try:
+                await _produce()
+            finally:
+                for _ in workers:
+                    await work_queue.put(None)
+                await asyncio.gather(*workers, return_exceptions=True)
+                saved_count = await result_writer.close()
+                if failures and record_dead_letters and settings.dlq_enabled:
+                    await self._record_dead_letters(failures)
+
+            if not reader.rows_read:
+                return {'articles_processed': 0, 'articles_summarized': 0, 'articles_categorized': 0}
+            logger.info(f"  ✅ AI processing completed: {processed_count} articles, {summarized_count} summaries, {categorized_count} categories")
             logger.info(f"  ✅ Saved {saved_count} processed articles to database")
             return {
                 'articles_processed': processed_count,
@@ -505,8 +906,190 @@ class NewsOrchestrator:
             stats['errors'].append(error_msg)
             return {'articles_processed': 0, 'articles_summarized': 0, 'articles_categorized': 0}
     
-    async def _generate_daily_summaries(self, timeout: float = 60.0) -> Dict[str, Any]:
-        """Generate daily summaries: read articles, generate AI summaries, save to DB."""
+    async def _record_dead_letters(self, failures: List[tuple]) -> None:
+        """Add articles whose processing failed to the dead-letter queue."""
+        dlq = get_dead_letter_queue()
+        entries = [
+            (
+                {key: article_data.get(key) for key in ('id', 'url', 'title', 'source_id', 'source_type')},
+                FailureReason.from_exception(error), f"{type(error).__name__}: {error}", None
+            )
+            for article_data, error in failures
+        ]
+
+        async def record_dead_letters_operation(db):
+            return await dlq.add_many(db, entries)
+
+        try:
+            added = await self.db_queue_manager.execute_write(record_dead_letters_operation, timeout=30.0)
+            logger.info(f"  📮 Recorded {added} failed articles in the dead-letter queue")
+        except Exception as e:
+            logger.warning(f"  ⚠️ Failed to record {len(entries)} articles in the dead-letter queue: {e}")
+
+    async def _retry_dead_letters(self) -> Dict[str, Any]:
+        """Re-process dead-letter entries whose retry is due."""
+        from .services.dlq_worker import DeadLetterRetryWorker
+
+        try:
+            totals = await DeadLetterRetryWorker(self).drain()
+            if totals['claimed']:
+                logger.info(f"  🔁 Retried {totals['claimed']} dead-letter entries, "
+                            f"{totals['articles_processed']} articles processed")
+            return totals
+        except Exception as e:
+            logger.warning(f"  ⚠️ Dead-letter retry failed: {e}")
+            return {'error': str(e)}
+
+    async def _process_via_job_queue(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Enqueue unprocessed articles as AI jobs and drain the queue alongside other workers."""
+        from .services.ai_worker import AIWorker, default_worker_id
+        from .services.job_queue import get_job_queue
+
+        job_queue = get_job_queue()
+        backlog_cutoff = datetime.utcnow() - timedelta(hours=settings.ai_backlog_age_hours)
+
+        async def read_unprocessed_ids_operation(db):
+            query = (
+                select(Article.id, Article.published_at)
+                .where(unprocessed_predicate(), not_dead_lettered_predicate())
+            )
+            query = self.article_limiter.apply_date_filters_to_query(query)
+            query = self.article_limiter.apply_limits_to_query(query)
+            result = await db.execute(query)
+            return [(row.id, row.published_at) for row in result]
+
+        async def enqueue_operation(db):
+            fresh, backlog = [], []
+            for article_id, published_at in unprocessed:
+                is_backlog = published_at is not None and published_at.replace(tzinfo=None) < backlog_cutoff
+                (backlog if is_backlog else fresh).append(article_id)
+            return (
+                await job_queue.enqueue(db, fresh, priority=int(AIPriority.FRESH)) +
+                await job_queue.enqueue(db, backlog, priority=int(AIPriority.BACKLOG))
+            )
+
+        try:
+            unprocessed = await self.db_queue_manager.execute_read(read_unprocessed_ids_operation, timeout=30.0)
+            created = await self.db_queue_manager.execute_write(enqueue_operation, timeout=30.0) if unprocessed else 0
+            logger.info(f"  📬 Enqueued {created} AI jobs ({len(unprocessed)} unprocessed articles)")
+        except Exception as e:
+            error_msg = f"Error enqueueing AI jobs: {e}"
+            logger.error(f"  ❌ {error_msg}")
+            stats['errors'].append(error_msg)
+
+        totals = await AIWorker(self, worker_id=f"cycle-{default_worker_id()}").run(drain=True)
+        stats['api_calls_made'] += totals['api_calls_made']
+        return {
+            'articles_processed': totals['articles_processed'],
+            'articles_summarized': totals['articles_summarized'],
+            'articles_categorized': totals['articles_categorized'],
+        }
+
+    def _plan_local_summaries(
+        self, articles_data: List[Dict[str, Any]], stats: Dict[str, Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Pick posts that get a local extractive summary instead of AI analysis.
+
+        Returns a dict keyed by article id with the local 'summary' and an 'audit'
+        flag. Audited posts (LOCAL_SUMMARY_AUDIT_RATE) still go through AI and
+        the two summaries are compared, so the local tier's quality stays visible.
+        """
+        from .services.smart_filter import get_smart_filter
+        smart_filter = get_smart_filter()
+        summarizer = get_extractive_summarizer()
+
+        plans: Dict[int, Dict[str, Any]] = {}
+        for article_data in articles_data:
+            needs_summary = not article_data['summary_processed'] or (
+                not article_data.get('summary') and article_data.get('content')
+            )
+            if not needs_summary:
+                continue
+            use_local, reason = smart_filter.should_summarize_locally(
+                article_data.get('title') or '', article_data.get('content') or '',
+                article_data.get('url') or '', article_data['source_type']
+            )
+            if not use_local:
+                continue
+            plans[article_data['id']] = {
+                'summary': summarizer.summarize(article_data['content'], article_data.get('title')),
+                'reason': reason,
+                'audit': random.random() < settings.local_summary_audit_rate,
+            }
+
+        if plans:
+            audited = sum(1 for plan in plans.values() if plan['audit'])
+            stats['local_summaries'] = stats.get('local_summaries', 0) + len(plans) - audited
+            logger.info(f"  ✂️ Local summaries for {len(plans) - audited} trivial posts ({audited} audited against AI)")
+        return plans
+
+    def _batch_analysis_candidates(self, articles_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Short Telegram posts that can be analyzed several-per-request.
+
+        Only posts without an external link qualify — their content is the post
+        itself, so no extraction is needed.
+        """
+        from urllib.parse import urlparse
+
+        def _is_telegram_url(url: str) -> bool:
+            try:
+                host = urlparse(url or '').netloc.lower()
+                return ('t.me' in host) or ('telegram.me' in host)
+            except Exception:
+                return False
+
+        return [
+            a for a in articles_data
+            if a['source_type'] == 'telegram'
+            and _is_telegram_url(a['url'])
+            and (not a['summary_processed'] or not a['category_processed'] or not a.get('summary'))
+            and self.ai_client.is_batchable(a.get('content'))
+        ]
+
+    async def _prefetch_batch_analysis(
+        self, candidates: List[Dict[str, Any]], stats: Dict[str, Any],
+        analysis_memo: Dict[int, Dict[str, Any]]
+    ) -> int:
+        """Analyze batch candidates (_batch_analysis_candidates) in batched AI requests.
+
+        Successful results are stored in analysis_memo under the article id and
+        used by the per-article pass instead of separate summary and
+        categorization requests.
+
+        Returns:
+            Number of articles that received a batch analysis
+        """
+        if len(candidates) < 2:
+            return 0
+
+        batch_input = [
+            {'title': a['title'] or '', 'content': a['content'], 'url': a['url'] or '', 'source_type': a['source_type']}
+            for a in candidates
+        ]
+        try:
+            batch_count = len(self.ai_client.plan_analysis_batches(batch_input))
+            logger.info(f"  📦 Batch-analyzing {len(candidates)} short Telegram posts in {batch_count} requests...")
+            results = await self.ai_client.analyze_articles_batch(batch_input, stats=stats)
+        except Exception as e:
+            logger.warning(f"  ⚠️ Batch analysis failed, using per-article requests: {e}")
+            return 0
+
+        attached = 0
+        for article_data, result in zip(candidates, results):
+            if result and result.get('summary'):
+                analysis_memo[article_data['id']] = result
+                attached += 1
+        logger.info(f"  ✅ Batch analysis ready for {attached}/{len(candidates)} posts")
+        return attached
+
+    @with_ai_priority(AIPriority.DIGEST)
+    async def _generate_daily_summaries(self, timeout: float = 60.0,
+                                        digest_stream: Optional[StreamingDigest] = None) -> Dict[str, Any]:
+        """Generate daily summaries: read articles, generate AI summaries, save to DB.
+
+        Args:
+            digest_stream: Digest assembled from the summaries while they stream
+        """
         try:
             today = datetime.utcnow().date()
 
@@ -523,15 +1106,27 @@ class NewsOrchestrator:
             # Step 2: Generate AI summaries outside any DB lock
             summary_generator = self.digest_builder.summary_generator
             generated: Dict[str, Any] = {}
-            for category, articles in categories.items():
-                if not articles:
-                    continue
+
+            async def summarize(category: str, articles: List[Article]):
                 summary_text = await summary_generator.generate_category_summary(
-                    category, articles, today
+                    category, articles, today,
+                    on_text=digest_stream.on_text(category) if digest_stream is not None else None
                 )
+                if digest_stream is not None:
+                    digest_stream.complete(category, summary_text)
                 if summary_text:
                     generated[category] = (summary_text, len(articles))
 
+            jobs = [(category, articles) for category, articles in categories.items() if articles]
+            if digest_stream is not None:
+                digest_stream.start({category: len(articles) for category, articles in jobs})
+            if settings.digest_parallel_categories:
+                # Streams overlap; the adaptive limiter keeps the request rate in check
+                await asyncio.gather(*(summarize(c, a) for c, a in jobs))
+            else:
+                for category, articles in jobs:
+                    await summarize(category, articles)
+
             if not generated:
                 logger.warning("  ⚠️ No summaries generated by AI")
                 return {'summaries_generated': 0}
@@ -580,75 +1175,95 @@ class NewsOrchestrator:
 
         return grouped
 
-    async def _save_ai_categories_to_database(self, db: AsyncSession, article_id: int,
-                                              ai_categories: List[Dict[str, Any]],
-                                              preloaded_categories: Optional[Dict[str, int]] = None):
-        """Save AI categories to database, resolving category_id via display service mapping.
+    async def _save_ai_categories_bulk(self, db: AsyncSession,
+                                       categories_by_article: Dict[int, List[Dict[str, Any]]],
+                                       preloaded_categories: Optional[Dict[str, int]] = None) -> int:
+        """Replace the AI categories of many articles with one DELETE and one INSERT.
 
-        Pass preloaded_categories to avoid repeated SELECT Category queries when saving
-        multiple articles in the same transaction.
+        AI category names are resolved to category ids in memory beforehand: known
+        fixed category names directly, everything else through one batched lookup
+        of the display service mapping. Returns the number of rows inserted.
+        Errors propagate so the caller's transaction (and retry) covers them.
         """
-        try:
-            from sqlalchemy import text
-            from .services.category_display_service import get_category_display_service
-
-            # Clear existing categories for this article
-            await db.execute(
-                text("DELETE FROM article_categories WHERE article_id = :article_id"),
-                {'article_id': article_id}
-            )
-
+        if not categories_by_article:
+            return 0
+        from .services.category_display_service import get_category_display_service
+
+        # Use preloaded categories if provided, otherwise load from DB
+        if preloaded_categories is not None:
+            categories_by_name = preloaded_categories
+        else:
+            from .models import Category
+            result = await db.execute(select(Category))
+            categories_by_name = {c.name.lower(): c.id for c in result.scalars().all()}
+        other_id = categories_by_name.get('other')
+
+        # Free-form AI categories: one mapping lookup for the whole batch
+        unknown = {
+            (cat_data.get('name') or 'Other')
+            for ai_categories in categories_by_article.values()
+            for cat_data in ai_categories
+            if (cat_data.get('name') or 'Other').lower() not in categories_by_name
+        }
+        mapped: Dict[str, str] = {}
+        if unknown:
             category_display_service = await get_category_display_service(db)
+            mapped = await category_display_service.resolve_fixed_categories(unknown)
 
-            # Use preloaded categories if provided, otherwise load from DB
-            if preloaded_categories is not None:
-                categories_by_name = preloaded_categories
-            else:
-                from .models import Category
-                result = await db.execute(select(Category))
-                categories_by_name = {c.name.lower(): c.id for c in result.scalars().all()}
-
-            other_id = categories_by_name.get('other')
-
+        article_ids, category_ids, confidences, ai_names = [], [], [], []
+        for article_id, ai_categories in categories_by_article.items():
+            seen = set()
             for cat_data in ai_categories:
-                ai_category_name = cat_data.get('name', 'Other')
-                confidence = cat_data.get('confidence', 1.0)
-
-                # Fast path: if AI returned a known fixed category name, use it directly
+                ai_category_name = cat_data.get('name') or 'Other'
                 category_id = categories_by_name.get(ai_category_name.lower())
                 if category_id is None:
-                    # Fallback: try mapping service for free-form AI categories
-                    display = await category_display_service.map_ai_category_to_display(ai_category_name)
-                    display_name = (display.get('name') or display.get('display_name') or ai_category_name).lower()
-                    category_id = categories_by_name.get(display_name) or other_id
-
+                    fixed_name = mapped.get(ai_category_name.strip().lower() or 'other', 'Other')
+                    category_id = categories_by_name.get(fixed_name.lower()) or other_id
                 if category_id is None:
                     logger.warning(f"  ⚠️ No category found for '{ai_category_name}', skipping")
                     continue
+                # First AI category wins when several map to the same category
+                if category_id in seen:
+                    continue
+                seen.add(category_id)
+                article_ids.append(article_id)
+                category_ids.append(category_id)
+                confidences.append(float(cat_data.get('confidence', 1.0)))
+                ai_names.append(ai_category_name[:100])
+
+        # Clear existing categories for these articles
+        await db.execute(
+            text("DELETE FROM article_categories WHERE article_id = ANY(CAST(:ids AS INTEGER[]))"),
+            {'ids': list(categories_by_article)}
+        )
+        if article_ids:
+            await db.execute(
+                text(
+                    "INSERT INTO article_categories "
+                    "(article_id, category_id, confidence, ai_category, created_at) "
+                    "SELECT article_id, category_id, confidence, ai_category, now() "
+                    "FROM unnest(CAST(:article_ids AS INTEGER[]), CAST(:category_ids AS INTEGER[]), "
+                    "CAST(:confidences AS DOUBLE PRECISION[]), CAST(:ai_names AS VARCHAR[])) "
+                    "AS c(article_id, category_id, confidence, ai_category) "
+                    "ON CONFLICT (article_id, category_id) DO NOTHING"
+                ),
+                {
+                    'article_ids': article_ids,
+                    'category_ids': category_ids,
+                    'confidences': confidences,
+                    'ai_names': ai_names,
+                }
+            )
 
-                await db.execute(
-                    text(
-                        "INSERT INTO article_categories "
-                        "(article_id, category_id, confidence, ai_category, created_at) "
-                        "VALUES (:article_id, :category_id, :confidence, :ai_category, now()) "
-                        "ON CONFLICT (article_id, category_id) DO NOTHING"
-                    ),
-                    {
-                        'article_id': article_id,
-                        'category_id': category_id,
-                        'confidence': confidence,
-                        'ai_category': ai_category_name,
-                    }
-                )
+        logger.debug(f"  Saved {len(article_ids)} AI categories for {len(categories_by_article)} articles")
+        return len(article_ids)
 
-            logger.debug(f"  Saved {len(ai_categories)} AI categories for article {article_id}")
-        except Exception as e:
-            logger.warning(f"  ⚠️ Error saving AI categories: {e}")
     # Delegate methods to specialized processors
     async def get_processing_stats(self, days: int = 7) -> Dict[str, Any]:
         """Get processing statistics."""
         return await self.stats_collector.get_processing_stats(days)
     
+    @with_ai_priority(AIPriority.BACKLOG)
     async def reprocess_failed_extractions(self, limit: int = 50, dry_run: bool = False) -> Dict[str, Any]:
         """Reprocess failed content extractions."""
         return await self.stats_collector.reprocess_failed_extractions(limit, dry_run)
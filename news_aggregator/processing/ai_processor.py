@@ -8,6 +8,9 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..services.ai_client import get_ai_client
+from ..services.extraction_constants import EXTRACTION_TOTAL_BUDGET_MS
+from ..services.text_rules import get_text_rules
+from ..core.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -93,14 +96,20 @@ class AIProcessor:
                             # Try AI-enhanced extraction with metadata first
                             extracted_content = None
                             async with ContentExtractor() as content_extractor:
+                                # One budget for both passes so a bad URL can't hold an AI slot for minutes
+                                extraction_deadline = Deadline.from_ms(EXTRACTION_TOTAL_BUDGET_MS)
                                 try:
-                                    extraction_result = await content_extractor.extract_article_content_with_metadata(article_url, retry_count=4)
+                                    extraction_result = await content_extractor.extract_article_content_with_metadata(
+                                        article_url, retry_count=4, deadline=extraction_deadline
+                                    )
                                     extracted_content = extraction_result.get('content')
                                 except Exception as e:
                                     logger.warning(f"  ⚠️ AI-enhanced extraction failed after retries, trying standard extraction: {e}")
                                     # Fallback to standard content extraction
                                     try:
-                                        extracted_content = await content_extractor.extract_article_content(article_url, retry_count=3)
+                                        extracted_content = await content_extractor.extract_article_content(
+                                            article_url, retry_count=3, deadline=extraction_deadline
+                                        )
                                     except Exception as e2:
                                         logger.error(f"  ❌ Standard extraction also failed after retries: {e2}")
                                         extracted_content = None
@@ -280,14 +289,20 @@ class AIProcessor:
                         # Try AI-enhanced extraction with metadata first
                         extracted_content = None
                         async with ContentExtractor() as content_extractor:
+                            # One budget for both passes so a bad URL can't hold an AI slot for minutes
+                            extraction_deadline = Deadline.from_ms(EXTRACTION_TOTAL_BUDGET_MS)
                             try:
-                                extraction_result = await content_extractor.extract_article_content_with_metadata(article_url, retry_count=4)
+                                extraction_result = await content_extractor.extract_article_content_with_metadata(
+                                    article_url, retry_count=4, deadline=extraction_deadline
+                                )
                                 extracted_content = extraction_result.get('content')
                             except Exception as e:
                                 logger.warning(f"  ⚠️ AI-enhanced extraction failed after retries, trying standard extraction: {e}")
                                 # Fallback to standard content extraction
                                 try:
-                                    extracted_content = await content_extractor.extract_article_content(article_url, retry_count=3)
+                                    extracted_content = await content_extractor.extract_article_content(
+                                        article_url, retry_count=3, deadline=extraction_deadline
+                                    )
                                 except Exception as e2:
                                     logger.error(f"  ❌ Standard extraction also failed after retries: {e2}")
                                     extracted_content = None
@@ -347,6 +362,7 @@ class AIProcessor:
                 content=article_content,
                 url=article_url,
                 original_context=original_context,
+                source_type=source_type,
             )
             
             elapsed_time = time.time() - start_time
@@ -837,10 +853,12 @@ class AIProcessor:
     async def get_summary_by_source_type(self, article, source_type: str, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Get article summary and optimized title based on source type.
 
-        Returns dict with 'summary' and 'optimized_title' keys.
+        Returns dict with 'summary', 'optimized_title' and 'analysis' keys. 'analysis'
+        is the full combined-analysis result the summary came from (None when the
+        summary is a non-AI fallback), so callers can reuse its categories and ad flags.
         """
-        def _make(summary, optimized_title=None):
-            return {'summary': summary, 'optimized_title': optimized_title}
+        def _make(summary, optimized_title=None, analysis=None):
+            return {'summary': summary, 'optimized_title': optimized_title, 'analysis': analysis}
 
         try:
             if source_type == 'rss':
@@ -856,26 +874,14 @@ class AIProcessor:
 
                 summary = ai_result.get('summary')
                 optimized_title = ai_result.get('optimized_title')
+                analysis = ai_result.get('analysis')
 
-                # Detect bot-protection / consent / error page summaries
-                _bot_markers = [
-                    # Bot protection
-                    'недоступен', 'защиты от ботов', 'проверки безопасности',
-                    'является ли пользователь ботом', 'включить javascript',
-                    'just a moment', 'access denied', 'cloudflare',
-                    'enable javascript', 'checking your browser',
-                    'temporarily unavailable', 'bot detection',
-                    # Cookie consent pages
-                    'согласие на использование файлов cookie',
-                    'consent to the use of cookies',
-                    'cookie policy', 'политика использования файлов cookie',
-                    'before you continue to google',
-                    'конфиденциальности и использование файлов cookie',
-                ]
-                if summary and any(m in summary.lower() for m in _bot_markers):
+                # Detect bot-protection / consent / error page summaries (rule set 'bot_summary')
+                if summary and get_text_rules().matches(summary, 'bot_summary'):
                     logger.warning(f"  ⚠️ Extracted summary looks like bot-protection page, discarding: {article.url}")
                     summary = None
                     optimized_title = None
+                    analysis = None
 
                 # If page extraction failed but RSS has content, use it as fallback
                 if not summary and len(rss_content.strip()) >= 100:
@@ -884,14 +890,17 @@ class AIProcessor:
                         title=article.title or '',
                         content=rss_content,
                         url=article.url,
+                        source_type=source_type,
                     )
                     stats['api_calls_made'] += 1
                     summary = (fallback_result or {}).get('summary')
                     optimized_title = (fallback_result or {}).get('optimized_title')
+                    analysis = fallback_result if summary else None
 
                 return _make(
                     summary or rss_content[:500] or article.title,
                     optimized_title,
+                    analysis,
                 )
 
             elif source_type == 'telegram':
@@ -945,7 +954,7 @@ class AIProcessor:
                         )
                         self._update_article_publication_date(article, ai_result.get('publication_date'), 'Telegram')
                         if ai_result.get('summary'):
-                            return _make(ai_result['summary'], ai_result.get('optimized_title'))
+                            return _make(ai_result['summary'], ai_result.get('optimized_title'), ai_result.get('analysis'))
                     except Exception as e:
                         logger.warning(f"  ⚠️ Skipping Telegram AI extraction (external link failed): {e}")
 
@@ -956,10 +965,11 @@ class AIProcessor:
                             title=article.title or '',
                             content=telegram_content,
                             url=article.url or '',
+                            source_type=source_type,
                         )
                         stats['api_calls_made'] += 1
                         if ai_result.get('summary'):
-                            return _make(ai_result['summary'], ai_result.get('optimized_title'))
+                            return _make(ai_result['summary'], ai_result.get('optimized_title'), ai_result)
                     except Exception as e:
                         logger.warning(f"  ⚠️ Telegram content summarization failed: {e}")
                 return _make(telegram_content or article.title)
@@ -971,6 +981,7 @@ class AIProcessor:
                 return _make(
                     ai_result.get('summary') or article.content or article.title,
                     ai_result.get('optimized_title'),
+                    ai_result.get('analysis'),
                 )
 
             else:
@@ -36,32 +36,8 @@ class CategorizationProcessor:
             )
             
             if analysis_result and 'categories' in analysis_result:
-                categories = analysis_result['categories']
-                original_categories = analysis_result.get('original_categories', [])
                 stats['api_calls_made'] += 1
-                
-                # Ensure each category dict has ai_category field for original AI category tracking
-                processed_categories = []
-                for i, cat in enumerate(categories):
-                    # Get corresponding original category
-                    original_cat = original_categories[i] if i < len(original_categories) else None
-                    
-                    if isinstance(cat, str):
-                        # If category is just a string, convert to dict format
-                        processed_categories.append({
-                            'name': cat,
-                            'confidence': 1.0,
-                            'ai_category': original_cat or cat  # Use original AI category if available
-                        })
-                    elif isinstance(cat, dict):
-                        # If already a dict, ensure ai_category field exists
-                        processed_categories.append({
-                            'name': cat.get('name', cat.get('category', 'Other')),
-                            'confidence': cat.get('confidence', 1.0),
-                            'ai_category': original_cat or cat.get('ai_category', cat.get('name', cat.get('category', 'Other')))
-                        })
-                
-                return processed_categories
+                return self.categories_from_analysis(analysis_result)
             else:
                 return []
                 
@@ -69,6 +45,37 @@ class CategorizationProcessor:
             logging.error(f"Error categorizing article {article.url}: {e}")
             return []
 
+    def categories_from_analysis(self, analysis_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert a combined-analysis result into category dicts (name, confidence, ai_category)."""
+        if not analysis_result or 'categories' not in analysis_result:
+            return []
+
+        categories = analysis_result['categories']
+        original_categories = analysis_result.get('original_categories', [])
+
+        # Ensure each category dict has ai_category field for original AI category tracking
+        processed_categories = []
+        for i, cat in enumerate(categories):
+            # Get corresponding original category
+            original_cat = original_categories[i] if i < len(original_categories) else None
+
+            if isinstance(cat, str):
+                # If category is just a string, convert to dict format
+                processed_categories.append({
+                    'name': cat,
+                    'confidence': 1.0,
+                    'ai_category': original_cat or cat  # Use original AI category if available
+                })
+            elif isinstance(cat, dict):
+                # If already a dict, ensure ai_category field exists
+                processed_categories.append({
+                    'name': cat.get('name', cat.get('category', 'Other')),
+                    'confidence': cat.get('confidence', 1.0),
+                    'ai_category': original_cat or cat.get('ai_category', cat.get('name', cat.get('category', 'Other')))
+                })
+
+        return processed_categories
+
     async def categorize_by_source_type(self, article: Article, source_type: str, stats: Dict[str, Any]) -> str:
         """Categorize article using AI for all source types."""
         await self._ensure_ai_client()
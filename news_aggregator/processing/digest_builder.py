@@ -1,18 +1,93 @@
 """Digest builder for creating combined daily news digests."""
 
 import datetime
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from ..models import DailySummary
 from ..config import get_settings
-from ..utils import TelegramMessageSplitter, get_logger, log_operation
+from ..utils import StreamingDigestSplitter, TelegramMessageSplitter, get_logger, log_operation
 from ..services.summary_generator import SummaryGenerator
 
 logger = get_logger(__name__, 'DIGEST_BUILDER')
 
 
+def _digest_header(date: datetime.date) -> str:
+    return f"<b>Сводка новостей за {date.strftime('%d.%m.%Y')}</b>"
+
+
+def _digest_footer(total_articles: int, categories_count: int) -> str:
+    return f"\n📊 Всего: {total_articles} новостей в {categories_count} категориях"
+
+
+class StreamingDigest:
+    """
+    Digest parts assembled while the category summaries are being generated.
+
+    Same layout as DigestBuilder.create_digest_parts(): categories by
+    article count, summaries shorter than DIGEST_MIN_SUMMARY_LENGTH left
+    out. start() fixes the categories; each summary's streamed text goes to
+    on_text(category) and its final text to complete(). Parts whose
+    summaries are all final are passed to on_part right away, so the first
+    messages can go out before the slowest category finishes.
+    """
+
+    def __init__(self, splitter: TelegramMessageSplitter, date: datetime.date,
+                 min_summary_length: int, on_part: Callable[[str], Any]):
+        self.splitter = splitter
+        self.date = date
+        self.min_summary_length = min_summary_length
+        self.on_part = on_part
+        self.articles_counts: Dict[str, int] = {}
+        self.valid: Dict[str, int] = {}
+        self._stream: Optional[StreamingDigestSplitter] = None
+
+    @property
+    def parts_closed(self) -> int:
+        return self._stream.parts_closed if self._stream else 0
+
+    def start(self, articles_counts: Dict[str, int]) -> None:
+        """Set the categories to be summarized and their article counts."""
+        self.articles_counts = dict(articles_counts)
+        titles = sorted(self.articles_counts, key=self.articles_counts.get, reverse=True)
+        metadata = {
+            "total_articles": sum(self.articles_counts.values()),
+            "categories_count": len(titles)
+        }
+        self._stream = StreamingDigestSplitter(
+            self.splitter, _digest_header(self.date), titles, self.on_part, metadata
+        )
+
+    def on_text(self, category: str) -> Callable[[str], None]:
+        """Streaming callback for one category's summary."""
+        def update(partial_text: str) -> None:
+            if self._stream is not None:
+                self._stream.update(category, partial_text)
+        return update
+
+    def complete(self, category: str, summary_text: Optional[str]) -> None:
+        if self._stream is None:
+            return
+        text = (summary_text or "").strip()
+        if len(text) < self.min_summary_length:
+            text = None
+        else:
+            self.valid[category] = self.articles_counts.get(category, 0)
+        self._stream.complete(category, text)
+
+    def finish(self) -> List[str]:
+        """Parts not passed to on_part yet (the last one with the totals footer)."""
+        if self._stream is None:
+            return []
+        total_articles = sum(self.valid.values())
+        categories_count = len(self.valid)
+        return self._stream.finish(
+            _digest_footer(total_articles, categories_count),
+            {"total_articles": total_articles, "categories_count": categories_count}
+        )
+
+
 class DigestBuilder:
     """Handles building daily news digests from category summaries."""
 
@@ -25,6 +100,14 @@ class DigestBuilder:
         self.splitter = TelegramMessageSplitter(safety_margin=safety_margin)
         self.summary_generator = SummaryGenerator()
 
+    def create_streaming_digest(
+        self,
+        date: datetime.date,
+        on_part: Callable[[str], Any]
+    ) -> StreamingDigest:
+        """Digest to be fed by summaries while they are generated (see StreamingDigest)."""
+        return StreamingDigest(self.splitter, date, self.settings.digest_min_summary_length, on_part)
+
     async def create_combined_digest(
         self,
         db: AsyncSession,
@@ -79,8 +162,8 @@ class DigestBuilder:
             )
 
             # Build components for message splitter
-            header = f"<b>Сводка новостей за {date.strftime('%d.%m.%Y')}</b>"
-            footer = f"\n📊 Всего: {total_articles} новостей в {categories_count} категориях"
+            header = _digest_header(date)
+            footer = _digest_footer(total_articles, categories_count)
 
             content_blocks = [
                 (summary.category, summary.summary_text.strip())
@@ -175,8 +258,8 @@ class DigestBuilder:
             categories_count = len(valid_summaries)
 
             # Build components for message splitter
-            header = f"<b>Сводка новостей за {date.strftime('%d.%m.%Y')}</b>"
-            footer = f"\n📊 Всего: {total_articles} новостей в {categories_count} категориях"
+            header = _digest_header(date)
+            footer = _digest_footer(total_articles, categories_count)
 
             content_blocks = [
                 (summary.category, summary.summary_text.strip())
@@ -0,0 +1,124 @@
+"""Persistent cache for AI analysis and summary results."""
+
+import copy
+import hashlib
+import logging
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import settings
+from ..core.cache import FileCache
+
+logger = logging.getLogger(__name__)
+
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_content(text: Optional[str]) -> str:
+    """Normalize text so trivially different copies (case, spacing, punctuation, links) hash the same."""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).lower()
+    text = _URL_RE.sub(' ', text)
+    return _NON_WORD_RE.sub(' ', text).strip()
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """SHA-256 over the normalized parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(normalize_content(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class AIResultCache:
+    """
+    Durable cache of AI results on disk.
+
+    Keys combine the normalized content hash with the model, the prompt template
+    version and the category-set version. Editing a prompt or the category list
+    changes the key only for the affected kind of request; stale entries are
+    never read again and are evicted by the size/entry limits of FileCache.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self._store = FileCache(
+            cache_dir=cache_dir or Path(settings.cache_dir) / 'ai_results',
+            default_ttl=settings.ai_cache_ttl,
+            max_size_mb=settings.ai_cache_max_size_mb,
+            max_entries=settings.ai_cache_max_entries,
+        )
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.ai_cache_enabled
+
+    @staticmethod
+    def build_key(kind: str, content_digest: str, model: str,
+                  prompt_version: str, category_version: str = '-') -> str:
+        return f"ai:{kind}:{model}:{prompt_version}:{category_version}:{content_digest}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None."""
+        if not self.enabled:
+            return None
+        try:
+            value = await self._store.get(key)
+        except Exception as e:
+            logger.warning(f"  ⚠️ AI cache read failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: Any) -> None:
+        if not self.enabled or value is None:
+            return
+        try:
+            await self._store.set(key, value)
+            self.writes += 1
+        except Exception as e:
+            logger.warning(f"  ⚠️ AI cache write failed: {e}")
+
+    async def clear(self) -> int:
+        return await self._store.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters since process start."""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'max_entries': self._store.max_entries,
+            'max_size_mb': self._store.max_size_mb,
+        }
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Counters plus on-disk usage (scans the cache directory)."""
+        stats = self.get_metrics()
+        stats.update(await self._store.get_stats())
+        return stats
+
+
+# Global instance
+_ai_cache: Optional[AIResultCache] = None
+
+
+def get_ai_cache() -> AIResultCache:
+    """Get global AI result cache instance."""
+    global _ai_cache
+    if _ai_cache is None:
+        _ai_cache = AIResultCache()
+    return _ai_cache
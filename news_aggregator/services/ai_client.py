@@ -1,21 +1,82 @@
 """AI API client for article summarization using Google Gemini."""
 
 import asyncio
+import inspect
 import json
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 import logging
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception, before_sleep_log
 
 from ..config import settings
-from ..core.http_client import get_http_client
+from ..core.http_client import ai_rate_limiter, get_ai_http_client
 from ..core.cache import cached
-from ..core.exceptions import APIError
+from ..core.exceptions import APIError, GenerationAbortedError
 from ..core.circuit_breaker import CircuitBreakerError, ai_service_breaker
+from ..core.adaptive_limiter import ai_concurrency_limiter
+from ..core.hedging import ai_request_hedger
+from ..core.metrics import pipeline_metrics
+from .model_router import ModelRoute, get_model_router, usage_cost
+from .gemini_recorder import get_gemini_recorder
+from .text_rules import get_text_rules
 
 logger = logging.getLogger(__name__)
 
 
+# JSON schema for combined (summary + categories + ads + date) analysis output
+COMBINED_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "optimized_title": {"type": ["string", "null"]},
+        "summary": {"type": ["string", "null"]},
+        "categories": {
+            "type": "array",
+            "items": {"type": "string"}
+        },
+        "category_confidences": {
+            "type": "array",
+            "items": {"type": "number"}
+        },
+        "category": {"type": ["string", "null"]},
+        "category_confidence": {"type": "number"},
+        "summary_confidence": {"type": "number"},
+        "original_categories": {
+            "type": "array",
+            "items": {"type": "string"}
+        },
+        "is_advertisement": {"type": "boolean"},
+        "ad_type": {"type": "string"},
+        "ad_confidence": {"type": "number"},
+        "ad_reasoning": {"type": "string"},
+        "publication_date": {"type": ["string", "null"]},
+        "content_quality": {"type": "number"},
+        "confidence": {"type": "number"}
+    },
+    "required": ["summary", "categories", "is_advertisement"],
+    "additionalProperties": True
+}
+
+# Batch variant: one combined-analysis item per article, tagged with its id
+BATCH_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                **COMBINED_ANALYSIS_SCHEMA,
+                "properties": {
+                    "id": {"type": "integer"},
+                    **COMBINED_ANALYSIS_SCHEMA["properties"],
+                },
+                "required": ["id"] + COMBINED_ANALYSIS_SCHEMA["required"],
+            }
+        }
+    },
+    "required": ["results"]
+}
+
+
 def is_retryable_api_error(exception):
     """Check if API error is transient and should be retried."""
     if isinstance(exception, APIError):
@@ -103,27 +164,8 @@ class AIClient:
                 }
 
             # Detect bot-protection / consent / error pages before wasting an AI call
-            _bot_content_markers = [
-                # Bot protection
-                'включить javascript и файлы cookie',
-                'проверки безопасности', 'является ли пользователь ботом',
-                'just a moment', 'checking if the site connection is secure',
-                'enable javascript and cookies', 'attention required',
-                'checking your browser before accessing',
-                # Cookie consent pages (Google, generic)
-                'before you continue to google',
-                'согласие на использование файлов cookie',
-                'consent to the use of cookies',
-                'we use cookies and data to',
-                'uses cookies to deliver its services',
-                'cookies help us deliver our services',
-                # Google Maps / non-article pages
-                'javascript is not available',
-                'javascript не доступен',
-                'требуется включить javascript',
-            ]
-            content_lower = content.lower()
-            if len(content.strip()) < 500 and any(m in content_lower for m in _bot_content_markers):
+            # (rule set 'bot_page' in services.text_rules)
+            if len(content.strip()) < 500 and get_text_rules().matches(content, 'bot_page'):
                 logger.warning(f"  ⚠️ Extracted content looks like bot-protection page, skipping AI: {article_url}")
                 return {
                     'summary': None,
@@ -148,7 +190,9 @@ class AIClient:
                 'summary': summary,
                 'optimized_title': optimized_title,
                 'publication_date': metadata_result.get('publication_date'),
-                'full_article_url': metadata_result.get('full_article_url')
+                'full_article_url': metadata_result.get('full_article_url'),
+                # Full combined analysis so callers can reuse categories/ad flags without another request
+                'analysis': analysis_result if summary else None
             }
             
         except Exception as e:
@@ -446,12 +490,14 @@ class AIClient:
         logger.info(f"  🏷️ Domain: {domain}")
         logger.info(f"  📝 Prompt length: {len(prompt)} chars")
         async def _make_request():
-            async with get_http_client() as client:
+            started = time.monotonic()
+            async with get_ai_http_client() as client:
                 response = await client.post(url, json=payload, params=params, timeout=30)
 
                 async with response:
                     if response.status == 200:
                         raw = await response.json()
+                        await self._record_exchange(model, "generateContent", payload, raw, started)
                         logger.info(f"  📄 Gemini raw response keys: {list(raw.keys())}")
                         candidates = raw.get("candidates") or []
                         if not candidates:
@@ -482,7 +528,6 @@ class AIClient:
                             "usage": usage
                         }
 
-                        self._track_ai_usage(data, analysis_type, domain)
                         return data
                     elif response.status == 429:
                         raise APIError("Rate limit exceeded", status_code=429)
@@ -495,14 +540,175 @@ class AIClient:
                             response_text=error_text
                         )
 
+        return await self._call_ai_service(model, _make_request, analysis_type, domain)
+
+    async def _call_ai_service(self, model: str, make_request, analysis_type: str, domain: str,
+                               route: Optional[ModelRoute] = None, hedge: bool = False) -> dict:
+        """
+        Run a Gemini request through the circuit breaker and adaptive limiter.
+
+        The request's latency and outcome feed the model router, and successful
+        responses (dicts with 'usage') are recorded in ai_usage_tracking. With
+        hedge=True a request slower than the recent p95 may be duplicated (see
+        RequestHedger). Only single-article combined analysis passes it: the
+        hedger's p95 is taken from those requests alone, so other request
+        types (batches, streams, digests) are neither hedged nor observed.
+        """
+        router = get_model_router()
+        timing = {}
+
+        async def _attempt(started_event: asyncio.Event):
+            async def _timed_request():
+                # Waiting for a rate slot is not service latency (it would read as overload)
+                await ai_rate_limiter.acquire()
+                started_event.set()
+                started = time.monotonic()
+                try:
+                    data = await make_request()
+                except Exception:
+                    router.record(model, time.monotonic() - started, ok=False)
+                    raise
+                latency = time.monotonic() - started
+                timing['latency'] = latency
+                router.record(model, latency, ok=True, usage=data.get('usage'))
+                if hedge:
+                    ai_request_hedger.observe(latency)
+                return data
+
+            return await ai_concurrency_limiter.call(_timed_request)
+
         try:
-            return await ai_service_breaker.call(_make_request)
+            async with pipeline_metrics.track(f"ai.{analysis_type}"):
+                if hedge:
+                    data = await ai_service_breaker.call(ai_request_hedger.run, _attempt)
+                else:
+                    data = await ai_service_breaker.call(_attempt, asyncio.Event())
         except CircuitBreakerError as e:
             logger.error(f"Circuit breaker is OPEN: {e}")
             raise APIError(f"AI service temporarily unavailable: {e}", status_code=503)
+
+        if data.get('usage') is not None:
+            self._track_ai_usage(data, analysis_type, domain, model=model, route=route,
+                                 latency=timing.get('latency'))
+        return data
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(is_retryable_api_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _stream_gemini_request(self, prompt: str, model: str,
+                                     analysis_type: str, domain: str,
+                                     temperature: float = 0.1, max_tokens: int = 2000,
+                                     on_text: Optional[Callable[[str], Any]] = None,
+                                     validator: Optional[Callable[[str], Optional[str]]] = None) -> dict:
+        """
+        Streaming variant of _make_gemini_request using streamGenerateContent (SSE).
+
+        Args:
+            on_text: Called with the accumulated text after every chunk (sync or async)
+            validator: Called with the accumulated text after every chunk; returning a
+                reason string aborts the generation with GenerationAbortedError
+
+        Returns:
+            OpenAI-like response dict with 'choices' and 'usage'
+        """
+        if "gemini-3" in model.lower():
+            endpoint_base = str(self.endpoint).replace("/v1/models", "/v1beta/models")
+            url = f"{endpoint_base}/{model}:streamGenerateContent"
+        else:
+            url = f"{self.endpoint}/{model}:streamGenerateContent"
+
+        payload = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+            }
+        }
+        params = {"key": self.api_key, "alt": "sse"}
+
+        logger.info(f"  🌊 Gemini streaming request: {model} ({analysis_type}, {len(prompt)} chars prompt)")
+
+        async def _make_request():
+            import aiohttp
+            started = time.monotonic()
+            text = ""
+            last_raw: dict = {}
+            async with get_ai_http_client() as client:
+                response = await client.post(
+                    url, json=payload, params=params,
+                    timeout=aiohttp.ClientTimeout(total=180, sock_read=60)
+                )
+                async with response:
+                    if response.status == 429:
+                        raise APIError("Rate limit exceeded", status_code=429)
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"  ❌ Gemini API error {response.status}: {error_text[:500]}...")
+                        raise APIError(
+                            f"Gemini API error: {response.status}",
+                            status_code=response.status,
+                            response_text=error_text
+                        )
+
+                    async for raw_line in response.content:
+                        line = raw_line.decode('utf-8', errors='ignore').strip()
+                        if not line.startswith('data:'):
+                            continue
+                        try:
+                            chunk = json.loads(line[len('data:'):].strip())
+                        except json.JSONDecodeError:
+                            continue
+                        last_raw = chunk
+                        candidates = chunk.get("candidates") or []
+                        parts = ((candidates[0].get("content") or {}).get("parts") or []) if candidates else []
+                        delta = "".join(part.get("text") or "" for part in parts)
+                        if not delta:
+                            continue
+                        text += delta
+
+                        if on_text:
+                            callback_result = on_text(text)
+                            if inspect.isawaitable(callback_result):
+                                await callback_result
+                        if validator:
+                            reason = validator(text)
+                            if reason:
+                                # Returned (not raised) so the circuit breaker doesn't count it as a failure
+                                return {"aborted": reason, "partial_text": text}
+
+            if not text.strip():
+                raise APIError(
+                    "Empty Gemini streaming response",
+                    status_code=200,
+                    response_text=json.dumps(last_raw)[:500]
+                )
+
+            await self._record_exchange(model, "streamGenerateContent", payload, {
+                "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+                "usageMetadata": last_raw.get("usageMetadata") or {},
+            }, started)
+            return {
+                "choices": [{"message": {"content": text.strip()}}],
+                "usage": self._normalize_gemini_usage(last_raw)
+            }
+
+        data = await self._call_ai_service(model, _make_request, analysis_type, domain)
+        if data.get("aborted"):
+            partial_text = data["partial_text"]
+            logger.warning(f"  ✋ Streaming generation aborted after {len(partial_text)} chars: {data['aborted']}")
+            raise GenerationAbortedError(data["aborted"], partial_text=partial_text)
+        return data
+
     async def _make_structured_ai_request(self, prompt: str, model: str, schema: dict,
-                                          analysis_type: str, domain: str) -> dict:
+                                          analysis_type: str, domain: str,
+                                          max_tokens: int = 2000,
+                                          cached_content: Optional[str] = None,
+                                          route: Optional[ModelRoute] = None,
+                                          hedge: bool = False) -> dict:
         """
         Make structured AI request using Gemini's native structured output with circuit breaker protection.
 
@@ -512,6 +718,11 @@ class AIClient:
             schema: JSON schema for structured output
             analysis_type: Type of analysis for tracking
             domain: Domain being analyzed for tracking
+            max_tokens: Maximum tokens to generate (default: 2000)
+            cached_content: cachedContents resource holding the static prompt prefix;
+                when set, prompt is only the per-request suffix
+            route: Model routing decision, recorded with the usage
+            hedge: Allow a hedged duplicate (single-article analysis only)
 
         Returns:
             Dict with 'result' (parsed structured data) and 'usage'
@@ -519,9 +730,9 @@ class AIClient:
         # Check if model is Gemini 3 (contains "gemini-3")
         is_gemini_3 = "gemini-3" in model.lower()
 
-        # Use v1beta endpoint for Gemini 3, v1 for others
+        # Use v1beta endpoint for Gemini 3 and cached content, v1 for others
         # See: https://ai.google.dev/gemini-api/docs/gemini-3
-        if is_gemini_3:
+        if is_gemini_3 or cached_content:
             # Replace /v1/models with /v1beta/models for Gemini 3
             endpoint_base = str(self.endpoint).replace("/v1/models", "/v1beta/models")
             url = f"{endpoint_base}/{model}:generateContent"
@@ -541,11 +752,13 @@ class AIClient:
             ],
             "generationConfig": {
                 "temperature": 0.1,
-                "maxOutputTokens": 2000,
+                "maxOutputTokens": max_tokens,
                 "responseMimeType": "application/json",
                 "responseJsonSchema": schema
             }
         }
+        if cached_content:
+            payload["cachedContent"] = cached_content
 
         params = {"key": self.api_key}
 
@@ -554,15 +767,19 @@ class AIClient:
         logger.info(f"  📊 Analysis type: {analysis_type}")
         logger.info(f"  🏷️ Domain: {domain}")
         logger.info(f"  📋 Using structured output with schema")
+        if cached_content:
+            logger.info(f"  🧊 Cached content: {cached_content}")
         logger.info(f"  🔍 Is Gemini 3: {is_gemini_3}")
         logger.info(f"  📝 Payload generationConfig keys: {list(payload['generationConfig'].keys())}")
         async def _make_request():
-            async with get_http_client() as client:
+            started = time.monotonic()
+            async with get_ai_http_client() as client:
                 response = await client.post(url, json=payload, params=params, timeout=40)
 
                 async with response:
                     if response.status == 200:
                         raw = await response.json()
+                        await self._record_exchange(model, "generateContent", payload, raw, started)
 
                         candidates = raw.get("candidates") or []
                         if not candidates:
@@ -609,7 +826,6 @@ class AIClient:
                             "usage": usage
                         }
 
-                        self._track_ai_usage(data, analysis_type, domain)
                         return data
 
                     elif response.status == 429:
@@ -623,14 +839,18 @@ class AIClient:
                             response_text=error_text
                         )
 
-        try:
-            return await ai_service_breaker.call(_make_request)
-        except CircuitBreakerError as e:
-            logger.error(f"Circuit breaker is OPEN: {e}")
-            raise APIError(f"AI service temporarily unavailable: {e}", status_code=503)
+        return await self._call_ai_service(model, _make_request, analysis_type, domain, route=route, hedge=hedge)
+
+    async def _record_exchange(self, model: str, action: str, payload: dict, raw: dict, started: float):
+        """Save the raw exchange when recording mode (AI_RECORD_DIR) is on."""
+        recorder = get_gemini_recorder()
+        if recorder.enabled:
+            await recorder.record(model, action, payload, raw, time.monotonic() - started)
 
-    def _track_ai_usage(self, response_data: dict, analysis_type: str, domain: str):
-        """Track AI API usage to database (fire-and-forget)."""
+    def _track_ai_usage(self, response_data: dict, analysis_type: str, domain: str,
+                        model: Optional[str] = None, route: Optional[ModelRoute] = None,
+                        latency: Optional[float] = None):
+        """Track AI API usage, model routing and latency to database (fire-and-forget)."""
         import asyncio
 
         async def _do_track():
@@ -645,16 +865,8 @@ class AIClient:
                 if not tokens_used:
                     tokens_used = prompt_tokens + completion_tokens
 
-                # Cost from config (per 1M tokens); defaults to 0 if not configured
-                input_rate = getattr(settings, 'ai_input_cost_per_1m', None) or 0.0
-                output_rate = getattr(settings, 'ai_output_cost_per_1m', None) or 0.0
-                cached_input_rate = getattr(settings, 'ai_cached_input_cost_per_1m', None) or 0.0
-
-                cost = (
-                    (prompt_tokens * input_rate) +
-                    (completion_tokens * output_rate) +
-                    (cached_tokens * cached_input_rate)
-                ) / 1_000_000
+                # Cost from config (per 1M tokens, per model); defaults to 0 if not configured
+                cost = usage_cost(model, usage)
 
                 from ..database import AsyncSessionLocal
                 from sqlalchemy import text
@@ -676,7 +888,10 @@ class AIClient:
                                 {
                                     "prompt_tokens": prompt_tokens,
                                     "completion_tokens": completion_tokens,
-                                    "cached_tokens": cached_tokens
+                                    "cached_tokens": cached_tokens,
+                                    "model": model,
+                                    "route": route.reason if route else None,
+                                    "latency_ms": round(latency * 1000) if latency is not None else None
                                 }
                             ),
                             "created_at": datetime.utcnow()
@@ -750,25 +965,65 @@ class AIClient:
     # analyze_article_complete() which provides better quality results
 
     async def _call_summary_llm(self, prompt: str, *, system_prompt: str | None = None,
-                                max_tokens: int = 1000) -> Optional[str]:
+                                max_tokens: int = 1000, stream: bool = False,
+                                on_text: Optional[Callable[[str], Any]] = None,
+                                validator: Optional[Callable[[str], Optional[str]]] = None,
+                                model: Optional[str] = None,
+                                analysis_type: str = "summary") -> Optional[str]:
+        """
+        Free-text generation for summaries and digests.
+
+        With stream=True (and AI_STREAMING_ENABLED) the response is streamed: on_text
+        receives the text as it grows and validator can abort a bad generation early
+        (raises GenerationAbortedError).
+        """
+        model = model or self.summarization_model
         # Build full prompt with system message if provided
         full_prompt = prompt
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
 
-        logger.info(f"  🤖 Sending to AI for summarization...")
-        # Use unified API with appropriate parameters for summarization
-        response_data = await self._make_raw_ai_request(
-            full_prompt,
-            model=self.summarization_model,
-            analysis_type="summary",
-            domain="summary",
-            temperature=0.2,  # Slightly higher for summarization
-            max_tokens=max_tokens
+        from .ai_cache import get_ai_cache, content_hash
+        from .prompts import PROMPT_VERSIONS
+        ai_cache = get_ai_cache()
+        cache_key = ai_cache.build_key(
+            'summary', content_hash(full_prompt, str(max_tokens)),
+            model, PROMPT_VERSIONS['summary']
         )
+        cached_summary = await ai_cache.get(cache_key)
+        if cached_summary:
+            logger.info(f"  ♻️ Summary served from AI cache")
+            return cached_summary
+
+        logger.info(f"  🤖 Sending to AI for summarization...")
+        if stream and settings.ai_streaming_enabled:
+            response_data = await self._stream_gemini_request(
+                full_prompt,
+                model=model,
+                analysis_type=analysis_type,
+                domain="summary",
+                temperature=0.2,
+                max_tokens=max_tokens,
+                on_text=on_text,
+                validator=validator
+            )
+        else:
+            # Use unified API with appropriate parameters for summarization
+            response_data = await self._make_raw_ai_request(
+                full_prompt,
+                model=model,
+                analysis_type=analysis_type,
+                domain="summary",
+                temperature=0.2,  # Slightly higher for summarization
+                max_tokens=max_tokens
+            )
         
         if response_data and 'choices' in response_data and response_data['choices']:
-            return (response_data['choices'][0]['message']['content'] or '').strip()
+            summary_text = (response_data['choices'][0]['message']['content'] or '').strip()
+            # Short answers are usually failures the caller retries - don't pin them in the cache
+            if len(summary_text) >= settings.digest_min_summary_length:
+                await ai_cache.set(cache_key, summary_text)
+            return summary_text
         return None
 
     def _is_summary_valid(self, summary: str, original: str) -> bool:
@@ -789,20 +1044,9 @@ class AIClient:
         return True
 
     def _simple_extractive_summary(self, content: str) -> str:
-        # Возьмём 3-4 первых информативных предложения до 600 символов
-        import re
-        sentences = re.split(r"(?<=[\.!?])\s+", content.strip())
-        picked = []
-        total = 0
-        for s in sentences:
-            if len(s) < 15:
-                continue
-            picked.append(s)
-            total += len(s)
-            if len(picked) >= 4 or total > 600:
-                break
-        text = " ".join(picked).strip()
-        return text[:700] + ('...' if len(text) > 700 else '')
+        # Локальная экстрактивная выжимка (до 4 предложений, ~700 символов)
+        from .extractive_summarizer import get_extractive_summarizer
+        return get_extractive_summarizer().summarize(content, max_sentences=4, max_chars=700)
 
     async def test_connection(self) -> bool:
         """Test AI API connectivity with minimal request."""
@@ -815,7 +1059,8 @@ class AIClient:
             return False
 
     async def analyze_article_complete(self, title: str, content: str, url: str,
-                                       original_context: str = None) -> Dict[str, Any]:
+                                       original_context: str = None,
+                                       source_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Complete article analysis with combined prompts - categorization, summarization,
         advertisement detection, and date extraction in one API call.
@@ -824,6 +1069,7 @@ class AIClient:
             title: Article title
             content: Article content
             url: Article URL
+            source_type: Source type ('telegram', 'rss', ...) used for model routing
             
         Returns:
             Dictionary with all analysis results
@@ -840,62 +1086,57 @@ class AIClient:
             else:
                 logger.warning(f"  ⚠️ Content too short for analysis: {len(content.strip()) if content else 0} chars < 30")
                 return self._get_fallback_analysis()
-        
+
+        router = get_model_router()
+        route = router.route(len(content) + len(original_context or ''), source_type)
+
+        # Identical/near-identical content analyzed with the same prompt and categories → reuse result
+        cache_key = await self._analysis_cache_key(title, content, url, original_context, model=route.model)
+        if cache_key:
+            from .ai_cache import get_ai_cache
+            cached_result = await get_ai_cache().get(cache_key)
+            if cached_result:
+                logger.info(f"  ♻️ Combined analysis served from AI cache")
+                return cached_result
+
         max_retries = 3
+        use_context_cache = self.supports_structured_output
         for attempt in range(max_retries + 1):
+            cached_content = None
+            if attempt > 0 and route.tier == 'light':
+                # The light model failed once - don't keep retrying on it
+                route = router.route(len(content), source_type, escalate=True)
+                cache_key = await self._analysis_cache_key(title, content, url, original_context, model=route.model)
             try:
                 # Build enhanced combined prompt with dynamic category metadata
-                prompt = await self._build_combined_analysis_prompt_enhanced(title, content, url, original_context=original_context)
+                prompt, cached_content = await self._build_analysis_request(
+                    title, content, url, original_context=original_context,
+                    use_context_cache=use_context_cache, model=route.model
+                )
                 logger.info(f"  🚀 Using enhanced prompt with category metadata")
                 retry_text = f" (attempt {attempt + 1}/{max_retries + 1})" if attempt > 0 else ""
                 logger.info(f"  🧠 Combined AI analysis for article{retry_text}...")
                 logger.info(f"  📄 Content length: {len(content)} characters")
                 logger.info(f"  📝 Title: {title[:100]}...")
+                logger.info(f"  🧭 Model route: {route.model} ({route.reason})")
                 # Extract domain for tracking
                 from urllib.parse import urlparse
                 domain = urlparse(url).netloc if url else "unknown"
 
                 # JSON schema for structured output
-                schema = {
-                    "type": "object",
-                    "properties": {
-                        "optimized_title": {"type": ["string", "null"]},
-                        "summary": {"type": ["string", "null"]},
-                        "categories": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "category_confidences": {
-                            "type": "array",
-                            "items": {"type": "number"}
-                        },
-                        "category": {"type": ["string", "null"]},
-                        "category_confidence": {"type": "number"},
-                        "summary_confidence": {"type": "number"},
-                        "original_categories": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "is_advertisement": {"type": "boolean"},
-                        "ad_type": {"type": "string"},
-                        "ad_confidence": {"type": "number"},
-                        "ad_reasoning": {"type": "string"},
-                        "publication_date": {"type": ["string", "null"]},
-                        "content_quality": {"type": "number"},
-                        "confidence": {"type": "number"}
-                    },
-                    "required": ["summary", "categories", "is_advertisement"],
-                    "additionalProperties": True
-                }
+                schema = COMBINED_ANALYSIS_SCHEMA
 
                 if self.supports_structured_output:
                     # Gemini: use structured output for guaranteed JSON
                     response_data = await self._make_structured_ai_request(
                         prompt,
-                        model=self.summarization_model,
+                        model=route.model,
                         schema=schema,
                         analysis_type="combined_analysis",
-                        domain=domain
+                        domain=domain,
+                        cached_content=cached_content,
+                        route=route,
+                        hedge=True
                     )
                     result = response_data.get("result") or {}
                     logger.info(f"  ✅ Combined analysis (structured) successful")
@@ -903,11 +1144,14 @@ class AIClient:
                     from .category_cache import get_category_cache
                     category_cache = get_category_cache()
                     valid_categories = await category_cache.get_categories()
-                    return self._validate_analysis_result(result, title, content, valid_categories)
+                    validated = self._validate_analysis_result(result, title, content, valid_categories)
+                    await self._store_analysis_in_cache(cache_key, validated)
+                    return validated
 
                 # Constructor / other: fallback to text parsing
                 response_data = await self._make_raw_ai_request(
                     prompt,
+                    model=route.model,
                     analysis_type="combined_analysis",
                     domain=domain
                 )
@@ -933,7 +1177,9 @@ class AIClient:
                     from .category_cache import get_category_cache
                     category_cache = get_category_cache()
                     valid_categories = await category_cache.get_categories()
-                    return self._validate_analysis_result(result, title, content, valid_categories)
+                    validated = self._validate_analysis_result(result, title, content, valid_categories)
+                    await self._store_analysis_in_cache(cache_key, validated)
+                    return validated
 
                 except json.JSONDecodeError as e:
                     logger.warning(f"  ⚠️ JSON parsing error: {e}")
@@ -946,6 +1192,11 @@ class AIClient:
                     
             except Exception as e:
                 logger.error(f"  ❌ Error in combined analysis: {e}")
+                if cached_content:
+                    # Handle may have expired or been rejected - retry with the full prompt
+                    from .gemini_context_cache import get_gemini_context_cache
+                    get_gemini_context_cache().invalidate(route.model)
+                    use_context_cache = False
                 if attempt < max_retries:
                     logger.info(f"  🔄 Retrying in 2 seconds...")
                     await asyncio.sleep(2)
@@ -955,6 +1206,278 @@ class AIClient:
         # Fallback if all retries failed
         return self._get_fallback_analysis()
     
+    async def _analysis_cache_key(self, title: Optional[str], content: str, url: Optional[str],
+                                  original_context: str = None,
+                                  model: Optional[str] = None) -> Optional[str]:
+        """
+        AI cache key for a combined analysis, or None if the cache is unavailable.
+
+        The digest covers every per-article input of the prompt except the URL
+        itself: title, content, original source text and the source context
+        derived from the URL (the only part of it that changes the
+        instructions). The same post republished under another URL shares the
+        result.
+        """
+        try:
+            from .ai_cache import get_ai_cache, content_hash
+            from .prompts import NewsPrompts, PromptBuilder, PROMPT_VERSIONS
+            ai_cache = get_ai_cache()
+            if not ai_cache.enabled:
+                return None
+            category_version = await NewsPrompts.get_category_set_version()
+            source_context = PromptBuilder.build_source_context(url or '')
+            return ai_cache.build_key(
+                'combined_analysis', content_hash(title, content, original_context, source_context),
+                model or self.summarization_model, PROMPT_VERSIONS['combined_analysis'], category_version
+            )
+        except Exception as e:
+            logger.debug(f"AI cache key unavailable: {e}")
+            return None
+
+    async def _store_analysis_in_cache(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        """Persist a successful analysis (results without a summary are not cached)."""
+        if cache_key and result.get('summary'):
+            from .ai_cache import get_ai_cache
+            await get_ai_cache().set(cache_key, result)
+
+    # ============================================================================
+    # BATCH ANALYSIS - several short articles in one structured request
+    # ============================================================================
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token estimate (mostly Cyrillic text averages ~3 chars per token)."""
+        return len(text or '') // 3 + 1
+
+    def is_batchable(self, content: Optional[str]) -> bool:
+        """Whether an article is short enough to share a batch request."""
+        if not settings.ai_batch_enabled or not content:
+            return False
+        length = len(content.strip())
+        return 30 <= length <= settings.ai_batch_max_article_chars
+
+    def plan_analysis_batches(self, articles: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Pack articles into batches, choosing K adaptively from the token budget.
+
+        A batch is closed when adding the next article would exceed either the
+        input token budget, the output token budget (K * per-article allowance)
+        or AI_BATCH_MAX_SIZE.
+
+        Args:
+            articles: Dicts with at least 'title' and 'content'
+
+        Returns:
+            List of batches (each a list of the original dicts, order preserved)
+        """
+        max_by_output = max(
+            1, settings.ai_batch_max_output_tokens // max(1, settings.ai_batch_output_tokens_per_article)
+        )
+        max_size = max(1, min(settings.ai_batch_max_size, max_by_output))
+        budget = settings.ai_batch_input_token_budget
+
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        for article in articles:
+            tokens = self._estimate_tokens(article.get('title', '')) + self._estimate_tokens(article.get('content', ''))
+            if current and (len(current) >= max_size or current_tokens + tokens > budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(article)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def analyze_articles_batch(self, articles: List[Dict[str, Any]],
+                                     stats: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Combined analysis for several short articles with one structured request per batch.
+
+        Articles are packed by plan_analysis_batches(); each batch returns an array of
+        per-article results. Articles missing from the response (partial parse failure)
+        or with an unusable result fall back to analyze_article_complete() individually.
+        Batches run concurrently; the adaptive limiter bounds the requests in flight.
+
+        Args:
+            articles: Dicts with 'title', 'content', 'url' and optionally 'source_type'
+            stats: Processing stats; 'api_calls_made' counts the batch and fallback requests
+
+        Returns:
+            List of validated analysis results, aligned with the input order
+        """
+        from .ai_cache import get_ai_cache
+        ai_cache = get_ai_cache()
+        router = get_model_router()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        cache_keys: List[Optional[str]] = [None] * len(articles)
+        cache_models: List[str] = [self.summarization_model] * len(articles)
+        indexed = []
+        for i, article in enumerate(articles):
+            content = article.get('content') or ''
+            # Cache lookup uses the model the article alone would be routed to
+            cache_models[i] = router.select(len(content), article.get('source_type')).model
+            cache_keys[i] = await self._analysis_cache_key(
+                article.get('title'), content, article.get('url'), model=cache_models[i]
+            )
+            cached_result = await ai_cache.get(cache_keys[i]) if cache_keys[i] else None
+            if cached_result:
+                results[i] = cached_result
+            else:
+                indexed.append(dict(article, _batch_index=i))
+        if len(indexed) < len(articles):
+            logger.info(f"  ♻️ {len(articles) - len(indexed)}/{len(articles)} batch articles served from AI cache")
+
+        api_calls = 0
+
+        async def analyze_single(item: Dict[str, Any]) -> None:
+            nonlocal api_calls
+            api_calls += 1
+            results[item['_batch_index']] = await self.analyze_article_complete(
+                item.get('title') or '', item.get('content') or '', item.get('url') or '',
+                source_type=item.get('source_type')
+            )
+
+        async def analyze_batch(batch: List[Dict[str, Any]]) -> None:
+            nonlocal api_calls
+            if len(batch) == 1:
+                await analyze_single(batch[0])
+                return
+
+            # The longest post decides whether the whole batch can use the light model
+            route = router.route(
+                max(len(item.get('content') or '') for item in batch),
+                batch[0].get('source_type')
+            )
+            api_calls += 1
+            batch_results = await self._analyze_batch_request(batch, route)
+            missing = []
+            for item in batch:
+                result = batch_results.get(item['_batch_index'])
+                if result and result.get('summary'):
+                    results[item['_batch_index']] = result
+                    if route.model == cache_models[item['_batch_index']]:
+                        await self._store_analysis_in_cache(cache_keys[item['_batch_index']], result)
+                else:
+                    missing.append(item)
+
+            if missing:
+                logger.warning(f"  ⚠️ Batch analysis returned {len(batch) - len(missing)}/{len(batch)} results, "
+                               f"falling back to single requests for {len(missing)}")
+            await asyncio.gather(*(analyze_single(item) for item in missing))
+
+        tasks = [asyncio.ensure_future(analyze_batch(batch)) for batch in self.plan_analysis_batches(indexed)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failed batch fails the call; the other batches must not keep running
+            for task in tasks:
+                task.cancel()
+            if stats is not None:
+                stats['api_calls_made'] += api_calls
+
+        return results
+
+    async def _analyze_batch_request(self, batch: List[Dict[str, Any]],
+                                     route: Optional[ModelRoute] = None) -> Dict[int, Dict[str, Any]]:
+        """Send one batch request; return validated results keyed by _batch_index (may be partial)."""
+        from .prompts import NewsPrompts, PromptBuilder
+
+        # Prompt ids are 1..K so the model doesn't have to echo large indexes
+        by_prompt_id = {pos + 1: item for pos, item in enumerate(batch)}
+        prompt = await NewsPrompts.batch_article_analysis([
+            {
+                'id': prompt_id,
+                'title': item.get('title') or '',
+                'url': item.get('url') or '',
+                'content': item.get('content') or '',
+                'source_context': PromptBuilder.build_source_context(item.get('url') or ''),
+            }
+            for prompt_id, item in by_prompt_id.items()
+        ])
+        max_tokens = min(
+            settings.ai_batch_max_output_tokens,
+            settings.ai_batch_output_tokens_per_article * len(batch)
+        )
+
+        model = route.model if route else self.summarization_model
+        logger.info(f"  📦 Batch AI analysis for {len(batch)} articles on {model} (max_tokens={max_tokens})...")
+        try:
+            response_data = await self._make_structured_ai_request(
+                prompt,
+                model=model,
+                schema=BATCH_ANALYSIS_SCHEMA,
+                analysis_type="combined_analysis_batch",
+                domain="batch",
+                max_tokens=max_tokens,
+                route=route
+            )
+        except Exception as e:
+            logger.warning(f"  ⚠️ Batch analysis request failed: {e}")
+            return {}
+
+        structured = response_data.get("result") or {}
+        items = structured.get("results") if isinstance(structured, dict) else structured
+        if not isinstance(items, list):
+            logger.warning("  ⚠️ Batch analysis response has no results array")
+            return {}
+
+        from .category_cache import get_category_cache
+        valid_categories = await get_category_cache().get_categories()
+
+        parsed: Dict[int, Dict[str, Any]] = {}
+        for entry in items:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                item = by_prompt_id.get(int(entry.get('id')))
+            except (TypeError, ValueError):
+                continue
+            if item is None or item['_batch_index'] in parsed:
+                continue
+            try:
+                parsed[item['_batch_index']] = self._validate_analysis_result(
+                    entry, item.get('title'), item.get('content'), valid_categories
+                )
+            except Exception as e:
+                logger.warning(f"  ⚠️ Invalid batch result for article id {entry.get('id')}: {e}")
+
+        logger.info(f"  ✅ Batch analysis parsed {len(parsed)}/{len(batch)} results")
+        return parsed
+
+    async def _build_analysis_request(self, title: str, content: str, url: str,
+                                      original_context: str = None,
+                                      use_context_cache: bool = True,
+                                      model: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Build the combined-analysis request as (prompt, cached_content).
+
+        With a Gemini context cache handle for the current prompt version, the
+        prompt holds only the per-article part; otherwise it is the full prompt
+        and cached_content is None.
+        """
+        if use_context_cache and settings.ai_context_cache_enabled:
+            try:
+                from .prompts import NewsPrompts, PromptBuilder, PROMPT_VERSIONS
+                from .gemini_context_cache import get_gemini_context_cache
+                template = await NewsPrompts.get_analysis_template()
+                version = f"{PROMPT_VERSIONS['combined_analysis']}-{template.category_version}"
+                handle = await get_gemini_context_cache().get_handle(
+                    model or self.summarization_model, version, template.cached_instructions
+                )
+                if handle:
+                    prompt = NewsPrompts.cached_article_analysis(
+                        title, content, url, PromptBuilder.build_source_context(url),
+                        original_context=original_context
+                    )
+                    return prompt, handle
+            except Exception as e:
+                logger.debug(f"Context cache unavailable, sending full prompt: {e}")
+
+        prompt = await self._build_combined_analysis_prompt_enhanced(title, content, url, original_context=original_context)
+        return prompt, None
+
     async def _build_combined_analysis_prompt_enhanced(self, title: str, content: str, url: str,
                                                        original_context: str = None) -> str:
         """Build enhanced combined prompt using dynamic category metadata."""
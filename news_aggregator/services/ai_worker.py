@@ -0,0 +1,170 @@
+"""AI worker: processes article-analysis jobs leased from the ai_jobs table."""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+from ..models import Article
+from .backlog_reader import article_work_item, article_work_query, unprocessed_predicate
+from .job_queue import JobQueue, LeasedJob, get_job_queue
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class LeasedJobReader:
+    """Page source for NewsOrchestrator._process_unprocessed_articles over leased jobs."""
+
+    def __init__(self, db_queue_manager, jobs: List[LeasedJob]):
+        self.db_queue_manager = db_queue_manager
+        self.jobs = jobs
+        self.loaded_ids: set = set()
+        self.rows_read = 0
+        self.pages_read = 0
+
+    async def pages(self):
+        article_ids = [job.article_id for job in self.jobs]
+
+        async def fetch_job_articles_operation(db):
+            # Articles finished in the meantime (or deleted) are not returned
+            query = article_work_query().where(Article.id.in_(article_ids)).where(unprocessed_predicate())
+            result = await db.execute(query)
+            return [article_work_item(row) for row in result]
+
+        page = await self.db_queue_manager.execute_read(fetch_job_articles_operation, timeout=10.0)
+        self.loaded_ids = {a['id'] for a in page}
+        if page:
+            self.rows_read += len(page)
+            self.pages_read += 1
+            yield page
+
+
+class AIWorker:
+    """
+    Leases article-analysis jobs and runs them through the regular processing pipeline.
+
+    Any number of workers (separate processes or containers) can share one
+    database. Each batch of leases is kept alive by a heartbeat while it is
+    processed; articles are written in micro-batches and their jobs are
+    completed in the same transaction. Jobs whose article could not be fully
+    processed or saved are released for a later attempt.
+    """
+
+    def __init__(self, orchestrator, worker_id: Optional[str] = None,
+                 batch_size: Optional[int] = None, poll_interval: Optional[float] = None,
+                 job_queue: Optional[JobQueue] = None):
+        self.orchestrator = orchestrator
+        self.db_queue_manager = orchestrator.db_queue_manager
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size or settings.ai_worker_batch_size
+        self.poll_interval = poll_interval if poll_interval is not None else settings.ai_worker_poll_interval
+        self.job_queue = job_queue or get_job_queue()
+        self.totals = {'batches': 0, 'jobs': 0, 'articles_processed': 0,
+                       'articles_summarized': 0, 'articles_categorized': 0, 'api_calls_made': 0}
+
+    async def run(self, drain: bool = False, stop_event: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """
+        Process jobs until stopped.
+
+        Args:
+            drain: Return as soon as no job can be leased instead of polling
+            stop_event: Set to stop after the current batch
+        """
+        logger.info(f"👷 AI worker {self.worker_id} started (batch {self.batch_size})")
+        while not (stop_event and stop_event.is_set()):
+            batch_stats = await self.run_once()
+            if batch_stats is not None:
+                continue
+            if drain:
+                break
+            try:
+                await asyncio.wait_for(
+                    stop_event.wait() if stop_event else asyncio.sleep(self.poll_interval),
+                    timeout=self.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+        logger.info(f"👷 AI worker {self.worker_id} stopped: {self.totals}")
+        return dict(self.totals)
+
+    async def run_once(self) -> Optional[Dict[str, Any]]:
+        """Lease and process one batch; returns None when there was nothing to lease."""
+        async def lease_operation(db):
+            return await self.job_queue.lease(db, self.worker_id, self.batch_size)
+
+        jobs = await self.db_queue_manager.execute_write(lease_operation, timeout=30.0)
+        if not jobs:
+            return None
+
+        logger.info(f"👷 {self.worker_id}: leased {len(jobs)} jobs")
+        jobs_by_article = {job.article_id: job for job in jobs}
+        heartbeat = asyncio.create_task(self._heartbeat([job.id for job in jobs]))
+        reader = LeasedJobReader(self.db_queue_manager, jobs)
+        stats = {'api_calls_made': 0, 'errors': [], 'categories_found': set()}
+
+        async def complete_jobs(db, batch: List[Dict[str, Any]]) -> None:
+            for article_data in batch:
+                job = jobs_by_article.get(article_data['id'])
+                if job is None:
+                    continue
+                if article_data['summary_processed'] and article_data['category_processed'] and article_data['ad_processed']:
+                    await self.job_queue.complete(db, self.worker_id, job.id, {
+                        'summary_chars': len(article_data.get('summary') or ''),
+                        'categories': [c.get('name') for c in article_data.get('categories') or []],
+                        'advertisement': (article_data.get('advertising') or {}).get('is_advertisement'),
+                    })
+                else:
+                    await self.job_queue.fail(db, self.worker_id, job, 'processing incomplete')
+
+        try:
+            # Failed jobs are retried by JobQueue.fail backoff, not the dead-letter queue
+            result = await self.orchestrator._process_unprocessed_articles(
+                stats, reader=reader, after_save=complete_jobs, record_dead_letters=False
+            )
+        finally:
+            heartbeat.cancel()
+            await self._settle(jobs, reader.loaded_ids, stats)
+
+        self.totals['batches'] += 1
+        self.totals['jobs'] += len(jobs)
+        self.totals['api_calls_made'] += stats['api_calls_made']
+        for key in ('articles_processed', 'articles_summarized', 'articles_categorized'):
+            self.totals[key] += result.get(key, 0)
+        return result
+
+    async def _settle(self, jobs: List[LeasedJob], loaded_ids: set, stats: Dict[str, Any]) -> None:
+        """Close jobs the pipeline did not: already-finished articles and unsaved results."""
+        error = '; '.join(stats['errors'])[:500] or 'result not persisted'
+
+        async def settle_operation(db):
+            for job in jobs:
+                if job.article_id not in loaded_ids:
+                    await self.job_queue.complete(db, self.worker_id, job.id, {'skipped': 'already processed'})
+                else:
+                    # No-op for jobs completed with their article (fenced on status = 'leased')
+                    await self.job_queue.fail(db, self.worker_id, job, error)
+
+        try:
+            await self.db_queue_manager.execute_write(settle_operation, timeout=30.0)
+        except Exception as e:
+            # Leases expire on their own and the jobs become leasable again
+            logger.warning(f"  ⚠️ Failed to settle {len(jobs)} jobs: {e}")
+
+    async def _heartbeat(self, job_ids: List[int]) -> None:
+        interval = max(5.0, self.job_queue.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+
+            async def heartbeat_operation(db):
+                return await self.job_queue.heartbeat(db, self.worker_id, job_ids)
+
+            try:
+                await self.db_queue_manager.execute_write(heartbeat_operation, timeout=10.0)
+            except Exception as e:
+                logger.warning(f"  ⚠️ Lease heartbeat failed for {self.worker_id}: {e}")
@@ -0,0 +1,344 @@
+"""Reading of the unprocessed article backlog: keyset pages, value ranking, streaming."""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import and_, case, exists, func, or_, select, text, tuple_
+
+from ..config import settings
+from ..models import Article, DeadLetterEntry, Source
+
+logger = logging.getLogger(__name__)
+
+
+def unprocessed_predicate():
+    """
+    Articles that still need AI work.
+
+    Must stay equivalent to the predicate of idx_articles_unprocessed_keyset
+    (migration 007) so Postgres can use the partial index.
+    """
+    return or_(
+        Article.processed == False,
+        Article.summary_processed == False,
+        Article.category_processed == False,
+        Article.ad_processed == False,
+        # Re-process articles that were marked done but have no summary
+        and_(Article.summary.is_(None), Article.content.isnot(None)),
+    )
+
+
+def not_dead_lettered_predicate():
+    """
+    Articles without a pending, claimed or failed dead-letter entry.
+
+    Dead-lettered articles are retried only by DeadLetterRetryWorker, which
+    honours next_retry_at and max_retries; the backlog readers must not pick
+    them up again every cycle. Served by idx_dead_letter_entries_open_article
+    (migration 015).
+    """
+    return ~exists().where(
+        DeadLetterEntry.article_id == Article.id,
+        DeadLetterEntry.status.in_(('pending', 'claimed', 'failed')),
+    )
+
+
+def article_work_query():
+    """SELECT of the columns the processing pipeline needs (no ORM objects)."""
+    return (
+        select(
+            Article.id, Article.title, Article.url, Article.content, Article.summary,
+            Article.source_id, Source.source_type, Article.published_at, Article.fetched_at,
+            Article.summary_processed, Article.category_processed, Article.ad_processed,
+        )
+        .select_from(Article)
+        .outerjoin(Source, Article.source_id == Source.id)
+    )
+
+
+def article_work_item(row) -> Dict[str, Any]:
+    """Row of article_work_query() as the dict the processing pipeline works on."""
+    return {
+        'id': row.id,
+        'title': row.title,
+        'url': row.url,
+        'content': row.content,
+        'summary': row.summary,
+        'source_id': row.source_id,
+        'source_type': row.source_type or 'rss',
+        'published_at': row.published_at,
+        'fetched_at': row.fetched_at,
+        'summary_processed': row.summary_processed,
+        'category_processed': row.category_processed,
+        'ad_processed': row.ad_processed,
+    }
+
+
+class UnprocessedArticleReader:
+    """
+    Streams unprocessed articles page by page, newest first.
+
+    Each page is a short read ordered by (fetched_at, id) DESC that continues
+    after the last row of the previous page, so the cost per page stays flat
+    however large the backlog is and no page re-reads rows already seen.
+    Only the columns the processing pipeline needs are selected. Article
+    limits (max articles, date range) from ArticleLimiter are honoured.
+    """
+
+    def __init__(self, db_queue_manager, article_limiter, page_size: Optional[int] = None):
+        self.db_queue_manager = db_queue_manager
+        self.article_limiter = article_limiter
+        self.page_size = max(1, page_size or settings.backlog_page_size)
+        self.rows_read = 0
+        self.pages_read = 0
+
+    async def pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield lists of article dicts until the backlog (or the article limit) is exhausted."""
+        max_articles = self.article_limiter.get_max_articles() if self.article_limiter.is_enabled() else None
+        cursor = None
+        while True:
+            limit = self.page_size
+            if max_articles:
+                limit = min(limit, max_articles - self.rows_read)
+                if limit <= 0:
+                    return
+
+            page = await self._read_page(cursor, limit)
+            if not page:
+                return
+            self.rows_read += len(page)
+            self.pages_read += 1
+            yield page
+            if len(page) < limit:
+                return
+            last = page[-1]
+            cursor = (last['fetched_at'], last['id'])
+
+    async def _read_page(self, cursor, limit: int) -> List[Dict[str, Any]]:
+        async def fetch_backlog_page_operation(db):
+            query = article_work_query().where(unprocessed_predicate(), not_dead_lettered_predicate())
+            query = self.article_limiter.apply_date_filters_to_query(query)
+            if cursor is not None:
+                query = query.where(tuple_(Article.fetched_at, Article.id) < tuple_(*cursor))
+            query = query.order_by(Article.fetched_at.desc(), Article.id.desc()).limit(limit)
+
+            result = await db.execute(query)
+            return [article_work_item(row) for row in result]
+
+        return await self.db_queue_manager.execute_read(fetch_backlog_page_operation, timeout=10.0)
+
+
+def value_ranking_query(article_limiter, limit: Optional[int] = None):
+    """
+    Ids of unprocessed articles, most valuable first.
+
+    score = source weight (Source.config['weight'], default 1)
+            * (0.2 + freshness)        freshness = exp(-age / BACKLOG_FRESHNESS_HOURS)
+            * (1 + ln(cluster size))   articles sharing a normalized, non-empty title
+            * cluster penalty          0.3 for all but the freshest of a cluster
+            * content quality          log-scaled content length
+            * (1 - 0.8 * ad rate)      source's advertisement share, last 30 days
+
+    Per-source fairness: the score is divided by
+    rank_within_source ** BACKLOG_SOURCE_FAIRNESS, and the ArticleLimiter's
+    per-source limit cuts each source off after that many articles. Date
+    filters apply; limit (e.g. max articles) is taken from the top.
+    """
+    age_hours = func.greatest(
+        func.extract('epoch', func.now() - func.coalesce(Article.published_at, Article.fetched_at)) / 3600.0,
+        0.0
+    )
+    freshness = func.exp(-age_hours / max(settings.backlog_freshness_hours, 0.1))
+    source_weight = func.coalesce(Source.config['weight'].as_float(), 1.0)
+    # Untitled articles are not a cluster: window partitions group NULL keys together,
+    # so they get size 1 / rank 1 explicitly
+    cluster_key = func.nullif(func.lower(func.trim(Article.title)), '')
+    cluster_size = case(
+        (cluster_key.is_(None), 1),
+        else_=func.count(Article.id).over(partition_by=cluster_key),
+    )
+    cluster_rank = case(
+        (cluster_key.is_(None), 1),
+        else_=func.row_number().over(
+            partition_by=cluster_key, order_by=func.coalesce(Article.published_at, Article.fetched_at).desc()
+        ),
+    )
+    quality = case(
+        (Article.content.is_(None), 0.2),
+        else_=0.2 + 0.8 * func.ln(1 + func.least(func.length(Article.content), 4000)) / func.ln(4001),
+    )
+
+    ad_rates = (
+        select(
+            Article.source_id.label('source_id'),
+            func.avg(case((Article.is_advertisement == True, 1.0), else_=0.0)).label('ad_rate'),
+        )
+        .where(Article.ad_processed == True)
+        .where(Article.fetched_at >= func.now() - text("interval '30 days'"))
+        .group_by(Article.source_id)
+        .subquery('source_ad_rates')
+    )
+
+    scored = (
+        select(
+            Article.id.label('id'),
+            Article.source_id.label('source_id'),
+            (
+                source_weight
+                * (0.2 + freshness)
+                * (1 + func.ln(cluster_size))
+                * case((cluster_rank == 1, 1.0), else_=0.3)
+                * quality
+                * (1 - 0.8 * func.coalesce(ad_rates.c.ad_rate, 0.0))
+            ).label('score'),
+        )
+        .select_from(Article)
+        .outerjoin(Source, Article.source_id == Source.id)
+        .outerjoin(ad_rates, ad_rates.c.source_id == Article.source_id)
+        .where(unprocessed_predicate(), not_dead_lettered_predicate())
+    )
+    scored = article_limiter.apply_date_filters_to_query(scored).subquery('scored')
+
+    source_rank = func.row_number().over(partition_by=scored.c.source_id, order_by=scored.c.score.desc())
+    fair = select(
+        scored.c.id,
+        (scored.c.score / func.power(source_rank, settings.backlog_source_fairness)).label('fair_score'),
+        source_rank.label('source_rank'),
+    ).subquery('fair')
+
+    query = select(fair.c.id)
+    per_source = article_limiter.get_per_source_limit() if article_limiter.is_enabled() else None
+    if per_source:
+        query = query.where(fair.c.source_rank <= per_source)
+    query = query.order_by(fair.c.fair_score.desc(), fair.c.id.desc())
+    if limit:
+        query = query.limit(limit)
+    return query
+
+
+class RankedArticleReader:
+    """
+    Streams unprocessed articles page by page, most valuable first.
+
+    One ranking query (ids only, see value_ranking_query) orders the whole
+    backlog up front; pages then read the ranked ids in order. When the
+    AI budget (max articles) or the cycle runs out, what was skipped is the
+    least valuable part. Articles finished in the meantime are left out.
+    """
+
+    def __init__(self, db_queue_manager, article_limiter, page_size: Optional[int] = None):
+        self.db_queue_manager = db_queue_manager
+        self.article_limiter = article_limiter
+        self.page_size = max(1, page_size or settings.backlog_page_size)
+        self.rows_read = 0
+        self.pages_read = 0
+
+    async def pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        max_articles = self.article_limiter.get_max_articles() if self.article_limiter.is_enabled() else None
+
+        async def rank_backlog_operation(db):
+            result = await db.execute(value_ranking_query(self.article_limiter, max_articles))
+            return [row.id for row in result]
+
+        ranked_ids = await self.db_queue_manager.execute_read(rank_backlog_operation, timeout=30.0)
+        if ranked_ids:
+            logger.info(f"  🏅 Ranked {len(ranked_ids)} unprocessed articles by value")
+        for start in range(0, len(ranked_ids), self.page_size):
+            chunk = ranked_ids[start:start + self.page_size]
+            page = await self._read_ids(chunk)
+            if page:
+                self.rows_read += len(page)
+                self.pages_read += 1
+                yield page
+
+    async def _read_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        position = {article_id: i for i, article_id in enumerate(ids)}
+
+        async def fetch_ranked_page_operation(db):
+            query = article_work_query().where(Article.id.in_(ids)).where(unprocessed_predicate(), not_dead_lettered_predicate())
+            result = await db.execute(query)
+            return [article_work_item(row) for row in result]
+
+        page = await self.db_queue_manager.execute_read(fetch_ranked_page_operation, timeout=10.0)
+        return sorted(page, key=lambda a: position[a['id']])
+
+
+def create_backlog_reader(db_queue_manager, article_limiter, page_size: Optional[int] = None):
+    """Backlog reader per BACKLOG_RANKING_ENABLED: by value, or newest first."""
+    if settings.backlog_ranking_enabled:
+        return RankedArticleReader(db_queue_manager, article_limiter, page_size)
+    return UnprocessedArticleReader(db_queue_manager, article_limiter, page_size)
+
+
+class StreamingArticleReader:
+    """
+    Page source for a staged cycle: freshly saved articles first, then the rest of the backlog.
+
+    The save stage puts lists of saved article ids on id_queue (None ends the
+    stream); each list is read back in pages while fetching and saving go on.
+    Once the stream ends, the remaining unprocessed backlog is read (see
+    create_backlog_reader), skipping articles already handed out. The
+    ArticleLimiter's max articles and date range apply to both parts; past
+    the limit the id queue is still drained so the save stage never blocks.
+    """
+
+    def __init__(self, db_queue_manager, article_limiter, id_queue: asyncio.Queue,
+                 page_size: Optional[int] = None):
+        self.db_queue_manager = db_queue_manager
+        self.article_limiter = article_limiter
+        self.id_queue = id_queue
+        self.page_size = max(1, page_size or settings.backlog_page_size)
+        self.rows_read = 0
+        self.pages_read = 0
+        self.fresh_rows = 0
+
+    async def pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        max_articles = self.article_limiter.get_max_articles() if self.article_limiter.is_enabled() else None
+        seen: set = set()
+
+        def room() -> Optional[int]:
+            return None if not max_articles else max_articles - self.rows_read
+
+        while True:
+            ids = await self.id_queue.get()
+            if ids is None:
+                break
+            ids = [i for i in dict.fromkeys(ids) if i not in seen]
+            for start in range(0, len(ids), self.page_size):
+                left = room()
+                if left is not None and left <= 0:
+                    break
+                chunk = ids[start:start + self.page_size][:left]
+                seen.update(chunk)
+                page = await self._read_ids(chunk)
+                if page:
+                    self.rows_read += len(page)
+                    self.fresh_rows += len(page)
+                    self.pages_read += 1
+                    yield page
+
+        # Whatever was not saved in this cycle (older backlog, earlier failures)
+        backlog = create_backlog_reader(self.db_queue_manager, self.article_limiter, self.page_size)
+        async for page in backlog.pages():
+            page = [a for a in page if a['id'] not in seen]
+            left = room()
+            if left is not None:
+                if left <= 0:
+                    return
+                page = page[:left]
+            if page:
+                seen.update(a['id'] for a in page)
+                self.rows_read += len(page)
+                self.pages_read += 1
+                yield page
+
+    async def _read_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        async def fetch_saved_articles_operation(db):
+            query = article_work_query().where(Article.id.in_(ids)).where(unprocessed_predicate(), not_dead_lettered_predicate())
+            query = self.article_limiter.apply_date_filters_to_query(query)
+            query = query.order_by(Article.fetched_at.desc(), Article.id.desc())
+            result = await db.execute(query)
+            return [article_work_item(row) for row in result]
+
+        return await self.db_queue_manager.execute_read(fetch_saved_articles_operation, timeout=10.0)
@@ -3,9 +3,9 @@ import logging
 Service for mapping AI categories to display categories at runtime.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import func, select, update
 
 from ..models import Category, CategoryMapping
 
@@ -191,11 +191,8 @@ class CategoryDisplayService:
             logger.warning(f"  ⚠️ Database mapping lookup failed for '{ai_category}': {e}")
 
         # Try default mapping rules
-        ai_lower = ai_category.lower().strip()
-
-        # Exact match
-        if ai_lower in self.DEFAULT_MAPPING:
-            fixed_category = self.DEFAULT_MAPPING[ai_lower]
+        fixed_category, mapping_source = self._default_fixed_category(ai_category)
+        if fixed_category:
             display_info = await self._get_category_info(fixed_category)
 
             return {
@@ -203,22 +200,9 @@ class CategoryDisplayService:
                 'display_name': display_info['display_name'],
                 'color': display_info['color'],
                 'ai_category': ai_category,
-                'mapping_source': 'default_exact'
+                'mapping_source': mapping_source
             }
 
-        # Partial match
-        for keyword, fixed_category in self.DEFAULT_MAPPING.items():
-            if keyword in ai_lower or ai_lower in keyword:
-                display_info = await self._get_category_info(fixed_category)
-
-                return {
-                    'name': fixed_category,
-                    'display_name': display_info['display_name'],
-                    'color': display_info['color'],
-                    'ai_category': ai_category,
-                    'mapping_source': f'default_partial:{keyword}'
-                }
-
         # Fallback to Other
         display_info = await self._get_category_info('Other')
         return {
@@ -229,6 +213,57 @@ class CategoryDisplayService:
             'mapping_source': 'fallback'
         }
     
+    def _default_fixed_category(self, ai_category: str) -> Tuple[Optional[str], Optional[str]]:
+        """Match DEFAULT_MAPPING rules: exact match first, then partial."""
+        ai_lower = ai_category.lower().strip()
+
+        # Exact match
+        if ai_lower in self.DEFAULT_MAPPING:
+            return self.DEFAULT_MAPPING[ai_lower], 'default_exact'
+
+        # Partial match
+        for keyword, fixed_category in self.DEFAULT_MAPPING.items():
+            if keyword in ai_lower or ai_lower in keyword:
+                return fixed_category, f'default_partial:{keyword}'
+
+        return None, None
+
+    async def resolve_fixed_categories(self, ai_categories: Iterable[str]) -> Dict[str, str]:
+        """
+        Map many AI categories to fixed category names at once.
+
+        Same rules as map_ai_category_to_display (database mapping, default
+        rules, 'Other'), but with one mapping query and one usage-stats update
+        (one use per distinct name) for the whole set and without committing,
+        so it can run inside a caller's write transaction. Keys are lowercased
+        AI category names.
+        """
+        names = {(name or 'Other').strip().lower() or 'other' for name in ai_categories}
+        if not names:
+            return {}
+
+        resolved: Dict[str, str] = {}
+        result = await self.db.execute(
+            select(CategoryMapping.ai_category, CategoryMapping.fixed_category).where(
+                func.lower(CategoryMapping.ai_category).in_(names),
+                CategoryMapping.is_active == True
+            )
+        )
+        for ai_category, fixed_category in result:
+            resolved.setdefault(ai_category.lower().strip(), fixed_category)
+
+        if resolved:
+            await self.db.execute(
+                update(CategoryMapping)
+                .where(func.lower(CategoryMapping.ai_category).in_(list(resolved)))
+                .values(usage_count=func.coalesce(CategoryMapping.usage_count, 0) + 1, last_used=func.now())
+            )
+
+        for name in names - resolved.keys():
+            fixed_category, _ = self._default_fixed_category(name)
+            resolved[name] = fixed_category or 'Other'
+        return resolved
+
     async def get_article_display_categories(self, ai_categories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert list of AI categories to display categories."""
         display_categories = []
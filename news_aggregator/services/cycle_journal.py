@@ -0,0 +1,183 @@
+"""Journal of processing cycles (table cycle_runs): checkpoints and resume after restart."""
+
+import json
+import logging
+import os
+import socket
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import text
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CycleCheckpoint:
+    """The journal entry of the running cycle and what it inherited from an interrupted one."""
+    run_id: int
+    resumed_from_id: Optional[int] = None
+    sources_done: Set[int] = field(default_factory=set)
+
+
+class CycleJournal:
+    """
+    Checkpoints of run_full_cycle.
+
+    A cycle opens a 'running' entry and checkpoints into it as it goes:
+    source ids are added in the same transaction that saves the source's
+    articles, and the analyzed-article counter in the same transaction that
+    persists their AI results (the articles' own flags are the per-article
+    checkpoint); heartbeat() keeps updated_at fresh in between. A 'running'
+    entry is taken over by the next cycle only if its owner is gone: this
+    process no longer runs it (cancelled), the owner is a dead process on
+    this host, or it has not been updated for CYCLE_STALE_MINUTES. Cycles
+    running in another process (e.g. `python -m news_aggregator process`
+    next to the server) are left alone. A taken-over entry is marked
+    'interrupted' and, if the chain started less than
+    CYCLE_RESUME_WINDOW_MINUTES ago, its saved sources are not fetched
+    again. Unprocessed articles are picked up from the database anyway.
+
+    Methods take an open session and are meant to run inside
+    DatabaseQueueManager operations.
+    """
+
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}-{os.getpid()}"
+        self._active: Set[int] = set()
+
+    async def start(self, db) -> CycleCheckpoint:
+        """Open a journal entry for a new cycle, resuming an interrupted one if recent enough."""
+        result = await db.execute(
+            text("""
+                SELECT id, owner, sources_done, COALESCE(origin_started_at, started_at) AS origin,
+                       updated_at < now() - make_interval(mins => :stale) AS stale
+                FROM cycle_runs
+                WHERE status = 'running' AND NOT (id = ANY(CAST(:active AS INTEGER[])))
+                ORDER BY started_at DESC
+                FOR UPDATE SKIP LOCKED
+            """),
+            {'active': list(self._active), 'stale': settings.cycle_stale_minutes}
+        )
+        orphans = [row for row in result.all() if row.stale or self._owner_is_gone(row.owner)]
+
+        resume = None
+        window_start = datetime.utcnow() - timedelta(minutes=settings.cycle_resume_window_minutes)
+        if orphans and orphans[0].origin and orphans[0].origin >= window_start:
+            resume = orphans[0]
+        if orphans:
+            await db.execute(
+                text("""
+                    UPDATE cycle_runs
+                    SET status = 'interrupted', finished_at = now(), updated_at = now()
+                    WHERE id = ANY(CAST(:ids AS INTEGER[]))
+                """),
+                {'ids': [row.id for row in orphans]}
+            )
+
+        sources_done = set()
+        if resume is not None:
+            raw = resume.sources_done
+            sources_done = set(json.loads(raw) if isinstance(raw, str) else raw or [])
+        run_id = (await db.execute(
+            text("""
+                INSERT INTO cycle_runs (status, owner, started_at, origin_started_at, updated_at,
+                                        resumed_from_id, sources_done, articles_fetched, articles_analyzed)
+                VALUES ('running', :owner, now(), COALESCE(CAST(:origin AS TIMESTAMP), now()), now(),
+                        :resumed_from_id, CAST(:sources_done AS JSON), 0, 0)
+                RETURNING id
+            """),
+            {'owner': self.owner, 'origin': resume.origin if resume else None,
+             'resumed_from_id': resume.id if resume else None,
+             'sources_done': json.dumps(sorted(sources_done))}
+        )).scalar_one()
+
+        self._active.add(run_id)
+        return CycleCheckpoint(run_id, resume.id if resume else None, sources_done)
+
+    def _owner_is_gone(self, owner: Optional[str]) -> bool:
+        """True for entries of this process (not active) or of a dead process on this host."""
+        if owner == self.owner:
+            return True
+        host, _, pid = (owner or '').rpartition('-')
+        if host != socket.gethostname() or not pid.isdigit():
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False  # Exists but belongs to another user
+        return False
+
+    async def heartbeat(self, db, checkpoint: CycleCheckpoint) -> None:
+        """Mark the entry as alive so other processes don't take it over."""
+        await db.execute(
+            text("UPDATE cycle_runs SET updated_at = now() WHERE id = :id AND status = 'running'"),
+            {'id': checkpoint.run_id}
+        )
+
+    async def record_sources(self, db, checkpoint: CycleCheckpoint, source_ids: Iterable[int],
+                             articles: int) -> None:
+        """Checkpoint sources whose articles are saved in this transaction."""
+        source_ids = sorted(set(source_ids))
+        if not source_ids and not articles:
+            return
+        await db.execute(
+            text("""
+                UPDATE cycle_runs
+                SET sources_done = CAST(CAST(COALESCE(sources_done, '[]') AS JSONB) || CAST(:ids AS JSONB) AS JSON),
+                    articles_fetched = articles_fetched + :articles, updated_at = now()
+                WHERE id = :id
+            """),
+            {'id': checkpoint.run_id, 'ids': json.dumps(source_ids), 'articles': articles}
+        )
+
+    async def record_analyzed(self, db, checkpoint: CycleCheckpoint, articles: int) -> None:
+        """Checkpoint articles whose AI results are persisted in this transaction."""
+        await db.execute(
+            text("""
+                UPDATE cycle_runs
+                SET articles_analyzed = articles_analyzed + :articles, updated_at = now()
+                WHERE id = :id
+            """),
+            {'id': checkpoint.run_id, 'articles': articles}
+        )
+
+    async def finish(self, db, checkpoint: CycleCheckpoint, stats: Dict[str, Any],
+                     error: Optional[str] = None) -> None:
+        """Close the journal entry as completed (or failed, with error)."""
+        self._active.discard(checkpoint.run_id)
+        await db.execute(
+            text("""
+                UPDATE cycle_runs
+                SET status = :status, stats = CAST(:stats AS JSON), error = :error,
+                    finished_at = now(), updated_at = now()
+                WHERE id = :id
+            """),
+            {'id': checkpoint.run_id, 'status': 'failed' if error else 'completed',
+             'stats': json.dumps(stats, ensure_ascii=False, default=_json_default), 'error': error}
+        )
+
+    def release(self, checkpoint: CycleCheckpoint) -> None:
+        """Give up a cycle without closing its entry (cancelled), so the next cycle resumes it."""
+        self._active.discard(checkpoint.run_id)
+
+
+def _json_default(value: Any) -> Any:
+    return sorted(value) if isinstance(value, set) else str(value)
+
+
+# Global instance
+_cycle_journal: Optional[CycleJournal] = None
+
+
+def get_cycle_journal() -> CycleJournal:
+    """Get global cycle journal instance."""
+    global _cycle_journal
+    if _cycle_journal is None:
+        _cycle_journal = CycleJournal()
+    return _cycle_journal
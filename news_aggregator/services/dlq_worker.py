@@ -0,0 +1,129 @@
+"""Retry worker for the dead-letter queue: re-processes due failed articles."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+from ..core.circuit_breaker import CircuitState, ai_service_breaker
+from ..core.dead_letter_queue import DeadLetter, DeadLetterQueue, get_dead_letter_queue
+from .ai_worker import LeasedJobReader, default_worker_id
+
+logger = logging.getLogger(__name__)
+
+
+def ai_service_available() -> bool:
+    """False while ai_service_breaker is open and not yet due for a recovery probe."""
+    if ai_service_breaker.get_state() != CircuitState.OPEN:
+        return True
+    reset_at = ai_service_breaker.get_stats().get('will_attempt_reset_at')
+    return reset_at is not None and time.time() >= reset_at
+
+
+class DeadLetterRetryWorker:
+    """
+    Claims due dead-letter entries and runs their articles through the regular pipeline.
+
+    Nothing is claimed while the AI circuit breaker is open - retries would
+    only fail again and burn their attempts. Entries whose article ends up
+    fully processed (or was processed or deleted in the meantime) are
+    completed in the same transaction as the article write; the others are
+    rescheduled with a doubled backoff until they run out of retries.
+    Each drain() first deletes entries finished more than DLQ_RETENTION_DAYS ago.
+    """
+
+    def __init__(self, orchestrator, owner: Optional[str] = None,
+                 batch_size: Optional[int] = None, dlq: Optional[DeadLetterQueue] = None):
+        self.orchestrator = orchestrator
+        self.db_queue_manager = orchestrator.db_queue_manager
+        self.owner = owner or f"dlq-{default_worker_id()}"
+        self.batch_size = batch_size or settings.dlq_retry_batch_size
+        self.dlq = dlq or get_dead_letter_queue()
+
+    async def drain(self, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """Retry due entries batch by batch until none are due, the breaker opens or max_batches."""
+        totals = {'batches': 0, 'claimed': 0, 'articles_processed': 0, 'skipped_breaker_open': False,
+                  'cleared': await self.cleanup()}
+        max_batches = max_batches or settings.dlq_retry_max_batches
+        while totals['batches'] < max_batches:
+            if not ai_service_available():
+                logger.info("  ⏸️ DLQ retry paused: AI circuit breaker is open")
+                totals['skipped_breaker_open'] = True
+                break
+            batch = await self.run_once()
+            if batch is None:
+                break
+            totals['batches'] += 1
+            totals['claimed'] += batch['claimed']
+            totals['articles_processed'] += batch['articles_processed']
+        return totals
+
+    async def cleanup(self) -> int:
+        """Delete done entries (and failed ones whose article is gone) older than DLQ_RETENTION_DAYS."""
+        async def cleanup_operation(db):
+            return await self.dlq.clear_old_entries(db, settings.dlq_retention_days)
+
+        try:
+            return await self.db_queue_manager.execute_write(cleanup_operation, timeout=30.0)
+        except Exception as e:
+            logger.warning(f"  ⚠️ DLQ cleanup failed: {e}")
+            return 0
+
+    async def run_once(self) -> Optional[Dict[str, Any]]:
+        """Claim and retry one batch; returns None when nothing was due."""
+        async def claim_operation(db):
+            return await self.dlq.claim_due(db, self.owner, self.batch_size)
+
+        entries = await self.db_queue_manager.execute_write(claim_operation, timeout=30.0)
+        if not entries:
+            return None
+
+        logger.info(f"  🔁 Retrying {len(entries)} dead-letter entries")
+        retryable = [e for e in entries if e.article_id is not None]
+        entries_by_article = {e.article_id: e for e in retryable}
+        reader = LeasedJobReader(self.db_queue_manager, retryable)
+        stats = {'api_calls_made': 0, 'errors': [], 'categories_found': set()}
+        settled: set = set()
+
+        async def settle_batch(db, batch: List[Dict[str, Any]]) -> None:
+            done = []
+            for article_data in batch:
+                entry = entries_by_article.get(article_data['id'])
+                if entry is None:
+                    continue
+                settled.add(entry.id)
+                if article_data['summary_processed'] and article_data['category_processed'] and article_data['ad_processed']:
+                    done.append(entry.id)
+                else:
+                    await self.dlq.mark_retry(db, self.owner, entry, 'processing incomplete')
+            await self.dlq.complete(db, self.owner, done)
+
+        result = {'articles_processed': 0}
+        try:
+            if retryable:
+                result = await self.orchestrator._process_unprocessed_articles(
+                    stats, reader=reader, after_save=settle_batch, record_dead_letters=False
+                )
+        finally:
+            await self._settle(entries, reader.loaded_ids, settled, stats)
+
+        return {'claimed': len(entries), 'articles_processed': result.get('articles_processed', 0)}
+
+    async def _settle(self, entries: List[DeadLetter], loaded_ids: set, settled: set,
+                      stats: Dict[str, Any]) -> None:
+        """Close entries the pipeline did not: finished/deleted articles and unsaved results."""
+        error = '; '.join(stats['errors'])[:500] or 'result not persisted'
+
+        async def settle_operation(db):
+            await self.dlq.complete(db, self.owner, [
+                e.id for e in entries if e.id not in settled and e.article_id not in loaded_ids
+            ])
+            for entry in entries:
+                if entry.id not in settled and entry.article_id in loaded_ids:
+                    await self.dlq.mark_retry(db, self.owner, entry, error)
+
+        try:
+            await self.db_queue_manager.execute_write(settle_operation, timeout=30.0)
+        except Exception as e:
+            # Claims expire on their own and the entries become due again
+            logger.warning(f"  ⚠️ Failed to settle {len(entries)} DLQ entries: {e}")
@@ -18,4 +18,11 @@ MIN_QUALITY_SCORE = 25  # Increased for production: filters out low-quality cont
 HTML_CACHE_TTL_SECONDS = 300        # cache fetched HTML for 5 minutes
 SELECTOR_CACHE_TTL_SECONDS = 21600  # cache domain selector for 6 hours
 
-
+# End-to-end extraction budget (all attempts, fetches, browser and retries)
+EXTRACTION_TOTAL_BUDGET_MS = 120_000
+# Per-request cap for plain HTML fetches
+HTML_FETCH_TIMEOUT_MS = 20_000
+# Minimum remaining budget required before starting browser rendering
+BROWSER_MIN_BUDGET_MS = 15_000
+# Minimum remaining budget required before starting another extraction attempt
+MIN_ATTEMPT_BUDGET_MS = 3_000
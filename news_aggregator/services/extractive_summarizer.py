@@ -0,0 +1,221 @@
+"""Local extractive summarization (no AI) for short and low-value posts."""
+
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Serbian-only letters (Cyrillic and Latin script)
+_SERBIAN_CYRILLIC_RE = re.compile(r'[ђјљњћџЂЈЉЊЋЏ]')
+_SERBIAN_LATIN_RE = re.compile(r'[čćšžđČĆŠŽĐ]')
+_CYRILLIC_RE = re.compile(r'[а-яёА-ЯЁђјљњћџЂЈЉЊЋЏ]')
+_LATIN_RE = re.compile(r'[a-zA-ZčćšžđČĆŠŽĐ]')
+
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_TAG_LINE_RE = re.compile(r'^(?:\s*[#@]\w+)+\s*$', re.MULTILINE)
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+# Sentence end: terminal punctuation followed by whitespace and an uppercase letter, digit or quote
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?…])\s+(?=[«"“(\[\dA-ZА-ЯЁЂЈЉЊЋЏČĆŠŽĐ])')
+
+# Abbreviations that end with a period but don't end a sentence
+_ABBREVIATIONS: Dict[str, Set[str]] = {
+    'ru': {'т.е', 'т.д', 'т.п', 'т.к', 'г', 'гг', 'руб', 'коп', 'млн', 'млрд', 'тыс', 'др', 'им', 'ул',
+           'пр', 'стр', 'см', 'напр', 'проф', 'акад', 'доп', 'ред', 'св', 'обл', 'р-н'},
+    'en': {'mr', 'mrs', 'ms', 'dr', 'prof', 'vs', 'e.g', 'i.e', 'etc', 'inc', 'ltd', 'co', 'corp', 'st',
+           'u.s', 'u.k', 'no', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct',
+           'nov', 'dec', 'approx'},
+    'sr': {'npr', 'tj', 'dr', 'itd', 'itsl', 'god', 'br', 'ul', 'mil', 'mlrd', 'sl', 'prof', 'gos', 'gđa',
+           'нпр', 'тј', 'др', 'итд', 'год', 'бр', 'ул', 'мил', 'млрд', 'проф', 'г', 'гђа'},
+}
+
+_STOPWORDS: Dict[str, Set[str]] = {
+    'ru': {'и', 'в', 'во', 'не', 'что', 'он', 'на', 'я', 'с', 'со', 'как', 'а', 'то', 'все', 'она', 'так',
+           'его', 'но', 'да', 'ты', 'к', 'у', 'же', 'вы', 'за', 'бы', 'по', 'только', 'ее', 'мне', 'было',
+           'вот', 'от', 'меня', 'еще', 'нет', 'о', 'из', 'ему', 'теперь', 'когда', 'даже', 'ну', 'ли',
+           'если', 'уже', 'или', 'ни', 'быть', 'был', 'него', 'до', 'вас', 'нибудь', 'опять', 'уж', 'вам',
+           'ведь', 'там', 'потом', 'себя', 'ничего', 'ей', 'может', 'они', 'тут', 'где', 'есть', 'надо',
+           'ней', 'для', 'мы', 'тебя', 'их', 'чем', 'была', 'сам', 'чтоб', 'без', 'будто', 'чего', 'раз',
+           'тоже', 'себе', 'под', 'будет', 'ж', 'тогда', 'кто', 'этот', 'того', 'потому', 'этого', 'какой',
+           'совсем', 'ним', 'здесь', 'этом', 'один', 'почти', 'мой', 'тем', 'чтобы', 'нее', 'были', 'куда',
+           'зачем', 'всех', 'никогда', 'можно', 'при', 'наконец', 'два', 'об', 'другой', 'хоть', 'после',
+           'над', 'больше', 'тот', 'через', 'эти', 'нас', 'про', 'всего', 'них', 'какая', 'много', 'разве',
+           'три', 'эту', 'моя', 'впрочем', 'хорошо', 'свою', 'этой', 'перед', 'иногда', 'лучше', 'чуть',
+           'том', 'нельзя', 'такой', 'им', 'более', 'всегда', 'конечно', 'всю', 'между', 'это', 'также'},
+    'en': {'the', 'a', 'an', 'and', 'or', 'but', 'if', 'of', 'at', 'by', 'for', 'with', 'about', 'to', 'from',
+           'in', 'on', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+           'did', 'this', 'that', 'these', 'those', 'it', 'its', 'as', 'he', 'she', 'they', 'we', 'you', 'i',
+           'his', 'her', 'their', 'our', 'your', 'not', 'no', 'so', 'than', 'too', 'very', 'can', 'will',
+           'just', 'also', 'into', 'over', 'after', 'before', 'more', 'most', 'said', 'says', 'would', 'could'},
+    'sr': {'i', 'u', 'je', 'da', 'se', 'na', 'za', 'su', 'od', 'sa', 'koji', 'koja', 'koje', 'kao', 'iz',
+           'ne', 'to', 'će', 'ce', 'biti', 'bio', 'bila', 'a', 'ali', 'ili', 'o', 'po', 'do', 'pa', 'kako',
+           'što', 'sto', 'još', 'jos', 'ga', 'ih', 'mu', 'joj', 'nije', 'sam', 'smo', 'ste', 'će', 'ovaj',
+           'ova', 'ovo', 'taj', 'ta', 'to', 'tako', 'kada', 'kad', 'gde', 'već', 'vec', 'prema', 'nakon',
+           'и', 'у', 'је', 'да', 'се', 'на', 'за', 'су', 'од', 'са', 'који', 'која', 'које', 'као', 'из',
+           'не', 'то', 'ће', 'бити', 'био', 'била', 'а', 'али', 'или', 'о', 'по', 'до', 'па', 'како', 'што',
+           'још', 'га', 'их', 'му', 'јој', 'није', 'овај', 'ова', 'ово', 'тај', 'та', 'када', 'где', 'већ',
+           'према', 'након'},
+}
+
+# Russian and Serbian are heavily inflected: compare word stems by prefix
+_STEM_LENGTH = {'ru': 6, 'sr': 6, 'en': 8}
+
+
+def detect_language(text: str) -> str:
+    """Detect 'ru', 'sr' or 'en' from the script and Serbian-specific letters."""
+    if not text:
+        return 'ru'
+    if _SERBIAN_CYRILLIC_RE.search(text):
+        return 'sr'
+    cyrillic = len(_CYRILLIC_RE.findall(text))
+    latin = len(_LATIN_RE.findall(text))
+    if cyrillic >= latin:
+        return 'ru'
+    return 'sr' if _SERBIAN_LATIN_RE.search(text) else 'en'
+
+
+def split_sentences(text: str, language: Optional[str] = None) -> List[str]:
+    """Split text into sentences, keeping abbreviations and initials intact."""
+    if not text:
+        return []
+    language = language or detect_language(text)
+    abbreviations = _ABBREVIATIONS.get(language, set())
+
+    sentences: List[str] = []
+    for paragraph in re.split(r'\n\s*\n|\n(?=[-•—▪️*])', text):
+        paragraph = ' '.join(paragraph.split())
+        if not paragraph:
+            continue
+        pending = ''
+        for piece in _SENTENCE_BOUNDARY_RE.split(paragraph):
+            pending = f"{pending} {piece}" if pending else piece
+            last_word = pending.rstrip('.!?…').rsplit(' ', 1)[-1].lower()
+            is_initial = len(last_word) == 1 and last_word.isalpha() and pending.endswith('.')
+            if pending.endswith('.') and (last_word in abbreviations or is_initial):
+                continue
+            sentences.append(pending.strip())
+            pending = ''
+        if pending:
+            sentences.append(pending.strip())
+    return sentences
+
+
+def tokenize(text: str, language: Optional[str] = None) -> List[str]:
+    """Lowercased content-word stems (stopwords and numbers removed)."""
+    language = language or detect_language(text)
+    stopwords = _STOPWORDS.get(language, set())
+    stem_length = _STEM_LENGTH.get(language, 8)
+    return [
+        word[:stem_length]
+        for word in _WORD_RE.findall((text or '').lower())
+        if len(word) > 2 and not word.isdigit() and word not in stopwords
+    ]
+
+
+def clean_post_text(text: str) -> str:
+    """Strip links and hashtag/mention-only lines that Telegram posts end with."""
+    text = _URL_RE.sub('', text or '')
+    text = _TAG_LINE_RE.sub('', text)
+    return text.strip()
+
+
+class ExtractiveSummarizer:
+    """
+    Sentence-scoring summarizer used instead of Gemini for trivial content.
+
+    Sentences are scored by the frequency of their content words in the whole
+    text, overlap with the title and position (news posts lead with the main
+    fact); the best ones are returned in their original order. Tokenization
+    (stopwords, abbreviations, stemming) follows the detected language.
+    """
+
+    def __init__(self, max_sentences: int = 3, max_chars: int = 600):
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+        self._stats = {'summaries': 0, 'audits': 0, 'audit_overlap_sum': 0.0, 'audit_low_overlap': 0}
+
+    def summarize(self, content: str, title: Optional[str] = None,
+                  max_sentences: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+        """Return an extractive summary of content (the cleaned post itself when it is short)."""
+        max_sentences = max_sentences or self.max_sentences
+        max_chars = max_chars or self.max_chars
+        text = clean_post_text(content)
+        if not text:
+            return (title or '').strip()
+
+        language = detect_language(text)
+        sentences = [s for s in split_sentences(text, language) if len(s) >= 15] or [text]
+        self._stats['summaries'] += 1
+        if len(sentences) <= max_sentences and len(' '.join(sentences)) <= max_chars:
+            return ' '.join(sentences)
+
+        frequencies = Counter(tokenize(text, language))
+        top_frequency = max(frequencies.values()) if frequencies else 1
+        title_tokens = set(tokenize(title or '', language))
+
+        scored = []
+        for position, sentence in enumerate(sentences):
+            tokens = tokenize(sentence, language)
+            if not tokens:
+                continue
+            score = sum(frequencies[t] / top_frequency for t in tokens) / len(tokens) ** 0.5
+            if title_tokens:
+                score += 0.5 * len(title_tokens.intersection(tokens)) / len(title_tokens)
+            if position == 0:
+                score += 0.3
+            scored.append((score, position, sentence))
+
+        picked: List[tuple] = []
+        total = 0
+        for score, position, sentence in sorted(scored, key=lambda item: (-item[0], item[1])):
+            if len(picked) >= max_sentences:
+                break
+            if picked and total + len(sentence) > max_chars:
+                continue
+            picked.append((position, sentence))
+            total += len(sentence) + 1
+
+        summary = ' '.join(sentence for _, sentence in sorted(picked)) if picked else sentences[0]
+        return summary[:max_chars].rstrip() + ('...' if len(summary) > max_chars else '')
+
+    def record_audit(self, local_summary: str, ai_summary: str) -> float:
+        """
+        Compare a local summary with the AI summary of the same post.
+
+        Returns the share of the AI summary's content words that the local
+        summary also contains (0.0-1.0). Both are Russian: only Russian posts
+        are routed locally (SmartFilter.should_summarize_locally).
+        """
+        ai_tokens = set(tokenize(ai_summary))
+        if not ai_tokens:
+            return 0.0
+        overlap = len(ai_tokens.intersection(tokenize(local_summary))) / len(ai_tokens)
+        self._stats['audits'] += 1
+        self._stats['audit_overlap_sum'] += overlap
+        if overlap < 0.3:
+            self._stats['audit_low_overlap'] += 1
+            logger.info(f"  🔬 Local summary audit: low overlap with AI summary ({overlap:.2f})")
+        return overlap
+
+    def get_stats(self) -> Dict[str, float]:
+        """Summaries produced and audit results since process start."""
+        audits = self._stats['audits']
+        return {
+            'summaries': self._stats['summaries'],
+            'audits': audits,
+            'audit_mean_overlap': round(self._stats['audit_overlap_sum'] / audits, 3) if audits else None,
+            'audit_low_overlap': self._stats['audit_low_overlap'],
+        }
+
+
+# Global instance
+_extractive_summarizer: Optional[ExtractiveSummarizer] = None
+
+
+def get_extractive_summarizer() -> ExtractiveSummarizer:
+    """Get global extractive summarizer instance."""
+    global _extractive_summarizer
+    if _extractive_summarizer is None:
+        _extractive_summarizer = ExtractiveSummarizer()
+    return _extractive_summarizer
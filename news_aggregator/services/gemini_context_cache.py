@@ -0,0 +1,178 @@
+"""Gemini context caching (cachedContents) for static prompt prefixes."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ..config import settings
+from ..core.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedContentHandle:
+    """A live cachedContents resource."""
+    name: str  # e.g. "cachedContents/abc123"
+    model: str
+    version: str
+    expires_at: float  # time.monotonic() deadline
+    instructions: str = ''  # Cached static prefix
+
+
+class GeminiContextCache:
+    """
+    Creates and reuses Gemini cached-content handles keyed by (model, prompt version).
+
+    The static instructions are uploaded once as the cached content's system
+    instruction; generateContent requests then reference the handle and only
+    send the per-article part. Handles are recreated shortly before their TTL
+    runs out. When creation fails (unsupported model, prefix below the minimum
+    cacheable size, API error) the key is skipped for a while and callers fall
+    back to sending the full prompt.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None):
+        self.api_key = api_key or settings.gemini_api_key
+        self.endpoint = endpoint or settings.gemini_api_endpoint
+        self.ttl_seconds = settings.ai_context_cache_ttl
+        self.refresh_margin = settings.ai_context_cache_refresh_margin
+        self.failure_backoff = 600.0
+
+        self._handles: Dict[Tuple[str, str], CachedContentHandle] = {}
+        self._failed_until: Dict[Tuple[str, str], float] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._stats = {'created': 0, 'reused': 0, 'failed': 0}
+
+    @property
+    def base_url(self) -> str:
+        """v1beta API root derived from the configured models endpoint."""
+        base = str(self.endpoint).rstrip('/')
+        if base.endswith('/models'):
+            base = base[:-len('/models')]
+        if base.endswith('/v1'):
+            base = base[:-len('/v1')] + '/v1beta'
+        return base
+
+    async def get_handle(self, model: str, version: str, instructions: str) -> Optional[str]:
+        """
+        Get a cached-content name for the given static instructions.
+
+        Args:
+            model: Gemini model the content is cached for
+            version: Prompt-template version; a new version gets a new handle
+            instructions: Static prompt prefix to cache
+
+        Returns:
+            cachedContents resource name, or None if caching is unavailable
+        """
+        if not settings.ai_context_cache_enabled or not instructions:
+            return None
+
+        key = (model, version)
+        handle = self._handles.get(key)
+        if handle and handle.expires_at - time.monotonic() > self.refresh_margin:
+            self._stats['reused'] += 1
+            return handle.name
+
+        if self._failed_until.get(key, 0) > time.monotonic():
+            return None
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            handle = self._handles.get(key)
+            if handle and handle.expires_at - time.monotonic() > self.refresh_margin:
+                self._stats['reused'] += 1
+                return handle.name
+
+            handle = await self._create(model, version, instructions)
+            if handle is None:
+                self._failed_until[key] = time.monotonic() + self.failure_backoff
+                return None
+
+            # Older versions for the same model are no longer referenced
+            for old_key in [k for k in self._handles if k[0] == model and k[1] != version]:
+                self._handles.pop(old_key, None)
+            self._handles[key] = handle
+            return handle.name
+
+    def cached_text(self, name: str) -> Optional[str]:
+        """Static prefix behind a known cached-content name."""
+        for handle in self._handles.values():
+            if handle.name == name:
+                return handle.instructions
+        return None
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """Forget known handles (they expire server-side on their own)."""
+        for key in [k for k in self._handles if model is None or k[0] == model]:
+            self._handles.pop(key, None)
+
+    async def _create(self, model: str, version: str, instructions: str) -> Optional[CachedContentHandle]:
+        url = f"{self.base_url}/cachedContents"
+        payload = {
+            "model": model if model.startswith("models/") else f"models/{model}",
+            "systemInstruction": {"parts": [{"text": instructions}]},
+            "ttl": f"{int(self.ttl_seconds)}s",
+        }
+        try:
+            async with get_http_client() as client:
+                response = await client.post(url, json=payload, params={"key": self.api_key}, timeout=30)
+                async with response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.warning(f"  ⚠️ Gemini context cache not created ({response.status}): {error_text[:200]}")
+                        self._stats['failed'] += 1
+                        return None
+                    data = await response.json()
+        except Exception as e:
+            logger.warning(f"  ⚠️ Gemini context cache request failed: {e}")
+            self._stats['failed'] += 1
+            return None
+
+        name = data.get("name")
+        if not name:
+            self._stats['failed'] += 1
+            return None
+
+        self._stats['created'] += 1
+        logger.info(f"  🧊 Gemini context cache {name} created for {model} (prompt {version})")
+        return CachedContentHandle(
+            name=name,
+            model=model,
+            version=version,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            instructions=instructions,
+        )
+
+    def get_stats(self) -> dict:
+        """Get handle statistics."""
+        now = time.monotonic()
+        return {
+            'enabled': settings.ai_context_cache_enabled,
+            **self._stats,
+            'handles': [
+                {
+                    'name': h.name,
+                    'model': h.model,
+                    'version': h.version,
+                    'expires_in_s': round(h.expires_at - now),
+                }
+                for h in self._handles.values()
+            ],
+        }
+
+
+# Global instance
+_context_cache: Optional[GeminiContextCache] = None
+
+
+def get_gemini_context_cache() -> GeminiContextCache:
+    """Get global Gemini context cache instance."""
+    global _context_cache
+    if _context_cache is None:
+        _context_cache = GeminiContextCache()
+    return _context_cache
@@ -0,0 +1,113 @@
+"""Recording of real Gemini traffic for offline replay (see devtools.gemini_mock)."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import settings
+from .gemini_context_cache import get_gemini_context_cache
+
+logger = logging.getLogger(__name__)
+
+
+def request_fingerprint(model: str, payload: Dict[str, Any], cached_prefix: Optional[str] = None) -> str:
+    """
+    Stable key for a generateContent request.
+
+    Covers the model, the prompt text, the response schema and, for requests
+    that reference cachedContent, the cached prefix text (cached_prefix). The
+    cachedContent name and sampling parameters are ignored, so a recording
+    replays against a later run whose cache handles have other names. Cached
+    and uncached runs send different prompts and do not share recordings.
+    """
+    model = model.split('/')[-1]
+    texts = [
+        part.get('text') or ''
+        for message in payload.get('contents') or []
+        for part in message.get('parts') or []
+    ]
+    schema = (payload.get('generationConfig') or {}).get('responseJsonSchema')
+    digest = hashlib.sha256()
+    digest.update(model.encode('utf-8'))
+    digest.update(b'\x1f')
+    if payload.get('cachedContent'):
+        digest.update((cached_prefix or '').encode('utf-8'))
+        digest.update(b'\x1d')
+    digest.update('\x1e'.join(texts).encode('utf-8'))
+    digest.update(b'\x1f')
+    digest.update(json.dumps(schema, sort_keys=True, ensure_ascii=False).encode('utf-8') if schema else b'-')
+    return digest.hexdigest()
+
+
+class GeminiRecorder:
+    """
+    Appends Gemini request/response pairs to JSONL files in AI_RECORD_DIR.
+
+    One file per day; each line holds the request fingerprint, model, a short
+    prompt preview, latency and the raw response. Streaming responses are
+    stored as one assembled non-streaming response.
+    """
+
+    def __init__(self, record_dir: Optional[str] = None):
+        record_dir = record_dir or settings.ai_record_dir
+        self.record_dir = Path(record_dir) if record_dir else None
+        self._lock = asyncio.Lock()
+        self.recorded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.record_dir is not None
+
+    async def record(self, model: str, action: str, payload: Dict[str, Any],
+                     response: Dict[str, Any], latency: float, status: int = 200) -> None:
+        """Append one exchange (never raises)."""
+        if not self.enabled:
+            return
+        try:
+            prompt = ''.join(
+                part.get('text') or ''
+                for message in payload.get('contents') or []
+                for part in message.get('parts') or []
+            )
+            cached_prefix = None
+            if payload.get('cachedContent'):
+                cached_prefix = get_gemini_context_cache().cached_text(payload['cachedContent'])
+            entry = {
+                'key': request_fingerprint(model, payload, cached_prefix),
+                'model': model,
+                'action': action,
+                'status': status,
+                'latency_ms': round(latency * 1000),
+                'prompt_preview': prompt[:200],
+                'recorded_at': datetime.utcnow().isoformat(),
+                'response': response,
+            }
+            line = json.dumps(entry, ensure_ascii=False) + '\n'
+            path = self.record_dir / f"gemini-{datetime.utcnow():%Y%m%d}.jsonl"
+            async with self._lock:
+                await asyncio.to_thread(self._append, path, line)
+            self.recorded += 1
+        except Exception as e:
+            logger.warning(f"  ⚠️ Failed to record Gemini exchange: {e}")
+
+    @staticmethod
+    def _append(path: Path, line: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+
+# Global instance
+_recorder: Optional[GeminiRecorder] = None
+
+
+def get_gemini_recorder() -> GeminiRecorder:
+    """Get global Gemini recorder instance."""
+    global _recorder
+    if _recorder is None:
+        _recorder = GeminiRecorder()
+    return _recorder
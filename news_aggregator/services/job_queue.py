@@ -0,0 +1,209 @@
+"""Durable Postgres-backed queue of AI jobs (table ai_jobs)."""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_ANALYSIS = 'article_analysis'
+
+
+@dataclass(frozen=True)
+class LeasedJob:
+    """A job currently leased by this worker."""
+    id: int
+    article_id: int
+    attempts: int
+    max_attempts: int
+
+
+class JobQueue:
+    """
+    Article-analysis jobs shared by any number of worker processes.
+
+    Workers lease jobs with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent
+    workers never block on or double-lease the same rows. A lease expires
+    after the visibility timeout unless extended by heartbeat(); an expired
+    lease (crashed worker) makes the job leasable again. Every lease counts
+    as an attempt; jobs that run out of attempts end as 'failed'. Completion
+    is fenced by leased_by, so a worker whose lease was taken over cannot
+    overwrite the new holder's outcome.
+
+    Methods take an open session and are meant to run inside
+    DatabaseQueueManager operations; complete() is called in the same
+    transaction that writes the article so both commit together.
+    """
+
+    def __init__(self, job_type: str = ARTICLE_ANALYSIS):
+        self.job_type = job_type
+        self.visibility_timeout = settings.ai_job_visibility_timeout
+        self.retry_delay = settings.ai_job_retry_delay
+
+    async def enqueue(self, db, article_ids: Iterable[int], priority: int = 2) -> int:
+        """Create jobs for articles without an open job; returns the number created."""
+        ids = list(dict.fromkeys(article_ids))
+        if not ids:
+            return 0
+        result = await db.execute(
+            text("""
+                INSERT INTO ai_jobs (article_id, job_type, status, priority, attempts, max_attempts,
+                                     available_at, created_at, updated_at)
+                SELECT id, :job_type, 'pending', :priority, 0, :max_attempts, now(), now(), now()
+                FROM unnest(CAST(:ids AS INTEGER[])) AS id
+                ON CONFLICT (article_id, job_type) WHERE status IN ('pending', 'leased') DO NOTHING
+            """),
+            {'job_type': self.job_type, 'priority': priority, 'ids': ids,
+             'max_attempts': settings.ai_job_max_attempts}
+        )
+        return result.rowcount or 0
+
+    async def lease(self, db, worker_id: str, limit: int) -> List[LeasedJob]:
+        """Lease up to limit jobs (most important first) for the visibility timeout."""
+        # Expired leases without attempts left are given up first
+        await db.execute(
+            text("""
+                UPDATE ai_jobs
+                SET status = 'failed', last_error = COALESCE(last_error, 'lease expired'),
+                    finished_at = now(), updated_at = now()
+                WHERE job_type = :job_type AND status = 'leased'
+                  AND lease_expires_at < now() AND attempts >= max_attempts
+            """),
+            {'job_type': self.job_type}
+        )
+        result = await db.execute(
+            text("""
+                WITH next_jobs AS (
+                    SELECT id FROM ai_jobs
+                    WHERE job_type = :job_type
+                      AND (status = 'pending' OR (status = 'leased' AND lease_expires_at < now()))
+                      AND available_at <= now()
+                      AND attempts < max_attempts
+                    ORDER BY priority, available_at, id
+                    LIMIT :limit
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE ai_jobs AS j
+                SET status = 'leased', leased_by = :worker_id, attempts = j.attempts + 1,
+                    lease_expires_at = now() + make_interval(secs => :timeout), updated_at = now()
+                FROM next_jobs
+                WHERE j.id = next_jobs.id
+                RETURNING j.id, j.article_id, j.attempts, j.max_attempts
+            """),
+            {'job_type': self.job_type, 'limit': limit, 'worker_id': worker_id,
+             'timeout': float(self.visibility_timeout)}
+        )
+        return [LeasedJob(row.id, row.article_id, row.attempts, row.max_attempts) for row in result]
+
+    async def heartbeat(self, db, worker_id: str, job_ids: List[int]) -> int:
+        """Extend the leases this worker still holds; returns how many were extended."""
+        if not job_ids:
+            return 0
+        result = await db.execute(
+            text("""
+                UPDATE ai_jobs
+                SET lease_expires_at = now() + make_interval(secs => :timeout), updated_at = now()
+                WHERE id = ANY(CAST(:ids AS INTEGER[])) AND status = 'leased' AND leased_by = :worker_id
+            """),
+            {'ids': job_ids, 'worker_id': worker_id, 'timeout': float(self.visibility_timeout)}
+        )
+        return result.rowcount or 0
+
+    async def complete(self, db, worker_id: str, job_id: int, result: Dict[str, Any]) -> bool:
+        """Mark a leased job done with its result."""
+        outcome = await db.execute(
+            text("""
+                UPDATE ai_jobs
+                SET status = 'done', result = CAST(:result AS JSON), last_error = NULL,
+                    lease_expires_at = NULL, finished_at = now(), updated_at = now()
+                WHERE id = :id AND status = 'leased' AND leased_by = :worker_id
+            """),
+            {'id': job_id, 'worker_id': worker_id, 'result': json.dumps(result, ensure_ascii=False, default=str)}
+        )
+        return bool(outcome.rowcount)
+
+    async def fail(self, db, worker_id: str, job: LeasedJob, error: str) -> bool:
+        """Release a leased job after a failed attempt: retry later or give up."""
+        final = job.attempts >= job.max_attempts
+        outcome = await db.execute(
+            text("""
+                UPDATE ai_jobs
+                SET status = :status, last_error = :error, leased_by = CASE WHEN :final THEN leased_by END,
+                    lease_expires_at = NULL,
+                    available_at = now() + make_interval(secs => :delay),
+                    finished_at = CASE WHEN :final THEN now() END, updated_at = now()
+                WHERE id = :id AND status = 'leased' AND leased_by = :worker_id
+            """),
+            {'id': job.id, 'worker_id': worker_id, 'status': 'failed' if final else 'pending',
+             'error': (error or '')[:2000], 'final': final,
+             'delay': float(self.retry_delay * job.attempts)}
+        )
+        return bool(outcome.rowcount)
+
+    async def get_stats(self, db) -> Dict[str, Any]:
+        """Queue depth, progress and per-worker throughput."""
+        counts = await db.execute(
+            text("SELECT status, COUNT(*) AS n FROM ai_jobs WHERE job_type = :job_type GROUP BY status"),
+            {'job_type': self.job_type}
+        )
+        by_status = {row.status: row.n for row in counts}
+
+        backlog = (await db.execute(
+            text("""
+                SELECT MIN(created_at) AS oldest,
+                       COUNT(*) FILTER (WHERE status = 'leased' AND lease_expires_at < now()) AS expired
+                FROM ai_jobs
+                WHERE job_type = :job_type AND status IN ('pending', 'leased')
+            """),
+            {'job_type': self.job_type}
+        )).one()
+
+        workers = await db.execute(
+            text("""
+                SELECT leased_by,
+                       COUNT(*) FILTER (WHERE status = 'leased' AND lease_expires_at >= now()) AS active,
+                       COUNT(*) FILTER (WHERE status = 'done' AND finished_at > now() - interval '1 hour') AS done_1h,
+                       COUNT(*) FILTER (WHERE status = 'failed' AND finished_at > now() - interval '1 hour') AS failed_1h,
+                       MAX(updated_at) AS last_seen
+                FROM ai_jobs
+                WHERE job_type = :job_type AND leased_by IS NOT NULL
+                  AND updated_at > now() - interval '1 hour'
+                GROUP BY leased_by
+                ORDER BY leased_by
+            """),
+            {'job_type': self.job_type}
+        )
+        return {
+            'job_type': self.job_type,
+            'by_status': by_status,
+            'open': by_status.get('pending', 0) + by_status.get('leased', 0),
+            'oldest_open_at': backlog.oldest.isoformat() if backlog.oldest else None,
+            'expired_leases': backlog.expired or 0,
+            'workers': [
+                {
+                    'worker_id': row.leased_by,
+                    'active_leases': row.active,
+                    'done_last_hour': row.done_1h,
+                    'failed_last_hour': row.failed_1h,
+                    'last_seen': row.last_seen.isoformat() if row.last_seen else None,
+                }
+                for row in workers
+            ],
+        }
+
+
+# Global instance
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get global AI job queue instance."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
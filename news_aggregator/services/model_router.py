@@ -0,0 +1,187 @@
+"""Per-request model selection for AI analysis (cost/latency aware)."""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Routing decision for one AI request."""
+    model: str
+    tier: str  # 'light' or 'standard'
+    reason: str
+
+
+@dataclass
+class _ModelStats:
+    calls: int = 0
+    errors: int = 0
+    error_rate: float = 0.0  # EWMA
+    latency_ewma: Optional[float] = None
+    tokens: int = 0
+    cost: float = 0.0
+    updated_at: float = 0.0  # time.monotonic() of the last outcome
+
+
+def model_cost_rates(model: Optional[str]) -> Tuple[float, float, float]:
+    """(input, output, cached input) price per 1M tokens for a model."""
+    input_rate = settings.ai_input_cost_per_1m or 0.0
+    output_rate = settings.ai_output_cost_per_1m or 0.0
+    cached_rate = settings.ai_cached_input_cost_per_1m or 0.0
+    if model and settings.light_model and model == settings.light_model:
+        if settings.light_input_cost_per_1m is not None:
+            input_rate = settings.light_input_cost_per_1m
+        if settings.light_output_cost_per_1m is not None:
+            output_rate = settings.light_output_cost_per_1m
+    return input_rate, output_rate, cached_rate
+
+
+def usage_cost(model: Optional[str], usage: Dict[str, int]) -> float:
+    """Request cost from normalized usage (Gemini prompt tokens include cached tokens)."""
+    input_rate, output_rate, cached_rate = model_cost_rates(model)
+    prompt_tokens = usage.get('prompt_tokens', 0) or 0
+    completion_tokens = usage.get('completion_tokens', 0) or 0
+    cached_tokens = usage.get('cached_tokens', 0) or 0
+    uncached_prompt_tokens = max(0, prompt_tokens - cached_tokens)
+    return (
+        (uncached_prompt_tokens * input_rate) +
+        (completion_tokens * output_rate) +
+        (cached_tokens * cached_rate)
+    ) / 1_000_000
+
+
+class ModelRouter:
+    """
+    Chooses between the standard analysis model and a cheaper light model.
+
+    Short inputs (and posts from light source types such as Telegram up to a
+    larger limit) go to LIGHT_MODEL; long articles stay on SUMMARIZATION_MODEL.
+    Recent per-model error rate and latency override the length rule: a
+    degraded light model sends traffic back to the standard model and vice
+    versa for inputs the light model can handle. A degraded model that has
+    seen no traffic for recovery_seconds gets another chance. Without
+    LIGHT_MODEL every request uses the standard model.
+    """
+
+    def __init__(self, standard_model: Optional[str] = None, light_model: Optional[str] = None):
+        self.standard_model = standard_model or settings.summarization_model
+        self.light_model = light_model if light_model is not None else settings.light_model
+        self.short_chars = settings.ai_router_short_chars
+        self.light_max_chars = settings.ai_router_light_max_chars
+        self.light_source_types = {
+            s.strip().lower() for s in (settings.ai_router_light_source_types or '').split(',') if s.strip()
+        }
+        self.max_error_rate = 0.3
+        self.min_calls_for_health = 5
+        self.recovery_seconds = 300.0
+
+        self._stats: Dict[str, _ModelStats] = {}
+        self._decisions: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.ai_router_enabled and self.light_model and self.light_model != self.standard_model)
+
+    def _healthy(self, model: str) -> bool:
+        stats = self._stats.get(model)
+        if not stats or stats.calls < self.min_calls_for_health:
+            return True
+        degraded = stats.error_rate > self.max_error_rate or (
+            stats.latency_ewma is not None and stats.latency_ewma > settings.ai_latency_target
+        )
+        if degraded and time.monotonic() - stats.updated_at > self.recovery_seconds:
+            # No recent traffic to judge by - forget the bad history and try again
+            stats.error_rate = 0.0
+            stats.latency_ewma = None
+            return True
+        return not degraded
+
+    def route(self, content_length: int, source_type: Optional[str] = None,
+              escalate: bool = False) -> ModelRoute:
+        """
+        Pick the model for one analysis request.
+
+        Args:
+            content_length: Characters of article content sent to the model
+            source_type: Source type of the article ('telegram', 'rss', ...)
+            escalate: A previous attempt on the light model failed - use the standard model
+        """
+        decision = self.select(content_length, source_type, escalate)
+        self._decisions[decision.reason] = self._decisions.get(decision.reason, 0) + 1
+        return decision
+
+    def select(self, length: int, source_type: Optional[str] = None, escalate: bool = False) -> ModelRoute:
+        """Same decision as route() without counting it (for cache lookups)."""
+        source_type = (source_type or '').lower()
+        if not self.enabled:
+            return ModelRoute(self.standard_model, 'standard', 'default')
+        if escalate:
+            return ModelRoute(self.standard_model, 'standard', 'escalated')
+
+        light_capable = length <= self.light_max_chars
+        if length <= self.short_chars:
+            preferred = ModelRoute(self.light_model, 'light', 'short_input')
+        elif light_capable and source_type in self.light_source_types:
+            preferred = ModelRoute(self.light_model, 'light', 'light_source')
+        else:
+            preferred = ModelRoute(self.standard_model, 'standard', 'long_input')
+
+        if preferred.tier == 'light' and not self._healthy(self.light_model):
+            return ModelRoute(self.standard_model, 'standard', 'light_degraded')
+        if (preferred.tier == 'standard' and light_capable
+                and not self._healthy(self.standard_model) and self._healthy(self.light_model)):
+            return ModelRoute(self.light_model, 'light', 'standard_degraded')
+        return preferred
+
+    def record(self, model: str, latency: float, ok: bool, usage: Optional[Dict[str, int]] = None) -> None:
+        """Feed the outcome of a request into the per-model statistics."""
+        stats = self._stats.setdefault(model, _ModelStats())
+        stats.calls += 1
+        stats.updated_at = time.monotonic()
+        stats.error_rate = 0.9 * stats.error_rate + (0.0 if ok else 0.1)
+        if not ok:
+            stats.errors += 1
+            return
+        stats.latency_ewma = latency if stats.latency_ewma is None else 0.8 * stats.latency_ewma + 0.2 * latency
+        if usage:
+            stats.tokens += usage.get('total_tokens', 0) or 0
+            stats.cost += usage_cost(model, usage)
+
+    def get_stats(self) -> dict:
+        """Get routing statistics."""
+        return {
+            'enabled': self.enabled,
+            'standard_model': self.standard_model,
+            'light_model': self.light_model,
+            'decisions': dict(self._decisions),
+            'models': {
+                model: {
+                    'calls': s.calls,
+                    'errors': s.errors,
+                    'error_rate': round(s.error_rate, 3),
+                    'latency_ewma_s': round(s.latency_ewma, 2) if s.latency_ewma is not None else None,
+                    'avg_tokens': round(s.tokens / (s.calls - s.errors)) if s.calls > s.errors else 0,
+                    'cost': round(s.cost, 6),
+                    'healthy': self._healthy(model),
+                }
+                for model, s in self._stats.items()
+            },
+        }
+
+
+# Global instance
+_model_router: Optional[ModelRouter] = None
+
+
+def get_model_router() -> ModelRouter:
+    """Get global model router instance."""
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouter()
+    return _model_router
@@ -0,0 +1,245 @@
+"""Near-duplicate detection: SimHash signatures with an LSH band index (memory + article_simhash_bands)."""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select, text
+
+from ..config import settings
+from ..models import Article, ArticleCategory, Category
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3  # Words per shingle
+MIN_SHINGLES = 8  # Shorter texts get no signature (too noisy to compare)
+BANDS = 4
+BAND_BITS = 16  # BANDS * BAND_BITS = 64; distance <= BANDS - 1 guarantees a shared band
+_MASK64 = (1 << 64) - 1
+_BAND_MASK = (1 << BAND_BITS) - 1
+# refresh() re-reads rows this far before the previous refresh: a write
+# transaction started earlier (created_at = its start) may commit only later
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def simhash(title: Optional[str], content: Optional[str]) -> Optional[int]:
+    """64-bit SimHash of word shingles of title and content (signed, fits BIGINT); None if too short."""
+    text_value = _TAG_RE.sub(' ', f"{title or ''} {content or ''}").lower()
+    words = _WORD_RE.findall(text_value)
+    if len(words) < SHINGLE_SIZE + MIN_SHINGLES - 1:
+        return None
+
+    weights = [0] * 64
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = ' '.join(words[i:i + SHINGLE_SIZE]).encode('utf-8')
+        h = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit in range(64):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return _to_signed(fingerprint)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK64).count('1')
+
+
+def band_values(fingerprint: int) -> List[int]:
+    """The BANDS 16-bit slices of a fingerprint (band 0 = lowest bits)."""
+    unsigned = fingerprint & _MASK64
+    return [(unsigned >> (band * BAND_BITS)) & _BAND_MASK for band in range(BANDS)]
+
+
+def _to_signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class NearDuplicateIndex:
+    """
+    In-memory LSH index of canonical articles' SimHash signatures.
+
+    Each fingerprint is split into BANDS bands; two fingerprints within
+    Hamming distance BANDS - 1 share at least one band exactly, so a lookup
+    only compares against the few articles in the matching buckets. The
+    index covers NEAR_DUPLICATE_WINDOW_HOURS. Signatures are persisted in
+    article_simhash_bands (in the article's write transaction) and loaded
+    incrementally by refresh(), so the index survives restarts and picks up
+    articles saved by other processes. Rows are saved in processing order,
+    not article id order, so refresh() tracks created_at rather than ids.
+    """
+
+    def __init__(self, max_distance: Optional[int] = None, window_hours: Optional[int] = None):
+        distance = settings.near_duplicate_max_distance if max_distance is None else max_distance
+        self.max_distance = max(0, min(distance, BANDS - 1))
+        self.window_seconds = (window_hours or settings.near_duplicate_window_hours) * 3600
+        self._buckets: Dict[Tuple[int, int], Set[int]] = {}
+        self._fingerprints: Dict[int, int] = {}
+        self._added_at: "OrderedDict[int, float]" = OrderedDict()
+        self._loaded_since = None  # created_at from which the next refresh reads
+        self.lookups = 0
+        self.hits = 0
+
+    def find(self, fingerprint: int, exclude: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """Closest canonical article within max_distance as (article_id, distance), or None."""
+        self.lookups += 1
+        candidates: Set[int] = set()
+        for band, value in enumerate(band_values(fingerprint)):
+            candidates |= self._buckets.get((band, value), set())
+        candidates.discard(exclude)
+
+        best = None
+        for article_id in candidates:
+            distance = hamming_distance(fingerprint, self._fingerprints[article_id])
+            if distance <= self.max_distance and (best is None or (distance, article_id) < best[::-1]):
+                best = (article_id, distance)
+        if best:
+            self.hits += 1
+        return best
+
+    def add(self, article_id: int, fingerprint: int) -> None:
+        if article_id in self._fingerprints:
+            return
+        self._fingerprints[article_id] = fingerprint
+        self._added_at[article_id] = time.time()
+        for band, value in enumerate(band_values(fingerprint)):
+            self._buckets.setdefault((band, value), set()).add(article_id)
+        self._evict()
+
+    def remove(self, article_id: int) -> None:
+        fingerprint = self._fingerprints.pop(article_id, None)
+        self._added_at.pop(article_id, None)
+        if fingerprint is None:
+            return
+        for band, value in enumerate(band_values(fingerprint)):
+            bucket = self._buckets.get((band, value))
+            if bucket is not None:
+                bucket.discard(article_id)
+                if not bucket:
+                    del self._buckets[(band, value)]
+
+    def _evict(self) -> None:
+        cutoff = time.time() - self.window_seconds
+        while self._added_at:
+            article_id, added_at = next(iter(self._added_at.items()))
+            if added_at >= cutoff:
+                break
+            self.remove(article_id)
+
+    async def refresh(self, db) -> int:
+        """Load signatures persisted since the last refresh (within the window); returns how many."""
+        db_now = (await db.execute(text("SELECT LOCALTIMESTAMP"))).scalar()
+        result = await db.execute(
+            text("""
+                SELECT article_id, band, value
+                FROM article_simhash_bands
+                WHERE created_at >= LOCALTIMESTAMP - make_interval(secs => :window)
+                  AND (CAST(:since AS TIMESTAMP) IS NULL OR created_at >= CAST(:since AS TIMESTAMP))
+                ORDER BY article_id, band
+            """),
+            {'since': self._loaded_since, 'window': float(self.window_seconds)}
+        )
+        bands_by_article: Dict[int, Dict[int, int]] = {}
+        for row in result:
+            bands_by_article.setdefault(row.article_id, {})[row.band] = row.value
+
+        loaded = 0
+        for article_id, bands in bands_by_article.items():
+            if len(bands) != BANDS or article_id in self._fingerprints:
+                continue
+            unsigned = 0
+            for band, value in bands.items():
+                unsigned |= (value & _BAND_MASK) << (band * BAND_BITS)
+            self.add(article_id, _to_signed(unsigned))
+            loaded += 1
+        if db_now is not None:
+            self._loaded_since = db_now - REFRESH_OVERLAP
+        return loaded
+
+    @staticmethod
+    async def save_signatures(db, signatures: List[Tuple[int, int]]) -> None:
+        """Persist canonical articles' bands (one INSERT for the batch)."""
+        if not signatures:
+            return
+        article_ids, bands, values = [], [], []
+        for article_id, fingerprint in signatures:
+            for band, value in enumerate(band_values(fingerprint)):
+                article_ids.append(article_id)
+                bands.append(band)
+                values.append(value)
+        await db.execute(
+            text("""
+                INSERT INTO article_simhash_bands (article_id, band, value, created_at)
+                SELECT b.article_id, b.band, b.value, now()
+                FROM unnest(CAST(:article_ids AS INTEGER[]), CAST(:bands AS INTEGER[]),
+                            CAST(:values AS INTEGER[])) AS b(article_id, band, value)
+                JOIN articles a ON a.id = b.article_id  -- articles deleted in the meantime are skipped
+                ON CONFLICT (article_id, band) DO NOTHING
+            """),
+            {'article_ids': article_ids, 'bands': bands, 'values': values}
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'articles': len(self._fingerprints),
+            'buckets': len(self._buckets),
+            'max_distance': self.max_distance,
+            'window_hours': self.window_seconds / 3600,
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+        }
+
+
+async def load_canonical_analysis(db, article_id: int) -> Optional[Dict[str, Any]]:
+    """Summary, categories and ad flags of a fully processed article, or None."""
+    article = (await db.execute(
+        select(
+            Article.summary, Article.summary_processed, Article.category_processed, Article.ad_processed,
+            Article.is_advertisement, Article.ad_confidence, Article.ad_type, Article.ad_reasoning,
+        ).where(Article.id == article_id)
+    )).one_or_none()
+    if article is None or not article.summary or not (
+        article.summary_processed and article.category_processed and article.ad_processed
+    ):
+        return None
+
+    categories = await db.execute(
+        select(Category.name, ArticleCategory.confidence, ArticleCategory.ai_category)
+        .join(Category, ArticleCategory.category_id == Category.id)
+        .where(ArticleCategory.article_id == article_id)
+    )
+    return {
+        'summary': article.summary,
+        'categories': [
+            {'name': row.name, 'confidence': row.confidence or 1.0, 'ai_category': row.ai_category or row.name}
+            for row in categories
+        ],
+        'advertising': {
+            'is_advertisement': bool(article.is_advertisement),
+            'ad_confidence': float(article.ad_confidence or 0.0),
+            'ad_type': article.ad_type,
+            'ad_reasoning': article.ad_reasoning,
+        },
+    }
+
+
+# Global instance
+_near_duplicate_index: Optional[NearDuplicateIndex] = None
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Get global near-duplicate index instance."""
+    global _near_duplicate_index
+    if _near_duplicate_index is None:
+        _near_duplicate_index = NearDuplicateIndex()
+    return _near_duplicate_index
@@ -5,7 +5,9 @@ This module contains all AI prompts used throughout the application.
 Centralizing prompts makes them easier to maintain, version, and improve.
 """
 
+import hashlib
 import time
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 # In-memory cache for categories (avoid DB hit on every article)
@@ -13,6 +15,35 @@ _categories_cache = None
 _categories_cache_time = 0
 _CATEGORIES_CACHE_TTL = 300  # 5 minutes
 
+# Precompiled analysis prompt parts (rebuilt once per category-set version)
+_analysis_template = None
+_analysis_template_time = 0
+# Safety refresh for changes made outside the admin API (learned mappings, mapping usage order)
+_ANALYSIS_TEMPLATE_TTL = 3600
+
+
+@dataclass(frozen=True)
+class AnalysisPromptTemplate:
+    """Static parts of the article analysis prompts for one category-set version."""
+    category_version: str
+    guidelines: str  # ANALYSIS TASKS ... DATE EXTRACTION rules with category metadata
+    examples: str
+    single_tail: str  # Everything after the article block in the single-article prompt
+    cached_instructions: str  # Static prefix sent once as Gemini cached content
+
+
+def invalidate_prompt_templates() -> None:
+    """Drop cached categories and compiled analysis templates.
+
+    Called after categories or category mappings are written so the next prompt
+    is rebuilt with the new category set.
+    """
+    global _categories_cache, _categories_cache_time, _analysis_template, _analysis_template_time
+    _categories_cache = None
+    _categories_cache_time = 0
+    _analysis_template = None
+    _analysis_template_time = 0
+
 
 class NewsPrompts:
     """Collection of all AI prompts for news processing."""
@@ -121,12 +152,8 @@ SUMMARIZATION REQUIREMENTS:
     # =============================================================================
     
     @staticmethod
-    async def unified_article_analysis_enhanced(title: str, content: str, url: str,
-                                               source_context: str = "from an UNKNOWN source",
-                                               original_context: str = None) -> str:
-        """
-        Enhanced unified prompt that uses dynamic category list from database.
-        """
+    async def _get_analysis_category_context():
+        """Get (available_categories, category_names, local_category_block) for analysis prompts."""
         # Get available categories from database
         available_categories = await NewsPrompts.get_available_categories()
         category_names = [cat.split(' (')[0] for cat in available_categories]
@@ -145,37 +172,75 @@ LOCAL CATEGORY RULE (CRITICAL):
 - This is important because some readers filter out "{lc}" — mixing it with other categories pollutes those feeds.
 - Exception: only add a second category if the article has GLOBAL significance beyond {lc}.
 """
-        
-        # Limit content size for cost optimization
-        content_preview = content[:3500] + ("..." if len(content) > 3500 else "")
+        return available_categories, category_names, local_category_block
 
-        # Build original context block if provided
-        original_context_block = ""
-        if original_context and original_context.strip():
-            original_preview = original_context[:2000] + ("..." if len(original_context) > 2000 else "")
-            original_context_block = f"""
+    @staticmethod
+    async def get_analysis_template() -> AnalysisPromptTemplate:
+        """Get the precompiled analysis template, building it on first use or after invalidation."""
+        global _analysis_template, _analysis_template_time
 
-ORIGINAL SOURCE TEXT (from RSS feed or Telegram post):
-{original_preview}
+        if _analysis_template and (time.time() - _analysis_template_time) < _ANALYSIS_TEMPLATE_TTL:
+            return _analysis_template
 
-⚠️ IMPORTANT: The "Content" above was extracted from the URL. The "Original Source Text" is the text
-from the RSS feed or Telegram channel that linked to this URL. If the extracted content appears to be
-an error page, cookie consent page, privacy policy, login page, or is completely unrelated to the
-original source text — IGNORE the extracted content and base your analysis entirely on the Original
-Source Text instead. The Original Source Text is the reliable source of information about the actual news.
-"""
+        template = NewsPrompts._build_analysis_template(*await NewsPrompts._get_analysis_category_context())
 
-        return f"""Analyze this article and provide complete analysis in JSON format.
+        # Categories came from the DB (not the hardcoded fallback) - keep the compiled template
+        if _categories_cache is not None:
+            _analysis_template = template
+            _analysis_template_time = time.time()
+        return template
+
+    @staticmethod
+    def _build_analysis_template(available_categories: list, category_names: list,
+                                 local_category_block: str) -> AnalysisPromptTemplate:
+        """Compile the static analysis prompt parts for one category context."""
+        payload = "\n".join(available_categories) + "\n" + local_category_block
+        guidelines = NewsPrompts._get_analysis_guidelines(available_categories, category_names, local_category_block)
+        examples = NewsPrompts._get_analysis_examples()
+
+        single_tail = f"""{guidelines}
+
+OUTPUT FORMAT (JSON):
+{{
+    "optimized_title": "Краткий информативный заголовок новости",
+    "categories": ["Business"],
+    "category_confidences": [0.95],
+    "summary": "Краткий пересказ 5-6 предложений...",
+    "summary_confidence": 0.90,
+    "is_advertisement": false,
+    "ad_type": "news_article",
+    "ad_confidence": 0.1,
+    "ad_reasoning": "Content focuses on news reporting...",
+    "publication_date": "2024-01-15",
+    "confidence": 0.85
+}}
+
+{examples}
+
+Answer ONLY with valid JSON, no additional text."""
+
+        return AnalysisPromptTemplate(
+            category_version=_text_version(payload),
+            guidelines=guidelines,
+            examples=examples,
+            single_tail=single_tail,
+            cached_instructions=f"""Analyze the article given in the request and provide complete analysis in JSON format.
 
 🇷🇺 ВАЖНО: ВСЕ результаты анализа должны быть на РУССКОМ языке!
 
-ARTICLE INFORMATION:
-Title: {title}
-URL: {url}
-Source: {source_context}
-Content: {content_preview}
-{original_context_block}
-ANALYSIS TASKS:
+{single_tail}""",
+        )
+
+    @staticmethod
+    async def get_category_set_version() -> str:
+        """Short hash of the category list and local-category rule used in analysis prompts."""
+        return (await NewsPrompts.get_analysis_template()).category_version
+
+    @staticmethod
+    def _get_analysis_guidelines(available_categories: list, category_names: list,
+                                 local_category_block: str) -> str:
+        """Get analysis task rules shared by single-article and batch prompts."""
+        return f"""ANALYSIS TASKS:
 1. TITLE OPTIMIZATION: Create clear, informative headline (max 120 characters for Telegram)
 2. CATEGORIZATION: Choose from available categories below  
 3. SUMMARIZATION: Create accurate summary in Russian - adapt length to content (see rules below)
@@ -236,28 +301,150 @@ Promotional keywords: "купить", "заказать", "скидка", "ак
 Business reporting keywords: "выпустила", "анонсировала", "представила", "запустила" (these are NEWS, not ads!)
 
 DATE EXTRACTION:
-Look for publication dates in content, ignore article dates.
+Look for publication dates in content, ignore article dates."""
+
+    @staticmethod
+    def _get_analysis_examples() -> str:
+        """Get category output examples shared by single-article and batch prompts."""
+        from ..config import settings
+        return f"""EXAMPLES:
+- Single category: "categories": ["Science"], "category_confidences": [0.95]
+- Two categories: "categories": ["Tech", "AI"], "category_confidences": [0.9, 0.85]
+{f'- Local news: "categories": ["{settings.local_category}"], "category_confidences": [0.95] — NOT ["{settings.local_category}", "Business"]' if settings.local_category else ''}
+- Promotional post: "categories": ["Marketing"], "category_confidences": [0.9], "is_advertisement": true"""
+
+    @staticmethod
+    async def unified_article_analysis_enhanced(title: str, content: str, url: str,
+                                               source_context: str = "from an UNKNOWN source",
+                                               original_context: str = None) -> str:
+        """
+        Enhanced unified prompt that uses dynamic category list from database.
+
+        The static part (rules, category metadata, examples) comes precompiled from
+        get_analysis_template(); only the article fields are filled in here.
+        """
+        template = await NewsPrompts.get_analysis_template()
+        article_information = NewsPrompts._format_article_information(
+            title, content, url, source_context, original_context
+        )
+        return NewsPrompts._render_article_analysis(template, article_information)
+
+    @staticmethod
+    def _render_article_analysis(template: AnalysisPromptTemplate, article_information: str) -> str:
+        """Single-article analysis prompt around a formatted ARTICLE INFORMATION block."""
+        return f"""Analyze this article and provide complete analysis in JSON format.
+
+🇷🇺 ВАЖНО: ВСЕ результаты анализа должны быть на РУССКОМ языке!
+
+{article_information}
+{template.single_tail}"""
+
+    @staticmethod
+    def cached_article_analysis(title: str, content: str, url: str,
+                                source_context: str = "from an UNKNOWN source",
+                                original_context: str = None) -> str:
+        """
+        Per-article part of the analysis prompt when the static instructions are
+        served from Gemini cached content (AnalysisPromptTemplate.cached_instructions).
+        """
+        article_information = NewsPrompts._format_article_information(
+            title, content, url, source_context, original_context
+        )
+        return f"""{article_information}
+Answer ONLY with valid JSON, no additional text."""
+
+    @staticmethod
+    def _format_article_information(title: str, content: str, url: str,
+                                    source_context: str, original_context: str = None) -> str:
+        """Format the ARTICLE INFORMATION block (with optional original source text)."""
+        # Limit content size for cost optimization
+        content_preview = content[:3500] + ("..." if len(content) > 3500 else "")
+
+        # Build original context block if provided
+        original_context_block = ""
+        if original_context and original_context.strip():
+            original_preview = original_context[:2000] + ("..." if len(original_context) > 2000 else "")
+            original_context_block = f"""
+
+ORIGINAL SOURCE TEXT (from RSS feed or Telegram post):
+{original_preview}
+
+⚠️ IMPORTANT: The "Content" above was extracted from the URL. The "Original Source Text" is the text
+from the RSS feed or Telegram channel that linked to this URL. If the extracted content appears to be
+an error page, cookie consent page, privacy policy, login page, or is completely unrelated to the
+original source text — IGNORE the extracted content and base your analysis entirely on the Original
+Source Text instead. The Original Source Text is the reliable source of information about the actual news.
+"""
+
+        return f"""ARTICLE INFORMATION:
+Title: {title}
+URL: {url}
+Source: {source_context}
+Content: {content_preview}
+{original_context_block}"""
+
+    @staticmethod
+    async def batch_article_analysis(articles: list) -> str:
+        """
+        Batch variant of unified_article_analysis_enhanced for several short articles.
+
+        Args:
+            articles: List of dicts with 'id', 'title', 'url', 'content', 'source_context'
+
+        The shared instructions are sent once; the model must return one result per
+        article in a "results" array, each tagged with the article's id.
+        """
+        return NewsPrompts._render_batch_analysis(await NewsPrompts.get_analysis_template(), articles)
+
+    @staticmethod
+    def _render_batch_analysis(template: AnalysisPromptTemplate, articles: list) -> str:
+        """Batch analysis prompt for the given articles (see batch_article_analysis)."""
+        article_blocks = []
+        for item in articles:
+            content = item.get('content') or ''
+            content_preview = content[:3500] + ("..." if len(content) > 3500 else "")
+            article_blocks.append(f"""[ARTICLE ID {item['id']}]
+Title: {item.get('title') or ''}
+URL: {item.get('url') or ''}
+Source: {item.get('source_context') or 'from an UNKNOWN source'}
+Content: {content_preview}""")
+        articles_text = "\n\n---\n\n".join(article_blocks)
+
+        return f"""Analyze EACH of the {len(articles)} articles below and provide complete analysis for every one of them in JSON format.
+
+🇷🇺 ВАЖНО: ВСЕ результаты анализа должны быть на РУССКОМ языке!
+
+{template.guidelines}
+
+BATCH RULES:
+- Analyze every article INDEPENDENTLY — never mix facts, names or numbers between articles.
+- Return exactly one result per article in "results", with "id" equal to the article's ARTICLE ID.
 
 OUTPUT FORMAT (JSON):
 {{
-    "optimized_title": "Краткий информативный заголовок новости",
-    "categories": ["Business"],
-    "category_confidences": [0.95],
-    "summary": "Краткий пересказ 5-6 предложений...",
-    "summary_confidence": 0.90,
-    "is_advertisement": false,
-    "ad_type": "news_article",
-    "ad_confidence": 0.1,
-    "ad_reasoning": "Content focuses on news reporting...",
-    "publication_date": "2024-01-15",
-    "confidence": 0.85
+    "results": [
+        {{
+            "id": 1,
+            "optimized_title": "Краткий информативный заголовок новости",
+            "categories": ["Business"],
+            "category_confidences": [0.95],
+            "summary": "Краткий пересказ...",
+            "summary_confidence": 0.90,
+            "is_advertisement": false,
+            "ad_type": "news_article",
+            "ad_confidence": 0.1,
+            "ad_reasoning": "Content focuses on news reporting...",
+            "publication_date": null,
+            "confidence": 0.85
+        }}
+    ]
 }}
 
-EXAMPLES:
-- Single category: "categories": ["Science"], "category_confidences": [0.95]
-- Two categories: "categories": ["Tech", "AI"], "category_confidences": [0.9, 0.85]
-{f'- Local news: "categories": ["{settings.local_category}"], "category_confidences": [0.95] — NOT ["{settings.local_category}", "Business"]' if settings.local_category else ''}
-- Promotional post: "categories": ["Marketing"], "category_confidences": [0.9], "is_advertisement": true
+{template.examples}
+
+ARTICLES:
+
+{articles_text}
 
 Answer ONLY with valid JSON, no additional text."""
 
@@ -416,6 +603,45 @@ If no link found, respond with:
 Return the complete, absolute URL. If the link is relative, make it absolute using the base URL."""
 
 
+# =============================================================================
+# PROMPT VERSIONS
+# =============================================================================
+
+def _text_version(*texts: str) -> str:
+    """Short hash of prompt text, used as a version in AI cache keys."""
+    return hashlib.sha256('\x1e'.join(texts).encode('utf-8')).hexdigest()[:12]
+
+
+def _analysis_prompt_version() -> str:
+    """Hash of the analysis prompt wording with placeholders for categories and articles.
+
+    The category set is versioned separately (AnalysisPromptTemplate.category_version).
+    """
+    template = NewsPrompts._build_analysis_template(
+        ['{category} ({description})'], ['{category}'], '{local_category_rule}'
+    )
+    fields = ('{title}', '{content}', '{url}', '{source}', '{original}')
+    article = {'id': 0, 'title': '{title}', 'url': '{url}', 'content': '{content}', 'source_context': '{source}'}
+    return _text_version(
+        NewsPrompts._render_article_analysis(template, NewsPrompts._format_article_information(*fields)),
+        template.cached_instructions,
+        NewsPrompts.cached_article_analysis(*fields),
+        NewsPrompts._render_batch_analysis(template, [article]),
+    )
+
+
+# Prompt template versions, derived from the template text: editing a prompt
+# changes its version, so persisted AI results from the old wording are not reused
+PROMPT_VERSIONS = {
+    'combined_analysis': _analysis_prompt_version(),
+    'summary': _text_version(
+        NewsPrompts._get_summarization_rules(),
+        NewsPrompts._get_professional_editor_system(),
+        NewsPrompts.category_summary('{category}', '{articles}'),
+    ),
+}
+
+
 # =============================================================================
 # GLOBAL PROMPT CONSTANTS
 # =============================================================================
@@ -0,0 +1,216 @@
+"""Incremental persistence of per-article AI results during a processing cycle."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from ..config import settings
+from ..core.metrics import pipeline_metrics
+from ..models import Article, Category
+from .near_duplicates import NearDuplicateIndex
+
+logger = logging.getLogger(__name__)
+
+# (db, {article_id: categories}, preloaded_categories) -> None
+SaveCategories = Callable[..., Awaitable[None]]
+# (db, batch) -> None, runs in the batch's write transaction
+AfterSave = Callable[[Any, List[Dict[str, Any]]], Awaitable[None]]
+
+# Queue wake-up without a new item (flush interval elapsed)
+_TICK = object()
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """Failures that say nothing about the batch's data, so splitting the batch won't help."""
+    return (
+        isinstance(error, (asyncio.TimeoutError, ConnectionError, OperationalError, InterfaceError))
+        or getattr(error, 'connection_invalidated', False)
+    )
+
+
+class ArticleResultWriter:
+    """
+    Background writer that persists finished articles in micro-batches.
+
+    Results are flushed every batch_size articles or flush_interval seconds,
+    whichever comes first, each batch in its own write transaction: one bulk
+    UPDATE of the articles, one DELETE and one INSERT for their category
+    rows and one INSERT of near-duplicate index bands. Writes are idempotent
+    (absolute column values, categories replaced per article, bands inserted
+    once), so a batch retried after a failure - or a cycle restarted after a
+    crash, which only picks up articles whose flags were never written - ends
+    in the same state. A batch that fails on its data (one bad article fails
+    the whole transaction) is split in halves and written again until the
+    failing articles are alone; those, and whole batches that failed on the
+    connection, are kept and retried with the next flush.
+
+    after_save, if given, runs in the same transaction as each batch (e.g. to
+    complete the batch's jobs in the AI job queue atomically with the write).
+    """
+
+    def __init__(self, db_queue_manager, save_categories: SaveCategories,
+                 batch_size: Optional[int] = None, flush_interval: Optional[float] = None,
+                 max_attempts: int = 3, after_save: Optional[AfterSave] = None):
+        self.db_queue_manager = db_queue_manager
+        self.save_categories = save_categories
+        self.after_save = after_save
+        self.batch_size = max(1, batch_size or settings.persist_batch_size)
+        self.flush_interval = flush_interval if flush_interval is not None else settings.persist_flush_interval
+        self.max_attempts = max_attempts
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._retry: List[Dict[str, Any]] = []
+        self._attempts: Dict[int, int] = {}
+        self.saved = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="article-result-writer")
+
+    def submit(self, article_data: Dict[str, Any]) -> None:
+        """Queue one finished article for persistence."""
+        self._queue.put_nowait(article_data)
+        pipeline_metrics.set_queue_depth("persist", self._queue.qsize())
+
+    async def close(self) -> int:
+        """Flush everything still queued and stop the writer; returns articles saved."""
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+        # Last chance for batches that failed earlier
+        while self._retry:
+            batch, self._retry = self._retry, []
+            await self._flush(batch)
+        return self.saved
+
+    async def _run(self) -> None:
+        pending: List[Dict[str, Any]] = []
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                item = _TICK
+            if item is None:
+                if pending:
+                    await self._flush(pending)
+                return
+            if item is not _TICK:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if pending and (len(pending) >= self.batch_size or time.monotonic() >= deadline):
+                # Earlier failed articles ride along with the next batch
+                batch, pending, deadline = pending + self._retry, [], None
+                self._retry = []
+                await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write one batch, bisecting it on failure; keep what still fails for a later attempt."""
+        if not batch:
+            return
+        # The same article may be queued twice (retry + resubmission) - last wins
+        by_id = {a['id']: a for a in batch}
+        batch = list(by_id.values())
+
+        async def save_batch_operation(db):
+            return await self._save_batch(db, batch)
+
+        try:
+            async with pipeline_metrics.track("persist"):
+                saved = await self.db_queue_manager.execute_write(save_batch_operation, timeout=30.0)
+        except Exception as e:
+            if len(batch) > 1 and not _is_connection_error(e):
+                logger.warning(f"  ⚠️ Failed to save batch of {len(batch)} articles, splitting it: {e}")
+                middle = len(batch) // 2
+                await self._flush(batch[:middle])
+                await self._flush(batch[middle:])
+                return
+            requeue = []
+            for article_data in batch:
+                attempts = self._attempts.get(article_data['id'], 0) + 1
+                self._attempts[article_data['id']] = attempts
+                if attempts < self.max_attempts:
+                    requeue.append(article_data)
+                else:
+                    self.failed += 1
+            self._retry.extend(requeue)
+            logger.warning(f"  ⚠️ Failed to save batch of {len(batch)} articles ({len(requeue)} will be retried): {e}")
+            return
+
+        self.saved += saved
+        self.batches += 1
+        logger.info(f"  💾 Saved batch of {saved} processed articles ({self.saved} so far)")
+
+    async def _save_batch(self, db, batch: List[Dict[str, Any]]) -> int:
+        rows = []
+        for article_data in batch:
+            row = {
+                'id': article_data['id'],
+                'summary_processed': article_data['summary_processed'],
+                'category_processed': article_data['category_processed'],
+                'ad_processed': article_data['ad_processed'],
+                'processed': all([
+                    article_data['summary_processed'],
+                    article_data['category_processed'],
+                    article_data['ad_processed'],
+                ]),
+            }
+            if article_data.get('summary'):
+                row['summary'] = article_data['summary']
+            if article_data.get('title'):
+                row['title'] = article_data['title']
+            if article_data.get('simhash') is not None:
+                row['simhash'] = article_data['simhash']
+            if article_data.get('canonical_article_id'):
+                row['canonical_article_id'] = article_data['canonical_article_id']
+            advertising = article_data.get('advertising')
+            if advertising:
+                row.update({
+                    'is_advertisement': advertising['is_advertisement'],
+                    'ad_confidence': advertising['ad_confidence'],
+                    'ad_type': advertising['ad_type'],
+                    'ad_reasoning': advertising['ad_reasoning'],
+                })
+            rows.append(row)
+
+        # One executemany UPDATE per column set; ids deleted in the meantime just match nothing
+        table = Article.__table__
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for columns, group in groups.items():
+            # Bind names must differ from column names in UPDATE ... SET
+            statement = update(table).where(table.c.id == bindparam('b_id')).values(
+                {column: bindparam(f"b_{column}") for column in columns if column != 'id'}
+            )
+            await db.execute(statement, [{f"b_{k}": v for k, v in row.items()} for row in group])
+
+        with_categories = [a for a in batch if a.get('categories')]
+        if with_categories:
+            cat_result = await db.execute(select(Category))
+            categories_by_name = {c.name.lower(): c.id for c in cat_result.scalars().all()}
+            async with pipeline_metrics.track("category_save"):
+                await self.save_categories(
+                    db, {a['id']: a['categories'] for a in with_categories},
+                    preloaded_categories=categories_by_name
+                )
+        # Fully analyzed originals become canonicals in the persisted near-duplicate index
+        signatures = [
+            (a['id'], a['simhash']) for a in batch
+            if a.get('simhash') is not None and not a.get('canonical_article_id') and a.get('summary')
+            and a['summary_processed'] and a['category_processed'] and a['ad_processed']
+        ]
+        await NearDuplicateIndex.save_signatures(db, signatures)
+        if self.after_save is not None:
+            await self.after_save(db, batch)
+        return len(rows)
@@ -1,13 +1,66 @@
 import logging
 """Smart Filtering service for reducing unnecessary AI requests."""
 
+import hashlib
 import re
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from ..config import settings
+from ..core.metrics import pipeline_metrics
+from .extractive_summarizer import detect_language
+from .text_rules import get_text_rules
 
 logger = logging.getLogger(__name__)
 
 
+class RecentHashCache:
+    """
+    Content hashes seen within a time window, bounded in size.
+
+    Entries are kept in insertion order (re-adding a hash moves it to the
+    end), so expired entries always sit at the front and are dropped from
+    there: insert, lookup and expiry are O(1) amortized. Once max_size is
+    reached the oldest entries are evicted before their window ends.
+    """
+
+    def __init__(self, window: timedelta, max_size: int):
+        self.window_seconds = window.total_seconds()
+        self.max_size = max(1, max_size)
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self.evicted = 0
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._entries:
+            seen_at = next(iter(self._entries.values()))
+            if seen_at > cutoff:
+                break
+            self._entries.popitem(last=False)
+
+    def get(self, content_hash: str) -> Optional[float]:
+        """When the hash was last seen (time.monotonic()), or None."""
+        self._expire(time.monotonic())
+        return self._entries.get(content_hash)
+
+    def add(self, content_hash: str) -> None:
+        now = time.monotonic()
+        self._expire(now)
+        self._entries[content_hash] = now
+        self._entries.move_to_end(content_hash)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def __contains__(self, content_hash: str) -> bool:
+        return self.get(content_hash) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class SmartFilter:
     """
     Smart filter to determine if articles need AI processing.
@@ -23,40 +76,17 @@ class SmartFilter:
         # Language detection patterns (simple heuristic)
         self.cyrillic_ratio_threshold = 0.3  # Minimum cyrillic characters for Russian content
         
-        # Spam/low-quality indicators
-        self.spam_patterns = [
-            r'\b(?:click here|кликни здесь|жми сюда)\b',
-            r'\b(?:buy now|купи сейчас|заказать сейчас)\b', 
-            r'\$\$\$+',  # Multiple dollar signs
-            r'!!!{3,}',  # Multiple exclamation marks
-            r'\b(?:free|бесплатно)\s+(?:download|скачать)\b',
-            r'\b(?:limited time|ограниченное время)\b',
-            r'\b(?:act now|действуй сейчас)\b',
-        ]
-        
-        # Navigation/boilerplate patterns to exclude
-        self.navigation_patterns = [
-            r'^\s*(?:home|главная|news|новости|about|о нас|contact|контакты)\s*$',
-            r'^\s*(?:menu|меню|navigation|навигация)\s*',
-            r'^\s*(?:cookie|куки)\s+(?:policy|политика)',
-            r'^\s*(?:privacy|конфиденциальность)\s+(?:policy|политика)',
-            r'^\s*(?:terms|условия)\s+(?:of service|использования)',
-            r'^\s*(?:404|error|ошибка)\s*',
-        ]
-        
-        # Metadata/low-quality content patterns
-        self.metadata_patterns = [
-            r'\d+\s+min\s+read',  # "5 min read"
-            r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{2}',  # "Sep 05"
-            r'^\s*\w{3}\s+\d{2}\s+.*\d+\s+min\s+read\s*$',  # Typical metadata line
-            r'\bsubscribe\s+(now|here|today)\b|\bподписаться\b',  # Subscribe prompts (more specific)
-            r'\bshare\s+(this|on|now)\b|\bpoделиться\b',  # Share prompts (more specific, avoid "shareholder")
-        ]
-        
+        # Spam, navigation/boilerplate and metadata patterns are the 'spam', 'navigation'
+        # and 'metadata' rule sets of services.text_rules (editable in the text_rules table)
+        self.text_rules = get_text_rules()
+
         # Duplicate detection (simple hash-based)
-        self.recent_content_hashes = {}  # Hash -> timestamp
         self.duplicate_detection_window = timedelta(hours=24)
+        self.recent_content_hashes = RecentHashCache(
+            self.duplicate_detection_window, settings.smart_filter_duplicate_cache_size
+        )
         
+    @pipeline_metrics.timed("smart_filter")
     async def should_process_with_ai(self, title: str, content: str, url: str, 
                                source_type: str = 'rss', allow_extraction: bool = True,
                                db_session: Optional[Any] = None) -> Tuple[bool, str]:
@@ -84,8 +114,11 @@ class SmartFilter:
         if not self._check_title_quality(title):
             return False, f"Title too short or low quality ({len(title)} chars)"
         
+        # Navigation and spam rules are checked in one pass over the text
+        rule_hits = self.text_rules.classify(f"{title} {content}", 'navigation', 'spam')
+
         # Check for navigation/boilerplate content
-        if self._is_navigation_content(title, content):
+        if 'navigation' in rule_hits:
             return False, "Navigation/boilerplate content detected"
         
         # Check language (for Russian content focus)
@@ -93,8 +126,8 @@ class SmartFilter:
             return False, "Content not in target language (Russian/English)"
         
         # Check for spam patterns
-        if self._is_spam_content(title, content):
-            return False, "Spam patterns detected"
+        if 'spam' in rule_hits:
+            return False, f"Spam patterns detected ({', '.join(rule_hits['spam'])})"
         
         # Check for metadata/low-quality content
         if self._is_metadata_content(content):
@@ -150,6 +183,54 @@ class SmartFilter:
         
         return True, f"Passed all filters (quality: {quality_score:.2f})"
     
+    def should_summarize_locally(self, title: str, content: str, url: str,
+                                 source_type: str = 'rss') -> Tuple[bool, str]:
+        """
+        Determine if a post is trivial enough for the local extractive summarizer.
+
+        Very short posts, single-sentence Telegram posts and low-value content
+        (quality score below LOCAL_SUMMARY_QUALITY_THRESHOLD) qualify. Only
+        Russian posts do - the AI summary of any other post is a Russian
+        translation with an optimized title - and only without 'ad_signal'
+        rule hits, since local posts are marked as not advertising without AI
+        ad detection. Only LOCAL_SUMMARY_SHARE of qualifying posts is routed
+        locally; the choice is a stable hash of the content, so a post is
+        routed the same way every time.
+
+        Returns:
+            Tuple of (summarize_locally, reason)
+        """
+        if not settings.local_summary_enabled or not content or not content.strip():
+            return False, "Local summaries disabled or no content"
+
+        if detect_language(content) != 'ru':
+            return False, "Not Russian: AI summary translates it"
+        if self.text_rules.matches(f"{title} {content}", 'ad_signal'):
+            return False, "Ad signals need AI ad detection"
+
+        # Posts that point to an external article need the article itself summarized
+        if url and url.startswith(('http://', 'https://')):
+            skip_domains = ['t.me', 'telegram.me']
+            if source_type != 'telegram' or not any(domain in url.lower() for domain in skip_domains):
+                return False, "External article needs AI summary"
+
+        text = content.strip()
+        sentence_count = len([s for s in re.split(r'[.!?…]+\s', text) if s.strip()])
+        if len(text) <= settings.local_summary_max_chars:
+            reason = f"Very short post ({len(text)} chars)"
+        elif source_type == 'telegram' and sentence_count <= 1:
+            reason = "Single-sentence Telegram post"
+        else:
+            quality_score = self._calculate_quality_score(title, text, source_type)
+            if quality_score >= settings.local_summary_quality_threshold:
+                return False, f"Quality high enough for AI summary ({quality_score:.2f})"
+            reason = f"Low-value content (quality: {quality_score:.2f})"
+
+        bucket = int(hashlib.md5(text.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF
+        if bucket >= settings.local_summary_share:
+            return False, f"{reason}, outside local summary share"
+        return True, reason
+
     def _check_content_length(self, content: str) -> bool:
         """Check if content length is appropriate for AI processing."""
         if not content:
@@ -166,13 +247,7 @@ class SmartFilter:
     
     def _is_navigation_content(self, title: str, content: str) -> bool:
         """Check if content is navigation/boilerplate."""
-        text = f"{title} {content}".lower()
-        
-        for pattern in self.navigation_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return self.text_rules.matches(f"{title} {content}", 'navigation')
     
     def _is_target_language(self, content: str) -> bool:
         """Check if content is in target language (Russian/English)."""
@@ -194,25 +269,16 @@ class SmartFilter:
     
     def _is_spam_content(self, title: str, content: str) -> bool:
         """Check if content contains spam patterns."""
-        text = f"{title} {content}".lower()
-        
-        for pattern in self.spam_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return self.text_rules.matches(f"{title} {content}", 'spam')
     
     def _is_metadata_content(self, content: str) -> bool:
         """Check if content is mostly metadata/boilerplate."""
         if not content:
             return False
         
-        content_lower = content.lower().strip()
-        
         # Check for metadata patterns
-        for pattern in self.metadata_patterns:
-            if re.search(pattern, content_lower, re.IGNORECASE):
-                return True
+        if self.text_rules.matches(content.strip(), 'metadata'):
+            return True
         
         # Check if content is too short and repetitive
         if len(content.strip()) < 100:  # Very short content
@@ -223,55 +289,48 @@ class SmartFilter:
         
         return False
     
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        # MD5 for DB compatibility and speed
+        return hashlib.md5(content.strip().lower().encode('utf-8')).hexdigest()
+
     async def _is_duplicate_content(self, content: str, db_session: Optional[Any] = None) -> bool:
         """Check if content is a duplicate of recently processed content."""
         if not content:
             return False
 
         try:
-            # Generate hash (MD5 for DB compatibility and speed)
-            import hashlib
-            content_hash = hashlib.md5(content.strip().lower().encode('utf-8')).hexdigest()
-            current_time = datetime.now()
-            
-            # 1. Check in-memory cache (Level 1 - Fastest)
-            # Clean old entries first
-            cutoff_time = current_time - self.duplicate_detection_window
-            self.recent_content_hashes = {
-                h: timestamp for h, timestamp in self.recent_content_hashes.items()
-                if timestamp > cutoff_time
-            }
-            
-            if content_hash in self.recent_content_hashes:
-                last_seen = self.recent_content_hashes[content_hash]
-                time_diff = current_time - last_seen
-                seconds_ago = int(time_diff.total_seconds())
+            content_hash = self._content_hash(content)
+
+            # 1. Check in-memory cache (Level 1 - Fastest, expired entries dropped as we go)
+            last_seen = self.recent_content_hashes.get(content_hash)
+            if last_seen is not None:
+                seconds_ago = int(time.monotonic() - last_seen)
                 logger.info(f"  🔍 Smart Filter: Content hash {content_hash} found in RAM cache ({seconds_ago}s ago)")
                 return True
-            
+
             # 2. Check database (Level 2 - Persistent)
             if db_session:
                 from sqlalchemy import select
                 from ..models import Article
-                
-                # Check if hash exists in DB
+
                 # Note: We rely on the index we added to hash_content
                 stmt = select(Article.id).where(Article.hash_content == content_hash).limit(1)
                 result = await db_session.execute(stmt)
                 if result.scalar_one_or_none():
                     logger.info(f"  🔍 Smart Filter: Content hash {content_hash} found in Database")
                     # Update RAM cache to save future DB hits
-                    self.recent_content_hashes[content_hash] = current_time
+                    self.recent_content_hashes.add(content_hash)
                     return True
-            
+
             # Not found: Add to RAM cache
-            self.recent_content_hashes[content_hash] = current_time
+            self.recent_content_hashes.add(content_hash)
             return False
-            
+
         except Exception as e:
             logger.warning(f"  ⚠️ Smart Filter: Duplicate check error: {e}")
             return False
-    
+
     def _calculate_quality_score(self, title: str, content: str, source_type: str) -> float:
         """Calculate content quality score (0.0 - 1.0)."""
         score = 0.5  # Base score
@@ -333,11 +392,12 @@ class SmartFilter:
         """Get statistics about filtering."""
         return {
             'recent_hashes_count': len(self.recent_content_hashes),
+            'recent_hashes_evicted': self.recent_content_hashes.evicted,
             'min_content_length': self.min_content_length,
             'max_content_length': self.max_content_length,
             'cyrillic_ratio_threshold': self.cyrillic_ratio_threshold,
-            'spam_patterns_count': len(self.spam_patterns),
-            'navigation_patterns_count': len(self.navigation_patterns)
+            'spam_patterns_count': self.text_rules.engine.rule_sets().get('spam', 0),
+            'navigation_patterns_count': self.text_rules.engine.rule_sets().get('navigation', 0)
         }
 
 
@@ -3,7 +3,7 @@ import logging
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
@@ -11,6 +11,7 @@ from sqlalchemy import select, func, and_
 from ..models import Source, Article
 from ..sources import get_source_registry, BaseSource, SourceInfo, SourceType
 from ..core.exceptions import SourceError
+from ..core.metrics import pipeline_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -194,14 +195,32 @@ class SourceManager:
 
     async def fetch_from_all_sources_no_db(self, sources: List[Source],
                                            max_concurrent: int = 5,
-                                           per_source_timeout: int = 120) -> Dict[str, List[Article]]:
+                                           per_source_timeout: int = 120) -> Dict[str, Optional[List[Article]]]:
         """
         Fetch articles from sources via HTTP - NO DATABASE ACCESS.
         This is purely I/O bound HTTP fetching, no semaphore locks.
         Each source has a timeout to prevent a single stuck source from blocking everything.
+        Sources whose fetch failed or timed out map to None (not an empty list).
         """
         results = {}
+        async for source_name, articles in self.iter_fetch_sources_no_db(sources, max_concurrent, per_source_timeout):
+            results[source_name] = articles
+
+        failed = sum(1 for a in results.values() if a is None)
+        logger.warning(f"[FETCH COMPLETE] All sources done. Total: {sum(len(a) for a in results.values() if a)} articles "
+                       f"from {len(results) - failed} sources ({failed} failed)")
+        return results
+
+    async def iter_fetch_sources_no_db(self, sources: List[Source],
+                                       max_concurrent: int = 5,
+                                       per_source_timeout: int = 120) -> AsyncIterator[Tuple[str, Optional[List[Article]]]]:
+        """
+        Fetch sources concurrently and yield (source_name, articles) as each source finishes.
 
+        Same rules as fetch_from_all_sources_no_db (no DB access, per-source
+        timeout, failed sources yield None), but results can be
+        consumed while slower sources are still being fetched.
+        """
         # Create semaphore to limit concurrent fetches
         semaphore = asyncio.Semaphore(max_concurrent)
 
@@ -209,17 +228,18 @@ class SourceManager:
             """Fetch articles from source without DB access."""
             async with semaphore:
                 try:
-                    source_instance = await self.get_source_instance(source)
-                    articles = []
+                    async with pipeline_metrics.track(f"fetch.{source.source_type or 'unknown'}"):
+                        source_instance = await self.get_source_instance(source)
+                        articles = []
 
-                    async for article in source_instance.fetch_articles():
-                        articles.append(article)
+                        async for article in source_instance.fetch_articles():
+                            articles.append(article)
 
                     logger.info(f"  ✅ Fetched {len(articles)} articles from {source.name}")
                     return source.name, articles
                 except Exception as e:
                     logger.warning(f"Error fetching from {source.name}: {e}")
-                    return source.name, []
+                    return source.name, None
 
         async def fetch_with_timeout(source: Source):
             """Wrap fetch in a per-source timeout."""
@@ -230,23 +250,19 @@ class SourceManager:
                 )
             except asyncio.TimeoutError:
                 logger.error(f"  ⏰ Source '{source.name}' timed out after {per_source_timeout}s — skipping")
-                return source.name, []
+                return source.name, None
 
         # Execute fetches concurrently (HTTP only, no DB lock)
-        tasks = [fetch_with_timeout(source) for source in sources]
-        fetch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for result in fetch_results:
-            if isinstance(result, Exception):
-                logger.error(f"Fetch task failed with exception: {result}")
-                continue
-
-            source_name, articles = result
-            results[source_name] = articles
-
-        logger.warning(f"[FETCH COMPLETE] All sources done. Total: {sum(len(a) for a in results.values())} articles from {len(results)} sources")
-        return results
+        tasks = [asyncio.create_task(fetch_with_timeout(source)) for source in sources]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    logger.error(f"Fetch task failed with exception: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @staticmethod
     def _collect_candidate_urls(article) -> List[str]:
@@ -332,17 +348,20 @@ class SourceManager:
         if title:
             seen_titles.add(title)
 
-    async def save_fetched_articles_with_sources(self, raw_articles: Dict[str, List[Article]],
+    async def save_fetched_articles_with_sources(self, raw_articles: Dict[str, Optional[List[Article]]],
                                                   source_map: Dict[str, Source], db: AsyncSession) -> Dict[str, List[Article]]:
         """
         Save fetched articles to database using provided source mapping.
         This is pure DB writes, no HTTP fetching.
+        Sources whose fetch failed (None) are left out of the result.
         """
         results = {}
 
         # Debug logs removed after verification
 
         for source_name, articles in raw_articles.items():
+            if articles is None:
+                continue
             try:
 
                 source = source_map.get(source_name)
@@ -2,16 +2,21 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from ..models import DailySummary, Article
 from ..config import get_settings
+from ..core.exceptions import GenerationAbortedError
+from ..core.metrics import pipeline_metrics
 from .ai_client import get_ai_client
 
 logger = logging.getLogger(__name__)
 
+_CYRILLIC_RE = re.compile(r'[а-яё]', re.IGNORECASE)
+
 
 class SummaryGenerator:
     """Handles AI generation of category summaries."""
@@ -26,11 +31,13 @@ class SummaryGenerator:
         self.min_summary_length = self.settings.digest_min_summary_length
         self.max_tokens = self.settings.digest_max_summary_tokens
 
+    @pipeline_metrics.timed("daily_summary", falsy_is_error=True)
     async def generate_category_summary(
         self,
         category: str,
         articles: List[Article],
-        date: Any
+        date: Any,
+        on_text: Optional[Callable[[str], Any]] = None
     ) -> Optional[str]:
         """
         Generate AI summary for a single category.
@@ -39,6 +46,7 @@ class SummaryGenerator:
             category: Category name
             articles: List of articles to summarize
             date: Date for the summary
+            on_text: Optional callback receiving the partial summary while it streams
 
         Returns:
             Generated summary text or fallback message
@@ -64,7 +72,7 @@ class SummaryGenerator:
 
             # Generate summary with retry logic
             summary_text = await self._generate_with_retry(
-                category, combined_content
+                category, combined_content, on_text=on_text
             )
 
             # Validate and return summary
@@ -102,7 +110,8 @@ class SummaryGenerator:
     async def _generate_with_retry(
         self,
         category: str,
-        content: str
+        content: str,
+        on_text: Optional[Callable[[str], Any]] = None
     ) -> Optional[str]:
         """Generate summary with exponential backoff retry."""
         summary_text = None
@@ -113,7 +122,10 @@ class SummaryGenerator:
 
                 summary_text = await self.ai_client._call_summary_llm(
                     summary_prompt,
-                    max_tokens=self.max_tokens
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                    on_text=on_text,
+                    validator=self._early_abort_reason
                 )
 
                 if summary_text:
@@ -130,6 +142,13 @@ class SummaryGenerator:
                     if attempt < self.max_retries - 1:
                         await asyncio.sleep(self.retry_delay)
 
+            except GenerationAbortedError as e:
+                # Bad output detected mid-stream: retry right away, the service isn't overloaded
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries}: "
+                    f"Summary generation for {category} aborted: {e}"
+                )
+
             except Exception as e:
                 logger.warning(
                     f"Attempt {attempt + 1}/{self.max_retries}: "
@@ -140,6 +159,17 @@ class SummaryGenerator:
 
         return None
 
+    @staticmethod
+    def _early_abort_reason(text: str) -> Optional[str]:
+        """Check a partially streamed summary for signs it will be unusable."""
+        if len(text) >= 200 and not _CYRILLIC_RE.search(text):
+            return "summary is not in Russian"
+        if len(text) >= 300:
+            tail = text[-50:]
+            if len(tail.strip()) >= 30 and text.count(tail) >= 3:
+                return "summary is repeating itself"
+        return None
+
     def _create_summary_prompt(self, category: str, content: str) -> str:
         """Create AI prompt for category summary generation."""
         from .prompts import NewsPrompts
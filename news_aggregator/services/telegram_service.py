@@ -7,6 +7,7 @@ from datetime import datetime
 from ..config import settings
 from ..core.http_client import get_http_client
 from ..core.exceptions import TelegramError
+from ..core.metrics import pipeline_metrics
 from ..utils.html_utils import validate_telegram_html, strip_html_tags
 
 
@@ -114,6 +115,7 @@ class TelegramService:
         """Send message to the service channel (errors, alerts)."""
         return await self._send_to_chat(text, self.service_chat_id)
 
+    @pipeline_metrics.timed("telegram_send", falsy_is_error=True)
     async def _send_to_chat(self, text: str, chat_id: str) -> bool:
         """Low-level send to a specific chat_id."""
         if not text or not str(text).strip():
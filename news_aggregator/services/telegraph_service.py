@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 from telegraph import Telegraph
 
 from ..config import settings
+from ..core.metrics import pipeline_metrics
 
 
 class TelegraphService:
@@ -24,6 +25,7 @@ class TelegraphService:
             self.telegraph = None
             logging.warning("Telegraph access token not configured")
     
+    @pipeline_metrics.timed("telegraph", falsy_is_error=True)
     async def create_news_page(self, articles_by_category: Dict[str, List]) -> Optional[str]:
         """
         Create Telegraph page with news content, automatically limiting size to fit Telegraph limits.
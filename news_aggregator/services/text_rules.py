@@ -0,0 +1,203 @@
+"""Text classification rules (spam, boilerplate, bot-protection markers), editable in the text_rules table."""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from ..core.rule_engine import Rule, RuleEngine
+from ..models import TextRule
+
+logger = logging.getLogger(__name__)
+
+# Seconds between reloads of the rules from the database
+RELOAD_INTERVAL = 300
+
+# Rule sets and the texts they are applied to
+RULE_SETS = {
+    'spam': "Spam patterns (SmartFilter, title + content)",
+    'navigation': "Navigation/boilerplate pages (SmartFilter, title + content)",
+    'metadata': "Metadata-only content that needs extraction (SmartFilter, content)",
+    'bot_page': "Bot-protection / consent pages in extracted content (AIClient)",
+    'bot_summary': "Summaries describing a bot-protection / consent page (AIProcessor)",
+    'bad_summary': "Summaries describing a blocked/error page (processing cycle)",
+    'bad_title': "Optimized titles taken from an error page (processing cycle)",
+    'ad_signal': "Promotional markers that keep a post out of local summaries (SmartFilter, title + content)",
+}
+
+
+def _literals(rule_set: str, **patterns: str) -> List[Rule]:
+    return [Rule(f"{rule_set}.{key}", rule_set, pattern) for key, pattern in patterns.items()]
+
+
+def _regexes(rule_set: str, **patterns: str) -> List[Rule]:
+    return [Rule(f"{rule_set}.{key}", rule_set, pattern, is_regex=True) for key, pattern in patterns.items()]
+
+
+DEFAULT_RULES: List[Rule] = [
+    *_regexes(
+        'spam',
+        click_here=r'\b(?:click here|кликни здесь|жми сюда)\b',
+        buy_now=r'\b(?:buy now|купи сейчас|заказать сейчас)\b',
+        dollars=r'\$\$\$+',  # Multiple dollar signs
+        exclamations=r'!!!{3,}',  # Multiple exclamation marks
+        free_download=r'\b(?:free|бесплатно)\s+(?:download|скачать)\b',
+        limited_time=r'\b(?:limited time|ограниченное время)\b',
+        act_now=r'\b(?:act now|действуй сейчас)\b',
+    ),
+    *_regexes(
+        'navigation',
+        menu_word=r'^\s*(?:home|главная|news|новости|about|о нас|contact|контакты)\s*$',
+        menu=r'^\s*(?:menu|меню|navigation|навигация)\s*',
+        cookie_policy=r'^\s*(?:cookie|куки)\s+(?:policy|политика)',
+        privacy_policy=r'^\s*(?:privacy|конфиденциальность)\s+(?:policy|политика)',
+        terms=r'^\s*(?:terms|условия)\s+(?:of service|использования)',
+        error_page=r'^\s*(?:404|error|ошибка)\s*',
+    ),
+    *_regexes(
+        'metadata',
+        min_read=r'\d+\s+min\s+read',  # "5 min read"
+        date=r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{2}',  # "Sep 05"
+        metadata_line=r'^\s*\w{3}\s+\d{2}\s+.*\d+\s+min\s+read\s*$',  # Typical metadata line
+        subscribe=r'\bsubscribe\s+(now|here|today)\b|\bподписаться\b',  # Subscribe prompts
+        share=r'\bshare\s+(this|on|now)\b|\bpoделиться\b',  # Share prompts (avoid "shareholder")
+    ),
+    *_literals(
+        'bot_page',
+        # Bot protection
+        enable_js_ru='включить javascript и файлы cookie',
+        security_check_ru='проверки безопасности',
+        is_bot_ru='является ли пользователь ботом',
+        just_a_moment='just a moment',
+        connection_secure='checking if the site connection is secure',
+        enable_js_cookies='enable javascript and cookies',
+        attention_required='attention required',
+        checking_browser='checking your browser before accessing',
+        # Cookie consent pages (Google, generic)
+        google_consent='before you continue to google',
+        cookie_consent_ru='согласие на использование файлов cookie',
+        cookie_consent='consent to the use of cookies',
+        cookies_and_data='we use cookies and data to',
+        cookies_deliver='uses cookies to deliver its services',
+        cookies_help='cookies help us deliver our services',
+        # Google Maps / non-article pages
+        js_not_available='javascript is not available',
+        js_not_available_ru='javascript не доступен',
+        js_required_ru='требуется включить javascript',
+    ),
+    *_literals(
+        'bot_summary',
+        # Bot protection
+        unavailable_ru='недоступен',
+        bot_protection_ru='защиты от ботов',
+        security_check_ru='проверки безопасности',
+        is_bot_ru='является ли пользователь ботом',
+        enable_js_ru='включить javascript',
+        just_a_moment='just a moment',
+        access_denied='access denied',
+        cloudflare='cloudflare',
+        enable_js='enable javascript',
+        checking_browser='checking your browser',
+        temporarily_unavailable='temporarily unavailable',
+        bot_detection='bot detection',
+        # Cookie consent pages
+        cookie_consent_ru='согласие на использование файлов cookie',
+        cookie_consent='consent to the use of cookies',
+        cookie_policy='cookie policy',
+        cookie_policy_ru='политика использования файлов cookie',
+        google_consent='before you continue to google',
+        privacy_cookies_ru='конфиденциальности и использование файлов cookie',
+    ),
+    *_literals(
+        'bad_summary',
+        unavailable_ru='недоступен',
+        bot_protection_ru='защиты от ботов',
+        just_a_moment='just a moment',
+        access_denied='access denied',
+        cloudflare='cloudflare',
+        enable_js='enable javascript',
+        checking_browser='checking your browser',
+        temporarily_unavailable='temporarily unavailable',
+    ),
+    *_literals(
+        'bad_title',
+        error_ru='ошибка',
+        just_a_moment='just a moment',
+        access_denied='access denied',
+        forbidden='forbidden',
+        cloudflare='cloudflare',
+        captcha='captcha',
+        robot='robot',
+        bot_detection='bot detection',
+        please_wait='please wait',
+        checking_browser='checking your browser',
+        temporarily_unavailable='temporarily unavailable',
+    ),
+    *_regexes(
+        'ad_signal',
+        buy=r'\b(?:купить|купите|заказать|закажите|успей)\b',
+        discount=r'скидк|распродаж|промокод|\bакци[яи]\b',
+        price_from=r'\bцена от\b',
+        ad_label=r'\bреклама\b|\berid\b',
+        sponsored=r'\b(?:sponsored|promo code|discount)\b',
+    ),
+]
+
+
+class TextRuleService:
+    """
+    The process-wide rule engine and its database-backed rule list.
+
+    Rule sets that have rows in text_rules (enabled or not) come from the
+    table; the others use DEFAULT_RULES, which the migration also seeds into
+    the table. Rules are reloaded every RELOAD_INTERVAL seconds by the
+    processing cycle and right after edits through the API.
+    """
+
+    def __init__(self):
+        self.engine = RuleEngine(DEFAULT_RULES)
+        self.loaded_at: Optional[float] = None
+
+    def classify(self, text: str, *rule_sets: str) -> Dict[str, List[str]]:
+        return self.engine.classify(text, *rule_sets)
+
+    def matches(self, text: str, rule_set: str) -> bool:
+        return self.engine.matches(text, rule_set)
+
+    async def load(self, db) -> int:
+        """Replace the rules with the database ones; returns the number of active rules."""
+        result = await db.execute(select(TextRule))
+        rows = result.scalars().all()
+        db_sets = {row.rule_set for row in rows}
+        rules = [r for r in DEFAULT_RULES if r.rule_set not in db_sets]
+        rules.extend(
+            Rule(row.rule_key, row.rule_set, row.pattern, bool(row.is_regex))
+            for row in rows if row.enabled
+        )
+        self.engine.replace_rules(rules)
+        self.loaded_at = time.monotonic()
+        return len(rules)
+
+    async def refresh_if_stale(self, db_queue_manager) -> None:
+        """Reload from the database if the rules are older than RELOAD_INTERVAL."""
+        if self.loaded_at is not None and time.monotonic() - self.loaded_at < RELOAD_INTERVAL:
+            return
+        try:
+            await db_queue_manager.execute_read(self.load, timeout=10.0)
+        except Exception as e:
+            # Keep the current rules; retried after RELOAD_INTERVAL
+            self.loaded_at = time.monotonic()
+            logger.warning(f"⚠️ Failed to load text rules, keeping current ones: {e}")
+
+
+# Global instance
+_text_rules: Optional[TextRuleService] = None
+
+
+def get_text_rules() -> TextRuleService:
+    """Get global text rule service instance."""
+    global _text_rules
+    if _text_rules is None:
+        _text_rules = TextRuleService()
+    return _text_rules
@@ -1,11 +1,14 @@
 """Utility modules for Evening News v2."""
 
-from .message_splitter import MessageSplitter, TelegramMessageSplitter, SplitResult, MessagePart
+from .message_splitter import (
+    MessageSplitter, TelegramMessageSplitter, StreamingDigestSplitter, SplitResult, MessagePart
+)
 from .logging_config import setup_logging, get_logger, log_operation, LoggingAdapter
 
 __all__ = [
     'MessageSplitter',
     'TelegramMessageSplitter',
+    'StreamingDigestSplitter',
     'SplitResult',
     'MessagePart',
     'setup_logging',
@@ -1,7 +1,7 @@
 """Universal message splitter for Telegram and other messaging platforms."""
 
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -309,3 +309,120 @@ class TelegramMessageSplitter(MessageSplitter):
             safety_margin: Safety margin for Telegraph button overhead
         """
         super().__init__(max_length=4096, safety_margin=safety_margin)
+
+
+
+class StreamingDigestSplitter:
+    """
+    Splits a digest into parts while its content blocks are still being generated.
+
+    Block titles and their order are known up front; texts arrive through
+    update() (partial, while streaming) and complete() (final; None drops
+    the block). A part is closed and passed to on_part as soon as every
+    block in it is final and the next block cannot join it: it is final
+    too, or its partial text alone already overflows the part. Closed parts
+    are laid out exactly like split_digest() lays out intermediate parts;
+    finish() returns the rest once all blocks are final. A block whose final
+    text ends up shorter than it streamed (e.g. after a retry) may leave a
+    closed part with some unused room.
+    """
+
+    def __init__(
+        self,
+        splitter: MessageSplitter,
+        header: str,
+        titles: List[str],
+        on_part: Callable[[str], Any],
+        metadata: Dict[str, Any] = None
+    ):
+        """
+        Args:
+            splitter: Splitter whose limits and part layout are used
+            header: Message header (included in each part)
+            titles: Block titles in digest order
+            on_part: Called with each part closed before finish()
+            metadata: Metadata for intermediate footers (counts announced up front)
+        """
+        self.splitter = splitter
+        self.header = header
+        self.titles = list(titles)
+        self.on_part = on_part
+        self.metadata = metadata
+        self.parts_closed = 0
+        self._texts: Dict[str, Optional[str]] = {}
+        self._partial_lengths: Dict[str, int] = {}
+        self._next = 0  # First block not yet in a closed part
+
+    def update(self, title: str, partial_text: str) -> None:
+        """Record the text streamed so far for a block."""
+        if title not in self._texts:
+            self._partial_lengths[title] = len(partial_text)
+            self._advance()
+
+    def complete(self, title: str, text: Optional[str]) -> None:
+        """Record the final text of a block (None or empty leaves the block out)."""
+        self._texts[title] = text.strip() if text else None
+        self._advance()
+
+    def finish(self, footer: str, metadata: Dict[str, Any] = None) -> List[str]:
+        """
+        Remaining parts, the last one with the footer; blocks never completed are left out.
+
+        If no part was closed early this is split_digest() of the completed
+        blocks with the given metadata.
+        """
+        for title in self.titles:
+            self._texts.setdefault(title, None)
+        self._advance()
+        blocks = [(title, self._texts[title]) for title in self.titles[self._next:] if self._texts[title]]
+        self._next = len(self.titles)
+
+        if not self.parts_closed:
+            if not blocks:
+                return []
+            split_result = self.splitter.split_digest(self.header, blocks, footer, metadata or self.metadata)
+            return [part.content for part in split_result.parts]
+
+        part_number = self.parts_closed + 1
+        return [self.splitter._build_part_content(
+            self.header, blocks, part_number, part_number, self.metadata, is_final=True, footer=footer
+        )]
+
+    def _advance(self) -> None:
+        """Close every part whose content can no longer change."""
+        while True:
+            blocks: List[Tuple[str, str]] = []
+            length = len(self.header) + 2  # header + empty line
+            index = self._next
+            closed = False
+            while index < len(self.titles):
+                title = self.titles[index]
+                final = title in self._texts
+                text = self._texts.get(title)
+                if final and not text:
+                    index += 1
+                    continue
+                streamed = len(text) if final else self._partial_lengths.get(title, 0)
+                block_length = len(title) + streamed + 4  # title + content + formatting
+                fits = length + block_length + self.splitter._estimate_part_footer(
+                    self.parts_closed + 1, len(blocks) + 1, self.metadata
+                ) <= self.splitter.effective_limit
+                if not final:
+                    closed = bool(blocks) and not fits
+                    break
+                if fits or not blocks:
+                    # An oversized block gets a part of its own, as in split_digest()
+                    blocks.append((title, text))
+                    length += block_length
+                    index += 1
+                else:
+                    closed = True
+                    break
+            if not closed:
+                return
+
+            self.parts_closed += 1
+            self._next = index
+            self.on_part(self.splitter._build_part_content(
+                self.header, blocks, self.parts_closed, 0, self.metadata, is_final=False
+            ))
@@ -0,0 +1,94 @@
+"""Tests for the adaptive AI concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from news_aggregator.core.adaptive_limiter import AdaptiveConcurrencyLimiter, AIPriority, ai_priority
+
+
+@pytest.mark.asyncio
+async def test_interactive_priority_from_context_is_kept():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+    with ai_priority(AIPriority.INTERACTIVE):
+        granted = await limiter.acquire()
+    assert granted == AIPriority.INTERACTIVE
+    assert limiter.get_stats()['classes']['interactive']['in_flight'] == 1
+    limiter.release(granted)
+
+    assert await limiter.acquire() == AIPriority.FRESH
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_in_priority_order():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    held = await limiter.acquire(AIPriority.INTERACTIVE)
+    order = []
+
+    async def request(priority):
+        granted = await limiter.acquire(priority)
+        order.append(granted)
+        limiter.release(granted)
+
+    tasks = [asyncio.create_task(request(p)) for p in
+             (AIPriority.BACKLOG, AIPriority.FRESH, AIPriority.INTERACTIVE, AIPriority.DIGEST)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 4
+
+    limiter.release(held)
+    await asyncio.gather(*tasks)
+    assert order == [AIPriority.INTERACTIVE, AIPriority.DIGEST, AIPriority.FRESH, AIPriority.BACKLOG]
+
+
+@pytest.mark.asyncio
+async def test_class_cap_leaves_room_for_higher_priorities():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    assert limiter.class_cap(AIPriority.BACKLOG) == 2
+
+    backlog = [await limiter.acquire(AIPriority.BACKLOG) for _ in range(2)]
+    third = asyncio.create_task(limiter.acquire(AIPriority.BACKLOG))
+    await asyncio.sleep(0)
+    assert not third.done()
+
+    # Free slots still go to other classes while backlog is at its cap
+    assert await asyncio.wait_for(limiter.acquire(AIPriority.FRESH), 1) == AIPriority.FRESH
+
+    limiter.release(backlog[0])
+    assert await asyncio.wait_for(third, 1) == AIPriority.BACKLOG
+
+
+
+def test_additive_increase_up_to_max():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, latency_target=10.0)
+
+    for _ in range(3):
+        limiter.on_success(latency=1.0)
+    assert limiter.limit == 3
+
+    for _ in range(50):
+        limiter.on_success(latency=1.0)
+    assert limiter.limit == 3
+
+
+def test_slow_calls_stop_growth():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8, latency_target=1.0)
+
+    for _ in range(10):
+        limiter.on_success(latency=5.0)
+    assert limiter.limit == 2
+
+
+def test_multiplicative_decrease_respects_cooldown_and_min():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, max_limit=8, decrease_cooldown=60.0)
+
+    limiter.on_overload()
+    limiter.on_overload()  # Within the cooldown: counted, but no second cut
+    assert limiter.limit == 4
+    assert limiter.get_stats()['total_overloads'] == 2
+
+    limiter._last_decrease -= 120
+    limiter.on_overload()
+    limiter._last_decrease -= 120
+    limiter.on_overload()
+    assert limiter.limit == 2
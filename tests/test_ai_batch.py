@@ -0,0 +1,108 @@
+"""Tests for batched multi-article AI analysis."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from news_aggregator.config import settings
+from news_aggregator.services.ai_client import AIClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    return AIClient()
+
+
+def _post(i: int, length: int = 200) -> dict:
+    return {"title": f"Post {i}", "content": ("Новость дня. " * 50)[:length], "url": f"https://t.me/chan/{i}"}
+
+
+def _item(prompt_id: int) -> dict:
+    return {
+        "id": prompt_id,
+        "summary": f"Краткий пересказ {prompt_id}",
+        "optimized_title": f"Заголовок {prompt_id}",
+        "categories": ["Tech"],
+        "is_advertisement": False,
+    }
+
+
+def test_batch_size_adapts_to_token_budget(client, monkeypatch):
+    monkeypatch.setattr(settings, "ai_batch_max_size", 8)
+    monkeypatch.setattr(settings, "ai_batch_input_token_budget", 300)
+
+    batches = client.plan_analysis_batches([_post(i, 300) for i in range(6)])
+
+    # ~100 tokens per post → 2 per batch under a 300-token budget
+    assert [len(b) for b in batches] == [2, 2, 2]
+
+
+def test_batch_size_capped_by_output_budget(client, monkeypatch):
+    monkeypatch.setattr(settings, "ai_batch_max_size", 20)
+    monkeypatch.setattr(settings, "ai_batch_input_token_budget", 100_000)
+    monkeypatch.setattr(settings, "ai_batch_output_tokens_per_article", 1000)
+    monkeypatch.setattr(settings, "ai_batch_max_output_tokens", 3000)
+
+    batches = client.plan_analysis_batches([_post(i) for i in range(7)])
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_falls_back_to_single_requests(client, monkeypatch):
+    monkeypatch.setattr(settings, "ai_batch_max_size", 8)
+    monkeypatch.setattr(settings, "ai_batch_input_token_budget", 100_000)
+    posts = [_post(i) for i in range(3)]
+
+    # Model answers only for prompt ids 1 and 3
+    client._make_structured_ai_request = AsyncMock(
+        return_value={"result": {"results": [_item(1), _item(3)]}, "usage": {}}
+    )
+    client.analyze_article_complete = AsyncMock(return_value={"summary": "single", "categories": ["Other"]})
+    cache = MagicMock()
+    cache.get_categories = AsyncMock(return_value=["Tech", "Other"])
+
+    with patch("news_aggregator.services.prompts.NewsPrompts.get_available_categories",
+               new_callable=AsyncMock, return_value=["Tech (Технологии)", "Other (Прочее)"]), \
+         patch("news_aggregator.services.category_cache.get_category_cache", return_value=cache):
+        results = await client.analyze_articles_batch(posts)
+
+    assert client._make_structured_ai_request.await_count == 1
+    assert results[0]["summary"] == "Краткий пересказ 1"
+    assert results[2]["summary"] == "Краткий пересказ 3"
+    assert results[1]["summary"] == "single"
+    client.analyze_article_complete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_and_count_every_request(client, monkeypatch):
+    monkeypatch.setattr(settings, "ai_batch_max_size", 2)
+    monkeypatch.setattr(settings, "ai_batch_input_token_budget", 100_000)
+    posts = [_post(i) for i in range(4)]
+    in_flight = {'now': 0, 'max': 0}
+
+    async def batch_request(prompt, **kwargs):
+        in_flight['now'] += 1
+        in_flight['max'] = max(in_flight['max'], in_flight['now'])
+        await asyncio.sleep(0.01)
+        in_flight['now'] -= 1
+        # Second item of each batch is missing
+        return {"result": {"results": [_item(1)]}, "usage": {}}
+
+    client._make_structured_ai_request = batch_request
+    client.analyze_article_complete = AsyncMock(return_value={"summary": "single", "categories": ["Other"]})
+    cache = MagicMock()
+    cache.get_categories = AsyncMock(return_value=["Tech", "Other"])
+    stats = {'api_calls_made': 0}
+
+    with patch("news_aggregator.services.prompts.NewsPrompts.get_available_categories",
+               new_callable=AsyncMock, return_value=["Tech (Технологии)", "Other (Прочее)"]), \
+         patch("news_aggregator.services.category_cache.get_category_cache", return_value=cache):
+        results = await client.analyze_articles_batch(posts, stats=stats)
+
+    assert in_flight['max'] == 2
+    assert [r["summary"] for r in results] == ["Краткий пересказ 1", "single", "Краткий пересказ 1", "single"]
+    assert stats['api_calls_made'] == 4  # 2 batch requests + 2 fallbacks
@@ -0,0 +1,67 @@
+"""Tests for the persistent AI result cache."""
+
+import pytest
+
+from news_aggregator.services.ai_cache import AIResultCache, content_hash
+
+
+def test_content_hash_ignores_formatting_noise():
+    a = content_hash("Правительство  объявило о новых мерах. https://t.me/chan/1")
+    b = content_hash("правительство объявило о новых мерах!\n\nhttps://example.com/x")
+    assert a == b
+    assert a != content_hash("Правительство объявило о других мерах.")
+
+
+@pytest.mark.asyncio
+async def test_versions_scope_cache_entries(tmp_path):
+    cache = AIResultCache(cache_dir=tmp_path)
+    digest = content_hash("Новость дня")
+    key = cache.build_key("combined_analysis", digest, "model-a", "v1", "cats1")
+
+    assert await cache.get(key) is None
+    await cache.set(key, {"summary": "Пересказ"})
+    assert (await cache.get(key))["summary"] == "Пересказ"
+
+    # A new category set or prompt version must not reuse the old result
+    assert await cache.get(cache.build_key("combined_analysis", digest, "model-a", "v1", "cats2")) is None
+    assert await cache.get(cache.build_key("combined_analysis", digest, "model-a", "v2", "cats1")) is None
+
+    metrics = cache.get_metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_entry_limit_evicts_oldest_without_rescanning(tmp_path, monkeypatch):
+    cache = AIResultCache(cache_dir=tmp_path)
+    store = cache._store
+    monkeypatch.setattr(store, "max_entries", 3)
+    for i in range(3):
+        await cache.set(f"key{i}", {"summary": str(i)})
+
+    # Writes work from the index only; stats (which read every file) are not needed
+    async def no_scan():
+        raise AssertionError("set() must not scan the cache directory")
+    monkeypatch.setattr(store, "get_stats", no_scan)
+
+    await cache.set("key3", {"summary": "3"})
+    await cache.set("key1", {"summary": "1b"})  # Overwrite doesn't evict
+
+    assert await cache.get("key0") is None
+    assert (await cache.get("key1"))["summary"] == "1b"
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+
+def test_prompt_versions_follow_the_template_text(monkeypatch):
+    from news_aggregator.services import prompts
+
+    version = prompts._analysis_prompt_version()
+    assert prompts.PROMPT_VERSIONS['combined_analysis'] == version
+    assert len(prompts.PROMPT_VERSIONS['summary']) == 12
+
+    # The category set is versioned separately and does not change the wording version
+    template = prompts.NewsPrompts._build_analysis_template(['Tech (gadgets)'], ['Tech'], '')
+    assert template.category_version == prompts._text_version("Tech (gadgets)\n")
+
+    monkeypatch.setattr(prompts.NewsPrompts, "_get_analysis_examples", staticmethod(lambda: "EXAMPLES: none"))
+    assert prompts._analysis_prompt_version() != version
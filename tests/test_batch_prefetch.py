@@ -0,0 +1,122 @@
+"""Tests for the batched Telegram prefetch running alongside the per-article pass."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from news_aggregator.config import settings
+from news_aggregator.core.adaptive_limiter import AIPriority, ai_priority_var
+from news_aggregator.orchestrator import NewsOrchestrator
+from news_aggregator.services.result_writer import ArticleResultWriter
+
+
+class OnePageReader:
+    def __init__(self, page):
+        self.page = page
+        self.rows_read = 0
+        self.pages_read = 0
+
+    async def pages(self):
+        self.rows_read += len(self.page)
+        self.pages_read += 1
+        yield self.page
+
+
+class FakeQueue:
+    async def execute_read(self, operation, timeout=None):
+        raise RuntimeError("no database")
+
+    async def execute_write(self, operation, timeout=None):
+        return await operation(None)
+
+
+class FakeAIClient:
+    """Batch analysis blocks until released and records the AI priority it ran under."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.batch_priorities = []
+
+    def is_batchable(self, content):
+        return True
+
+    def plan_analysis_batches(self, items):
+        return [items]
+
+    async def analyze_articles_batch(self, items, stats=None):
+        self.batch_priorities.append(ai_priority_var.get())
+        await self.release.wait()
+        return [{'summary': f"batch {item['url']}"} for item in items]
+
+
+class FakeAIProcessor:
+    def __init__(self):
+        self.summarized = []
+
+    async def get_summary_by_source_type(self, article, source_type, stats):
+        self.summarized.append(article.url)
+        return {'summary': f"single {article.url}"}
+
+
+class FakeCategorizer:
+    def categories_from_analysis(self, analysis):
+        return []
+
+    async def categorize_by_source_type_new(self, article, source_type, stats):
+        return []
+
+
+def _article(article_id, url, source_type, published_at):
+    return {
+        'id': article_id, 'title': f"Title {article_id}", 'url': url, 'content': "Короткий пост.",
+        'summary': None, 'source_id': 1, 'source_type': source_type, 'published_at': published_at,
+        'fetched_at': published_at, 'summary_processed': False, 'category_processed': False,
+        'ad_processed': False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_page_is_worked_on_while_the_batch_prefetch_runs(monkeypatch):
+    monkeypatch.setattr(settings, "near_duplicates_enabled", False)
+    monkeypatch.setattr(settings, "local_summary_enabled", False)
+
+    async def save_batch(self, db, batch):
+        return len(batch)
+
+    monkeypatch.setattr(ArticleResultWriter, "_save_batch", save_batch)
+
+    old = datetime.utcnow() - timedelta(hours=settings.ai_backlog_age_hours + 24)
+    page = [
+        _article(1, "https://t.me/channel/1", 'telegram', old),
+        _article(2, "https://t.me/channel/2", 'telegram', old),
+        _article(3, "https://example.com/news", 'rss', datetime.utcnow()),
+    ]
+    orchestrator = object.__new__(NewsOrchestrator)
+    orchestrator.db_queue_manager = FakeQueue()
+    orchestrator.ai_client = FakeAIClient()
+    orchestrator.ai_processor = FakeAIProcessor()
+    orchestrator.categorization_processor = FakeCategorizer()
+
+    async def save_categories(db, articles):
+        return None
+
+    orchestrator._save_ai_categories_bulk = save_categories
+    stats = {'api_calls_made': 0, 'errors': []}
+
+    run = asyncio.create_task(orchestrator._process_unprocessed_articles(stats, reader=OnePageReader(page)))
+    for _ in range(50):
+        if orchestrator.ai_processor.summarized:
+            break
+        await asyncio.sleep(0.01)
+
+    # The RSS article was processed while the batch request is still out
+    assert orchestrator.ai_processor.summarized == ["https://example.com/news"]
+    assert orchestrator.ai_client.batch_priorities == [AIPriority.BACKLOG]
+
+    orchestrator.ai_client.release.set()
+    result = await asyncio.wait_for(run, timeout=5.0)
+
+    assert result['articles_processed'] == 3
+    assert [a['summary'] for a in page[:2]] == ["batch https://t.me/channel/1", "batch https://t.me/channel/2"]
+    assert orchestrator.ai_processor.summarized == ["https://example.com/news"]  # No per-article requests
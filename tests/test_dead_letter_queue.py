@@ -0,0 +1,129 @@
+"""Tests for the Postgres dead-letter queue (SQL is checked against a recording session)."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from news_aggregator.core.circuit_breaker import CircuitBreakerError
+from news_aggregator.core.dead_letter_queue import DeadLetter, DeadLetterQueue, FailureReason
+
+
+class RecordingSession:
+    """Stands in for an AsyncSession: records statements, returns queued results."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+        return self.results.pop(0) if self.results else SimpleNamespace(rowcount=1)
+
+
+def _entry(retry_count: int, max_retries: int = 3) -> DeadLetter:
+    return DeadLetter(id=7, article_id=42, reason="timeout", retry_count=retry_count,
+                      max_retries=max_retries, article_data={"id": 42})
+
+
+def test_failure_reason_from_exception():
+    assert FailureReason.from_exception(CircuitBreakerError("open")) == FailureReason.AI_SERVICE_UNAVAILABLE
+    assert FailureReason.from_exception(asyncio.TimeoutError()) == FailureReason.TIMEOUT
+    assert FailureReason.from_exception(RuntimeError("Read timed out")) == FailureReason.TIMEOUT
+    assert FailureReason.from_exception(RuntimeError("HTTP 429: Rate limit exceeded")) == FailureReason.RATE_LIMITED
+    assert FailureReason.from_exception(RuntimeError("Quota exhausted")) == FailureReason.RATE_LIMITED
+    assert FailureReason.from_exception(ValueError("bad json")) == FailureReason.UNKNOWN_ERROR
+
+
+@pytest.mark.asyncio
+async def test_claim_due_requeues_expired_claims_and_parses_rows():
+    rows = [SimpleNamespace(id=1, article_id=10, reason="timeout", retry_count=1, max_retries=3,
+                            article_data=json.dumps({"id": 10, "url": "https://example.com/a"})),
+            SimpleNamespace(id=2, article_id=None, reason="unknown_error", retry_count=0, max_retries=3,
+                            article_data=None)]
+    db = RecordingSession(SimpleNamespace(rowcount=0), rows)
+    dlq = DeadLetterQueue(max_retries=3)
+
+    entries = await dlq.claim_due(db, "worker-1", 50, reason=FailureReason.TIMEOUT)
+
+    requeue_sql, _ = db.statements[0]
+    claim_sql, params = db.statements[1]
+    assert "claim_expires_at < now()" in requeue_sql
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql and "next_retry_at <= now()" in claim_sql
+    assert params["owner"] == "worker-1" and params["limit"] == 50 and params["reason"] == "timeout"
+    assert entries[0].article_data["url"] == "https://example.com/a"
+    assert entries[1].article_data == {}
+
+
+@pytest.mark.asyncio
+async def test_mark_retry_doubles_backoff_until_max_retries():
+    dlq = DeadLetterQueue(max_retries=3)
+    dlq.max_delay = 3600
+
+    db = RecordingSession()
+    assert await dlq.mark_retry(db, "worker-1", _entry(retry_count=0), "boom")
+    sql, params = db.statements[0]
+    assert "backoff_seconds * 2" in sql and "LEAST" in sql
+    assert params["status"] == "pending" and params["final"] is False
+    assert params["max_delay"] == 3600 and params["error"] == "boom"
+
+    db = RecordingSession()
+    await dlq.mark_retry(db, "worker-1", _entry(retry_count=2))
+    _, params = db.statements[0]
+    assert params["status"] == "failed" and params["final"] is True
+
+
+@pytest.mark.asyncio
+async def test_mark_retry_ignores_entries_claimed_by_someone_else():
+    db = RecordingSession(SimpleNamespace(rowcount=0))
+
+    assert not await DeadLetterQueue(max_retries=3).mark_retry(db, "worker-2", _entry(retry_count=0))
+    assert db.statements[0][1]["owner"] == "worker-2"
+
+
+class RecordingQueueManager:
+    """Runs read operations against one RecordingSession."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute_read(self, operation, timeout=None):
+        return await operation(self.session)
+
+
+class UnlimitedLimiter:
+    def is_enabled(self):
+        return False
+
+    def apply_date_filters_to_query(self, query):
+        return query
+
+
+@pytest.mark.asyncio
+async def test_backlog_readers_skip_dead_lettered_articles():
+    from news_aggregator.services.ai_worker import LeasedJobReader
+    from news_aggregator.services.backlog_reader import UnprocessedArticleReader
+
+    db = RecordingSession([])
+    assert [page async for page in UnprocessedArticleReader(RecordingQueueManager(db), UnlimitedLimiter()).pages()] == []
+    sql, _ = db.statements[0]
+    assert "NOT (EXISTS" in sql and "FROM dead_letter_entries" in sql
+    assert "dead_letter_entries.article_id = articles.id" in sql
+    assert "dead_letter_entries.status IN" in sql
+
+    # Leased jobs include DeadLetterRetryWorker's own retries
+    db = RecordingSession([])
+    jobs = [SimpleNamespace(article_id=42)]
+    assert [page async for page in LeasedJobReader(RecordingQueueManager(db), jobs).pages()] == []
+    assert "dead_letter_entries" not in db.statements[0][0]
+
+
+@pytest.mark.asyncio
+async def test_clear_old_entries_keeps_failed_entries_of_existing_articles():
+    db = RecordingSession(SimpleNamespace(rowcount=2))
+
+    assert await DeadLetterQueue(max_retries=3).clear_old_entries(db, 7) == 2
+    sql, params = db.statements[0]
+    assert "status = 'done' OR (status = 'failed' AND article_id IS NULL)" in sql
+    assert params == {"days": 7}
@@ -0,0 +1,95 @@
+"""Tests for end-to-end deadline propagation in content extraction."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from news_aggregator.core.deadline import Deadline
+# Pre-import so patch() can resolve the dotted path
+import news_aggregator.extraction.extraction_strategies  # noqa: F401
+
+
+def _make_strategies():
+    from news_aggregator.extraction.extraction_strategies import ExtractionStrategies
+    from news_aggregator.extraction.extraction_utils import ExtractionUtils
+    from news_aggregator.extraction.html_processor import HTMLProcessor
+    from news_aggregator.extraction.date_extractor import DateExtractor
+    from news_aggregator.extraction.metadata_extractor import MetadataExtractor
+
+    utils = ExtractionUtils()
+    return ExtractionStrategies(
+        utils, HTMLProcessor(utils), DateExtractor(utils), MetadataExtractor(utils)
+    )
+
+
+def test_deadline_caps_step_timeouts():
+    deadline = Deadline(10)
+    assert deadline.cap(30) <= 10
+    assert deadline.cap(2) == 2
+    assert deadline.can_afford(5_000)
+    assert not deadline.can_afford(20_000)
+    assert not deadline.expired
+    assert Deadline(0).expired
+
+
+@pytest.mark.asyncio
+async def test_browser_skipped_when_budget_is_low():
+    """Browser rendering must not start when the remaining budget can't afford it."""
+    strategies = _make_strategies()
+    memory = AsyncMock()
+    memory.get_successful_pattern = AsyncMock(return_value=None)
+
+    with patch("news_aggregator.extraction.extraction_strategies.get_extraction_memory",
+               new_callable=AsyncMock, return_value=memory), \
+         patch.object(strategies, "fetch_html_content", new_callable=AsyncMock, return_value=None), \
+         patch.object(strategies, "fetch_html_content_fallback", new_callable=AsyncMock, return_value=None), \
+         patch.object(strategies, "record_extraction_failure", new_callable=AsyncMock), \
+         patch.object(strategies, "_extract_with_browser_and_html", new_callable=AsyncMock) as browser:
+        result = await strategies.attempt_extraction_with_metadata(
+            "https://example.com/a", "example.com", 1, deadline=Deadline(5)
+        )
+
+    browser.assert_not_called()
+    assert result["content"] is None
+
+
+@pytest.mark.asyncio
+async def test_html_fetch_bounded_by_deadline():
+    """A hanging fetch returns None once the deadline runs out."""
+    strategies = _make_strategies()
+
+    async def _hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    client = MagicMock()
+    client.get = _hang
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=client)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("news_aggregator.extraction.extraction_strategies.get_http_client", return_value=ctx):
+        html = await strategies.fetch_html_content("https://example.com/a", deadline=Deadline(0.2))
+
+    assert html is None
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_budget_exhausted():
+    """CoreExtractor must not start new attempts after the deadline expires."""
+    from news_aggregator.extraction.core_extractor import CoreExtractor
+
+    strategies = _make_strategies()
+    strategies.attempt_extraction_with_metadata = AsyncMock(return_value={"content": None})
+    strategies.fetch_html_content = AsyncMock(return_value=None)
+    extractor = CoreExtractor(strategies.utils, strategies.html_processor, strategies)
+
+    with patch("news_aggregator.extraction.core_extractor.get_extraction_memory", new_callable=AsyncMock), \
+         patch("news_aggregator.extraction.core_extractor.get_stability_tracker", new_callable=AsyncMock):
+        result = await extractor.extract_article_content_with_metadata(
+            "https://example.com/a", retry_count=4, deadline=Deadline(0)
+        )
+
+    strategies.attempt_extraction_with_metadata.assert_not_called()
+    strategies.fetch_html_content.assert_not_called()
+    assert result["content"] is None
@@ -0,0 +1,88 @@
+"""Tests for the local extractive summarizer."""
+
+from news_aggregator.services.extractive_summarizer import (
+    ExtractiveSummarizer, clean_post_text, detect_language, split_sentences, tokenize
+)
+
+
+def test_detect_language():
+    assert detect_language("Правительство приняло новый закон.") == "ru"
+    assert detect_language("Влада је усвојила нови закон.") == "sr"
+    assert detect_language("Vlada je usvojila novi zakon o porezu, rekao je ministar Đorđević.") == "sr"
+    assert detect_language("The government passed a new law.") == "en"
+
+
+def test_abbreviations_and_initials_do_not_end_sentences():
+    assert split_sentences("Цена выросла на 5 млн. руб. за год. Эксперты удивлены.", "ru") == [
+        "Цена выросла на 5 млн. руб. за год.", "Эксперты удивлены."
+    ]
+    assert split_sentences("Dr. Smith met J. Doe in London. They talked.", "en") == [
+        "Dr. Smith met J. Doe in London.", "They talked."
+    ]
+
+
+def test_tokenize_drops_stopwords_and_stems():
+    assert tokenize("Правительство и министерства 2024", "ru") == ["правит", "минист"]
+
+
+def test_clean_post_text_strips_links_and_tag_lines():
+    assert clean_post_text("Новость дня https://t.me/x/1\n#новости @channel") == "Новость дня"
+
+
+def test_short_post_is_returned_whole():
+    summarizer = ExtractiveSummarizer()
+    text = "Мэрия открыла новый парк в центре города. Вход свободный."
+
+    assert summarizer.summarize(text) == text
+
+
+def test_long_post_keeps_the_best_sentences_in_order():
+    summarizer = ExtractiveSummarizer(max_sentences=2)
+    text = (
+        "Центробанк повысил ключевую ставку до шестнадцати процентов. "
+        "Погода в столице сегодня была солнечной и тёплой. "
+        "Решение по ставке аналитики связывают с ростом инфляции. "
+        "На выходных в парках прошли концерты. "
+        "Ставка останется на этом уровне до следующего заседания."
+    )
+
+    summary = summarizer.summarize(text, title="Центробанк повысил ставку")
+
+    assert summary.startswith("Центробанк повысил ключевую ставку")
+    assert "концерты" not in summary and "Погода" not in summary
+    assert summarizer.get_stats()["summaries"] == 1
+
+
+def test_summary_respects_max_chars():
+    summary = ExtractiveSummarizer(max_chars=80).summarize("Очень длинное предложение о событиях дня " * 10)
+
+    assert len(summary) <= 83 and summary.endswith("...")
+
+
+def test_audit_overlap():
+    summarizer = ExtractiveSummarizer()
+
+    assert summarizer.record_audit("Центробанк повысил ставку", "Центробанк повысил ставку") == 1.0
+    assert summarizer.record_audit("Погода солнечная", "Центробанк повысил ставку") == 0.0
+    stats = summarizer.get_stats()
+    assert stats["audits"] == 2 and stats["audit_mean_overlap"] == 0.5 and stats["audit_low_overlap"] == 1
+
+
+def test_only_russian_posts_without_ad_signals_are_summarized_locally(monkeypatch):
+    from news_aggregator.config import settings
+    from news_aggregator.services.smart_filter import SmartFilter
+
+    monkeypatch.setattr(settings, "local_summary_enabled", True)
+    monkeypatch.setattr(settings, "local_summary_share", 1.0)
+    smart_filter = SmartFilter()
+
+    def route(content):
+        return smart_filter.should_summarize_locally("Заголовок", content, "https://t.me/channel/1", "telegram")
+
+    assert route("Правительство приняло новый закон о налогах.")[0]
+    assert route("Влада је усвојила нови закон.") == (False, "Not Russian: AI summary translates it")
+    assert route("The government passed a new law.") == (False, "Not Russian: AI summary translates it")
+    assert route("Новый смартфон: успей купить со скидкой!") == (False, "Ad signals need AI ad detection")
+
+    monkeypatch.setattr(settings, "local_summary_enabled", False)
+    assert not route("Правительство приняло новый закон о налогах.")[0]
@@ -0,0 +1,88 @@
+"""Tests for Gemini context caching against a local stand-in endpoint."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+
+from news_aggregator.config import settings
+import news_aggregator.core.http_client as http_client_module
+import news_aggregator.services.gemini_context_cache as context_cache_module
+from news_aggregator.services.ai_client import AIClient
+
+
+ANALYSIS = {
+    "optimized_title": "Заголовок",
+    "summary": "Краткий пересказ новости.",
+    "categories": ["Tech"],
+    "is_advertisement": False,
+}
+
+
+@pytest.fixture
+async def gemini_stub():
+    """Minimal Gemini API stand-in recording every request body."""
+    calls = {"cached_contents": [], "generate": []}
+
+    async def create_cached_content(request):
+        calls["cached_contents"].append(await request.json())
+        return web.json_response({"name": f"cachedContents/stub{len(calls['cached_contents'])}"})
+
+    async def generate_content(request):
+        calls["generate"].append(await request.json())
+        return web.json_response({
+            "candidates": [{"content": {"parts": [{"text": json.dumps(ANALYSIS)}]}}],
+            "usageMetadata": {"promptTokenCount": 1300, "cachedContentTokenCount": 1100,
+                              "candidatesTokenCount": 80},
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1beta/cachedContents", create_cached_content)
+    app.router.add_post("/v1beta/models/{model_action}", generate_content)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/v1/models", calls
+    for client in (http_client_module.http_client, http_client_module.ai_http_client):
+        if client:
+            await client.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_static_prefix_sent_once_via_cached_content(gemini_stub, monkeypatch):
+    endpoint, calls = gemini_stub
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(settings, "gemini_api_endpoint", endpoint)
+    monkeypatch.setattr(settings, "ai_cache_enabled", False)
+    monkeypatch.setattr(settings, "ai_context_cache_enabled", True)
+    monkeypatch.setattr(http_client_module, "http_client", None)
+    monkeypatch.setattr(http_client_module, "ai_http_client", None)
+    monkeypatch.setattr(context_cache_module, "_context_cache", None)
+
+    client = AIClient()
+    tracked = []
+    client._track_ai_usage = lambda data, *args, **kwargs: tracked.append(data["usage"])
+    cache = MagicMock()
+    cache.get_categories = AsyncMock(return_value=["Tech", "Other"])
+
+    with patch("news_aggregator.services.prompts.NewsPrompts.get_available_categories",
+               new_callable=AsyncMock, return_value=["Tech (Технологии)", "Other (Прочее)"]), \
+         patch("news_aggregator.services.category_cache.get_category_cache", return_value=cache):
+        for i in range(2):
+            result = await client.analyze_article_complete(
+                f"Title {i}", f"Уникальный текст статьи номер {i}. " * 5, f"https://example.com/{i}"
+            )
+            assert result["summary"] == ANALYSIS["summary"]
+
+    assert len(calls["cached_contents"]) == 1
+    assert "ANALYSIS TASKS" in calls["cached_contents"][0]["systemInstruction"]["parts"][0]["text"]
+    for i, body in enumerate(calls["generate"]):
+        assert body["cachedContent"] == "cachedContents/stub1"
+        prompt = body["contents"][0]["parts"][0]["text"]
+        assert "ANALYSIS TASKS" not in prompt
+        assert f"номер {i}" in prompt
+    assert tracked[0]["cached_tokens"] == 1100
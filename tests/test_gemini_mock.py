@@ -0,0 +1,93 @@
+"""Smoke tests for the Gemini mock server and recording fingerprints."""
+
+import json
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from news_aggregator.devtools.gemini_mock import GeminiMockServer, LatencyModel, MockConfig, _from_schema
+from news_aggregator.services.ai_client import BATCH_ANALYSIS_SCHEMA, COMBINED_ANALYSIS_SCHEMA
+from news_aggregator.services.gemini_recorder import request_fingerprint
+
+
+def _payload(prompt: str, schema=None, cached_content=None) -> dict:
+    payload = {"contents": [{"role": "user", "parts": [{"text": prompt}]}], "generationConfig": {}}
+    if schema:
+        payload["generationConfig"]["responseJsonSchema"] = schema
+    if cached_content:
+        payload["cachedContent"] = cached_content
+    return payload
+
+
+@pytest.fixture
+async def mock_server():
+    """The mock on a local port with no latency; yields (server, base url)."""
+    server = GeminiMockServer(MockConfig(latency=LatencyModel.parse("fixed:0"), stream_chunk_chars=10, seed=1))
+    runner = web.AppRunner(server.create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield server, f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def test_synthesized_analysis_matches_the_schema():
+    response = GeminiMockServer().synthesize("gemini-test", _payload("Статья", COMBINED_ANALYSIS_SCHEMA))
+    result = json.loads(response["candidates"][0]["content"]["parts"][0]["text"])
+
+    assert set(COMBINED_ANALYSIS_SCHEMA["required"]) <= set(result)
+    assert result["summary"] and result["is_advertisement"] is False
+    assert result["publication_date"] is None and result["categories"] == ["Other"]
+    assert response["usageMetadata"]["cachedContentTokenCount"] == 0
+
+
+def test_batch_results_carry_the_article_ids():
+    prompt = "[ARTICLE ID 7]\nПервая\n\n[ARTICLE ID 12]\nВторая"
+
+    results = _from_schema(BATCH_ANALYSIS_SCHEMA, prompt, seed=3)["results"]
+
+    assert [item["id"] for item in results] == [7, 12]
+    assert results[0]["summary"] != results[1]["summary"]  # Seeded per article
+    assert _from_schema(BATCH_ANALYSIS_SCHEMA, "no ids", seed=3)["results"][0]["id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_is_chunked(mock_server):
+    server, base_url = mock_server
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{base_url}/v1/models/gemini-test:streamGenerateContent",
+                                json=_payload("Сводка")) as response:
+            body = (await response.read()).decode("utf-8")
+
+    events = [json.loads(line[len("data: "):]) for line in body.split("\r\n\r\n") if line.startswith("data: ")]
+    texts = [event["candidates"][0]["content"]["parts"][0]["text"] for event in events]
+    expected = server.synthesize("gemini-test", _payload("Сводка"))["candidates"][0]["content"]["parts"][0]["text"]
+    assert len(events) > 1 and all(len(text) <= 10 for text in texts)
+    assert "".join(texts) == expected
+    assert "usageMetadata" in events[-1] and "usageMetadata" not in events[0]
+
+
+@pytest.mark.asyncio
+async def test_cached_prefix_is_part_of_the_replay_key(mock_server, tmp_path):
+    server, base_url = mock_server
+    recorded = {"candidates": [{"content": {"parts": [{"text": "recorded"}]}}]}
+    key = request_fingerprint("gemini-test", _payload("Статья", cached_content="cachedContents/old"), "Инструкции v1")
+    (tmp_path / "gemini-20260101.jsonl").write_text(json.dumps({"key": key, "response": recorded}) + "\n")
+    server.load_recordings(str(tmp_path))
+
+    async with aiohttp.ClientSession() as session:
+        replies = []
+        for instructions in ("Инструкции v1", "Инструкции v2"):
+            async with session.post(f"{base_url}/v1beta/cachedContents",
+                                    json={"systemInstruction": {"parts": [{"text": instructions}]}}) as response:
+                name = (await response.json())["name"]
+            async with session.post(f"{base_url}/v1/models/gemini-test:generateContent",
+                                    json=_payload("Статья", cached_content=name)) as response:
+                replies.append(await response.json())
+
+    assert replies[0] == recorded  # Same prefix under a new handle name
+    assert replies[1] != recorded
+    assert server.stats["replayed"] == 1 and server.stats["synthesized"] == 1
+    assert key != request_fingerprint("gemini-test", _payload("Статья"))
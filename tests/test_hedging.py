@@ -0,0 +1,133 @@
+"""Tests for budgeted request hedging."""
+
+import asyncio
+
+import pytest
+
+from news_aggregator.core.adaptive_limiter import AdaptiveConcurrencyLimiter
+from news_aggregator.core.hedging import RequestHedger
+
+
+def _hedger(limiter=None, **kwargs) -> RequestHedger:
+    options = {'budget_ratio': 1.0, 'min_delay': 0.0, 'min_samples': 5}
+    options.update(kwargs)
+    hedger = RequestHedger(limiter or AdaptiveConcurrencyLimiter(initial_limit=4), **options)
+    for _ in range(5):
+        hedger.observe(0.05)
+    return hedger
+
+
+def _attempts(*durations, results=None):
+    """Attempt factory: the n-th call sleeps durations[n] and returns results[n] (or raises it)."""
+    calls = {'started': 0, 'cancelled': []}
+
+    async def attempt(started: asyncio.Event):
+        index = calls['started']
+        calls['started'] += 1
+        started.set()
+        try:
+            await asyncio.sleep(durations[index])
+        except asyncio.CancelledError:
+            calls['cancelled'].append(index)
+            raise
+        result = results[index] if results else index
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return attempt, calls
+
+
+def test_hedge_delay_is_the_percentile_with_a_floor():
+    hedger = RequestHedger(AdaptiveConcurrencyLimiter(), min_delay=0.5, min_samples=20)
+    for latency in range(1, 20):
+        hedger.observe(latency / 10)
+    assert hedger.hedge_delay() is None  # Too little history
+
+    hedger.observe(2.0)
+    assert hedger.hedge_delay() == 2.0  # p95 of 0.1..1.9, 2.0
+
+    floored = RequestHedger(AdaptiveConcurrencyLimiter(), min_delay=0.5, min_samples=3)
+    for _ in range(3):
+        floored.observe(0.1)
+    assert floored.hedge_delay() == 0.5
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    hedger = _hedger()
+    attempt, calls = _attempts(5.0, 0.01)
+
+    assert await asyncio.wait_for(hedger.run(attempt), timeout=2.0) == 1
+    await asyncio.sleep(0)
+
+    assert calls['cancelled'] == [0]
+    stats = hedger.get_stats()
+    assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    hedger = _hedger()
+    attempt, calls = _attempts(0.01)
+
+    assert await hedger.run(attempt) == 0
+    assert calls['started'] == 1 and hedger.get_stats()['hedged'] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_does_not_beat_running_primary():
+    hedger = _hedger()
+    attempt, calls = _attempts(0.2, 0.01, results=['primary', RuntimeError('hedge failed')])
+
+    assert await asyncio.wait_for(hedger.run(attempt), timeout=2.0) == 'primary'
+    assert hedger.get_stats()['hedge_wins'] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_paid_from_the_budget():
+    hedger = _hedger(budget_ratio=0.5)
+
+    attempt, calls = _attempts(0.1)
+    await hedger.run(attempt)  # 0.5 tokens: not enough for a hedge
+    assert calls['started'] == 1 and hedger.get_stats()['skipped_budget'] == 1
+
+    attempt, calls = _attempts(0.1, 0.5)
+    await hedger.run(attempt)  # 1.0 token: hedged, primary still wins
+    stats = hedger.get_stats()
+    assert calls['started'] == 2 and stats['hedged'] == 1 and stats['budget_tokens'] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_a_free_limiter_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    hedger = _hedger(limiter)
+    held = await limiter.acquire()
+    attempt, calls = _attempts(0.1)
+
+    await hedger.run(attempt)
+    limiter.release(held)
+
+    assert calls['started'] == 1 and hedger.get_stats()['skipped_capacity'] == 1
+
+
+@pytest.mark.asyncio
+async def test_only_hedged_request_types_feed_the_p95(monkeypatch):
+    from news_aggregator.config import settings
+    from news_aggregator.services import ai_client as ai_client_module
+    from news_aggregator.services.ai_client import AIClient
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    hedger = _hedger(min_samples=1000)
+    monkeypatch.setattr(ai_client_module, "ai_request_hedger", hedger)
+    samples = len(hedger._latencies)
+
+    async def make_request():
+        return {"usage": None}
+
+    client = AIClient()
+    await client._call_ai_service("gemini-test", make_request, "combined_analysis_batch", "batch")
+    assert len(hedger._latencies) == samples and hedger.get_stats()['requests'] == 0
+
+    await client._call_ai_service("gemini-test", make_request, "combined_analysis", "example.com", hedge=True)
+    assert len(hedger._latencies) == samples + 1 and hedger.get_stats()['requests'] == 1
@@ -0,0 +1,166 @@
+"""Tests for the AI job queue (SQL checked against a recording session) and the AI worker."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from news_aggregator.services.ai_worker import AIWorker
+from news_aggregator.services.job_queue import JobQueue, LeasedJob
+
+
+class RecordingSession:
+    """Stands in for an AsyncSession: records statements, returns queued results."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params))
+        return self.results.pop(0) if self.results else SimpleNamespace(rowcount=1)
+
+
+@pytest.mark.asyncio
+async def test_lease_gives_up_exhausted_expired_leases_first():
+    rows = [SimpleNamespace(id=1, article_id=10, attempts=1, max_attempts=3)]
+    db = RecordingSession(SimpleNamespace(rowcount=0), rows)
+
+    jobs = await JobQueue().lease(db, "worker-1", 5)
+
+    give_up_sql, _ = db.statements[0]
+    lease_sql, params = db.statements[1]
+    assert "status = 'failed'" in give_up_sql and "attempts >= max_attempts" in give_up_sql
+    assert "FOR UPDATE SKIP LOCKED" in lease_sql and "attempts = j.attempts + 1" in lease_sql
+    assert params["worker_id"] == "worker-1" and params["limit"] == 5
+    assert jobs == [LeasedJob(1, 10, 1, 3)]
+
+
+@pytest.mark.asyncio
+async def test_fail_backs_off_then_gives_up():
+    queue = JobQueue()
+    queue.retry_delay = 30
+    db = RecordingSession()
+
+    assert await queue.fail(db, "worker-1", LeasedJob(1, 10, attempts=2, max_attempts=3), "boom")
+    await queue.fail(db, "worker-1", LeasedJob(1, 10, attempts=3, max_attempts=3), "boom")
+
+    retry_sql, retry = db.statements[0]
+    _, final = db.statements[1]
+    assert "leased_by = :worker_id" in retry_sql  # Fenced: a taken-over lease is left alone
+    assert retry["status"] == "pending" and retry["delay"] == 60.0 and not retry["final"]
+    assert final["status"] == "failed" and final["final"]
+
+
+@pytest.mark.asyncio
+async def test_complete_reports_a_lost_lease():
+    db = RecordingSession(SimpleNamespace(rowcount=0))
+
+    assert not await JobQueue().complete(db, "worker-1", 1, {"ok": True})
+    assert "status = 'leased' AND leased_by = :worker_id" in db.statements[0][0]
+
+
+class FakeJobQueue:
+    """In-memory job queue with the same fencing as the SQL one."""
+
+    visibility_timeout = 300
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.status = {job.id: 'pending' for job in jobs}
+        self.results = {}
+
+    async def lease(self, db, worker_id, limit):
+        leased = [job for job in self.jobs if self.status[job.id] == 'pending'][:limit]
+        for job in leased:
+            self.status[job.id] = 'leased'
+        return leased
+
+    async def complete(self, db, worker_id, job_id, result):
+        if self.status[job_id] != 'leased':
+            return False
+        self.status[job_id] = 'done'
+        self.results[job_id] = result
+        return True
+
+    async def fail(self, db, worker_id, job, error):
+        if self.status[job.id] != 'leased':
+            return False
+        self.status[job.id] = 'failed' if job.attempts >= job.max_attempts else 'pending'
+        self.results[job.id] = error
+        return True
+
+    async def heartbeat(self, db, worker_id, job_ids):
+        return len(job_ids)
+
+
+class FakeDatabase:
+    """execute_read returns the worker's article page; execute_write runs the operation."""
+
+    def __init__(self, page):
+        self.page = page
+
+    async def execute_read(self, operation, timeout=None):
+        return self.page
+
+    async def execute_write(self, operation, timeout=None):
+        return await operation(None)
+
+
+def _article(article_id, complete=True):
+    return {'id': article_id, 'summary': 'Summary', 'categories': [{'name': 'Tech'}],
+            'summary_processed': complete, 'category_processed': complete, 'ad_processed': True}
+
+
+class FakeOrchestrator:
+    def __init__(self, page, save=True):
+        self.db_queue_manager = FakeDatabase(page)
+        self.save = save
+
+    async def _process_unprocessed_articles(self, stats, reader, after_save, record_dead_letters):
+        assert record_dead_letters is False
+        async for page in reader.pages():
+            stats['api_calls_made'] += len(page)
+            if self.save:
+                await after_save(None, page)
+            else:
+                stats['errors'].append('write failed')
+        return {'articles_processed': len(reader.loaded_ids)}
+
+
+@pytest.mark.asyncio
+async def test_worker_settles_every_leased_job():
+    jobs = [LeasedJob(1, 10, 1, 3), LeasedJob(2, 20, 1, 3), LeasedJob(3, 30, 3, 3)]
+    queue = FakeJobQueue(jobs)
+    # Article 30 was finished in the meantime and is not loaded
+    orchestrator = FakeOrchestrator([_article(10), _article(20, complete=False)])
+    worker = AIWorker(orchestrator, worker_id="w", batch_size=10, job_queue=queue)
+
+    result = await worker.run_once()
+
+    assert result == {'articles_processed': 2}
+    assert queue.status == {1: 'done', 2: 'pending', 3: 'done'}
+    assert queue.results[1]['categories'] == ['Tech']
+    assert queue.results[2] == 'processing incomplete'
+    assert queue.results[3] == {'skipped': 'already processed'}
+    assert worker.totals['jobs'] == 3 and worker.totals['api_calls_made'] == 2
+    assert await worker.run_once() is not None  # Job 2 is leasable again
+
+
+@pytest.mark.asyncio
+async def test_unsaved_results_release_their_jobs():
+    jobs = [LeasedJob(1, 10, 1, 3), LeasedJob(2, 20, 3, 3)]
+    queue = FakeJobQueue(jobs)
+    worker = AIWorker(FakeOrchestrator([_article(10), _article(20)], save=False), worker_id="w",
+                      job_queue=queue)
+
+    await worker.run_once()
+
+    assert queue.status == {1: 'pending', 2: 'failed'}
+    assert queue.results[1] == 'write failed'
+
+
+@pytest.mark.asyncio
+async def test_drain_stops_when_nothing_is_leasable():
+    worker = AIWorker(FakeOrchestrator([]), worker_id="w", job_queue=FakeJobQueue([]))
+
+    assert (await worker.run(drain=True))['batches'] == 0
@@ -0,0 +1,78 @@
+"""Tests for per-stage pipeline metrics."""
+
+import pytest
+
+from news_aggregator.core.metrics import LATENCY_BUCKETS, PipelineMetrics, StageStats
+
+
+def test_percentiles_over_recent_window():
+    stats = StageStats(window=100)
+    for latency in range(1, 201):
+        stats.observe(latency / 100)
+
+    snapshot = stats.snapshot()
+    # Only the last 100 samples (1.01 .. 2.00) count for percentiles
+    assert snapshot['p50'] == 1.51 and snapshot['p95'] == 1.96 and snapshot['p99'] == 2.0
+    assert snapshot['count'] == 200 and snapshot['max'] == 2.0
+    assert snapshot['avg'] == pytest.approx(1.005)
+
+
+def test_histogram_buckets_are_upper_bounds():
+    stats = StageStats()
+    for latency in (0.01, 0.011, 0.3, 500.0):
+        stats.observe(latency, ok=latency < 100)
+
+    histogram = stats.snapshot()['histogram']
+    assert histogram['le_0.01'] == 1 and histogram['le_0.05'] == 1 and histogram['le_0.5'] == 1
+    assert histogram['le_inf'] == 1
+    assert sum(histogram.values()) == 4 and len(histogram) == len(LATENCY_BUCKETS) + 1
+    assert stats.snapshot()['errors'] == 1
+
+
+def test_empty_stage_snapshot():
+    snapshot = StageStats().snapshot()
+    assert snapshot['p50'] is None and snapshot['avg'] is None
+
+
+def test_in_flight_and_queue_depth_maxima():
+    stats = StageStats()
+    stats.enter()
+    stats.enter()
+    stats.leave()
+    stats.set_queue_depth(7)
+    stats.set_queue_depth(2)
+
+    snapshot = stats.snapshot()
+    assert snapshot['in_flight'] == 1 and snapshot['max_in_flight'] == 2
+    assert snapshot['queue_depth'] == 2 and snapshot['max_queue_depth'] == 7
+
+
+@pytest.mark.asyncio
+async def test_cycle_scope_is_separate_from_lifetime():
+    metrics = PipelineMetrics()
+    metrics.observe('fetch.rss', 0.2)
+    metrics.begin_cycle()
+
+    async with metrics.track('fetch.rss'):
+        pass
+    with pytest.raises(RuntimeError):
+        async with metrics.track('ai.summary'):
+            raise RuntimeError("boom")
+
+    cycle = metrics.end_cycle()['stages']
+    assert cycle['fetch.rss']['count'] == 1 and cycle['ai.summary']['errors'] == 1
+    assert metrics.snapshot()['lifetime']['fetch.rss']['count'] == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_counts_falsy_results_as_errors():
+    metrics = PipelineMetrics()
+
+    @metrics.timed('daily_summary', falsy_is_error=True)
+    async def summarize(text):
+        return text
+
+    await summarize('ok')
+    await summarize(None)
+
+    assert metrics.snapshot()['lifetime']['daily_summary']['errors'] == 1
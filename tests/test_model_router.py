@@ -0,0 +1,79 @@
+"""Tests for cost/latency aware model routing."""
+
+import pytest
+
+from news_aggregator.config import settings
+import news_aggregator.services.model_router as model_router_module
+from news_aggregator.services.model_router import ModelRouter, usage_cost
+
+
+@pytest.fixture
+def router(monkeypatch):
+    monkeypatch.setattr(settings, "ai_router_enabled", True)
+    monkeypatch.setattr(settings, "ai_router_short_chars", 500)
+    monkeypatch.setattr(settings, "ai_router_light_max_chars", 1500)
+    monkeypatch.setattr(settings, "ai_router_light_source_types", "telegram")
+    monkeypatch.setattr(settings, "ai_latency_target", 20.0)
+    return ModelRouter(standard_model="std", light_model="light")
+
+
+def test_length_and_source_type_decide(router):
+    assert router.route(300).model == "light"
+    assert router.route(1000, "telegram").reason == "light_source"
+    assert router.route(1000, "rss").model == "std"
+    assert router.route(3000, "telegram").reason == "long_input"
+    assert router.route(300, escalate=True).reason == "escalated"
+    assert router.get_stats()["decisions"] == {
+        "short_input": 1, "light_source": 1, "long_input": 2, "escalated": 1
+    }
+
+
+def test_select_does_not_count(router):
+    router.select(300)
+    assert router.get_stats()["decisions"] == {}
+
+
+def test_disabled_without_a_distinct_light_model(monkeypatch):
+    monkeypatch.setattr(settings, "ai_router_enabled", True)
+    assert ModelRouter(standard_model="std", light_model="std").route(10).reason == "default"
+    assert ModelRouter(standard_model="std", light_model="").route(10).model == "std"
+
+
+def test_degraded_light_model_falls_back(router):
+    for _ in range(5):
+        router.record("light", 1.0, ok=False)
+
+    assert router.route(300).reason == "light_degraded"
+    assert router.get_stats()["models"]["light"]["healthy"] is False
+
+
+def test_slow_standard_model_sends_light_capable_inputs_to_light(router):
+    for _ in range(5):
+        router.record("std", 60.0, ok=True)
+
+    assert router.route(1000, "rss").reason == "standard_degraded"
+    assert router.route(3000).model == "std"  # Too long for the light model
+
+
+def test_degraded_model_recovers_after_quiet_period(router, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(model_router_module.time, "monotonic", lambda: now[0])
+    for _ in range(5):
+        router.record("light", 1.0, ok=False)
+    assert router.route(300).model == "std"
+
+    now[0] += router.recovery_seconds + 1
+    assert router.route(300).model == "light"
+
+
+def test_usage_cost_uses_light_rates(monkeypatch):
+    monkeypatch.setattr(settings, "light_model", "light")
+    monkeypatch.setattr(settings, "ai_input_cost_per_1m", 1.0)
+    monkeypatch.setattr(settings, "ai_output_cost_per_1m", 4.0)
+    monkeypatch.setattr(settings, "ai_cached_input_cost_per_1m", 0.25)
+    monkeypatch.setattr(settings, "light_input_cost_per_1m", 0.1)
+    monkeypatch.setattr(settings, "light_output_cost_per_1m", 0.4)
+    usage = {"prompt_tokens": 1_000_000, "completion_tokens": 1_000_000, "cached_tokens": 400_000}
+
+    assert usage_cost("std", usage) == pytest.approx(0.6 + 4.0 + 0.1)
+    assert usage_cost("light", usage) == pytest.approx(0.06 + 0.4 + 0.1)
@@ -0,0 +1,93 @@
+"""Tests for SimHash near-duplicate detection."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from news_aggregator.services.near_duplicates import (
+    BANDS, REFRESH_OVERLAP, NearDuplicateIndex, band_values, hamming_distance, simhash
+)
+
+TEXT = ("Правительство Сербии объявило о новых мерах поддержки малого бизнеса. "
+        "Программа включает льготные кредиты, налоговые каникулы и гранты для стартапов "
+        "в регионах с высокой безработицей. Первые выплаты ожидаются весной.")
+
+
+def _flip(fingerprint: int, *bits: int) -> int:
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def test_simhash_is_stable_and_tolerates_small_edits():
+    a = simhash("Новые меры поддержки", TEXT)
+    assert a == simhash("Новые меры поддержки", TEXT)
+    assert -(1 << 63) <= a < 1 << 63  # Fits BIGINT
+
+    edited = simhash("Новые меры поддержки", TEXT.replace("весной", "летом") + " https://t.me/x")
+    other = simhash("Погода", "Синоптики обещают дожди и похолодание по всей стране в ближайшие выходные дни, "
+                              "температура опустится до пяти градусов ночью и десяти днём.")
+    assert hamming_distance(a, edited) < hamming_distance(a, other)
+
+
+def test_simhash_skips_short_texts():
+    assert simhash("Коротко", "Всего три слова") is None
+
+
+def test_band_values_cover_all_bits():
+    fingerprint = simhash("t", TEXT)
+    bands = band_values(fingerprint)
+    assert len(bands) == BANDS
+    rebuilt = sum(value << (16 * i) for i, value in enumerate(bands))
+    assert rebuilt == fingerprint & ((1 << 64) - 1)
+    assert band_values(-1) == [0xFFFF] * BANDS
+
+
+def test_find_within_and_beyond_max_distance():
+    index = NearDuplicateIndex(max_distance=3, window_hours=24)
+    base = simhash("t", TEXT)
+    index.add(1, base)
+
+    assert index.find(base) == (1, 0)
+    assert index.find(_flip(base, 0, 17, 40)) == (1, 3)  # One flip in three of the bands
+    assert index.find(_flip(base, 0, 17, 40, 60)) is None  # Beyond max_distance
+    assert index.find(base, exclude=1) is None
+
+    index.add(2, _flip(base, 5))
+    assert index.find(_flip(base, 5)) == (2, 0)
+    index.remove(2)
+    assert index.find(_flip(base, 5)) == (1, 1)
+
+
+class RecordingSession:
+    def __init__(self, now, rows):
+        self.now, self.rows, self.params = now, rows, []
+
+    async def execute(self, statement, params=None):
+        if params is None:
+            return SimpleNamespace(scalar=lambda: self.now)
+        self.params.append(params)
+        return self.rows
+
+
+def _rows(article_id, fingerprint):
+    return [SimpleNamespace(article_id=article_id, band=b, value=v) for b, v in enumerate(band_values(fingerprint))]
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_created_at_watermark_not_article_ids():
+    index = NearDuplicateIndex(max_distance=3, window_hours=24)
+    base = simhash("t", TEXT)
+    first_now = datetime(2026, 1, 1, 12, 0)
+
+    db = RecordingSession(first_now, _rows(50, base))
+    assert await index.refresh(db) == 1
+    assert db.params[0]['since'] is None
+
+    # A lower id saved later (another worker, value-ordered backlog) is still loaded
+    other = _flip(base, 1, 2, 3, 20, 21, 22, 40, 41, 42, 60, 61, 62)
+    db = RecordingSession(datetime(2026, 1, 1, 12, 1), _rows(50, base) + _rows(7, other))
+    assert await index.refresh(db) == 1
+    assert db.params[0]['since'] == first_now - REFRESH_OVERLAP
+    assert index.find(other) == (7, 0)
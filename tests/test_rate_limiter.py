@@ -0,0 +1,20 @@
+"""Tests for the HTTP client rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from news_aggregator.core.http_client import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_limit_wait_for_the_window():
+    limiter = RateLimiter(max_calls=2, time_window=0.2)
+    started = time.monotonic()
+
+    await asyncio.wait_for(asyncio.gather(*(limiter.acquire() for _ in range(5))), timeout=2.0)
+
+    # Calls 3-4 wait one window, call 5 a second one
+    assert 0.35 <= time.monotonic() - started < 1.0
+    assert not limiter.lock.locked()
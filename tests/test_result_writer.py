@@ -0,0 +1,107 @@
+"""Tests for the micro-batching article result writer."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from news_aggregator.services.result_writer import ArticleResultWriter
+
+
+class FakeQueue:
+    """execute_write stand-in; the writer's _save_batch is replaced per test."""
+
+    async def execute_write(self, operation, timeout=None):
+        return await operation(None)
+
+
+def _writer(poison=(), down=None, **kwargs):
+    """Writer recording written batches; batches holding a poison id fail, all fail while down[0]."""
+    writer = ArticleResultWriter(FakeQueue(), save_categories=None, **kwargs)
+    writer.written = []
+    writer.attempted = []
+
+    async def save_batch(db, batch):
+        ids = [a['id'] for a in batch]
+        writer.attempted.append(ids)
+        if down and down[0]:
+            raise OperationalError("UPDATE articles", {}, ConnectionRefusedError("connection refused"))
+        if any(i in poison for i in ids):
+            raise IntegrityError("UPDATE articles", {}, ValueError("bad value"))
+        writer.written.append(ids)
+        return len(batch)
+
+    writer._save_batch = save_batch
+    return writer
+
+
+def _article(article_id):
+    return {'id': article_id}
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_the_batch_is_full():
+    writer = _writer(batch_size=2, flush_interval=60)
+    writer.start()
+    for i in range(5):
+        writer.submit(_article(i))
+    await asyncio.sleep(0.01)
+
+    assert writer.written == [[0, 1], [2, 3]]
+    assert await writer.close() == 5
+    assert writer.written[-1] == [4]
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_the_interval():
+    writer = _writer(batch_size=100, flush_interval=0.05)
+    writer.start()
+    writer.submit(_article(1))
+    await asyncio.sleep(0.01)
+    assert writer.written == []
+
+    await asyncio.sleep(0.1)
+    assert writer.written == [[1]]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_poison_article_is_isolated_by_bisection():
+    writer = _writer(poison={2}, batch_size=4, flush_interval=60, max_attempts=2)
+    writer.start()
+    for i in range(4):
+        writer.submit(_article(i))
+
+    assert await writer.close() == 3
+    assert sorted(i for ids in writer.written for i in ids) == [0, 1, 3]
+    assert writer.failed == 1
+    # Whole batch, then halves, then the failing half's articles; one retry of the poison on close
+    assert writer.attempted == [[0, 1, 2, 3], [0, 1], [2, 3], [2], [3], [2]]
+
+
+@pytest.mark.asyncio
+async def test_connection_failure_keeps_the_batch_whole_for_retry():
+    down = [True]
+    writer = _writer(down=down, batch_size=3, flush_interval=60)
+    writer.start()
+    for i in range(3):
+        writer.submit(_article(i))
+    await asyncio.sleep(0.01)
+    assert writer.attempted == [[0, 1, 2]]  # Not bisected
+
+    down[0] = False
+    assert await writer.close() == 3
+    assert writer.written == [[0, 1, 2]]
+    assert writer.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_close_drains_the_queue_and_deduplicates():
+    writer = _writer(batch_size=100, flush_interval=60)
+    writer.start()
+    writer.submit({'id': 1, 'summary': 'old'})
+    writer.submit(_article(2))
+    writer.submit({'id': 1, 'summary': 'new'})
+
+    assert await writer.close() == 2
+    assert writer.written == [[1, 2]]
@@ -0,0 +1,80 @@
+"""Tests for the compiled text rule engine."""
+
+from news_aggregator.core.rule_engine import CompiledRules, Rule, RuleEngine
+
+
+def test_literal_prefixes_are_all_reported():
+    rules = CompiledRules([
+        Rule("a.short", "a", "just a"),
+        Rule("a.long", "a", "Just a moment"),
+        Rule("a.other", "a", "cloudflare"),
+    ])
+
+    # The scan reports only the longest literal at a position; its prefixes come along
+    assert rules.match("Please wait, JUST A MOMENT...") == {"a.short", "a.long"}
+    assert rules.match("just a second") == {"a.short"}
+    assert rules.match("nothing here") == set()
+
+
+def test_same_literal_in_two_rules():
+    rules = CompiledRules([Rule("a.x", "a", "captcha"), Rule("b.x", "b", "CAPTCHA")])
+
+    assert rules.match("solve the captcha") == {"a.x", "b.x"}
+
+
+def test_regex_prefilter_reports_every_matching_rule():
+    rules = CompiledRules([
+        Rule("spam.buy", "spam", r"\bbuy now\b", is_regex=True),
+        Rule("spam.dollars", "spam", r"\$\$\$+", is_regex=True),
+        Rule("spam.grouped", "spam", r"\bsubscribe\s+(now|today)\b", is_regex=True),
+    ])
+
+    assert rules.match("BUY NOW for $$$$") == {"spam.buy", "spam.dollars"}
+    assert rules.match("Subscribe today") == {"spam.grouped"}
+    assert rules.match("a regular news text") == set()
+    assert rules.errors == []
+
+
+def test_backreference_rule_still_fires():
+    rules = CompiledRules([
+        Rule("x.plain", "x", r"foo", is_regex=True),
+        Rule("x.repeat", "x", r"(\w)\1{4}", is_regex=True),
+    ])
+
+    assert rules.match("zzzzz") == {"x.repeat"}
+    assert rules.match("foo zzzzz") == {"x.plain", "x.repeat"}
+
+
+def test_rules_that_break_the_combined_pattern_are_checked_alone():
+    rules = CompiledRules([
+        Rule("x.flags", "x", r"(?i)bar", is_regex=True),
+        Rule("x.name1", "x", r"(?P<n>foo)", is_regex=True),
+        Rule("x.name2", "x", r"(?P<n>baz)", is_regex=True),
+        Rule("x.plain", "x", r"qux", is_regex=True),
+    ])
+
+    assert rules.errors == []
+    assert rules.match("BAR baz") == {"x.flags", "x.name2"}
+    assert rules.match("qux") == {"x.plain"}
+
+
+def test_invalid_regex_is_skipped_and_reported():
+    rules = CompiledRules([Rule("x.bad", "x", r"(unclosed", is_regex=True), Rule("x.ok", "x", "ok")])
+
+    assert "x.bad" not in rules.rules
+    assert rules.match("ok (unclosed") == {"x.ok"}
+    assert len(rules.errors) == 1
+
+
+def test_classify_groups_matches_by_rule_set():
+    engine = RuleEngine([
+        Rule("spam.buy", "spam", r"buy now", is_regex=True),
+        Rule("navigation.menu", "navigation", r"^\s*menu", is_regex=True),
+        Rule("bot_page.moment", "bot_page", "just a moment"),
+    ])
+
+    assert engine.classify("Menu: buy now", "spam", "navigation") == {
+        "spam": ["spam.buy"], "navigation": ["navigation.menu"]
+    }
+    assert engine.matches("Just a moment...", "bot_page")
+    assert not engine.matches("Just a moment...", "spam")
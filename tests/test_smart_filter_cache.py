@@ -0,0 +1,54 @@
+"""Tests for SmartFilter's bounded duplicate-hash cache."""
+
+from datetime import timedelta
+
+from news_aggregator.services import smart_filter as smart_filter_module
+from news_aggregator.services.smart_filter import RecentHashCache
+
+
+def _clock(monkeypatch, start=1000.0):
+    now = [start]
+    monkeypatch.setattr(smart_filter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_window(monkeypatch):
+    now = _clock(monkeypatch)
+    cache = RecentHashCache(timedelta(seconds=60), max_size=10)
+    cache.add("a")
+    now[0] += 30
+    cache.add("b")
+
+    now[0] += 31  # "a" is 61s old, "b" 31s
+    assert "a" not in cache
+    assert cache.get("b") == 1030.0
+    assert len(cache) == 1
+
+
+def test_re_adding_moves_entry_to_the_end(monkeypatch):
+    now = _clock(monkeypatch)
+    cache = RecentHashCache(timedelta(seconds=60), max_size=10)
+    cache.add("a")
+    now[0] += 10
+    cache.add("b")
+    now[0] += 40
+    cache.add("a")  # Refreshed: now newer than "b"
+
+    now[0] += 20  # "b" 60s old, "a" 20s
+    assert "b" not in cache
+    assert "a" in cache
+
+
+def test_size_bound_evicts_oldest_first(monkeypatch):
+    now = _clock(monkeypatch)
+    cache = RecentHashCache(timedelta(hours=24), max_size=3)
+    for key in ("a", "b", "c"):
+        cache.add(key)
+        now[0] += 1
+    cache.add("a")
+    cache.add("d")
+
+    assert "b" not in cache
+    assert all(key in cache for key in ("a", "c", "d"))
+    assert len(cache) == 3
+    assert cache.evicted == 1
@@ -0,0 +1,151 @@
+"""Tests for streamed summary generation and the digest parts assembled from it."""
+
+import json
+
+import pytest
+from aiohttp import web
+
+from news_aggregator.config import settings
+from news_aggregator.core.exceptions import GenerationAbortedError
+import news_aggregator.core.http_client as http_client_module
+from news_aggregator.services.ai_client import AIClient
+from news_aggregator.services.summary_generator import SummaryGenerator
+from news_aggregator.utils import StreamingDigestSplitter, TelegramMessageSplitter
+
+
+def _sse_chunk(text: str) -> bytes:
+    return b"data: " + json.dumps({"candidates": [{"content": {"parts": [{"text": text}]}}]}).encode() + b"\n\n"
+
+
+@pytest.fixture
+async def stream_stub(monkeypatch):
+    """streamGenerateContent stand-in replying with the chunks in chunks[0]."""
+    chunks = [[]]
+
+    async def stream_content(request):
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for chunk in chunks[0]:
+            await response.write(chunk)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/models/{model_action}", stream_content)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(settings, "gemini_api_endpoint", f"http://127.0.0.1:{port}/v1/models")
+    monkeypatch.setattr(http_client_module, "ai_http_client", None)
+    yield chunks
+    if http_client_module.ai_http_client:
+        await http_client_module.ai_http_client.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stream_accumulates_text_parts(stream_stub):
+    stream_stub[0] = [
+        b": keep-alive\n\n",
+        _sse_chunk("Первая часть, "),
+        b"data: {not json\n\n",
+        b"data: " + json.dumps({"candidates": [{"content": {"parts": [
+            {"text": "вторая "}, {"text": "часть."}
+        ]}}], "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5}}).encode() + b"\n\n",
+    ]
+    seen = []
+
+    data = await AIClient()._stream_gemini_request(
+        "prompt", "gemini-test", "daily_summary", "digest", on_text=seen.append
+    )
+
+    assert seen == ["Первая часть, ", "Первая часть, вторая часть."]
+    assert data["choices"][0]["message"]["content"] == "Первая часть, вторая часть."
+
+
+@pytest.mark.asyncio
+async def test_validator_aborts_the_stream(stream_stub):
+    stream_stub[0] = [_sse_chunk("a" * 100), _sse_chunk("b" * 100), _sse_chunk("c" * 100)]
+    seen = []
+
+    with pytest.raises(GenerationAbortedError) as exc_info:
+        await AIClient()._stream_gemini_request(
+            "prompt", "gemini-test", "daily_summary", "digest",
+            on_text=seen.append, validator=SummaryGenerator._early_abort_reason
+        )
+
+    assert exc_info.value.partial_text == "a" * 100 + "b" * 100
+    assert len(seen) == 2
+
+
+def test_early_abort_reason():
+    russian = "В сфере технологий произошли важные события. "
+
+    assert SummaryGenerator._early_abort_reason("Short English text") is None
+    assert SummaryGenerator._early_abort_reason("English text only. " * 11) == "summary is not in Russian"
+    assert SummaryGenerator._early_abort_reason(russian * 3) is None
+    assert SummaryGenerator._early_abort_reason(russian * 8) == "summary is repeating itself"
+    distinct = "".join(f"Событие номер {i} изменило рынок. " for i in range(20))
+    assert SummaryGenerator._early_abort_reason(distinct) is None
+
+
+def _streaming_splitter(blocks, parts):
+    return StreamingDigestSplitter(
+        TelegramMessageSplitter(safety_margin=496), "<b>Header</b>", [t for t, _ in blocks],
+        parts.append, {"total_articles": 9, "categories_count": len(blocks)}
+    )
+
+
+def test_streaming_split_matches_split_digest():
+    splitter = TelegramMessageSplitter(safety_margin=496)
+    blocks = [(f"Category {i}", f"Summary {i} " + "x" * 900) for i in range(7)]
+    metadata = {"total_articles": 9, "categories_count": len(blocks)}
+    early = []
+    stream = _streaming_splitter(blocks, early)
+
+    for title, text in blocks:
+        stream.update(title, text[:100])
+        stream.complete(title, text)
+    parts = early + stream.finish("\nFooter", metadata)
+
+    expected = splitter.split_digest("<b>Header</b>", blocks, "\nFooter", metadata)
+    assert len(early) == expected.total_parts - 1
+    assert parts == [part.content for part in expected.parts]
+
+
+def test_part_closes_while_next_block_is_still_streaming():
+    blocks = [("A", "a" * 2000), ("B", "b" * 1000), ("C", "c" * 500)]
+    early = []
+    stream = _streaming_splitter(blocks, early)
+
+    stream.complete("A", blocks[0][1])
+    stream.update("B", "b" * 500)
+    assert early == []  # B may still fit next to A
+
+    stream.update("B", "b" * 1800)
+    assert len(early) == 1 and "a" * 2000 in early[0] and "<b>B</b>" not in early[0]
+
+
+def test_blocks_complete_out_of_order_and_dropped_blocks():
+    blocks = [("A", "a" * 3000), ("B", "b" * 3000), ("C", "c" * 100)]
+    early = []
+    stream = _streaming_splitter(blocks, early)
+
+    stream.complete("C", blocks[2][1])
+    stream.complete("B", blocks[1][1])
+    assert early == []  # Nothing is final before A
+    stream.complete("A", blocks[0][1])
+    assert len(early) == 1 and "<b>A</b>" in early[0]
+    rest = stream.finish("\nFooter")
+    assert len(rest) == 1 and "<b>B</b>" in rest[0] and "<b>C</b>" in rest[0] and rest[0].endswith("\nFooter")
+
+    stream = _streaming_splitter(blocks, [])
+    stream.complete("A", None)
+    stream.complete("B", blocks[1][1])
+    stream.complete("C", blocks[2][1])
+    parts = stream.finish("\nFooter")
+    assert len(parts) == 1 and "<b>A</b>" not in parts[0] and parts[0].endswith("\nFooter")